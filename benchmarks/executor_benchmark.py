@@ -0,0 +1,120 @@
+# executor_benchmark.py
+# Author: Thomas MINIER - MIT License 2017-2020
+"""Micro-benchmark of the query executor, measuring the number of results produced per time quantum.
+
+It compares the current executor (deadline checked every few ticks, results stored in a list)
+with the legacy executor (results pushed in an asyncio.Queue, quantum enforced by asyncio.wait_for).
+Each query is evaluated from start to end: after each quantum, the plan is saved, serialized and reloaded,
+just like with the HTTP server.
+
+Usage: python -m benchmarks.executor_benchmark --quantum 0.5 --repeat 20
+"""
+from asyncio import Queue
+from asyncio import TimeoutError as asyncTimeoutError
+from asyncio import get_event_loop, wait_for
+from math import inf
+from statistics import mean
+from time import perf_counter
+
+import click
+
+from sage.database.core.dataset import Dataset
+from sage.database.core.graph import Graph
+from sage.database.hdt.connector import HDTFileConnector
+from sage.query_engine.iterators.loader import load
+from sage.query_engine.optimizer.query_parser import parse_query
+from sage.query_engine.primitives import PreemptiveLoop
+from sage.query_engine.protobuf.iterators_pb2 import RootTree
+from sage.query_engine.sage_engine import SageEngine
+
+GRAPH_URI = 'http://localhost:8000/sparql/test'
+
+QUERIES = {
+    'scan': 'SELECT * WHERE { ?s ?p ?o }',
+    'join': 'SELECT * WHERE { ?s1 <http://example.org/p1> ?common . ?s2 <http://example.org/p2> ?common }',
+    'filter': 'SELECT * WHERE { ?s ?p ?o . FILTER(?p = <http://example.org/p1>) }'
+}
+
+
+class TooManyResults(Exception):
+    pass
+
+
+async def legacy_executor(pipeline, queue, limit):
+    """Copy of the executor based on an asyncio.Queue"""
+    try:
+        with PreemptiveLoop() as loop:
+            while pipeline.has_next():
+                value = await pipeline.next()
+                if value is not None:
+                    await queue.put(value)
+                if queue.qsize() >= limit:
+                    raise TooManyResults()
+                await loop.tick()
+    except StopAsyncIteration:
+        pass
+
+
+async def legacy_execute(plan, quantum, limit=inf):
+    """Copy of SageEngine.execute based on asyncio.wait_for"""
+    results = list()
+    queue = Queue()
+    query_done = False
+    root = None
+    try:
+        await wait_for(legacy_executor(plan, queue, limit), timeout=quantum)
+        query_done = True
+    except (StopAsyncIteration, asyncTimeoutError, TooManyResults):
+        pass
+    finally:
+        while not queue.empty():
+            results.append(queue.get_nowait())
+    if not query_done:
+        root = RootTree()
+        getattr(root, plan.serialized_name() + '_source').CopyFrom(plan.save())
+    return (results, root, query_done, None)
+
+
+async def current_execute(plan, quantum, limit=inf):
+    return await SageEngine().execute(plan, quantum, limit)
+
+
+async def evaluate(execute, query, dataset, quantum):
+    """Evaluate a query from start to end.
+
+    Returns: A list of tuples (number of results, execution time in ms), one per quantum.
+    """
+    plan, _ = parse_query(query, dataset, GRAPH_URI)
+    per_quantum = list()
+    while True:
+        start = perf_counter()
+        results, saved_plan, done, _ = await execute(plan, quantum)
+        per_quantum.append((len(results), (perf_counter() - start) * 1000))
+        if done:
+            return per_quantum
+        plan = load(saved_plan.SerializeToString(), dataset)
+
+
+@click.command()
+@click.option("--file", type=str, default="tests/data/test.hdt", show_default=True, help="HDT file to query")
+@click.option("--quantum", type=float, default=0.5, show_default=True, help="Time quantum, in milliseconds")
+@click.option("--repeat", type=int, default=20, show_default=True, help="Number of evaluations of each query")
+def benchmark(file, quantum, repeat):
+    """Compare the number of results per quantum of the current and legacy executors"""
+    graph = Graph(GRAPH_URI, 'test', 'benchmark graph', HDTFileConnector(file))
+    dataset = Dataset('benchmark', 'executor benchmark', {GRAPH_URI: graph})
+    loop = get_event_loop()
+    print(f"quantum = {quantum}ms, {repeat} evaluations per query")
+    print(f"{'query':<8}{'executor':<10}{'results':>9}{'quanta':>8}{'results/quantum':>17}{'ms/quantum':>12}{'results/ms':>12}")
+    for name, query in QUERIES.items():
+        for label, execute in [('legacy', legacy_execute), ('current', current_execute)]:
+            quanta = [loop.run_until_complete(evaluate(execute, query, dataset, quantum / 1000)) for _ in range(repeat)]
+            nb_results = sum(r for r, _ in quanta[0])
+            nb_quanta = mean([len(q) for q in quanta])
+            duration = mean([t for q in quanta for _, t in q])
+            throughput = sum(r for q in quanta for r, _ in q) / sum(t for q in quanta for _, t in q)
+            print(f"{name:<8}{label:<10}{nb_results:>9}{nb_quanta:>8.1f}{nb_results / nb_quanta:>17.1f}{duration:>12.3f}{throughput:>12.1f}")
+
+
+if __name__ == '__main__':
+    benchmark()
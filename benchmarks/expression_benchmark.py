@@ -0,0 +1,67 @@
+# expression_benchmark.py
+# Author: Thomas MINIER - MIT License 2017-2020
+"""Micro-benchmark of FILTER and BIND expressions, measuring the cost of evaluating an expression on a set of solution mappings.
+
+It compares the native evaluation of expressions (see `sage.query_engine.iterators.expression_compiler`)
+with their evaluation using rdflib, on all the solution mappings of the triple pattern ?s ?p ?o.
+
+Usage: python -m benchmarks.expression_benchmark --repeat 20
+"""
+from statistics import mean
+from time import perf_counter
+
+import click
+
+from sage.database.hdt.connector import HDTFileConnector
+from sage.query_engine.iterators.bind import BindIterator
+from sage.query_engine.iterators.filter import FilterIterator
+from sage.query_engine.iterators.utils import EmptyIterator
+
+FILTERS = [
+    '?p = <http://example.org/p1>',
+    '(?p = <http://example.org/p1> && ?o != <http://example.org/o001>)',
+    'REGEX(STR(?o), "o00")',
+    'CONTAINS(STR(?s), "s1") || ?o = <http://example.org/o002>'
+]
+
+BINDS = [
+    'STR(?o)',
+    'CONCAT(STR(?s), "-", STR(?o))',
+    'IF(CONTAINS(STR(?o), "o00"), "small", "big")'
+]
+
+
+def per_row(iterator, mappings, native, repeat):
+    """Get the mean cost of evaluating the expression of an iterator on a set of solution mappings, in microseconds per row"""
+    native_expression = iterator._native_expression
+    if not native:
+        iterator._native_expression = None
+    timings = list()
+    for _ in range(repeat):
+        start = perf_counter()
+        for mu in mappings:
+            iterator._evaluate(dict(mu))
+        timings.append((perf_counter() - start) * 1e6 / len(mappings))
+    iterator._native_expression = native_expression
+    return mean(timings)
+
+
+@click.command()
+@click.option("--file", type=str, default="tests/data/test.hdt", show_default=True, help="HDT file used to generate solution mappings")
+@click.option("--repeat", type=int, default=20, show_default=True, help="Number of evaluations of each expression on all solution mappings")
+def benchmark(file, repeat):
+    """Compare the per-row cost of the native and rdflib evaluations of FILTER and BIND expressions"""
+    iterator, _ = HDTFileConnector(file).search('?s', '?p', '?o')
+    mappings = [{'?s': s, '?p': p, '?o': o} for s, p, o in iterator]
+    print(f"{len(mappings)} solution mappings, {repeat} evaluations per expression")
+    print(f"{'expression':<75}{'native':>10}{'rdflib':>10}{'speedup':>9}")
+    iterators = [(f"FILTER {e}", FilterIterator(EmptyIterator(), e)) for e in FILTERS]
+    iterators += [(f"BIND {e}", BindIterator(EmptyIterator(), e, '?z')) for e in BINDS]
+    for label, iterator in iterators:
+        native = per_row(iterator, mappings, True, repeat) if iterator._native_expression is not None else float('nan')
+        rdflib = per_row(iterator, mappings, False, repeat)
+        print(f"{label:<75}{native:>9.2f}u{rdflib:>9.2f}u{rdflib / native:>8.1f}x")
+
+
+if __name__ == '__main__':
+    benchmark()
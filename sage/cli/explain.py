@@ -8,10 +8,13 @@ from rdflib import BNode, Graph, Literal, Namespace, RDFS, XSD
 from sage.cli.utils import load_graph
 from sage.database.core.yaml_config import load_config
 from sage.query_engine.sage_engine import SageEngine
+from sage.query_engine.iterators.loader import load
 from sage.query_engine.optimizer.query_parser import parse_query
+from sage.query_engine.profiler import PlanProfiler
 from sage.http_server.server import run_app
 from starlette.testclient import TestClient
 from tests.http.utils import post_sparql
+from time import time
 
 import inspect
 import click
@@ -48,6 +51,75 @@ import json
 #         pass
 
 
+def describe_operator(iterator) -> str:
+    """Get a short description of an iterator, i.e., its name and the triple pattern it evaluates (if any)"""
+    triple = getattr(iterator, '_innerTriple', None) or getattr(iterator, '_triple', None)
+    if triple is None:
+        return iterator.serialized_name()
+    return f"{iterator.serialized_name()} {{ {triple['subject']} {triple['predicate']} {triple['object']} }}"
+
+
+def describe_plan(iterator, depth=0):
+    """Describe all operators of a plan, as a list of tuples (depth, description, estimated cardinality)"""
+    estimate = len(iterator) if hasattr(iterator, '__len__') else None
+    triple = getattr(iterator, '_innerTriple', None)
+    if triple is not None:
+        # the estimated cardinality of an index join is the one of its inner triple pattern
+        estimate = iterator._graph.estimate(triple['subject'], triple['predicate'], triple['object'])
+    operators = [(depth, describe_operator(iterator), estimate)]
+    for child in iterator.children():
+        operators += describe_plan(child, depth + 1)
+    return operators
+
+
+def merge_stats(total, stats):
+    """Sum the statistics of two quanta, as trees of per-operator statistics"""
+    if total is None:
+        total = {'rows_out': 0, 'time': 0.0, 'db_calls': 0, 'db_reads': 0, 'quanta': 0, 'children': [None] * len(stats['children'])}
+    for key in ['rows_out', 'time', 'db_calls', 'db_reads']:
+        total[key] += stats[key]
+    if stats['time'] > 0:
+        total['quanta'] += 1
+    total['children'] = [merge_stats(t, s) for t, s in zip(total['children'], stats['children'])]
+    return total
+
+
+def flatten_stats(stats):
+    """Flatten a tree of per-operator statistics, in the same order as `describe_plan`"""
+    operators = [stats]
+    for child in stats['children']:
+        operators += flatten_stats(child)
+    return operators
+
+
+async def analyze(plan, dataset, graph):
+    """Execute a plan quantum by quantum, as the SaGe server does, and profile each quantum.
+
+    Returns: A tuple (`nb_results`, `quanta`, `stats`) where `quanta` is the list of (number of results, execution time, size of the saved plan) per quantum
+    and `stats` are the per-operator statistics, summed over all quanta.
+    """
+    engine = SageEngine()
+    quanta = list()
+    total = None
+    nb_results = 0
+    while True:
+        profiler = PlanProfiler()
+        start = time()
+        results, saved_plan, done, abort_reason = await engine.execute(plan, graph.quota / 1000, graph.max_results, batch_size=graph.batch_size, profiler=profiler)
+        elapsed = (time() - start) * 1000
+        if abort_reason is not None:
+            graph.abort()
+            raise Exception(f"The SPARQL query has been aborted for the following reason: '{abort_reason}'")
+        graph.commit()
+        nb_results += len(results)
+        total = merge_stats(total, profiler.tree())
+        saved_bytes = saved_plan.SerializeToString() if saved_plan is not None else b''
+        quanta.append((len(results), elapsed, len(saved_bytes)))
+        if done:
+            return nb_results, quanta, total
+        plan = load(saved_bytes, dataset)
+
+
 @click.command()
 @click.argument("config_file")
 @click.argument("graph_uri")
@@ -56,7 +128,8 @@ import json
 @click.option("-u", "--update", is_flag=True, help="explain a SPARQL update query")
 @click.option("-p", "--parse", is_flag=True, help="print the query parse tree")
 @click.option("-i", "--indentnb", default=2, help="pretty print indent value")
-def explain(query,file,config_file,graph_uri,indentnb,update,parse):
+@click.option("-a", "--analyze", "run_analyze", is_flag=True, help="execute the query quantum by quantum and report per-operator statistics (EXPLAIN ANALYZE)")
+def explain(query,file,config_file,graph_uri,indentnb,update,parse,run_analyze):
     coloredlogs.install(level='INFO', fmt='%(asctime)s - %(levelname)s %(message)s')
     logger = logging.getLogger(__name__)
 
@@ -134,6 +207,26 @@ def explain(query,file,config_file,graph_uri,indentnb,update,parse):
     print("-----------------")
     pp.pprint(cards)
 
+    if run_analyze:
+        operators = describe_plan(iterator)
+        loop = asyncio.get_event_loop()
+        nb_results, quanta, stats = loop.run_until_complete(analyze(iterator, dataset, graph))
+        print("-----------------")
+        print("Quanta")
+        print("-----------------")
+        print(f"{'quantum':>8}{'results':>10}{'time (ms)':>12}{'saved plan (bytes)':>20}")
+        for index, (results, elapsed, size) in enumerate(quanta):
+            print(f"{index + 1:>8}{results:>10}{elapsed:>12.2f}{size:>20}")
+        print(f"{nb_results} results in {len(quanta)} quanta, {sum([q[1] for q in quanta]):.2f}ms")
+        print("-----------------")
+        print("Operators")
+        print("-----------------")
+        print(f"{'estimated':>10}{'actual':>10}{'db reads':>10}{'db calls':>10}{'time (ms)':>12}{'quanta':>8}  operator")
+        for (depth, description, estimate), op in zip(operators, flatten_stats(stats)):
+            estimate = estimate if estimate is not None else '-'
+            print(f"{estimate:>10}{op['rows_out']:>10}{op['db_reads']:>10}{op['db_calls']:>10}{op['time']:>12.2f}{op['quanta']:>8}  {'  ' * depth}{description}")
+        print("(estimated: estimated cardinality of the triple pattern evaluated by the operator, actual: solution mappings produced by the operator)")
+
     ## if you want to run it call sage-query !
     # print("-----------------")
     # print("Results")
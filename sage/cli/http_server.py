@@ -13,9 +13,10 @@ set_event_loop_policy(uvloop.EventLoopPolicy())
 @click.argument("config")
 @click.option("-p", "--port", type=int, default=8000, show_default=True, help="The port to bind")
 @click.option("-w", "--workers", type=int, default=4, show_default=True, help="he number of server workers")
+@click.option("--pool-size", type=int, default=0, show_default=True, help="The number of worker processes used to execute queries (0 executes queries in the server process)")
 @click.option('-h', "--host", type=str, default="0.0.0.0", show_default=True, help="Set the host address.")
 @click.option("--log-level", type=click.Choice(["debug", "info", "warning", "error"]), default="info", show_default=True, help="The granularity of log outputs")
-def start_sage_server(config, port, workers, host, log_level):
+def start_sage_server(config, port, workers, pool_size, host, log_level):
   """Launch the Sage server using the CONFIG configuration file"""
-  app = run_app(config)
+  app = run_app(config, pool_size=pool_size)
   uvicorn.run(app, port=port, host=host, log_level=log_level)
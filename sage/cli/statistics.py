@@ -0,0 +1,55 @@
+# statistics.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import logging
+from time import time
+
+import click
+import coloredlogs
+
+from sage.cli.utils import load_graph
+from sage.database.core.characteristic_sets import CharacteristicSets, catalog_path
+from sage.database.core.yaml_config import load_config
+from sage.database.import_manager import builtin_backends
+
+
+def scan_graph(graph):
+    """Get an iterator over all RDF triples of a RDF graph"""
+    iterator, _ = graph.search('?s', '?p', '?o')
+    while iterator.has_next():
+        triple = iterator.next()
+        if triple is not None:
+            yield triple
+
+
+@click.command()
+@click.argument("config")
+@click.argument("graph_name")
+@click.option("-o", "--output", type=str, default=None,
+              help="Path of the file in which the characteristic sets are stored. Defaults to the 'statistics' key of the graph, or to the file of the graph followed by '.cs.json'.")
+def build_statistics(config, graph_name, output):
+    """
+        Build the characteristic sets of the RDF graph GRAPH_NAME, described in the configuration file CONFIG, by scanning the graph once.
+        They are used by the query optimizer to estimate the cardinality of star-shaped joins.
+    """
+    # install logger
+    coloredlogs.install(level='INFO', fmt='%(asctime)s - %(levelname)s %(message)s')
+    logger = logging.getLogger(__name__)
+
+    # load graph from config file
+    g_config, _ = load_graph(config, graph_name, logger, backends=list(builtin_backends().keys()))
+    path = output if output is not None else catalog_path(g_config)
+    if path is None:
+        logger.error("No path found to store the characteristic sets of the RDF graph '{}'. Please set one using the --output option.".format(graph_name))
+        exit(1)
+    graph = load_config(config).get_graph(g_config['uri'])
+    if graph is None:
+        logger.error("Impossible to load the RDF graph '{}'".format(graph_name))
+        exit(1)
+
+    # RDF triples grouped by subject can be processed one subject at a time
+    subject_sorted = graph.search_ordering('?s', '?p', '?o')[:1] == ['subject']
+    logger.info("Scanning the RDF graph '{}'...".format(graph_name))
+    start = time()
+    catalog = CharacteristicSets.build(scan_graph(graph), subject_sorted=subject_sorted)
+    catalog.save(path)
+    logger.info("{} characteristic sets successfully built in {}s and stored in {}".format(len(catalog), time() - start, path))
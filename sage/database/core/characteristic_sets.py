@@ -0,0 +1,206 @@
+# characteristic_sets.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import json
+from hashlib import blake2b
+from heapq import heappush, heapreplace
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Suffix of the file storing the characteristic sets of a RDF graph, next to the file of the graph (for file-based backends)
+CATALOG_SUFFIX = '.cs.json'
+
+# Number of hash values kept by the sketches that count the distinct objects of a predicate in a characteristic set
+SKETCH_SIZE = 1024
+
+# Number of distinct hash values (64 bits) of the sketches
+HASH_RANGE = 2 ** 64
+
+
+def catalog_path(config: dict) -> Optional[str]:
+    """Get the path of the file storing the characteristic sets of a RDF graph, from its configuration.
+
+    The path is set using the 'statistics' key of the graph, and defaults to the file of the graph followed by `CATALOG_SUFFIX`.
+
+    Argument: The configuration of the RDF graph, as declared in a SaGe configuration file.
+
+    Returns: The path of the catalog, or `None` if the graph declares no path and is not stored in a file.
+    """
+    if 'statistics' in config:
+        return config['statistics']
+    if 'file' in config:
+        return config['file'] + CATALOG_SUFFIX
+    return None
+
+
+class DistinctSketch(object):
+    """A K-Minimum-Values sketch, which estimates the number of distinct values added to it using a bounded amount of memory.
+
+    The sketch keeps the `size` smallest hash values of the values added to it. The count is exact as long as there are
+    at most `size` distinct values, and is estimated from the largest hash value kept otherwise.
+
+    Args:
+      * size: Maximum number of hash values kept by the sketch.
+    """
+
+    def __init__(self, size: int = SKETCH_SIZE):
+        super(DistinctSketch, self).__init__()
+        self._size = size
+        # the hash values kept, negated in the heap so the largest one is on top
+        self._heap = list()
+        self._hashes = set()
+
+    def __len__(self) -> int:
+        """Get the (estimated) number of distinct values added to the sketch"""
+        if len(self._heap) < self._size:
+            return len(self._heap)
+        return round((self._size - 1) * HASH_RANGE / (1 - self._heap[0]))
+
+    def add(self, value: str) -> None:
+        """Add a value to the sketch"""
+        # a stable hash function, so the catalogs built from the same RDF graph are the same
+        h = int.from_bytes(blake2b(value.encode('utf-8'), digest_size=8).digest(), 'big')
+        if h in self._hashes:
+            return
+        if len(self._heap) < self._size:
+            heappush(self._heap, -h)
+            self._hashes.add(h)
+        elif h < -self._heap[0]:
+            self._hashes.discard(-heapreplace(self._heap, -h))
+            self._hashes.add(h)
+
+
+class CharacteristicSets(object):
+    """A catalog of the characteristic sets of a RDF graph, used to estimate the cardinality of star-shaped joins.
+
+    The characteristic set of a subject is the set of predicates found in the RDF triples of this subject.
+    For each characteristic set, the catalog stores the number of subjects that have it and, for each of its predicates,
+    the number of RDF triples (occurrences) and the number of distinct objects of these subjects with this predicate.
+    Unlike the statistics of a single triple pattern, these capture the correlations between the predicates of a same subject.
+
+    Args:
+      * sets: For each characteristic set, a tuple (`subjects`, `predicates`) where `subjects` is the number of subjects that have it,
+        and `predicates` maps each of its predicates to a tuple (`occurrences`, `distinct objects`).
+    """
+
+    def __init__(self, sets: List[Tuple[int, Dict[str, Tuple[int, int]]]]):
+        super(CharacteristicSets, self).__init__()
+        self._sets = sets
+        # index the characteristic sets by predicate, to find the supersets of a set of predicates
+        self._index = dict()
+        for position, (_, predicates) in enumerate(self._sets):
+            for predicate in predicates.keys():
+                if predicate not in self._index:
+                    self._index[predicate] = set()
+                self._index[predicate].add(position)
+
+    def __len__(self) -> int:
+        return len(self._sets)
+
+    @staticmethod
+    def build(triples: Iterable[Tuple[str, str, str]], subject_sorted: bool = True) -> 'CharacteristicSets':
+        """Build the characteristic sets of a RDF graph by scanning its RDF triples once.
+
+        The distinct objects of each predicate of a characteristic set are counted using a `DistinctSketch`, so the memory used to
+        summarize the subjects is bounded by the number of characteristic sets and of their predicates, whatever the number of distinct objects.
+
+        Args:
+          * triples: The RDF triples of the graph.
+          * subject_sorted: True if the RDF triples are grouped by subject, so the RDF triples of a subject are discarded once it is added to the sketches of its characteristic set.
+            Otherwise, the RDF triples of all subjects are kept in memory until the end of the scan.
+
+        Returns: The catalog of the characteristic sets of the RDF graph.
+        """
+        # for each characteristic set: number of subjects, and occurrences and sketch of the distinct objects of each predicate
+        subjects = dict()
+        occurrences = dict()
+        objects = dict()
+
+        def add_subject(predicates: Dict[str, List[str]]) -> None:
+            key = frozenset(predicates.keys())
+            if key not in subjects:
+                subjects[key] = 0
+                occurrences[key] = {predicate: 0 for predicate in key}
+                objects[key] = {predicate: DistinctSketch() for predicate in key}
+            subjects[key] += 1
+            for predicate, values in predicates.items():
+                occurrences[key][predicate] += len(values)
+                for value in values:
+                    objects[key][predicate].add(value)
+
+        current, predicates = None, dict()
+        pending = dict()
+        for s, p, o in triples:
+            if not subject_sorted:
+                pending.setdefault(s, dict()).setdefault(p, list()).append(o)
+                continue
+            if s != current:
+                if current is not None:
+                    add_subject(predicates)
+                current, predicates = s, dict()
+            predicates.setdefault(p, list()).append(o)
+        if current is not None:
+            add_subject(predicates)
+        for predicates in pending.values():
+            add_subject(predicates)
+        sets = [(subjects[key], {predicate: (occurrences[key][predicate], len(objects[key][predicate])) for predicate in key}) for key in subjects.keys()]
+        # the largest characteristic sets come first
+        sets.sort(key=lambda s: s[0], reverse=True)
+        return CharacteristicSets(sets)
+
+    @staticmethod
+    def load(path: str) -> 'CharacteristicSets':
+        """Load a catalog of characteristic sets from a file, as written by `save`"""
+        with open(path, 'r') as file:
+            catalog = json.load(file)
+        predicates = catalog['predicates']
+        sets = list()
+        for c_set in catalog['sets']:
+            sets.append((c_set['subjects'], {predicates[p]: (occurrences, distinct) for p, occurrences, distinct in c_set['predicates']}))
+        return CharacteristicSets(sets)
+
+    def save(self, path: str) -> None:
+        """Save the catalog in a file, in JSON format, where each predicate is stored only once"""
+        predicates = sorted(self._index.keys())
+        ids = {predicate: position for position, predicate in enumerate(predicates)}
+        catalog = {
+            'predicates': predicates,
+            'sets': [{'subjects': nb_subjects, 'predicates': [[ids[p], occurrences, distinct] for p, (occurrences, distinct) in c_set.items()]} for nb_subjects, c_set in self._sets]
+        }
+        with open(path, 'w') as file:
+            json.dump(catalog, file, separators=(',', ':'))
+
+    def _supersets(self, predicates: Set[str]) -> Set[int]:
+        """Get the positions of the characteristic sets that contain a set of predicates"""
+        positions = None
+        for predicate in predicates:
+            if predicate not in self._index:
+                return set()
+            positions = set(self._index[predicate]) if positions is None else positions & self._index[predicate]
+        return positions if positions is not None else set(range(len(self._sets)))
+
+    def nb_subjects(self, predicates: Set[str]) -> int:
+        """Get the number of distinct subjects that have all predicates of a set"""
+        return sum(self._sets[position][0] for position in self._supersets(predicates))
+
+    def star_cardinality(self, star: List[Tuple[str, bool]]) -> float:
+        """Estimate the cardinality of a star-shaped join, i.e., of triple patterns that share the same subject.
+
+        For each characteristic set that contains all predicates of the star, the number of subjects that have it is multiplied
+        by the average number of RDF triples per subject of each predicate. When the object of a triple pattern is bound,
+        objects are assumed to be uniformly distributed among the distinct objects of the predicate.
+
+        Argument: The triple patterns of the star, as tuples (`predicate`, `bound object`),
+        where `bound object` is True if the object of the triple pattern is a RDF term.
+
+        Returns: The estimated cardinality of the star-shaped join.
+        """
+        cardinality = 0
+        for position in self._supersets(set([predicate for predicate, _ in star])):
+            nb_subjects, predicates = self._sets[position]
+            estimate = nb_subjects
+            for predicate, bound_object in star:
+                occurrences, distinct = predicates[predicate]
+                estimate *= occurrences / nb_subjects
+                if bound_object:
+                    estimate /= max(1, distinct)
+            cardinality += estimate
+        return cardinality
@@ -2,8 +2,11 @@
 # Author: Thomas MINIER - MIT License 2017-2020
 from datetime import datetime
 from math import inf
-from typing import List, Optional, Tuple
+from os.path import isfile
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
+from sage.database.core.characteristic_sets import CharacteristicSets
+from sage.database.core.lookup_cache import LookupCache
 from sage.database.db_connector import DatabaseConnector
 from sage.database.db_iterator import DBIterator
 
@@ -18,10 +21,14 @@ class Graph(object):
       * connector: Database connector used to search/store RDF triples in this graph.
       * quantum: Time quantum associated with this graph.
       * max_results: Maximum number of results per query when executing a query with this graph.
+      * batch_size: Maximum number of solution mappings fetched per batch when executing a query with this graph (1 disables batching).
       * default_queries: List of queries that can be executed with this graph.
+      * adaptive: True to revise the join orders of the saved plans of this graph when they are reloaded, using the runtime counters saved with them.
+      * statistics: Path to the file storing the characteristic sets of this graph, built using the `sage-statistics` command. It is loaded the first time it is used.
+      * lookup_cache: True to cache the lookups of the inner triple patterns of Index Loop joins in a LRU cache shared by all queries on this graph, or the options of the cache (see `LookupCache`).
     """
 
-    def __init__(self, uri: str, name: str, description: str, connector: DatabaseConnector, quantum=75, max_results=inf, default_queries: List[dict] = list()):
+    def __init__(self, uri: str, name: str, description: str, connector: DatabaseConnector, quantum=75, max_results=inf, batch_size=1, default_queries: List[dict] = list(), adaptive: bool = False, statistics: Optional[str] = None, lookup_cache: Union[bool, Dict[str, int]] = False):
         super(Graph, self).__init__()
         self._uri = uri
         self._name = name
@@ -29,7 +36,13 @@ class Graph(object):
         self._connector = connector
         self._quantum = quantum
         self._max_results = max_results
+        self._batch_size = batch_size
         self._example_queries = default_queries
+        self._adaptive = adaptive
+        self._statistics = statistics
+        self._characteristic_sets = None
+        self._lookup_cache_options = lookup_cache
+        self._lookup_cache = None
     
     @property
     def uri(self) -> str:
@@ -51,6 +64,14 @@ class Graph(object):
     def max_results(self) -> float:
         return self._max_results
 
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    @property
+    def adaptive(self) -> bool:
+        return self._adaptive
+
     @property
     def nb_triples(self) -> int:
         return self._connector.nb_triples
@@ -84,6 +105,143 @@ class Graph(object):
         """
         return self._connector.search(subject, predicate, obj, last_read=last_read, as_of=as_of)
 
+    def estimate(self, subject: str, predicate: str, obj: str, as_of: Optional[datetime] = None) -> int:
+        """Estimate the cardinality of a triple pattern, without opening an iterator over its matching RDF triples.
+
+        Args:
+          * subject: Subject of the triple pattern.
+          * predicate: Predicate of the triple pattern.
+          * obj: Object of the triple pattern.
+          * as_of: A version timestamp. When set, perform all reads against a consistent snapshot represented by this timestamp.
+
+        Returns: The estimated cardinality of the triple pattern.
+        """
+        return self._connector.estimate(subject, predicate, obj, as_of=as_of)
+
+    def sample(self, subject: str, predicate: str, obj: str, size: int, as_of: Optional[datetime] = None) -> List[Tuple[str, str, str]]:
+        """Get a sample of the RDF triples matching a triple pattern.
+
+        Args:
+          * subject: Subject of the triple pattern.
+          * predicate: Predicate of the triple pattern.
+          * obj: Object of the triple pattern.
+          * size: The maximum number of RDF triples to sample.
+          * as_of: A version timestamp. When set, perform all reads against a consistent snapshot represented by this timestamp.
+
+        Returns: At most `size` RDF triples matching the triple pattern.
+        """
+        return self._connector.sample(subject, predicate, obj, size, as_of=as_of)
+
+    def search_ordering(self, subject: str, predicate: str, obj: str) -> List[str]:
+        """Get the positions by which the RDF triples returned by a search are sorted, from the most significant to the least significant"""
+        return self._connector.search_ordering(subject, predicate, obj)
+
+    def supports_batched_lookups(self) -> bool:
+        """Return True if the graph can resolve several triple patterns in a single call, using `search_many`"""
+        return self._connector.supports_batched_lookups()
+
+    def search_many(self, patterns: List[Tuple[str, str, str]], offset: int = 0, as_of: Optional[datetime] = None) -> Iterator[Tuple[int, Tuple[str, str, str]]]:
+        """Get an iterator over all RDF triples matching a list of triple patterns, using a single call to the database.
+
+        Args:
+          * patterns: List of triple patterns (subject, predicate, object) to search for.
+          * offset: Number of RDF triples matching the first triple pattern to skip. Used to resume a search.
+          * as_of: A version timestamp. When set, perform all reads against a consistent snapshot represented by this timestamp.
+
+        Returns:
+          An iterator over tuples (`index`, `triple`), where `index` is the position in the list of the triple pattern matched by the RDF triple `triple`.
+        """
+        return self._connector.search_many(patterns, offset=offset, as_of=as_of)
+
+    def term_dictionary(self) -> Optional[Any]:
+        """Get the dictionary which encodes the RDF terms of the graph as integer IDs, or `None` if the underlying DatabaseConnector does not encode RDF terms"""
+        return self._connector.term_dictionary()
+
+    def search_ids(self, subject: Union[int, str], predicate: Union[int, str], obj: Union[int, str], last_read: Optional[str] = None, as_of: Optional[datetime] = None) -> Tuple[DBIterator, int]:
+        """Get an iterator over all RDF triples matching a triple pattern, as triples of IDs of the term dictionary of the graph.
+
+        Args:
+          * subject: Subject of the triple pattern, as a SPARQL variable, a RDF term or an ID of the term dictionary.
+          * predicate: Predicate of the triple pattern, as a SPARQL variable, a RDF term or an ID of the term dictionary.
+          * object: Object of the triple pattern, as a SPARQL variable, a RDF term or an ID of the term dictionary.
+          * last_read: A RDF triple ID. When set, the search is resumed for this RDF triple.
+          * as_of: A version timestamp. When set, perform all reads against a consistent snapshot represented by this timestamp.
+
+        Returns:
+          A tuple (`iterator`, `cardinality`), where `iterator` is a Python iterator over RDF triples matching the given triples pattern, and `cardinality` is the estimated cardinality of the triple pattern.
+        """
+        return self._connector.search_ids(subject, predicate, obj, last_read=last_read, as_of=as_of)
+
+    def search_many_ids(self, patterns: List[Tuple[Union[int, str], Union[int, str], Union[int, str]]], offset: int = 0, as_of: Optional[datetime] = None) -> Iterator[Tuple[int, Tuple[Any, Any, Any]]]:
+        """Get an iterator over all RDF triples matching a list of triple patterns, as triples of IDs of the term dictionary of the graph, using a single call to the database"""
+        return self._connector.search_many_ids(patterns, offset=offset, as_of=as_of)
+
+    def distinct_values(self, subject: str, predicate: str, obj: str, position: str, cardinality: int) -> int:
+        """Estimate the number of distinct RDF terms found at a position of the RDF triples matching a triple pattern.
+
+        Args:
+          * subject: Subject of the triple pattern.
+          * predicate: Predicate of the triple pattern.
+          * obj: Object of the triple pattern.
+          * position: Position of the RDF terms to count: 'subject', 'predicate' or 'object'.
+          * cardinality: The estimated cardinality of the triple pattern.
+
+        Returns: The estimated number of distinct RDF terms, at least 1.
+        """
+        return self._connector.distinct_values(subject, predicate, obj, position, cardinality)
+
+    def characteristic_sets(self) -> Optional[CharacteristicSets]:
+        """Get the catalog of the characteristic sets of the graph, loading it from disk the first time it is requested.
+
+        Returns: The catalog of the characteristic sets, or the one of the underlying DatabaseConnector if the graph has no catalog stored on disk.
+        """
+        if self._characteristic_sets is None and self._statistics is not None and isfile(self._statistics):
+            self._characteristic_sets = CharacteristicSets.load(self._statistics)
+        if self._characteristic_sets is None:
+            return self._connector.characteristic_sets()
+        return self._characteristic_sets
+
+    def lookup_cache(self) -> Optional[LookupCache]:
+        """Get the cache of the lookups of the inner triple patterns of Index Loop joins, creating it the first time it is requested.
+
+        The cache is shared by all queries executed on the graph by the current process, so it outlives the time quanta of a query.
+        Lookups are keyed on their snapshot timestamp, and the cache is cleared when the graph is updated.
+
+        Returns: The cache, or `None` if lookups are not cached for this graph.
+        """
+        if not self._lookup_cache_options:
+            return None
+        elif self._lookup_cache is None and isinstance(self._lookup_cache_options, dict):
+            self._lookup_cache = LookupCache(**self._lookup_cache_options)
+        elif self._lookup_cache is None:
+            self._lookup_cache = LookupCache()
+        return self._lookup_cache
+
+    def supports_sorted_seek(self) -> bool:
+        """Return True if the graph can efficiently find the RDF terms of a triple pattern in sorted order, using `seek`"""
+        return self._connector.supports_sorted_seek()
+
+    def seek(self, subject: str, predicate: str, obj: str, position: str, lower: Optional[Any] = None, strict: bool = False, as_of: Optional[datetime] = None) -> Optional[Tuple[Any, str]]:
+        """Find the smallest RDF term found at a position of the RDF triples matching a triple pattern, above a lower bound.
+
+        Args:
+          * subject: Subject of the triple pattern.
+          * predicate: Predicate of the triple pattern.
+          * obj: Object of the triple pattern.
+          * position: Position of the RDF terms to find: 'subject', 'predicate' or 'object'.
+          * lower: Key of the lower bound, or `None` to find the smallest RDF term.
+          * strict: True if the RDF term must be strictly above the lower bound.
+          * as_of: A version timestamp. When set, perform all reads against a consistent snapshot represented by this timestamp.
+
+        Returns:
+          A tuple (`key`, `term`) for the RDF term found, or `None` if there is no RDF term above the lower bound.
+        """
+        return self._connector.seek(subject, predicate, obj, position, lower=lower, strict=strict, as_of=as_of)
+
+    def seek_key(self, term: str, position: str) -> Any:
+        """Get the key of a RDF term found at a position of the RDF triples, as returned by `seek`"""
+        return self._connector.seek_key(term, position)
+
     def insert(self, subject: str, predicate: str, obj: str):
         """Insert a RDF triple into the RDF graph.
         
@@ -93,6 +251,8 @@ class Graph(object):
           * obj: Object of the RDF triple.
         """
         self._connector.insert(subject, predicate, obj)
+        if self._lookup_cache is not None:
+            self._lookup_cache.clear()
 
     def delete(self, subject: str, predicate: str, obj: str):
         """Delete a RDF triple from the RDF graph.
@@ -103,6 +263,8 @@ class Graph(object):
           * obj: Object of the RDF triple.
         """
         self._connector.delete(subject, predicate, obj)
+        if self._lookup_cache is not None:
+            self._lookup_cache.clear()
 
     def commit(self) -> None:
         """Commit any ongoing transaction (at the database level)."""
@@ -0,0 +1,172 @@
+# lookup_cache.py
+# Author: Thomas MINIER - MIT License 2017-2020
+from collections import OrderedDict
+from sys import getsizeof
+from typing import Any, Dict, List, Optional, Tuple
+
+from sage.database.db_iterator import DBIterator
+
+# Default maximum number of lookups kept in a cache
+DEFAULT_MAX_ENTRIES = 1024
+
+# Default maximum (estimated) number of bytes used by the RDF triples kept in a cache
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+
+# Default maximum number of RDF triples matching a triple pattern for its lookup to be cached
+DEFAULT_MAX_RESULTS = 64
+
+
+class CachedLookup(object):
+    """The RDF triples matching a triple pattern, with the `last_read` ID of the database iterator after each of them.
+
+    Args:
+      * pattern: The triple pattern.
+      * triples: The RDF triples, in the order they were read.
+      * positions: The `last_read` ID of the database iterator before reading the first RDF triple, then after reading each of them.
+      * dictionary: The dictionary used to encode the RDF terms of the RDF triples as integer IDs, or `None` if they are RDF terms.
+    """
+    __slots__ = ('pattern', 'triples', 'positions', 'dictionary', 'size')
+
+    def __init__(self, pattern: Dict[str, Any], triples: List[Any], positions: List[str], dictionary: Optional[Any] = None):
+        self.pattern = pattern
+        self.triples = triples
+        self.positions = positions
+        self.dictionary = dictionary
+        self.size = getsizeof(triples) + getsizeof(positions) + sum([getsizeof(position) for position in positions])
+        for triple in triples:
+            if triple is not None:
+                self.size += getsizeof(triple) + sum([getsizeof(term) for term in triple])
+
+
+class CachedIterator(DBIterator):
+    """A CachedIterator replays the RDF triples of a cached lookup, then reads the remaining RDF triples from a database iterator, if any.
+
+    Its `last_read` IDs are the ones of the database iterator that read the RDF triples, so it can be saved and resumed like it.
+
+    Args:
+      * lookup: The cached lookup.
+      * source: A database iterator positioned after the last RDF triple of the lookup, or `None` if the lookup holds all RDF triples.
+    """
+
+    def __init__(self, lookup: CachedLookup, source: Optional[DBIterator] = None):
+        super(CachedIterator, self).__init__(lookup.pattern)
+        self._lookup = lookup
+        self._source = source
+        self._position = 0
+
+    def __len__(self) -> int:
+        return len(self._lookup.triples)
+
+    def has_source(self) -> bool:
+        """Return True if the remaining RDF triples are read from a database iterator, once the cached lookup is replayed"""
+        return self._source is not None
+
+    def last_read(self) -> str:
+        """Return the index ID of the last element read"""
+        if self._position >= len(self._lookup.triples) and self._source is not None:
+            return self._source.last_read()
+        return self._lookup.positions[self._position]
+
+    def term_dictionary(self) -> Optional[Any]:
+        """Get the dictionary used to encode the RDF terms of the RDF triples as integer IDs, or `None` if the iterator yields RDF terms"""
+        return self._lookup.dictionary
+
+    def next(self) -> Optional[Tuple[Any, Any, Any]]:
+        """Return the next RDF triple or raise `StopIteration` if there are no more triples to scan"""
+        if self._position < len(self._lookup.triples):
+            self._position += 1
+            return self._lookup.triples[self._position - 1]
+        elif self._source is not None:
+            return self._source.next()
+        raise StopIteration()
+
+    def has_next(self) -> bool:
+        """Return True if there is still results to read, and False otherwise"""
+        return self._position < len(self._lookup.triples) or (self._source is not None and self._source.has_next())
+
+
+class LookupCache(object):
+    """A LRU cache of the RDF triples matching triple patterns, used to avoid searching the same triple pattern several times during the execution of queries.
+
+    Only the lookups of triple patterns with few matches are cached, and the cache is bounded both
+    by its number of lookups and by the (estimated) memory used by their RDF triples.
+
+    Args:
+      * max_entries: Maximum number of lookups kept in the cache.
+      * max_bytes: Maximum number of bytes used by the RDF triples kept in the cache.
+      * max_results: Maximum number of RDF triples matching a triple pattern for its lookup to be cached.
+
+    Example:
+      >>> cache = LookupCache()
+      >>> iterator, cardinality = cache.get(key)
+      >>> if iterator is None:
+      >>>   iterator, cardinality = graph.search(subject, predicate, obj)
+      >>>   iterator = cache.put(key, iterator, cardinality)
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES, max_results: int = DEFAULT_MAX_RESULTS):
+        super(LookupCache, self).__init__()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._max_results = max_results
+        self._lookups = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._lookups)
+
+    @property
+    def nb_bytes(self) -> int:
+        """Get the (estimated) number of bytes used by the RDF triples kept in the cache"""
+        return self._bytes
+
+    def clear(self) -> None:
+        """Remove all lookups from the cache"""
+        self._lookups.clear()
+        self._bytes = 0
+
+    def get(self, key: Any) -> Tuple[Optional[CachedIterator], int]:
+        """Get an iterator over the cached RDF triples of a lookup.
+
+        Argument: The key of the lookup, e.g., its triple pattern.
+
+        Returns: A tuple (`iterator`, `cardinality`), where `iterator` is `None` if the lookup is not in the cache.
+        """
+        lookup = self._lookups.get(key)
+        if lookup is None:
+            self.misses += 1
+            return None, 0
+        self.hits += 1
+        self._lookups.move_to_end(key)
+        return CachedIterator(lookup), len(lookup.triples)
+
+    def put(self, key: Any, iterator: DBIterator, cardinality: int) -> DBIterator:
+        """Cache the RDF triples read by a database iterator, if there are few of them.
+
+        Args:
+          * key: The key of the lookup, e.g., its triple pattern.
+          * iterator: A database iterator which has not been read yet.
+          * cardinality: The estimated cardinality of the triple pattern read by the iterator.
+
+        Returns: An iterator over the RDF triples of the database iterator, to use instead of it.
+        """
+        if cardinality > self._max_results:
+            return iterator
+        triples, positions = list(), [iterator.last_read()]
+        while iterator.has_next() and len(triples) <= self._max_results:
+            triples.append(iterator.next())
+            positions.append(iterator.last_read())
+        pattern = {'subject': iterator.subject, 'predicate': iterator.predicate, 'object': iterator.object}
+        lookup = CachedLookup(pattern, triples, positions, iterator.term_dictionary())
+        # the cardinality was underestimated, so the rest of the RDF triples is read from the database iterator
+        if iterator.has_next():
+            return CachedIterator(lookup, source=iterator)
+        if lookup.size <= self._max_bytes:
+            self._lookups[key] = lookup
+            self._bytes += lookup.size
+            while len(self._lookups) > self._max_entries or self._bytes > self._max_bytes:
+                _, evicted = self._lookups.popitem(last=False)
+                self._bytes -= evicted.size
+        return CachedIterator(lookup)
@@ -6,6 +6,7 @@ from uuid import uuid4
 
 from yaml import FullLoader, load
 
+from sage.database.core.characteristic_sets import catalog_path
 from sage.database.core.dataset import Dataset
 from sage.database.core.graph import Graph
 from sage.database.import_manager import builtin_backends, import_backend
@@ -72,6 +73,15 @@ def load_config(config_file: str) -> Dataset:
         logging.warning("You are using SaGe without limitations on the number of results sent per page. This is fine, but be carefull as very large page of results can have unexpected serialization time.")
         max_results = inf
 
+    # get default number of solution mappings fetched per batch (1 disables batching)
+    batch_size = config['batch_size'] if 'batch_size' in config else 1
+
+    # revise the join orders of saved plans when they are reloaded (disabled by default)
+    adaptive = config['adaptive'] if 'adaptive' in config else False
+
+    # cache the inner lookups of Index Loop joins during query execution (disabled by default)
+    lookup_cache = config['lookup_cache'] if 'lookup_cache' in config else False
+
     #get default-graph-uri
     default_graph=None
     if 'default_graph_uri' in config:
@@ -90,7 +100,11 @@ def load_config(config_file: str) -> Dataset:
         g_description = g_config["description"] if "description" in g_config else f"Unnamed RDF graph with id {g_name}"
         g_quantum = g_config["quota"] if "quota" in g_config else quantum
         g_max_results = g_config["max_results"] if "max_results" in g_config else max_results
+        g_batch_size = g_config["batch_size"] if "batch_size" in g_config else batch_size
         g_queries = g_config["queries"] if "queries" in g_config else list()
+        g_adaptive = g_config["adaptive"] if "adaptive" in g_config else adaptive
+        g_lookup_cache = g_config["lookup_cache"] if "lookup_cache" in g_config else lookup_cache
+        g_statistics = catalog_path(g_config)
 
         # load the graph connector using available backends
         if "backend" in g_config and g_config["backend"] in backends:
@@ -100,7 +114,7 @@ def load_config(config_file: str) -> Dataset:
             continue
 
         # build the graph and register it using its URI
-        graphs[g_uri] = Graph(g_uri, g_name, g_description, g_connector, quantum=g_quantum, max_results=g_max_results, default_queries=g_queries)
+        graphs[g_uri] = Graph(g_uri, g_name, g_description, g_connector, quantum=g_quantum, max_results=g_max_results, batch_size=g_batch_size, default_queries=g_queries, adaptive=g_adaptive, statistics=g_statistics, lookup_cache=g_lookup_cache)
         logging.info(f"RDF Graph '{g_uri}'  (backend: {g_config['backend']}) successfully loaded")
 
     if default_graph is not None and graphs[default_graph] is None:
@@ -1,9 +1,12 @@
 # db_connector.py
 # Author: Thomas MINIER - MIT License 2017-2020
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Any, Iterator, List, Optional, Tuple, Union
 
+from sage.database.core.characteristic_sets import CharacteristicSets
+from sage.database.core.lookup_cache import LookupCache
 from sage.database.db_iterator import DBIterator
 
 
@@ -53,6 +56,214 @@ class DatabaseConnector(ABC):
         """
         pass
 
+    def estimate(self, subject: str, predicate: str, obj: str, as_of: Optional[datetime] = None) -> int:
+        """Estimate the cardinality of a triple pattern, without opening an iterator over its matching RDF triples.
+
+        If not overrided, this method performs a search and discards its iterator.
+
+        Args:
+          * subject: Subject of the triple pattern.
+          * predicate: Predicate of the triple pattern.
+          * obj: Object of the triple pattern.
+          * as_of: A version timestamp. When set, perform all reads against a consistent snapshot represented by this timestamp.
+
+        Returns: The estimated cardinality of the triple pattern, as returned by `search`.
+        """
+        _, cardinality = self.search(subject, predicate, obj, as_of=as_of)
+        return cardinality
+
+    def sample(self, subject: str, predicate: str, obj: str, size: int, as_of: Optional[datetime] = None) -> List[Tuple[str, str, str]]:
+        """Get a sample of the RDF triples matching a triple pattern.
+
+        If not overrided, this method reads the first RDF triples returned by a search,
+        which are not uniformly distributed when the RDF triples are sorted.
+
+        Args:
+          * subject: Subject of the triple pattern.
+          * predicate: Predicate of the triple pattern.
+          * obj: Object of the triple pattern.
+          * size: The maximum number of RDF triples to sample.
+          * as_of: A version timestamp. When set, perform all reads against a consistent snapshot represented by this timestamp.
+
+        Returns: At most `size` RDF triples matching the triple pattern.
+        """
+        iterator, _ = self.search(subject, predicate, obj, as_of=as_of)
+        triples = list()
+        while len(triples) < size and iterator.has_next():
+            triple = iterator.next()
+            if triple is not None:
+                triples.append(triple)
+        return triples
+
+    def search_ordering(self, subject: str, predicate: str, obj: str) -> List[str]:
+        """Get the order of the RDF triples returned by a search, without opening an iterator over them.
+
+        Args:
+          * subject: Subject of the triple pattern.
+          * predicate: Predicate of the triple pattern.
+          * obj: Object of the triple pattern.
+
+        Returns: The positions ('subject', 'predicate' or 'object') by which the RDF triples are sorted, from the most significant to the least significant, as returned by the `ordering` method of the iterator.
+        """
+        return list()
+
+    def supports_batched_lookups(self) -> bool:
+        """Return True if the connector can resolve several triple patterns in a single call, using `search_many`"""
+        return False
+
+    def search_many(self, patterns: List[Tuple[str, str, str]], offset: int = 0, as_of: Optional[datetime] = None) -> Iterator[Tuple[int, Tuple[str, str, str]]]:
+        """Get an iterator over all RDF triples matching a list of triple patterns, using a single call to the database.
+
+        RDF triples are yielded grouped by triple pattern, in the order of the patterns in the list.
+
+        Args:
+          * patterns: List of triple patterns (subject, predicate, object) to search for.
+          * offset: Number of RDF triples matching the first triple pattern to skip. Used to resume a search.
+          * as_of: A version timestamp. When set, perform all reads against a consistent snapshot represented by this timestamp.
+
+        Returns:
+          An iterator over tuples (`index`, `triple`), where `index` is the position in the list of the triple pattern matched by the RDF triple `triple`.
+
+        Throws: `NotImplementedError` if the connector does not support batched lookups.
+
+        Example:
+          >>> patterns = [('?s', 'http://xmlns.com/foaf/0.1/name', '"Ann"'), ('?s', 'http://xmlns.com/foaf/0.1/name', '"Bob"')]
+          >>> for index, (s, p, o) in connector.search_many(patterns):
+          >>>   print(f"RDF Triple {s} {p} {o} matches the triple pattern {patterns[index]}")
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support batched lookups")
+
+    def term_dictionary(self) -> Optional[Any]:
+        """Get the dictionary which encodes the RDF terms of the database as integer IDs, used by `search_ids` and `search_many_ids`.
+
+        A dictionary gives a single ID to each RDF term, and provides the methods `encode(term)`, `decode(id)` and `may_be_literal(id)`.
+        If not overrided, this method returns `None`, as RDF terms are not encoded.
+
+        Returns: The term dictionary, or `None` if the connector does not encode RDF terms.
+        """
+        return None
+
+    def search_ids(self, subject: Union[int, str], predicate: Union[int, str], obj: Union[int, str], last_read: Optional[str] = None, as_of: Optional[datetime] = None) -> Tuple[DBIterator, int]:
+        """Get an iterator over all RDF triples matching a triple pattern, as triples of IDs of the term dictionary (see `term_dictionary`).
+
+        The terms of the triple pattern are SPARQL variables, RDF terms or IDs of the term dictionary.
+        If not overrided, this method is the same as `search`, as RDF terms are not encoded.
+
+        Args:
+          * subject: Subject of the triple pattern.
+          * predicate: Predicate of the triple pattern.
+          * object: Object of the triple pattern.
+          * last_read: A RDF triple ID. When set, the search is resumed for this RDF triple.
+          * as_of: A version timestamp. When set, perform all reads against a consistent snapshot represented by this timestamp.
+
+        Returns:
+          A tuple (`iterator`, `cardinality`), where `iterator` is a Python iterator over RDF triples matching the given triples pattern, and `cardinality` is the estimated cardinality of the triple pattern.
+        """
+        return self.search(subject, predicate, obj, last_read=last_read, as_of=as_of)
+
+    def search_many_ids(self, patterns: List[Tuple[Union[int, str], Union[int, str], Union[int, str]]], offset: int = 0, as_of: Optional[datetime] = None) -> Iterator[Tuple[int, Tuple[Any, Any, Any]]]:
+        """Get an iterator over all RDF triples matching a list of triple patterns, as triples of IDs of the term dictionary (see `search_ids`).
+
+        If not overrided, this method is the same as `search_many`, as RDF terms are not encoded.
+        """
+        return self.search_many(patterns, offset=offset, as_of=as_of)
+
+    def distinct_values(self, subject: str, predicate: str, obj: str, position: str, cardinality: int) -> int:
+        """Estimate the number of distinct RDF terms found at a position of the RDF triples matching a triple pattern.
+
+        If not overrided, this method bounds the cardinality of the triple pattern
+        by the number of distinct subjects, predicates or objects in the database.
+
+        Args:
+          * subject: Subject of the triple pattern.
+          * predicate: Predicate of the triple pattern.
+          * obj: Object of the triple pattern.
+          * position: Position of the RDF terms to count: 'subject', 'predicate' or 'object'. It must be a SPARQL variable in the triple pattern.
+          * cardinality: The estimated cardinality of the triple pattern.
+
+        Returns: The estimated number of distinct RDF terms, at least 1.
+        """
+        totals = {'subject': self.nb_subjects, 'predicate': self.nb_predicates, 'object': self.nb_objects}
+        total = totals[position]
+        if total is not None and total > 0:
+            cardinality = min(cardinality, total)
+        return max(1, cardinality)
+
+    def characteristic_sets(self) -> Optional[CharacteristicSets]:
+        """Get the catalog of the characteristic sets of the RDF triples stored by the connector.
+
+        If not overrided, this method returns `None`, as catalogs are built offline and attached to RDF graphs (see `Graph.characteristic_sets`).
+
+        Returns: The catalog of the characteristic sets, or `None` if there is none.
+        """
+        return None
+
+    def lookup_cache(self) -> Optional[LookupCache]:
+        """Get the cache for the lookups of the inner triple patterns of Index Loop joins.
+
+        If not overrided, this method returns `None`, as caches are enabled per RDF graph (see `Graph.lookup_cache`).
+
+        Returns: The cache, or `None` if lookups must not be cached.
+        """
+        return None
+
+    def supports_sorted_seek(self) -> bool:
+        """Return True if the connector can efficiently find the RDF terms of a triple pattern in sorted order, using `seek`"""
+        return False
+
+    def seek(self, subject: str, predicate: str, obj: str, position: str, lower: Optional[Any] = None, strict: bool = False, as_of: Optional[datetime] = None) -> Optional[Tuple[Any, str]]:
+        """Find the smallest RDF term found at a position of the RDF triples matching a triple pattern, above a lower bound.
+
+        RDF terms are compared using keys, which are only meaningful to the connector that produced them.
+        Two RDF terms with different keys are always different, but two different RDF terms found
+        at different positions may share the same key.
+
+        If not overrided, this method reads all RDF triples matching the triple pattern and sorts their RDF terms,
+        which is only suitable for in-memory databases.
+
+        Args:
+          * subject: Subject of the triple pattern.
+          * predicate: Predicate of the triple pattern.
+          * obj: Object of the triple pattern.
+          * position: Position of the RDF terms to find: 'subject', 'predicate' or 'object'. It must be a SPARQL variable in the triple pattern.
+          * lower: Key of the lower bound, or `None` to find the smallest RDF term.
+          * strict: True if the RDF term must be strictly above the lower bound.
+          * as_of: A version timestamp. When set, perform all reads against a consistent snapshot represented by this timestamp.
+
+        Returns:
+          A tuple (`key`, `term`) for the RDF term found, or `None` if there is no RDF term above the lower bound.
+
+        Example:
+          >>> key, term = connector.seek('?s', 'http://xmlns.com/foaf/0.1/knows', '?o', 'subject')
+          >>> next_key, next_term = connector.seek('?s', 'http://xmlns.com/foaf/0.1/knows', '?o', 'subject', lower=key, strict=True)
+        """
+        iterator, _ = self.search(subject, predicate, obj, as_of=as_of)
+        index = ['subject', 'predicate', 'object'].index(position)
+        terms = set()
+        while iterator.has_next():
+            triple = iterator.next()
+            if triple is not None:
+                terms.add(triple[index])
+        terms = sorted(terms)
+        if lower is None:
+            found = 0
+        elif strict:
+            found = bisect_right(terms, lower)
+        else:
+            found = bisect_left(terms, lower)
+        return (terms[found], terms[found]) if found < len(terms) else None
+
+    def seek_key(self, term: str, position: str) -> Any:
+        """Get the key of a RDF term found at a position of the RDF triples, as returned by `seek`.
+
+        Args:
+          * term: A RDF term.
+          * position: Position of the RDF term: 'subject', 'predicate' or 'object'.
+
+        Returns: The key of the RDF term.
+        """
+        return term
+
     @abstractmethod
     def from_config(config: dict):
         """Build a DatabaseConnector from a dictionnary"""
@@ -1,7 +1,7 @@
 # db_iterator.py
 # Author: Thomas MINIER - MIT License 2017-2020
 from abc import ABC, abstractmethod
-from typing import Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class DBIterator(ABC):
@@ -37,6 +37,28 @@ class DBIterator(ABC):
         """Return the index ID of the last element read"""
         pass
 
+    def ordering(self) -> List[str]:
+        """Get the positions ('subject', 'predicate' or 'object') by which the RDF triples are sorted, from the most significant to the least significant.
+
+        An empty list means that the RDF triples are not yielded in any particular order.
+        """
+        return list()
+
+    def order_key(self, term: str, position: str) -> Any:
+        """Get the key used to compare a RDF term found at a position of the RDF triples, following the order of the iterator.
+
+        Args:
+          * term: A RDF term read from the iterator.
+          * position: Position of the RDF term in the RDF triple: 'subject', 'predicate' or 'object'.
+
+        Returns: A key such that RDF triples are yielded by ascending keys.
+        """
+        return term
+
+    def term_dictionary(self) -> Optional[Any]:
+        """Get the dictionary used to encode the RDF terms of the RDF triples as integer IDs, or `None` if the iterator yields RDF terms"""
+        return None
+
     @abstractmethod
     def next(self) -> Tuple[str, str, str]:
         """Return the next RDF triple or raise `StopIteration` if there are no more triples to scan"""
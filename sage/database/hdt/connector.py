@@ -1,15 +1,38 @@
 # hdt_file_connector.py
 # Author: Thomas MINIER - MIT License 2017-2020
 import os.path
-from typing import Optional, Tuple
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Any, Iterator, List, Optional, Tuple, Union
 
 from hdt import HDTDocument
 
 from sage.database.db_connector import DatabaseConnector
-from sage.database.hdt.iterator import HDTIterator
+from sage.database.db_iterator import DBIterator, EmptyIterator
+from sage.database.hdt.dictionary import HDTDictionary
+from sage.database.hdt.iterator import IDENTIFIER_POSITIONS, HDTIdIterator, HDTIterator
+from sage.database.utils import get_kind
 
 from datetime import datetime
 
+# Order of the RDF triples returned by a HDT search, for each type of triple pattern
+HDT_ORDERINGS = {
+    'spo': ['subject', 'predicate', 'object'],
+    'sp?': ['subject', 'predicate', 'object'],
+    's??': ['subject', 'predicate', 'object'],
+    '???': ['subject', 'predicate', 'object'],
+    's?o': ['subject', 'object', 'predicate'],
+    '?p?': ['predicate', 'subject', 'object'],
+    '?po': ['predicate', 'object', 'subject'],
+    '??o': ['object', 'predicate', 'subject']
+}
+
+# Maximum cardinality of a triple pattern for which the number of distinct RDF terms is counted exactly
+DISTINCT_SCAN_LIMIT = 1000
+
+# Maximum number of sorted lists of RDF term IDs kept in memory by a connector, used by seeks that cannot follow the HDT indexes
+SORTED_IDS_CACHE_SIZE = 64
+
 class HDTFileConnector(DatabaseConnector):
     """A HDTFileConnector search for RDF triples in a HDT file.
     
@@ -22,6 +45,8 @@ class HDTFileConnector(DatabaseConnector):
     def __init__(self, file: str, mapped=True, indexed=True):
         super(HDTFileConnector, self).__init__()
         self._hdt = HDTDocument(file, map=mapped, indexed=indexed)
+        self._sorted_ids = OrderedDict()
+        self._dictionary = HDTDictionary(self._hdt)
 
     def search(self, subject: str, predicate: str, obj: str, last_read: Optional[str] = None, as_of: Optional[datetime] = None) -> Tuple[HDTIterator, int]:
         """Get an iterator over all RDF triples matching a triple pattern.
@@ -42,8 +67,251 @@ class HDTFileConnector(DatabaseConnector):
         # convert None & empty string to offset = 0
         offset = 0 if last_read is None or last_read == '' else int(float(last_read))
         pattern = {'subject': subject, 'predicate': predicate, 'object': obj}
+        ordering = HDT_ORDERINGS[get_kind(subject or None, predicate or None, obj or None)]
         iterator, card = self._hdt.search_triples(subject, predicate, obj, offset=offset)
-        return HDTIterator(iterator, pattern, start_offset=offset), card
+        return HDTIterator(iterator, pattern, start_offset=offset, document=self._hdt, ordering=ordering), card
+
+    def term_dictionary(self) -> HDTDictionary:
+        """Get the dictionary which encodes the RDF terms of the HDT file as global integer IDs, used by `search_ids`"""
+        return self._dictionary
+
+    def _local_ids(self, subject: Union[int, str], predicate: Union[int, str], obj: Union[int, str]) -> Optional[Tuple[int, int, int]]:
+        """Get the HDT IDs of a triple pattern, where 0 stands for SPARQL variables, or `None` if a RDF term of the pattern does not appear at its position in the HDT file"""
+        ids = list()
+        for position, term in [('subject', subject), ('predicate', predicate), ('object', obj)]:
+            if term is None or (type(term) is str and (term == '' or term.startswith('?'))):
+                ids.append(0)
+                continue
+            local_id = self._dictionary.local(term, position) if type(term) is int else self._hdt.convert_term(term, IDENTIFIER_POSITIONS[position])
+            if not local_id:
+                return None
+            ids.append(local_id)
+        return tuple(ids)
+
+    def search_ids(self, subject: Union[int, str], predicate: Union[int, str], obj: Union[int, str], last_read: Optional[str] = None, as_of: Optional[datetime] = None) -> Tuple[DBIterator, int]:
+        """Get an iterator over all RDF triples matching a triple pattern, as triples of global IDs (see `HDTDictionary`).
+
+        RDF triples are read in the same order as with `search`, so both methods share the same `last_read` IDs.
+
+        Args:
+          * subject: Subject of the triple pattern, as a SPARQL variable, a RDF term or a global ID.
+          * predicate: Predicate of the triple pattern, as a SPARQL variable, a RDF term or a global ID.
+          * object: Object of the triple pattern, as a SPARQL variable, a RDF term or a global ID.
+          * last_read: A RDF triple ID. When set, the search is resumed for this RDF triple.
+          * as_of: A version timestamp. Ignored, as HDT files are read-only.
+
+        Returns:
+          A tuple (`iterator`, `cardinality`), where `iterator` is a Python iterator over RDF triples of global IDs matching the given triples pattern, and `cardinality` is the estimated cardinality of the triple pattern.
+        """
+        offset = 0 if last_read is None or last_read == '' else int(float(last_read))
+        pattern = {'subject': subject, 'predicate': predicate, 'object': obj}
+        ids = self._local_ids(subject, predicate, obj)
+        if ids is None:
+            return EmptyIterator(pattern), 0
+        ordering = HDT_ORDERINGS[get_kind(*[str(local_id) if local_id > 0 else None for local_id in ids])]
+        iterator, card = self._hdt.search_triples_ids(*ids, offset=offset)
+        return HDTIdIterator(iterator, pattern, self._dictionary, start_offset=offset, document=self._hdt, ordering=ordering), card
+
+    def estimate(self, subject: str, predicate: str, obj: str, as_of: Optional[datetime] = None) -> int:
+        """Estimate the cardinality of a triple pattern, using the HDT indexes.
+
+        Args:
+          * subject: Subject of the triple pattern.
+          * predicate: Predicate of the triple pattern.
+          * obj: Object of the triple pattern.
+          * as_of: A version timestamp. Ignored, as HDT files are read-only.
+
+        Returns: The estimated cardinality of the triple pattern.
+        """
+        subject = subject if (subject is not None) and (not subject.startswith('?')) else ""
+        predicate = predicate if (predicate is not None) and (not predicate.startswith('?')) else ""
+        obj = obj if (obj is not None) and (not obj.startswith('?')) else ""
+        _, card = self._hdt.search_triples(subject, predicate, obj, limit=1)
+        return card
+
+    def sample(self, subject: str, predicate: str, obj: str, size: int, as_of: Optional[datetime] = None) -> List[Tuple[str, str, str]]:
+        """Get a sample of the RDF triples matching a triple pattern, read at evenly spaced offsets of the HDT indexes.
+
+        Args:
+          * subject: Subject of the triple pattern.
+          * predicate: Predicate of the triple pattern.
+          * obj: Object of the triple pattern.
+          * size: The maximum number of RDF triples to sample.
+          * as_of: A version timestamp. Ignored, as HDT files are read-only.
+
+        Returns: At most `size` RDF triples matching the triple pattern.
+        """
+        subject = subject if (subject is not None) and (not subject.startswith('?')) else ""
+        predicate = predicate if (predicate is not None) and (not predicate.startswith('?')) else ""
+        obj = obj if (obj is not None) and (not obj.startswith('?')) else ""
+        _, card = self._hdt.search_triples(subject, predicate, obj, limit=1)
+        step = max(1, card // max(1, size))
+        triples = list()
+        for offset in range(0, min(card, step * size), step):
+            iterator, _ = self._hdt.search_triples(subject, predicate, obj, offset=offset, limit=1)
+            triples += list(iterator)
+        return triples
+
+    def search_ordering(self, subject: str, predicate: str, obj: str) -> List[str]:
+        """Get the positions by which the RDF triples returned by a search are sorted, from the most significant to the least significant"""
+        subject = subject if (subject is not None) and (not subject.startswith('?')) else None
+        predicate = predicate if (predicate is not None) and (not predicate.startswith('?')) else None
+        obj = obj if (obj is not None) and (not obj.startswith('?')) else None
+        return HDT_ORDERINGS[get_kind(subject, predicate, obj)]
+
+    def supports_batched_lookups(self) -> bool:
+        """Return False, as `search_many` looks up the triple patterns one after the other, so it issues as many searches as Index Loop joins"""
+        return False
+
+    def search_many(self, patterns: List[Tuple[str, str, str]], offset: int = 0, as_of: Optional[datetime] = None) -> Iterator[Tuple[int, Tuple[str, str, str]]]:
+        """Get an iterator over all RDF triples matching a list of triple patterns.
+
+        The HDT file is searched in-process, so the patterns are looked up one after the other,
+        and each lookup is only performed once the RDF triples of the previous pattern have been consumed.
+
+        Args:
+          * patterns: List of triple patterns (subject, predicate, object) to search for.
+          * offset: Number of RDF triples matching the first triple pattern to skip. Used to resume a search.
+          * as_of: A version timestamp. Ignored, as HDT files are read-only.
+
+        Returns:
+          An iterator over tuples (`index`, `triple`), where `index` is the position in the list of the triple pattern matched by the RDF triple `triple`.
+        """
+        for index, (subject, predicate, obj) in enumerate(patterns):
+            subject = subject if (subject is not None) and (not subject.startswith('?')) else ""
+            predicate = predicate if (predicate is not None) and (not predicate.startswith('?')) else ""
+            obj = obj if (obj is not None) and (not obj.startswith('?')) else ""
+            iterator, _ = self._hdt.search_triples(subject, predicate, obj, offset=offset if index == 0 else 0)
+            for triple in iterator:
+                yield index, triple
+
+    def search_many_ids(self, patterns: List[Tuple[Union[int, str], Union[int, str], Union[int, str]]], offset: int = 0, as_of: Optional[datetime] = None) -> Iterator[Tuple[int, Tuple[int, int, int]]]:
+        """Get an iterator over all RDF triples matching a list of triple patterns, as triples of global IDs (see `search_ids`).
+
+        Args:
+          * patterns: List of triple patterns (subject, predicate, object) to search for, whose terms are SPARQL variables, RDF terms or global IDs.
+          * offset: Number of RDF triples matching the first triple pattern to skip. Used to resume a search.
+          * as_of: A version timestamp. Ignored, as HDT files are read-only.
+
+        Returns:
+          An iterator over tuples (`index`, `triple`), where `index` is the position in the list of the triple pattern matched by the RDF triple of global IDs `triple`.
+        """
+        triple = self._dictionary.triple
+        for index, (subject, predicate, obj) in enumerate(patterns):
+            ids = self._local_ids(subject, predicate, obj)
+            if ids is None:
+                continue
+            iterator, _ = self._hdt.search_triples_ids(*ids, offset=offset if index == 0 else 0)
+            for ids in iterator:
+                yield index, triple(ids)
+
+    def distinct_values(self, subject: str, predicate: str, obj: str, position: str, cardinality: int) -> int:
+        """Estimate the number of distinct RDF terms found at a position of the RDF triples matching a triple pattern.
+
+        The RDF terms are counted exactly, using their IDs, when the triple pattern has at most `DISTINCT_SCAN_LIMIT` matches.
+
+        Args:
+          * subject: Subject of the triple pattern.
+          * predicate: Predicate of the triple pattern.
+          * obj: Object of the triple pattern.
+          * position: Position of the RDF terms to count: 'subject', 'predicate' or 'object'.
+          * cardinality: The estimated cardinality of the triple pattern.
+
+        Returns: The estimated number of distinct RDF terms, at least 1.
+        """
+        if cardinality > DISTINCT_SCAN_LIMIT:
+            return super(HDTFileConnector, self).distinct_values(subject, predicate, obj, position, cardinality)
+        ids = list()
+        for name, term in [('subject', subject), ('predicate', predicate), ('object', obj)]:
+            ids.append(0 if term is None or term.startswith('?') else self._hdt.convert_term(term, IDENTIFIER_POSITIONS[name]))
+            if ids[-1] == 0 and not (term is None or term.startswith('?')):
+                return 1
+        index = ['subject', 'predicate', 'object'].index(position)
+        iterator, _ = self._hdt.search_triples_ids(*ids)
+        return max(1, len({triple[index] for triple in iterator}))
+
+    def supports_sorted_seek(self) -> bool:
+        """Return True if the connector can efficiently find the RDF terms of a triple pattern in sorted order, using `seek`"""
+        return True
+
+    def _id_at(self, pattern: Tuple[int, int, int], index: int, offset: int) -> Optional[int]:
+        """Get the ID of the RDF term at a position of the RDF triple found at an offset of a search, or `None` if the offset is out of range"""
+        try:
+            iterator, _ = self._hdt.search_triples_ids(*pattern, limit=1, offset=offset)
+            triple = next(iterator, None)
+        except RuntimeError:
+            return None
+        return triple[index] if triple is not None else None
+
+    def _sorted_ids_of(self, pattern: Tuple[int, int, int], index: int) -> List[int]:
+        """Get the sorted list of IDs of all RDF terms found at a position of the RDF triples matching a pattern of IDs"""
+        cache_key = (pattern, index)
+        if cache_key in self._sorted_ids:
+            self._sorted_ids.move_to_end(cache_key)
+            return self._sorted_ids[cache_key]
+        iterator, _ = self._hdt.search_triples_ids(*pattern)
+        ids = sorted({triple[index] for triple in iterator})
+        self._sorted_ids[cache_key] = ids
+        if len(self._sorted_ids) > SORTED_IDS_CACHE_SIZE:
+            self._sorted_ids.popitem(last=False)
+        return ids
+
+    def seek(self, subject: str, predicate: str, obj: str, position: str, lower: Optional[Any] = None, strict: bool = False, as_of: Optional[datetime] = None) -> Optional[Tuple[Any, str]]:
+        """Find the smallest RDF term found at a position of the RDF triples matching a triple pattern, above a lower bound.
+
+        Keys are the IDs of the RDF terms in the HDT dictionary. When `position` is the first position
+        of the index order which is not bound in the triple pattern, the RDF triples matching the pattern are sorted by the IDs
+        of their RDF terms at this position, so the RDF term is found using a binary search over the offsets of the search.
+        Otherwise, the sorted list of IDs of all RDF terms found at this position is built once and cached.
+
+        Args:
+          * subject: Subject of the triple pattern.
+          * predicate: Predicate of the triple pattern.
+          * obj: Object of the triple pattern.
+          * position: Position of the RDF terms to find: 'subject', 'predicate' or 'object'.
+          * lower: ID of the lower bound, or `None` to find the smallest RDF term.
+          * strict: True if the RDF term must be strictly above the lower bound.
+          * as_of: A version timestamp. Ignored, as HDT files are read-only.
+
+        Returns:
+          A tuple (`key`, `term`) for the RDF term found, or `None` if there is no RDF term above the lower bound.
+        """
+        terms = {'subject': subject, 'predicate': predicate, 'object': obj}
+        ids = dict()
+        for name, term in terms.items():
+            if term is None or term.startswith('?'):
+                ids[name] = 0
+            else:
+                ids[name] = self._hdt.convert_term(term, IDENTIFIER_POSITIONS[name])
+                # the RDF term is not in the HDT dictionary, so the triple pattern has no matches
+                if ids[name] == 0:
+                    return None
+        pattern = (ids['subject'], ids['predicate'], ids['object'])
+        index = ['subject', 'predicate', 'object'].index(position)
+        bound = lower if lower is None or not strict else lower + 1
+        kind = get_kind(*[term if ids[name] > 0 else None for name, term in terms.items()])
+        leading = [name for name in HDT_ORDERINGS[kind] if ids[name] == 0][0]
+        if leading == position:
+            _, cardinality = self._hdt.search_triples_ids(*pattern)
+            # the cardinality may be overestimated, but it must not be underestimated for the binary search to be correct
+            if self._id_at(pattern, index, cardinality) is None:
+                low, high = 0, cardinality
+                while bound is not None and low < high:
+                    middle = (low + high) // 2
+                    found = self._id_at(pattern, index, middle)
+                    if found is not None and found < bound:
+                        low = middle + 1
+                    else:
+                        high = middle
+                found = self._id_at(pattern, index, low)
+                return (found, self._hdt.convert_id(found, IDENTIFIER_POSITIONS[position])) if found is not None else None
+        sorted_ids = self._sorted_ids_of(pattern, index)
+        found = bisect_left(sorted_ids, bound) if bound is not None else 0
+        return (sorted_ids[found], self._hdt.convert_id(sorted_ids[found], IDENTIFIER_POSITIONS[position])) if found < len(sorted_ids) else None
+
+    def seek_key(self, term: str, position: str) -> Any:
+        """Get the key of a RDF term found at a position of the RDF triples, i.e., its ID in the HDT dictionary"""
+        return self._hdt.convert_term(term, IDENTIFIER_POSITIONS[position])
 
     @property
     def nb_triples(self) -> int:
@@ -0,0 +1,108 @@
+# dictionary.py
+# Author: Thomas MINIER - MIT License 2017-2020
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from hdt import HDTDocument, IdentifierPosition
+
+# Default maximum number of RDF terms kept decoded in memory by a dictionary
+DECODE_CACHE_SIZE = 65536
+
+
+class HDTDictionary(object):
+    """The dictionary of a HDT file, which gives a single integer ID to each RDF term, whatever the positions where it appears.
+
+    HDT numbers subjects, predicates and objects separately: terms shared by the subjects and the objects have the same ID at both positions,
+    but other subjects and objects may have the same ID, and predicates have their own IDs. Global IDs are laid out as follows:
+      * `1` to `nb_subjects`: the subjects, with their HDT IDs.
+      * `nb_subjects + 1` to `nb_subjects + nb_objects - nb_shared`: the objects which are not subjects.
+      * Above: the predicates which are neither subjects nor objects. Other predicates have the ID of the subject or the object.
+
+    So two RDF terms are equal if and only if they have the same global ID. Decoded RDF terms are kept in a LRU cache.
+
+    Args:
+      * document: The HDT document.
+      * cache_size: Maximum number of decoded RDF terms kept in memory.
+    """
+
+    def __init__(self, document: HDTDocument, cache_size: int = DECODE_CACHE_SIZE):
+        super(HDTDictionary, self).__init__()
+        self._document = document
+        self._nb_shared = document.nb_shared
+        self._nb_subjects = document.nb_subjects
+        self._objects_end = self._nb_subjects + document.nb_objects - self._nb_shared
+        # global IDs of the predicates, indexed by their HDT IDs, and the reverse mapping, built on first use
+        self._predicates: Optional[List[int]] = None
+        self._predicate_ids = None
+        self.decode = lru_cache(maxsize=cache_size)(self._decode)
+        self.encode = lru_cache(maxsize=cache_size)(self._encode)
+
+    def _load_predicates(self) -> None:
+        """Compute the global IDs of all predicates"""
+        self._predicates = [0]
+        for predicate_id in range(1, self._document.nb_predicates + 1):
+            term = self._document.convert_id(predicate_id, IdentifierPosition.Predicate)
+            global_id = self._from_subject_or_object(term)
+            self._predicates.append(global_id if global_id is not None else self._objects_end + predicate_id)
+        self._predicate_ids = {global_id: predicate_id for predicate_id, global_id in enumerate(self._predicates) if predicate_id > 0}
+
+    def _from_subject_or_object(self, term: str) -> Optional[int]:
+        """Get the global ID of a RDF term from the subjects or objects sections, or `None` if it is in none of them"""
+        subject_id = self._document.convert_term(term, IdentifierPosition.Subject)
+        if subject_id > 0:
+            return subject_id
+        object_id = self._document.convert_term(term, IdentifierPosition.Object)
+        if object_id > 0:
+            return self.from_object(object_id)
+        return None
+
+    def from_object(self, object_id: int) -> int:
+        """Get the global ID of an object from its HDT ID"""
+        return object_id if object_id <= self._nb_shared else object_id - self._nb_shared + self._nb_subjects
+
+    def from_predicate(self, predicate_id: int) -> int:
+        """Get the global ID of a predicate from its HDT ID"""
+        if self._predicates is None:
+            self._load_predicates()
+        return self._predicates[predicate_id]
+
+    def triple(self, ids: Tuple[int, int, int]) -> Tuple[int, int, int]:
+        """Convert a RDF triple of HDT IDs, as read from the HDT file, into a RDF triple of global IDs"""
+        if self._predicates is None:
+            self._load_predicates()
+        subject_id, predicate_id, object_id = ids
+        return (subject_id, self._predicates[predicate_id], object_id if object_id <= self._nb_shared else object_id - self._nb_shared + self._nb_subjects)
+
+    def local(self, global_id: int, position: str) -> Optional[int]:
+        """Get the HDT ID of a RDF term at a position ('subject', 'predicate' or 'object'), or `None` if the RDF term never appears at this position"""
+        if position == 'subject':
+            return global_id if global_id <= self._nb_subjects else None
+        elif position == 'object':
+            if global_id <= self._nb_shared:
+                return global_id
+            elif self._nb_subjects < global_id <= self._objects_end:
+                return global_id - self._nb_subjects + self._nb_shared
+            return None
+        if self._predicates is None:
+            self._load_predicates()
+        return self._predicate_ids.get(global_id)
+
+    def may_be_literal(self, global_id: int) -> bool:
+        """Return True if a RDF term may be a literal, i.e., it only appears as an object"""
+        return self._nb_subjects < global_id <= self._objects_end
+
+    def _decode(self, global_id: int) -> str:
+        """Get the RDF term of a global ID (see `decode`, which caches it)"""
+        if global_id <= self._nb_subjects:
+            return self._document.convert_id(global_id, IdentifierPosition.Subject)
+        elif global_id <= self._objects_end:
+            return self._document.convert_id(global_id - self._nb_subjects + self._nb_shared, IdentifierPosition.Object)
+        return self._document.convert_id(global_id - self._objects_end, IdentifierPosition.Predicate)
+
+    def _encode(self, term: str) -> Optional[int]:
+        """Get the global ID of a RDF term, or `None` if it is not in the HDT file (see `encode`, which caches it)"""
+        global_id = self._from_subject_or_object(term)
+        if global_id is not None:
+            return global_id
+        predicate_id = self._document.convert_term(term, IdentifierPosition.Predicate)
+        return self.from_predicate(predicate_id) if predicate_id > 0 else None
@@ -1,10 +1,18 @@
 # hdt_file_connector.py
 # Author: Thomas MINIER - MIT License 2017-2020
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
-from hdt import TripleIterator
+from hdt import HDTDocument, IdentifierPosition, TripleIDIterator, TripleIterator
 
 from sage.database.db_iterator import DBIterator
+from sage.database.hdt.dictionary import HDTDictionary
+
+# HDT positions of RDF terms
+IDENTIFIER_POSITIONS = {
+    'subject': IdentifierPosition.Subject,
+    'predicate': IdentifierPosition.Predicate,
+    'object': IdentifierPosition.Object
+}
 
 
 class HDTIterator(DBIterator):
@@ -14,17 +22,33 @@ class HDTIterator(DBIterator):
       * source: HDT iterator which scans for RDF triples from a HDT file.
       * pattern: Triple pattern scanned.
       * start_offset: Initial offset of the source iterator. Used to compute the `last_read` triple when preemption occurs.
+      * document: HDT document scanned, used to compare RDF terms following the order of the iterator.
+      * ordering: Positions by which the RDF triples are sorted, from the most significant to the least significant.
     """
 
-    def __init__(self, source: TripleIterator, pattern: Dict[str, str], start_offset=0):
+    def __init__(self, source: TripleIterator, pattern: Dict[str, str], start_offset=0, document: Optional[HDTDocument] = None, ordering: List[str] = list()):
         super(HDTIterator, self).__init__(pattern)
         self._source = source
         self._start_offset = start_offset
+        self._document = document
+        self._ordering = ordering if document is not None else list()
 
     def last_read(self) -> str:
         """Return the ID of the last element read"""
         return str(self._source.nb_reads + self._start_offset)
 
+    def ordering(self) -> List[str]:
+        """Get the positions ('subject', 'predicate' or 'object') by which the RDF triples are sorted, from the most significant to the least significant"""
+        return self._ordering
+
+    def order_key(self, term: str, position: str) -> int:
+        """Get the key used to compare a RDF term found at a position of the RDF triples, i.e., its ID in the HDT dictionary.
+
+        Terms shared by the subjects and objects sections have the same ID at both positions,
+        so keys of terms found at different positions are equal when the terms are equal.
+        """
+        return self._document.convert_term(term, IDENTIFIER_POSITIONS[position])
+
     def next(self) -> Tuple[str, str, str]:
         """Return the next solution mapping or raise `StopIteration` if there are no more solutions"""
         return next(self._source)
@@ -32,3 +56,34 @@ class HDTIterator(DBIterator):
     def has_next(self) -> bool:
         """Return True if there is still results to read, and False otherwise"""
         return self._source.has_next()
+
+
+class HDTIdIterator(HDTIterator):
+    """An HDTIdIterator scans RDF triples in a HDT file, as triples of global IDs of the HDT dictionary (see `HDTDictionary`).
+
+    Args:
+      * source: HDT iterator which scans for RDF triples of IDs from a HDT file.
+      * pattern: Triple pattern scanned.
+      * dictionary: Dictionary of the HDT file, used to convert the IDs of the HDT file into global IDs.
+      * start_offset: Initial offset of the source iterator. Used to compute the `last_read` triple when preemption occurs.
+      * document: HDT document scanned, used to compare RDF terms following the order of the iterator.
+      * ordering: Positions by which the RDF triples are sorted, from the most significant to the least significant.
+    """
+
+    def __init__(self, source: TripleIDIterator, pattern: Dict[str, str], dictionary: HDTDictionary, start_offset=0, document: Optional[HDTDocument] = None, ordering: List[str] = list()):
+        super(HDTIdIterator, self).__init__(source, pattern, start_offset=start_offset, document=document, ordering=ordering)
+        self._dictionary = dictionary
+
+    def order_key(self, term: Union[int, str], position: str) -> int:
+        """Get the key used to compare a RDF term (or its global ID) found at a position of the RDF triples, i.e., its ID in the HDT dictionary"""
+        if type(term) is int:
+            return self._dictionary.local(term, position)
+        return super(HDTIdIterator, self).order_key(term, position)
+
+    def term_dictionary(self) -> HDTDictionary:
+        """Get the dictionary used to encode the RDF terms of the RDF triples as integer IDs"""
+        return self._dictionary
+
+    def next(self) -> Tuple[int, int, int]:
+        """Return the next RDF triple of global IDs or raise `StopIteration` if there are no more triples to scan"""
+        return self._dictionary.triple(next(self._source))
@@ -2,16 +2,19 @@
 # Author: Thomas MINIER - MIT License 2017-2020
 import json
 from datetime import datetime
+from itertools import groupby
 from math import ceil
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from uuid import uuid4
 
 from sage.database.db_connector import DatabaseConnector
 from sage.database.db_iterator import DBIterator, EmptyIterator
-from sage.database.postgres.queries import (get_delete_query, get_insert_query,
+from sage.database.postgres.queries import (get_batch_query, get_delete_query,
+                                            get_insert_query, get_ordering,
                                             get_resume_query, get_start_query)
 from sage.database.postgres.transaction_manager import TransactionManager
 from sage.database.postgres.utils import id_to_predicate
+from sage.database.utils import get_kind
 
 import logging
 
@@ -61,14 +64,16 @@ class PostgresIterator(DBIterator):
       * start_params: Parameters to use with the prepared SQL query.
       * pattern: Triple pattern scanned.
       * fetch_size: The number of SQL rows/RDF triples to fetch per batch.
+      * ordering: Columns by which the SQL rows are sorted, following the byte order of their values, from the most significant to the least significant.
     """
 
-    def __init__(self, cursor, connection, start_query: str, start_params: List[str], pattern: Dict[str, str], fetch_size: int = 2000):
+    def __init__(self, cursor, connection, start_query: str, start_params: List[str], pattern: Dict[str, str], fetch_size: int = 2000, ordering: List[str] = list()):
         super(PostgresIterator, self).__init__(pattern)
         self._cursor = cursor
         self._connection = connection
         self._current_query = start_query
         self._fetch_size = fetch_size
+        self._ordering = ordering
         # resume query execution with a SQL query
         #print(f" GO {self._current_query} : {start_params}")
         #if self._current_query is None:
@@ -104,6 +109,10 @@ class PostgresIterator(DBIterator):
             'o': triple[2]
         }, separators=(',', ':'))
 
+    def ordering(self) -> List[str]:
+        """Get the positions ('subject', 'predicate' or 'object') by which the RDF triples are sorted, from the most significant to the least significant"""
+        return self._ordering
+
     def next(self) -> Optional[Dict[str, str]]:
         """Return the next solution mapping or raise `StopIteration` if there are no more solutions"""
         if not self.has_next():
@@ -139,6 +148,8 @@ class PostgresConnector(DatabaseConnector):
         self._manager = TransactionManager(dbname, user, password, host=host, port=port)
         self._fetch_size = fetch_size
         self._warmup = True
+        # True if the database sorts text values by byte order, like Python does
+        self._byte_ordered = False
 
         # Data used for cardinality estimation.
         # They are initialized using PostgreSQL histograms, after the 1st connection to the DB.
@@ -173,6 +184,9 @@ class PostgresConnector(DatabaseConnector):
             # fetch estimated table cardinality
             cursor.execute(f"SELECT reltuples AS approximate_row_count FROM pg_class WHERE relname = '{self._table_name}'")
             self._avg_row_count = cursor.fetchone()[0]
+            # fetch the collation used to sort text values
+            cursor.execute("SELECT datcollate FROM pg_database WHERE datname = current_database()")
+            self._byte_ordered = cursor.fetchone()[0] in ['C', 'POSIX']
             # fetch subject histograms
             (null_frac, n_distinct, selectivities, sum_freqs) = fetch_histograms(cursor, self._table_name, 'subject')
             self._subject_histograms = {
@@ -218,6 +232,27 @@ class PostgresConnector(DatabaseConnector):
         """Abort any ongoing transaction"""
         self._manager.abort()
 
+    def distinct_values(self, subject: str, predicate: str, obj: str, position: str, cardinality: int) -> int:
+        """Estimate the number of distinct RDF terms found at a position of the RDF triples matching a triple pattern, using PostgreSQL histograms.
+
+        Args:
+          * subject: Subject of the triple pattern.
+          * predicate: Predicate of the triple pattern.
+          * obj: Object of the triple pattern.
+          * position: Position of the RDF terms to count: 'subject', 'predicate' or 'object'.
+          * cardinality: The estimated cardinality of the triple pattern.
+
+        Returns: The estimated number of distinct RDF terms, at least 1.
+        """
+        histograms = {'subject': self._subject_histograms, 'predicate': self._predicate_histograms, 'object': self._object_histograms}
+        n_distinct = histograms[position]['n_distinct']
+        # a negative number of distinct values is a fraction of the number of rows
+        if n_distinct < 0:
+            n_distinct = -n_distinct * self._avg_row_count
+        if n_distinct > 0:
+            cardinality = min(cardinality, int(ceil(n_distinct)))
+        return max(1, cardinality)
+
     def _estimate_cardinality(self, subject: Optional[str], predicate: Optional[str], obj: Optional[str]) -> int:
         """Estimate the cardinality of a triple pattern using PostgreSQL histograms.
 
@@ -264,6 +299,59 @@ class PostgresConnector(DatabaseConnector):
         cardinality = int(ceil(selectivity * self._avg_row_count))
         return cardinality if cardinality > 0 else 1
 
+    def estimate(self, subject: str, predicate: str, obj: str, as_of: Optional[datetime] = None) -> int:
+        """Estimate the cardinality of a triple pattern using PostgreSQL histograms, without executing any SQL query.
+
+        Args:
+          * subject: Subject of the triple pattern.
+          * predicate: Predicate of the triple pattern.
+          * obj: Object of the triple pattern.
+          * as_of: A version timestamp. Ignored, as histograms are not versioned.
+
+        Returns: The estimated cardinality of the triple pattern.
+        """
+        # do warmup if necessary, to fetch the histograms
+        self.open()
+        return self._estimate_cardinality(subject, predicate, obj)
+
+    def sample(self, subject: str, predicate: str, obj: str, size: int, as_of: Optional[datetime] = None) -> List[Tuple[str, str, str]]:
+        """Get a sample of the RDF triples matching a triple pattern, i.e., the first RDF triples of its index scan.
+
+        The sample is read using a single SQL query with a LIMIT clause, so no server-side cursor is opened.
+
+        Args:
+          * subject: Subject of the triple pattern.
+          * predicate: Predicate of the triple pattern.
+          * obj: Object of the triple pattern.
+          * size: The maximum number of RDF triples to sample.
+          * as_of: A version timestamp. Ignored, as this connector does not support versioning.
+
+        Returns: At most `size` RDF triples matching the triple pattern.
+        """
+        # do warmup if necessary
+        self.open()
+        subject = subject if (subject is not None) and (not subject.startswith('?')) else None
+        predicate = predicate if (predicate is not None) and (not predicate.startswith('?')) else None
+        obj = obj if (obj is not None) and (not obj.startswith('?')) else None
+        query, params = get_start_query(subject, predicate, obj, self._table_name)
+        cursor = self._manager.get_connection().cursor()
+        try:
+            cursor.execute(query + " LIMIT %s", (list(params) if params is not None else list()) + [size])
+            return [(s, id_to_predicate(p), o) for s, p, o in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+    def search_ordering(self, subject: str, predicate: str, obj: str) -> List[str]:
+        """Get the positions by which the RDF triples returned by a search are sorted, from the most significant to the least significant"""
+        # do warmup if necessary, to fetch the collation of the database
+        self.open()
+        if not self._byte_ordered:
+            return list()
+        subject = subject if (subject is not None) and (not subject.startswith('?')) else None
+        predicate = predicate if (predicate is not None) and (not predicate.startswith('?')) else None
+        obj = obj if (obj is not None) and (not obj.startswith('?')) else None
+        return get_ordering(subject, predicate, obj)
+
     def search(self, subject: str, predicate: str, obj: str, last_read: Optional[str] = None, as_of: Optional[datetime] = None) -> Tuple[PostgresIterator, int]:
         """Get an iterator over all RDF triples matching a triple pattern.
 
@@ -313,10 +401,50 @@ class PostgresConnector(DatabaseConnector):
             # seems to trigger infinite loop
             #return None,0
         # create the iterator to yield the matching RDF triples
-        iterator = PostgresIterator(cursor, self._manager.get_connection(), start_query, start_params, pattern, fetch_size=self._fetch_size)
+        # the order of the SQL rows can only be exploited when it matches the order of Python strings
+        ordering = get_ordering(subject, predicate, obj) if self._byte_ordered else list()
+        iterator = PostgresIterator(cursor, self._manager.get_connection(), start_query, start_params, pattern, fetch_size=self._fetch_size, ordering=ordering)
         card = self._estimate_cardinality(subject, predicate, obj) if iterator.has_next() else 0
         return iterator, card
 
+    def supports_batched_lookups(self) -> bool:
+        """Return True if the connector can resolve several triple patterns in a single call, using `search_many`"""
+        return True
+
+    def search_many(self, patterns: List[Tuple[str, str, str]], offset: int = 0, as_of: Optional[datetime] = None) -> Iterator[Tuple[int, Tuple[str, str, str]]]:
+        """Get an iterator over all RDF triples matching a list of triple patterns, using a single SQL query.
+
+        Consecutive triple patterns of the same kind are resolved by the same SQL query,
+        which joins the SQL table with the patterns' bound values, so a list of patterns that bind the same positions
+        (e.g., the inner patterns of a bind join) costs a single round trip and a single server-side cursor.
+
+        Args:
+          * patterns: List of triple patterns (subject, predicate, object) to search for.
+          * offset: Number of RDF triples matching the first triple pattern to skip. Used to resume a search.
+          * as_of: A version timestamp. Ignored, as this connector does not support versioning.
+
+        Returns:
+          An iterator over tuples (`index`, `triple`), where `index` is the position in the list of the triple pattern matched by the RDF triple `triple`.
+        """
+        # do warmup if necessary
+        self.open()
+        start = 0
+        for _, group in groupby(patterns, key=lambda pattern: get_kind(*pattern)):
+            group = list(group)
+            query, params = get_batch_query(group, self._table_name, offset=offset if start == 0 else 0)
+            # dedicated cursor used to scan this group of triple patterns
+            cursor = self._manager.get_connection().cursor(str(uuid4()))
+            try:
+                cursor.execute(query, params)
+                rows = cursor.fetchmany(size=self._fetch_size)
+                while len(rows) > 0:
+                    for index, s, p, o in rows:
+                        yield start + index, (s, id_to_predicate(p), o)
+                    rows = cursor.fetchmany(size=self._fetch_size)
+            finally:
+                cursor.close()
+            start += len(group)
+
     def from_config(config: dict):
         """Build a PostgresConnector from a configuration object.
 
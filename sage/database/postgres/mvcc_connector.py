@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from uuid import uuid4
 
+from sage.database.db_connector import DatabaseConnector
 from sage.database.db_iterator import DBIterator, EmptyIterator
 from sage.database.postgres.connector import PostgresConnector
 from sage.database.postgres.mvcc_queries import (get_delete_query,
@@ -103,6 +104,43 @@ class MVCCPostgresConnector(PostgresConnector):
     def __init__(self, table_name: str, dbname: str, user: str, password: str, host: str = '', port: int = 5432, fetch_size: int = 2000):
         super(MVCCPostgresConnector, self).__init__(table_name, dbname, user, password, host, port, fetch_size)
 
+    def supports_batched_lookups(self) -> bool:
+        """Return False, as batched lookups do not read against a consistent snapshot of the versioned table"""
+        return False
+
+    def estimate(self, subject: str, predicate: str, obj: str, as_of: Optional[datetime] = None) -> int:
+        """Estimate the cardinality of a triple pattern using PostgreSQL histograms, without executing any SQL query.
+
+        Histograms are computed over all versions of the RDF triples, so the estimation is the same for every timestamp.
+
+        Args:
+          * subject: Subject of the triple pattern.
+          * predicate: Predicate of the triple pattern.
+          * obj: Object of the triple pattern.
+          * as_of: A version timestamp. Ignored, as histograms are not versioned.
+
+        Returns: The estimated cardinality of the triple pattern.
+        """
+        return super(MVCCPostgresConnector, self).estimate(subject, predicate, obj, as_of=as_of)
+
+    def sample(self, subject: str, predicate: str, obj: str, size: int, as_of: Optional[datetime] = None) -> List[Tuple[str, str, str]]:
+        """Get a sample of the RDF triples matching a triple pattern, i.e., the first RDF triples of a search, so only the RDF triples valid at the timestamp are sampled.
+
+        Args:
+          * subject: Subject of the triple pattern.
+          * predicate: Predicate of the triple pattern.
+          * obj: Object of the triple pattern.
+          * size: The maximum number of RDF triples to sample.
+          * as_of: A version timestamp. When set, perform all reads against a consistent snapshot represented by this timestamp.
+
+        Returns: At most `size` RDF triples matching the triple pattern.
+        """
+        return DatabaseConnector.sample(self, subject, predicate, obj, size, as_of=as_of)
+
+    def search_ordering(self, subject: str, predicate: str, obj: str) -> List[str]:
+        """Return an empty list, as the RDF triples returned by a search are not yielded in any particular order"""
+        return list()
+
     def search(self, subject: str, predicate: str, obj: str, last_read: Optional[str] = None, as_of: Optional[datetime] = None) -> Tuple[MVCCPostgresIterator, int]:
         """Get an iterator over all RDF triples matching a triple pattern.
 
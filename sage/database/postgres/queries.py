@@ -2,7 +2,7 @@
 # Author: Thomas MINIER - MIT License 2017-2020
 from typing import List, Tuple
 
-from sage.database.utils import get_kind
+from sage.database.utils import get_kind, is_var
 
 
 def get_start_query(subj: str, pred: str, obj: str, table_name: str) -> Tuple[str, List[str]]:
@@ -49,6 +49,29 @@ def get_start_query(subj: str, pred: str, obj: str, table_name: str) -> Tuple[st
     return query, params
 
 
+def get_ordering(subj: str, pred: str, obj: str) -> List[str]:
+    """Get the order of the SQL rows returned by the queries which scan for a triple pattern.
+
+    It follows the ORDER BY clauses of the queries built by `get_start_query` and `get_resume_query`.
+
+    Args:
+      * subj: Subject of the triple pattern.
+      * pred: Predicate of the triple pattern.
+      * obj: Object of the triple pattern.
+
+    Returns:
+      The columns by which the SQL rows are sorted, from the most significant to the least significant.
+    """
+    kind = get_kind(subj, pred, obj)
+    if kind in ['spo', 's??', 'sp?']:
+        return ['subject', 'predicate', 'object']
+    elif kind in ['???', '?p?', '?po']:
+        return ['predicate', 'object', 'subject']
+    elif kind in ['s?o', '??o']:
+        return ['object', 'subject', 'predicate']
+    raise Exception(f"Unkown pattern type: {kind}")
+
+
 def get_resume_query(subj: str, pred: str, obj: str, last_read: Tuple[str, str, str], table_name: str, symbol: str = ">=") -> Tuple[str, str]:
     """Get a prepared SQL query which resumes scanning for a triple pattern.
 
@@ -103,6 +126,34 @@ def get_resume_query(subj: str, pred: str, obj: str, last_read: Tuple[str, str,
     return query, params
 
 
+def get_batch_query(patterns: List[Tuple[str, str, str]], table_name: str, offset: int = 0) -> Tuple[str, List[str]]:
+    """Get a prepared SQL query which scans for several triple patterns at once.
+
+    The triple patterns are joined with the SQL table as a VALUES list, so they must all bind the same positions, i.e., be of the same kind.
+    Each SQL row starts with the position of the triple pattern it matches, and rows are sorted by position, then by (subject, predicate, object).
+
+    Args:
+      * patterns: List of triple patterns (subject, predicate, object) of the same kind.
+      * table_name: Name of the SQL table to scan for RDF triples.
+      * offset: Number of SQL rows to skip, i.e., the number of RDF triples matching the first triple pattern already read.
+
+    Returns:
+      A tuple with the prepared SQL query and its parameters.
+    """
+    columns = [column for column, term in zip(['subject', 'predicate', 'object'], patterns[0]) if not is_var(term)]
+    row = "(" + ", ".join(["%s"] * (len(columns) + 1)) + ")"
+    params = list()
+    for index, pattern in enumerate(patterns):
+        params.append(index)
+        params += [term for term in pattern if not is_var(term)]
+    conditions = " AND ".join([f"t.{column} = v.{column}" for column in columns]) if len(columns) > 0 else "TRUE"
+    query = f"SELECT v.idx, t.subject, t.predicate, t.object FROM {table_name} AS t "
+    query += f"JOIN (VALUES {', '.join([row] * len(patterns))}) AS v({', '.join(['idx'] + columns)}) ON {conditions} "
+    query += "ORDER BY v.idx, t.subject, t.predicate, t.object OFFSET %s"
+    params.append(offset)
+    return query, params
+
+
 def get_insert_query(table_name: str) -> str:
     """Build a SQL query to insert a RDF triple into a PostgreSQL table.
 
@@ -2,9 +2,10 @@
 # Author: Thomas MINIER - MIT License 2017-2020
 import logging
 from asyncio import run
+from json import dumps
 from concurrent.futures import ThreadPoolExecutor
 from time import time
-from typing import Dict, List, Iterable
+from typing import List, Iterable
 from uuid import uuid4
 
 import grpc
@@ -16,14 +17,16 @@ from sage.grpc import service_pb2_grpc
 from sage.grpc.service_pb2 import Binding, BindingSet, SageQuery, SageResponse
 from sage.http_server.utils import decode_saved_plan, encode_saved_plan
 from sage.query_engine.iterators.loader import load
+from sage.query_engine.iterators.mappings import SolutionMappings
 from sage.query_engine.optimizer.query_parser import parse_query
+from sage.query_engine.profiler import PlanProfiler
 from sage.query_engine.sage_engine import SageEngine
 
 
-def create_bindings(bindings: List[Dict[str, str]]) -> Iterable[BindingSet]:
-  """Create an iterator that converts a set of dict-based bindings to a set of protobuf-based bindings.
+def create_bindings(bindings: List[SolutionMappings]) -> Iterable[BindingSet]:
+  """Create an iterator that converts a set of bindings, as produced by the query engine, to a set of protobuf-based bindings.
   
-  Argument: List of solutions bindings, encoded as dictionaries.
+  Argument: List of solutions bindings, as produced by the query engine (or encoded as dictionaries).
 
   Yields: Set of solutions bindings, encoded in a Protobuf format.
   """
@@ -63,7 +66,7 @@ class SageQueryService(service_pb2_grpc.SageSPARQLServicer):
             saved_plan = next_link
         else:
             saved_plan = self._dataset.statefull_manager.get_plan(next_link)
-        plan = load(decode_saved_plan(saved_plan), self._dataset)
+        plan = load(decode_saved_plan(saved_plan), self._dataset, adaptive=graph.adaptive)
       else:
         plan, cardinalities = parse_query(query, self._dataset, graph_name)
       loading_time = (time() - start) * 1000
@@ -72,7 +75,8 @@ class SageQueryService(service_pb2_grpc.SageSPARQLServicer):
       engine = SageEngine()
       quota = graph.quota / 1000
       max_results = graph.max_results
-      bindings, saved_plan, is_done, abort_reason = run(engine.execute(plan, quota, max_results))
+      profiler = PlanProfiler() if request.profile else None
+      bindings, saved_plan, is_done, abort_reason = run(engine.execute(plan, quota, max_results, batch_size=graph.batch_size, profiler=profiler))
 
       # commit or abort (if necessary)
       if abort_reason is not None:
@@ -95,9 +99,12 @@ class SageQueryService(service_pb2_grpc.SageSPARQLServicer):
         # delete the saved plan, as it will not be reloaded anymore
         self._dataset.statefull_manager.delete_plan(next_link)
       exportTime = (time() - start) * 1000
+      stats = {"cardinalities": cardinalities, "import": loading_time, "export": exportTime}
+      if request.profile:
+        stats["operators"] = profiler.tree()
 
       # create response
-      response = SageResponse(is_done = is_done, next_link = next_page)
+      response = SageResponse(is_done = is_done, next_link = next_page, stats = dumps(stats))
       for binding in create_bindings(bindings):
         response.bindings.append(binding)
       return response
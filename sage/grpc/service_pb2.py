@@ -2,8 +2,6 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: service.proto
 
-import sys
-_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
@@ -19,8 +17,8 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   name='service.proto',
   package='sage',
   syntax='proto3',
-  serialized_options=_b('\n\026fr.univnantes.gdd.sageB\nSageSPARQLP\001\242\002\003HLW'),
-  serialized_pb=_b('\n\rservice.proto\x12\x04sage\"H\n\tSageQuery\x12\r\n\x05query\x18\x01 \x01(\t\x12\x19\n\x11\x64\x65\x66\x61ult_graph_uri\x18\x02 \x01(\t\x12\x11\n\tnext_link\x18\x03 \x01(\t\"*\n\x07\x42inding\x12\x10\n\x08variable\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"+\n\nBindingSet\x12\x1d\n\x06values\x18\x01 \x03(\x0b\x32\r.sage.Binding\"V\n\x0cSageResponse\x12\"\n\x08\x62indings\x18\x01 \x03(\x0b\x32\x10.sage.BindingSet\x12\x0f\n\x07is_done\x18\x02 \x01(\x08\x12\x11\n\tnext_link\x18\x03 \x01(\t2<\n\nSageSPARQL\x12.\n\x05Query\x12\x0f.sage.SageQuery\x1a\x12.sage.SageResponse\"\x00\x42,\n\x16\x66r.univnantes.gdd.sageB\nSageSPARQLP\x01\xa2\x02\x03HLWb\x06proto3')
+  serialized_options=b'\n\026fr.univnantes.gdd.sageB\nSageSPARQLP\001\242\002\003HLW',
+  serialized_pb=b'\n\rservice.proto\x12\x04sage\"Y\n\tSageQuery\x12\r\n\x05query\x18\x01 \x01(\t\x12\x19\n\x11\x64\x65\x66\x61ult_graph_uri\x18\x02 \x01(\t\x12\x11\n\tnext_link\x18\x03 \x01(\t\x12\x0f\n\x07profile\x18\x04 \x01(\x08\"*\n\x07\x42inding\x12\x10\n\x08variable\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"+\n\nBindingSet\x12\x1d\n\x06values\x18\x01 \x03(\x0b\x32\r.sage.Binding\"e\n\x0cSageResponse\x12\"\n\x08\x62indings\x18\x01 \x03(\x0b\x32\x10.sage.BindingSet\x12\x0f\n\x07is_done\x18\x02 \x01(\x08\x12\x11\n\tnext_link\x18\x03 \x01(\t\x12\r\n\x05stats\x18\x04 \x01(\t2<\n\nSageSPARQL\x12.\n\x05Query\x12\x0f.sage.SageQuery\x1a\x12.sage.SageResponse\"\x00\x42,\n\x16\x66r.univnantes.gdd.sageB\nSageSPARQLP\x01\xa2\x02\x03HLWb\x06proto3'
 )
 
 
@@ -36,21 +34,28 @@ _SAGEQUERY = _descriptor.Descriptor(
     _descriptor.FieldDescriptor(
       name='query', full_name='sage.SageQuery.query', index=0,
       number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='default_graph_uri', full_name='sage.SageQuery.default_graph_uri', index=1,
       number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='next_link', full_name='sage.SageQuery.next_link', index=2,
       number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='profile', full_name='sage.SageQuery.profile', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
@@ -67,7 +72,7 @@ _SAGEQUERY = _descriptor.Descriptor(
   oneofs=[
   ],
   serialized_start=23,
-  serialized_end=95,
+  serialized_end=112,
 )
 
 
@@ -81,14 +86,14 @@ _BINDING = _descriptor.Descriptor(
     _descriptor.FieldDescriptor(
       name='variable', full_name='sage.Binding.variable', index=0,
       number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='value', full_name='sage.Binding.value', index=1,
       number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
@@ -104,8 +109,8 @@ _BINDING = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=97,
-  serialized_end=139,
+  serialized_start=114,
+  serialized_end=156,
 )
 
 
@@ -135,8 +140,8 @@ _BINDINGSET = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=141,
-  serialized_end=184,
+  serialized_start=158,
+  serialized_end=201,
 )
 
 
@@ -164,7 +169,14 @@ _SAGERESPONSE = _descriptor.Descriptor(
     _descriptor.FieldDescriptor(
       name='next_link', full_name='sage.SageResponse.next_link', index=2,
       number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='stats', full_name='sage.SageResponse.stats', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
@@ -180,8 +192,8 @@ _SAGERESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=186,
-  serialized_end=272,
+  serialized_start=203,
+  serialized_end=304,
 )
 
 _BINDINGSET.fields_by_name['values'].message_type = _BINDING
@@ -229,8 +241,8 @@ _SAGESPARQL = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=0,
   serialized_options=None,
-  serialized_start=274,
-  serialized_end=334,
+  serialized_start=306,
+  serialized_end=366,
   methods=[
   _descriptor.MethodDescriptor(
     name='Query',
@@ -1,9 +1,11 @@
 # responses.py
 # Author: Thomas MINIER - MIT License 2017-2020
 from json import dumps
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from xml.etree import ElementTree
 
+from sage.query_engine.iterators.mappings import SolutionMappings
+
 
 def analyze_term(value: str) -> Tuple[str, str, Optional[str], Optional[str]]:
     """Analyze a RDF term and extract various information about it.
@@ -82,15 +84,25 @@ def skolemize_one(bnode: str, url: str) -> str:
     return f"{url}/bnode#{bnode[2:]}" if bnode.startswith("_:") else bnode
 
 
-def skolemize(bindings: Iterable[Dict[str, str]], url: str) -> Iterable[Dict[str, str]]:
-    """Skolemize blank nodes in a list of solution bindings.
+def bindings_to_dicts(bindings: Iterable[Union[SolutionMappings, Dict[str, str]]]) -> List[Dict[str, str]]:
+    """Convert a list of solution bindings, as produced by the query engine, to a list of dictionaries.
+
+    Argument: An iterable which yields set of solution bindings.
+
+    Returns: The solution bindings, as dictionaries.
+    """
+    return [b.to_dict() if type(b) is SolutionMappings else b for b in bindings]
+
+
+def skolemize(bindings: Iterable[Union[SolutionMappings, Dict[str, str]]], url: str) -> Iterable[Dict[str, str]]:
+    """Skolemize blank nodes in a list of solution bindings, and convert them to dictionaries.
     
     Args:
       * bindings: An iterable which yields set of solution bindings to process.
       * url: Prefix URL used for skolemization.
 
     Yields:
-      Solution bindings, where blank nodes have been skolemized using the input URL.
+      Solution bindings, as dictionaries, where blank nodes have been skolemized using the input URL.
     """
     for b in bindings:
         r = dict()
@@ -145,7 +157,7 @@ def w3c_json_streaming(bindings: Iterable[Dict[str, str]], next_link: Optional[s
       A page of SaGe results in the W3C SPARQL JSON results format.
     """
     hasNext = "true" if next_link is not None else "false"
-    vars = list(map(lambda x: x[1:], bindings[0].keys()))
+    vars = list(map(lambda x: x[1:], bindings[0].keys())) if len(bindings) > 0 else list()
     # generate headers
     yield "{\"head\":{\"vars\":["
     yield ",".join(map(lambda x: f"\"{x}\"", vars))
@@ -208,7 +220,7 @@ def bindings_to_w3c_xml(bindings: Iterable[Dict[str, str]], skol_url: str) -> El
                     literal_node.set(extra_label, extra_value)
         return result_node
 
-    vars = list(map(lambda x: x[1:], bindings[0].keys()))
+    vars = list(map(lambda x: x[1:], bindings[0].keys())) if len(bindings) > 0 else list()
     root = ElementTree.Element("sparql", xmlns="http://www.w3.org/2005/sparql-results#")
     # build head
     head = ElementTree.SubElement(root, "head")
@@ -221,6 +233,36 @@ def bindings_to_w3c_xml(bindings: Iterable[Dict[str, str]], skol_url: str) -> El
     return root
 
 
+def stats_to_w3c_xml(stats: dict, root: ElementTree.Element) -> ElementTree.Element:
+    """Formats statistics about query execution in XML, as a child of an XML node.
+
+    Args:
+      * stats: Statistics about query execution.
+      * root: XML node to which the statistics are added.
+
+    Returns: The XML node that contains the statistics.
+    """
+    def convert_operator(operator, root):
+        attributes = {key: str(value) for key, value in operator.items() if key != 'children'}
+        operator_node = ElementTree.SubElement(root, "operator", **attributes)
+        for child in operator['children']:
+            convert_operator(child, operator_node)
+        return operator_node
+
+    stats_node = ElementTree.SubElement(root, "stats")
+    for key in ['import', 'export']:
+        if key in stats:
+            stats_node.set(key, str(stats[key]))
+    for cardinality in stats.get('cardinalities', list()):
+        triple = cardinality['triple']
+        cardinality_node = ElementTree.SubElement(stats_node, "cardinality", subject=triple['subject'], predicate=triple['predicate'], object=triple['object'], value=str(cardinality['cardinality']))
+        if 'bound_cardinality' in cardinality:
+            cardinality_node.set('bound', str(cardinality['bound_cardinality']))
+    if stats.get('operators') is not None:
+        convert_operator(stats['operators'], stats_node)
+    return stats_node
+
+
 def w3c_xml(bindings: Iterable[Dict[str, str]], next_link: Optional[str], stats: dict, skol_url: str) -> Iterable[str]:
     """Yield a page of SaGe results in the W3C SPARQL XML results format, so it can be sent in an HTTP response.
     
@@ -240,5 +282,5 @@ def w3c_xml(bindings: Iterable[Dict[str, str]], next_link: Optional[str], stats:
     hasNext_node.text = str(next_link is not None)
     next_node = ElementTree.SubElement(controls, "next")
     next_node.text = next_link
-    # TODO include stats
+    stats_to_w3c_xml(stats, controls)
     return ElementTree.tostring(page, encoding="utf-8").decode("utf-8")
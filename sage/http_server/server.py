@@ -22,6 +22,8 @@ from sage.database.descriptors import VoidDescriptor, many_void
 from sage.http_server.utils import decode_saved_plan, encode_saved_plan
 from sage.query_engine.iterators.loader import load
 from sage.query_engine.optimizer.query_parser import parse_query
+from sage.query_engine.process_pool import EngineProcessPool
+from sage.query_engine.profiler import PlanProfiler
 from sage.query_engine.sage_engine import SageEngine
 
 
@@ -30,6 +32,7 @@ class SagePostQuery(BaseModel):
     query: str = Field(..., description="The SPARQL query to execute.")
     defaultGraph: str = Field(None, description="(Optional) The URI of the default RDF graph queried.")
     next: str = Field(None, description="(Optional) A next link used to resume query execution from a saved state.")
+    profile: bool = Field(False, description="(Optional) True to include per-operator execution statistics in the response.")
 
 def choose_void_format(mimetypes):
     if "text/turtle" in mimetypes:
@@ -44,7 +47,7 @@ def choose_void_format(mimetypes):
         return "json-ld", "application/json"
     return "ntriples", "application/n-triples"
 
-async def execute_query(query: str, default_graph_uri: str, next_link: Optional[str], dataset: Dataset) -> Tuple[List[Dict[str, str]], Optional[str], Dict[str, str]]:
+async def execute_query(query: str, default_graph_uri: str, next_link: Optional[str], dataset: Dataset, pool: Optional[EngineProcessPool] = None, profile: bool = False) -> Tuple[List[Dict[str, str]], Optional[str], Dict[str, str]]:
     """Execute a query using the SageEngine and returns the appropriate HTTP response.
 
     Any failure will results in a rollback/abort on the current query execution.
@@ -54,6 +57,8 @@ async def execute_query(query: str, default_graph_uri: str, next_link: Optional[
       * default_graph_uri: URI of the default RDF graph to use.
       * next_link: URI to a saved plan. Can be `None` if query execution should starts from the beginning.
       * dataset: RDF dataset on which the query is executed.
+      * pool: (Optional) A pool of worker processes. When set, the query is executed by a worker process.
+      * profile: True to collect per-operator execution statistics, which are returned in `stats['operators']`.
 
     Returns:
       A tuple (`bindings`, `next_page`, `stats`) where:
@@ -69,31 +74,45 @@ async def execute_query(query: str, default_graph_uri: str, next_link: Optional[
             raise HTTPException(status_code=404, detail=f"RDF Graph {default_graph_uri} not found on the server.")
         graph = dataset.get_graph(default_graph_uri)
 
-        # decode next_link or build query execution plan
-        cardinalities = dict()
-        start = time()
+        # decode next_link
         if next_link is not None:
             if dataset.is_stateless:
                 saved_plan = next_link
             else:
                 saved_plan = dataset.statefull_manager.get_plan(next_link)
-            plan = load(decode_saved_plan(saved_plan), dataset)
+            saved_plan = decode_saved_plan(saved_plan)
         else:
-            plan, cardinalities = parse_query(query, dataset, default_graph_uri)
-        loading_time = (time() - start) * 1000
+            saved_plan = None
 
-        # execute query
-        engine = SageEngine()
         quota = graph.quota / 1000
         max_results = graph.max_results
-        bindings, saved_plan, is_done, abort_reason = await engine.execute(plan, quota, max_results)
-
-        # commit or abort (if necessary)
-        if abort_reason is not None:
-            graph.abort()
-            raise HTTPException(status_code=500, detail=f"The SPARQL query has been aborted for the following reason: '{abort_reason}'")
+        if pool is not None:
+            # load and execute the plan in a worker process, which also commits or aborts the transaction
+            bindings, saved_plan, is_done, abort_reason, cardinalities, loading_time, operators = await pool.execute(query, default_graph_uri, saved_plan, quota, max_results, batch_size=graph.batch_size, profile=profile)
+            if abort_reason is not None:
+                raise HTTPException(status_code=500, detail=f"The SPARQL query has been aborted for the following reason: '{abort_reason}'")
         else:
-            graph.commit()
+            # load the saved plan or build query execution plan
+            cardinalities = dict()
+            start = time()
+            if saved_plan is not None:
+                plan = load(saved_plan, dataset, adaptive=graph.adaptive)
+            else:
+                plan, cardinalities = parse_query(query, dataset, default_graph_uri)
+            loading_time = (time() - start) * 1000
+
+            # execute query
+            engine = SageEngine()
+            profiler = PlanProfiler() if profile else None
+            bindings, saved_plan, is_done, abort_reason = await engine.execute(plan, quota, max_results, batch_size=graph.batch_size, profiler=profiler)
+            operators = profiler.tree() if profile else None
+
+            # commit or abort (if necessary)
+            if abort_reason is not None:
+                graph.abort()
+                raise HTTPException(status_code=500, detail=f"The SPARQL query has been aborted for the following reason: '{abort_reason}'")
+            else:
+                graph.commit()
 
         start = time()
         # encode saved plan if query execution is not done yet and there was no abort
@@ -111,6 +130,8 @@ async def execute_query(query: str, default_graph_uri: str, next_link: Optional[
 
         exportTime = (time() - start) * 1000
         stats = {"cardinalities": cardinalities, "import": loading_time, "export": exportTime}
+        if profile:
+            stats["operators"] = operators
 
         return (bindings, next_page, stats)
     except Exception as err:
@@ -140,18 +161,20 @@ def create_response(mimetypes: List[str], bindings: List[Dict[str, str]], next_p
         iterator = responses.w3c_json_streaming(bindings, next_page, stats, skol_url)
         return StreamingResponse(iterator, media_type="application/json")
     elif "application/xml" in mimetypes or "application/sparql-results+xml" in mimetypes:
-        iterator = responses.w3c_xml(bindings, next_page, stats)
+        iterator = responses.w3c_xml(bindings, next_page, stats, skol_url)
         return Response(iterator, media_type="application/xml")
     return JSONResponse({
-        "bindings": bindings,
+        "bindings": responses.bindings_to_dicts(bindings),
         "next": next_page,
         "stats": stats
     })
 
-def run_app(config_file: str) -> FastAPI:
+def run_app(config_file: str, pool_size: int = 0) -> FastAPI:
     """Create the HTTP server, compatible with uvicorn/gunicorn.
 
-    Argument: SaGe configuration file, in YAML format.
+    Args:
+      * config_file: SaGe configuration file, in YAML format.
+      * pool_size: Number of worker processes used to execute queries. Use 0 to execute queries in the server process.
 
     Returns: The FastAPI HTTP application.
     """
@@ -171,6 +194,14 @@ def run_app(config_file: str) -> FastAPI:
     # Build the RDF dataset from the configuration file
     dataset = load_config(config_file)
 
+    # Start the pool of worker processes (if needed)
+    pool = EngineProcessPool(config_file, pool_size) if pool_size > 0 else None
+
+    @app.on_event("shutdown")
+    def shutdown_pool():
+        if pool is not None:
+            pool.shutdown()
+
     @app.get("/")
     async def root():
         return "The SaGe SPARQL query server is running!"
@@ -181,13 +212,14 @@ def run_app(config_file: str) -> FastAPI:
         request: Request,
         query: str = Query(..., description="The SPARQL query to execute."),
         default_graph_uri: str = Query(..., alias="default-graph-uri", description="The URI of the default RDF graph queried."),
-        next_link: str = Query(None, alias="next", description="(Optional) A next link used to resume query execution from a saved state.")
+        next_link: str = Query(None, alias="next", description="(Optional) A next link used to resume query execution from a saved state."),
+        profile: bool = Query(False, description="(Optional) True to include per-operator execution statistics in the response.")
     ):
         """Execute a SPARQL query using the Web Preemption model"""
         try:
             mimetypes = request.headers['accept'].split(",")
             server_url = urlunparse(request.url.components[0:3] + (None, None, None))
-            bindings, next_page, stats = await execute_query(query, default_graph_uri, next_link, dataset)
+            bindings, next_page, stats = await execute_query(query, default_graph_uri, next_link, dataset, pool=pool, profile=profile)
             return create_response(mimetypes, bindings, next_page, stats, server_url)
         except HTTPException as err:
             raise err
@@ -202,7 +234,7 @@ def run_app(config_file: str) -> FastAPI:
         try:
             mimetypes = request.headers['accept'].split(",")
             default_graph_uri = item.defaultGraph if item.defaultGraph is not None else dataset.default_graph
-            bindings, next_page, stats = await execute_query(item.query, default_graph_uri, item.next, dataset)
+            bindings, next_page, stats = await execute_query(item.query, default_graph_uri, item.next, dataset, pool=pool, profile=item.profile)
             server_url = urlunparse(request.url.components[0:3] + (None, None, None))
             return create_response(mimetypes, bindings, next_page, stats, server_url)
         except HTTPException as err:
@@ -1,6 +1,7 @@
 # utils.py
 # Author: Thomas MINIER - MIT License 2017-2020
 from base64 import b64decode, b64encode
+from typing import Union
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 from sage.query_engine.protobuf.iterators_pb2 import RootTree
@@ -19,17 +20,18 @@ def secure_url(url: str) -> str:
     return urlunparse((scheme, netloc, path, params, query, fragment)).replace("%7E", "~")
 
 
-def encode_saved_plan(savedPlan: RootTree) -> str:
+def encode_saved_plan(savedPlan: Union[RootTree, bytes]) -> str:
     """Encode a Protobuf-based saved plan into string format.
 
-    Argument: A saved plan, encoded as a Protobuf message.
+    Argument: A saved plan, encoded as a Protobuf message or already serialized.
 
     Returns: The saved plan, encoded as a string of bytes.
     """
     if savedPlan is None:
         return None
-    bytes = savedPlan.SerializeToString()
-    return b64encode(bytes).decode('utf-8')
+    if not isinstance(savedPlan, bytes):
+        savedPlan = savedPlan.SerializeToString()
+    return b64encode(savedPlan).decode('utf-8')
 
 
 def decode_saved_plan(input: str) -> RootTree:
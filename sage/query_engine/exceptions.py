@@ -13,3 +13,7 @@ class TooManyResults(Exception):
 class UnsupportedSPARQL(Exception):
     """Raised when a SPARQL feature is not supported by the Sage query engine"""
     pass
+
+class NativeEvaluationError(Exception):
+    """Raised when a natively compiled expression cannot evaluate a set of solution mappings, which must then be evaluated using rdflib"""
+    pass
@@ -1,6 +1,7 @@
 # projection.py
 # Author: Thomas MINIER - MIT License 2017-2020
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from rdflib.plugins.sparql.evalutils import _eval
 from rdflib import BNode, Literal, URIRef, Variable
@@ -10,6 +11,9 @@ from rdflib.plugins.sparql.sparql import Bindings, QueryContext
 from rdflib.util import from_n3
 
 
+from sage.query_engine.exceptions import NativeEvaluationError
+from sage.query_engine.iterators.expression_compiler import compile_native_bind
+from sage.query_engine.iterators.mappings import EMPTY_MAPPINGS, SolutionMappings
 from sage.query_engine.iterators.preemptable_iterator import PreemptableIterator
 from sage.query_engine.primitives import PreemptiveLoop
 from sage.query_engine.iterators.utils import find_in_mappings, EmptyIterator
@@ -128,6 +132,38 @@ def reify(s,p,o):
 register_custom_function(URIRef("hello"),myfunc,raw=True)
 register_custom_function(URIRef("summ"),summary,raw=True)
 
+@lru_cache(maxsize=1024)
+def compile_bind_expression(bindexpr: str, bindvar: str) -> Tuple[Any, Any]:
+    """Compile a SPARQL BIND expression using rdflib.
+
+    Compiled expressions are cached for the whole process, so saved plans
+    reloaded at each time quantum do not parse their BIND expressions again.
+
+    Args:
+      * bindexpr: A SPARQL BIND expression.
+      * bindvar: The bind variable.
+
+    Returns: A tuple (`expression`, `prologue`) where `expression` is the compiled expression,
+    which can be evaluated with a rdflib `QueryContext`, and `prologue` is the query prologue used to evaluate it.
+    """
+    compiled_expr = parseQuery(f"SELECT * WHERE {{?s ?p ?o . BIND({bindexpr} as {bindvar})}}")
+    compiled_expr = translateQuery(compiled_expr)
+    return compiled_expr.algebra.p.p.expr, compiled_expr.prologue
+
+
+@lru_cache(maxsize=1024)
+def compile_native_bind_expression(bindexpr: str, bindvar: str) -> Optional[Callable[[Optional[Dict[str, str]]], Union[Literal, URIRef, BNode]]]:
+    """Compile a SPARQL BIND expression into a native Python function, see `compile_native_bind`.
+
+    Args:
+      * bindexpr: A SPARQL BIND expression.
+      * bindvar: The bind variable.
+
+    Returns: The native function, or `None` if the expression can only be evaluated using rdflib.
+    """
+    return compile_native_bind(compile_bind_expression(bindexpr, bindvar)[0])
+
+
 class BindIterator(PreemptableIterator):
     """A BindIterator evaluates a BIND statement in a pipeline of iterators.
 
@@ -137,7 +173,7 @@ class BindIterator(PreemptableIterator):
       * bindvar: the bind variable
     """
 
-    def __init__(self, source: PreemptableIterator, bindexpr: str, bindvar: str, mu: Optional[Dict[str, str]] = None):
+    def __init__(self, source: PreemptableIterator, bindexpr: str, bindvar: str, mu: Optional[SolutionMappings] = None):
         super(BindIterator, self).__init__()
         self._source = source
         self._expr=bindexpr
@@ -147,12 +183,8 @@ class BindIterator(PreemptableIterator):
         #print("bindexpr:"+bindexpr)
         #print("bindvar:"+bindexpr)
 
-        compiled_expr = parseQuery(f"SELECT * WHERE {{?s ?p ?o . BIND({bindexpr} as {bindvar})}}")
-        compiled_expr = translateQuery(compiled_expr)
-        self._prologue = compiled_expr.prologue
-        #print("bind_compil:"+str(compiled_expr.algebra.p.p.expr))
-        #self._compiled_expression = compiled_expr.algebra.p.p.expr
-        self._compiled_expression = compiled_expr.algebra.p.p.expr
+        self._compiled_expression, self._prologue = compile_bind_expression(bindexpr, bindvar)
+        self._native_expression = compile_native_bind_expression(bindexpr, bindvar)
 
     def __repr__(self) -> str:
         return f"<BindIterator BIND {self._expr} AS {self._bindvar} FROM {self._source}>"
@@ -203,6 +235,13 @@ class BindIterator(PreemptableIterator):
             return self._result
 
 
+        if self._native_expression is not None:
+            try:
+                self._result = self._native_expression(bindings)
+                return self._result
+            except NativeEvaluationError:
+                # fallback to the rdflib evaluation
+                pass
         context = None
         if bindings is None:
             context=QueryContext(Bindings())
@@ -214,7 +253,7 @@ class BindIterator(PreemptableIterator):
         self._result=self._compiled_expression.eval(context)
         return self._result
 
-    def next_sync(self) -> Optional[Dict[str, str]]:
+    def next_sync(self) -> Optional[SolutionMappings]:
         """Get the next item from the iterator, following the iterator protocol.
 
         This function may contains `non interruptible` clauses which must
@@ -228,8 +267,7 @@ class BindIterator(PreemptableIterator):
             raise StopAsyncIteration()
 
         if self._source is None:
-            mappings=dict()
-            mappings[self._bindvar]=str(self._evaluate(self._mu))
+            mappings = EMPTY_MAPPINGS.extend(self._bindvar, str(self._evaluate(self._mu)))
             self._delivered=True
             return mappings
         else:
@@ -242,13 +280,12 @@ class BindIterator(PreemptableIterator):
             self._evaluate(self._mu)
             if not self.has_next():
                 raise StopAsyncIteration()
-            mu = self._mu
-            mu[self._bindvar]=str(self._result)
+            mu = self._mu.extend(self._bindvar, str(self._result))
             self._mu = None
             return mu
 
 
-    async def next(self) -> Optional[Dict[str, str]]:
+    async def next(self) -> Optional[SolutionMappings]:
         """Get the next item from the iterator, following the iterator protocol.
 
         This function may contains `non interruptible` clauses which must
@@ -262,24 +299,59 @@ class BindIterator(PreemptableIterator):
             raise StopAsyncIteration()
 
         if self._source is None:
-            mappings=dict()
-            mappings[self._bindvar]=str(self._evaluate(self._mu))
+            mappings = EMPTY_MAPPINGS.extend(self._bindvar, str(self._evaluate(self._mu)))
             self._delivered=True
             return mappings
         else:
             if self._mu is None:
                 self._mu = await self._source.next()
             with PreemptiveLoop() as loop:
-                while not self._evaluate(self._mu):
-                    self._mu = await self._source.next()
+                while self._mu is None or not self._evaluate(self._mu):
+                    # discard the rejected mappings, so they are not saved with the plan
+                    self._mu = None
                     await loop.tick()
-            if not self.has_next():
-                raise StopAsyncIteration()
-            mu = self._mu
-            mu[self._bindvar]=str(self._result)
+                    if loop.expired() or not self._source.has_next():
+                        return None
+                    self._mu = await self._source.next()
+            mu = self._mu.extend(self._bindvar, str(self._result))
             self._mu = None
             return mu
 
+    def supports_batch(self) -> bool:
+        """Return True if the iterator implements the batch protocol"""
+        return self._source is None or self._source.supports_batch()
+
+    async def next_batch(self, size: int) -> List[SolutionMappings]:
+        """Get the next batch of items from the iterator.
+
+        As with `next`, solution mappings for which the BIND expression
+        does not evaluate to a truthy value are discarded.
+
+        Argument: The maximum number of solution mappings to produce.
+
+        Returns: A list of at most `size` solution mappings, which may be empty.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        if not self.has_next():
+            raise StopAsyncIteration()
+        if self._source is None:
+            mappings = EMPTY_MAPPINGS.extend(self._bindvar, str(self._evaluate(self._mu)))
+            self._delivered = True
+            return [mappings]
+        candidates = list()
+        # first, evaluate the mappings left by a preempted call to next()
+        if self._mu is not None:
+            candidates.append(self._mu)
+            self._mu = None
+        if len(candidates) < size and self._source.has_next():
+            candidates += await self._source.next_batch(size - len(candidates))
+        batch = list()
+        for mu in candidates:
+            if mu is not None and self._evaluate(mu):
+                batch.append(mu.extend(self._bindvar, str(self._result)))
+        return batch
+
     def save(self) -> SavedBindIterator:
         """Save and serialize the iterator as a Protobuf message"""
         saved_bind = SavedBindIterator()
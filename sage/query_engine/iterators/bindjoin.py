@@ -0,0 +1,215 @@
+# bindjoin.py
+# Author: Thomas MINIER - MIT License 2017-2020
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sage.database.core.graph import Graph
+from sage.query_engine.iterators.mappings import SolutionMappings, selector
+from sage.query_engine.iterators.preemptable_iterator import PreemptableIterator
+from sage.query_engine.iterators.utils import encode_in_mappings, vars_positions
+from sage.query_engine.primitives import PreemptiveLoop
+from sage.query_engine.protobuf.iterators_pb2 import (SavedBindJoinIterator,
+                                                      TriplePattern)
+from sage.query_engine.protobuf.utils import pyDict_to_protoDict
+
+# Default number of solution mappings from the outer relation resolved per call to the database
+DEFAULT_BLOCK_SIZE = 50
+
+
+class BindJoinIterator(PreemptableIterator):
+    """A BindJoinIterator implements a Bind join (a.k.a. block Index Loop join) in a pipeline of iterators.
+
+    Unlike the IndexJoinIterator, which searches the inner triple pattern once per solution mappings of the outer relation,
+    it buffers a block of solution mappings from the outer relation, then resolves the inner triple pattern
+    for the whole block using a single call to the database (see `Graph.search_many`).
+
+    The state of the join is the block of solution mappings which remain to be joined, where the first one
+    is the block's current solution mappings, and the number of RDF triples already joined with it.
+
+    Args:
+      * source: Previous iterator in the pipeline, i.e., the outer relation of the join
+      * innerTriple: The inner relation, i.e., a triple pattern.
+      * graph: The RDF Graph on which the join is evaluated. It must support batched lookups.
+      * block_size: Maximum number of solution mappings from the outer relation per block.
+      * block: A block of solution mappings used to resume join processing.
+      * offset: Number of RDF triples already joined with the first solution mappings of the block, used to resume join processing.
+      * as_of: Perform all reads against a consistent snapshot represented by a timestamp.
+      * rows_in: Number of solution mappings read from the outer relation since the start of query execution, used to resume query processing.
+      * rows_out: Number of solution mappings produced since the start of query execution, used to resume query processing.
+      * projection: SPARQL variables kept in the solution mappings produced by the join, i.e., the ones still needed downstream, or `None` to keep all of them.
+    """
+
+    def __init__(self, source: PreemptableIterator, innerTriple: Dict[str, str], graph: Graph, block_size: int = DEFAULT_BLOCK_SIZE, block: Optional[List[SolutionMappings]] = None, offset: int = 0, as_of: Optional[datetime] = None, rows_in: int = 0, rows_out: int = 0, projection: Optional[List[str]] = None):
+        super(BindJoinIterator, self).__init__()
+        self._source = source
+        self._innerTriple = innerTriple
+        self._variables = vars_positions(innerTriple['subject'], innerTriple['predicate'], innerTriple['object'])
+        self._graph = graph
+        # RDF terms are substituted by their IDs when the graph encodes them
+        self._dictionary = graph.term_dictionary()
+        self._select = selector(tuple(self._variables), self._dictionary)
+        self._block_size = block_size
+        self._block = list(block) if block is not None else list()
+        # position in the block of the current solution mappings, and number of RDF triples joined with it
+        self._position = 0
+        self._offset = offset
+        self._start_timestamp = as_of
+        # the ongoing lookup of the block, and the next match read from it but not yet joined
+        self._lookup = None
+        self._lookahead = None
+        self._db_calls = 0
+        self._db_reads = 0
+        # runtime counters, saved with the plan so the join order can be revised (see `reoptimize`)
+        self._rows_in = rows_in
+        self._rows_out = rows_out
+        # variables kept in the solution mappings produced
+        self._projection = projection
+        self._projected_variables = frozenset(projection) if projection is not None else None
+        if len(self._block) > 0:
+            self._start_lookup()
+
+    def __repr__(self) -> str:
+        return f"<BindJoinIterator ({self._source} JOIN {{ {self._innerTriple['subject']} {self._innerTriple['predicate']} {self._innerTriple['object']} }})>"
+
+    def serialized_name(self) -> str:
+        """Get the name of the iterator, as used in the plan serialization protocol"""
+        return "bindjoin"
+
+    def db_calls(self) -> int:
+        """Get the number of calls to the database (i.e., searches) issued by the iterator since its creation"""
+        return self._db_calls
+
+    def db_reads(self) -> int:
+        """Get the number of RDF triples read from the database by the iterator since its creation"""
+        return self._db_reads
+
+    def has_next(self) -> bool:
+        """Return True if the iterator has more item to yield"""
+        return self._source.has_next() or self._has_match()
+
+    def _start_lookup(self) -> None:
+        """Resolve the inner triple pattern for all solution mappings in the current block, using a single call to the database"""
+        patterns = list()
+        dictionary = self._dictionary
+        for mappings in self._block:
+            patterns.append((encode_in_mappings(self._innerTriple['subject'], mappings, dictionary), encode_in_mappings(self._innerTriple['predicate'], mappings, dictionary), encode_in_mappings(self._innerTriple['object'], mappings, dictionary)))
+        self._db_calls += 1
+        self._lookup = self._graph.search_many_ids(patterns, offset=self._offset, as_of=self._start_timestamp)
+        self._position = 0
+        self._lookahead = None
+
+    def _has_match(self) -> bool:
+        """Return True if the ongoing lookup has more matches to join, and discard the block once all of them have been joined"""
+        if self._lookahead is None and self._lookup is not None:
+            self._lookahead = next(self._lookup, None)
+            if self._lookahead is None:
+                self._lookup = None
+                self._block = list()
+                self._position = 0
+                self._offset = 0
+            else:
+                self._db_reads += 1
+        return self._lookahead is not None
+
+    def _next_match(self) -> SolutionMappings:
+        """Join the next match of the ongoing lookup with its solution mappings from the block, keeping the SPARQL variables still needed downstream"""
+        index, triple = self._lookahead
+        self._lookahead = None
+        if index != self._position:
+            self._position = index
+            self._offset = 0
+        self._offset += 1
+        self._rows_out += 1
+        return self._block[index].join(self._select(triple), self._projected_variables)
+
+    def _block_is_ready(self) -> bool:
+        """Return True if the block being filled must be resolved, i.e., it is full or the outer relation is exhausted"""
+        return len(self._block) >= self._block_size or not self._source.has_next()
+
+    async def next(self) -> Optional[SolutionMappings]:
+        """Get the next item from the iterator, following the iterator protocol.
+
+        This function may contains `non interruptible` clauses which must
+        be atomically evaluated before preemption occurs.
+
+        If the time quantum expires while filling a block, the partial block is resolved right away,
+        so its state can be saved exactly.
+
+        Returns: A set of solution mappings, or `None` if none was produced during this call.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        if not self.has_next():
+            raise StopAsyncIteration()
+        with PreemptiveLoop() as loop:
+            while not self._has_match():
+                mappings = await self._source.next()
+                if mappings is not None:
+                    self._rows_in += 1
+                    self._block.append(mappings)
+                await loop.tick()
+                if len(self._block) > 0 and (loop.expired() or self._block_is_ready()):
+                    self._start_lookup()
+                if loop.expired() or not self.has_next():
+                    return None
+        return self._next_match()
+
+    def supports_batch(self) -> bool:
+        """Return True if the iterator implements the batch protocol"""
+        return self._source.supports_batch()
+
+    async def next_batch(self, size: int) -> List[SolutionMappings]:
+        """Get the next batch of items from the iterator.
+
+        The work done during a batch is bounded: at most `size` steps are performed,
+        where a step either reads a batch from the outer relation to fill the current block
+        or joins a batch of matches from the ongoing lookup.
+
+        Argument: The maximum number of solution mappings to produce.
+
+        Returns: A list of at most `size` solution mappings, which may be empty.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        if not self.has_next():
+            raise StopAsyncIteration()
+        batch = list()
+        steps = 0
+        while steps < size and len(batch) < size and self.has_next():
+            steps += 1
+            if self._has_match():
+                while len(batch) < size and self._has_match():
+                    batch.append(self._next_match())
+            else:
+                outer = await self._source.next_batch(self._block_size - len(self._block))
+                self._rows_in += len(outer)
+                self._block += outer
+                if len(self._block) > 0 and self._block_is_ready():
+                    self._start_lookup()
+        return batch
+
+    def save(self) -> SavedBindJoinIterator:
+        """Save and serialize the iterator as a Protobuf message"""
+        saved_join = SavedBindJoinIterator()
+        # save source operator
+        source_field = self._source.serialized_name() + '_source'
+        getattr(saved_join, source_field).CopyFrom(self._source.save())
+        # save inner join
+        inner = TriplePattern()
+        inner.subject = self._innerTriple['subject']
+        inner.predicate = self._innerTriple['predicate']
+        inner.object = self._innerTriple['object']
+        inner.graph = self._innerTriple['graph']
+        saved_join.inner.CopyFrom(inner)
+        # save the solution mappings of the block which remain to be joined
+        for mappings in self._block[self._position:]:
+            pyDict_to_protoDict(mappings, saved_join.block.add().mu)
+        saved_join.offset = self._offset
+        saved_join.block_size = self._block_size
+        if self._start_timestamp is not None:
+            saved_join.timestamp = self._start_timestamp.isoformat()
+        saved_join.rows_in = self._rows_in
+        saved_join.rows_out = self._rows_out
+        if self._projection is not None:
+            saved_join.projection.extend(self._projection)
+        return saved_join
@@ -0,0 +1,511 @@
+# expression_compiler.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import re
+from decimal import Decimal, InvalidOperation
+from functools import reduce
+from operator import ge, gt, le, lt, or_
+from typing import Any, Callable, Dict, Optional, Union
+
+from rdflib import BNode, Literal, URIRef, Variable
+
+from sage.query_engine.exceptions import NativeEvaluationError
+from sage.query_engine.iterators.mappings import SolutionMappings
+from sage.query_engine.iterators.utils import to_rdflib_term
+
+XSD = 'http://www.w3.org/2001/XMLSchema#'
+XSD_STRING = XSD + 'string'
+XSD_BOOLEAN = XSD + 'boolean'
+XSD_INTEGER = XSD + 'integer'
+XSD_DECIMAL = XSD + 'decimal'
+XSD_DOUBLE = XSD + 'double'
+XSD_FLOAT = XSD + 'float'
+RDF_LANGSTRING = 'http://www.w3.org/1999/02/22-rdf-syntax-ns#langString'
+
+# Kinds of RDF terms
+IRI = 0
+# simple literals, xsd:string literals and literals with a language tag
+STRING = 1
+NUMERIC = 2
+BOOLEAN = 3
+# blank nodes and literals that can only be evaluated by rdflib
+OPAQUE = 4
+
+# Literals in N3 format, without escaped characters.
+# Language tags must be in lower case, as rdflib may normalize them.
+_LITERAL = re.compile(r'^"([^"\\]*)"(?:@([a-z]+(?:-[a-z0-9]+)*)|\^\^<([^<>"{}|^`\\\s]*)>)?$')
+# Lexical forms left untouched by rdflib
+_INTEGER = re.compile(r'^(?:0|-?[1-9][0-9]*)$')
+_DECIMAL = re.compile(r'^-?[0-9]+\.[0-9]+$')
+_DOUBLE = re.compile(r'^-?[0-9]+(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?$')
+
+_ORDERINGS = {'<': lt, '>': gt, '<=': le, '>=': ge}
+_REGEX_FLAGS = {'i': re.IGNORECASE, 's': re.DOTALL, 'm': re.MULTILINE}
+
+ExpressionFunction = Callable[[Dict[str, str]], "Term"]
+
+
+class UnsupportedExpression(Exception):
+    """Raised when an expression cannot be compiled into a native expression"""
+    pass
+
+
+class Term(object):
+    """A RDF term, as manipulated by native expressions.
+
+    Args:
+      * kind: Kind of the RDF term (IRI, STRING, NUMERIC, BOOLEAN or OPAQUE).
+      * lexical: IRI or lexical form of the RDF term, or `None` if it cannot be computed without rdflib.
+      * lang: Language tag of the literal, if any.
+      * datatype: Datatype IRI of the literal, if any. Numbers computed by arithmetic expressions have no datatype.
+      * number: Python value of numeric and boolean literals.
+      * node: RDF term in rdflib format, if already known.
+      * source: RDF term in N3 format, as found in solution mappings, if the term comes from solution mappings.
+    """
+    __slots__ = ('kind', 'lexical', 'lang', 'datatype', 'number', 'node', 'source')
+
+    def __init__(self, kind: int, lexical: Optional[str] = None, lang: Optional[str] = None, datatype: Optional[str] = None,
+                 number: Optional[Union[int, float, Decimal, bool]] = None, node: Optional[Any] = None, source: Optional[str] = None):
+        self.kind = kind
+        self.lexical = lexical
+        self.lang = lang
+        self.datatype = datatype
+        self.number = number
+        self.node = node
+        self.source = source
+
+    def to_rdflib(self) -> Union[Literal, URIRef, BNode]:
+        """Get the RDF term in rdflib format.
+
+        Throws: `NativeEvaluationError` if only rdflib can compute the RDF term.
+        """
+        if self.source is not None:
+            return to_rdflib_term(self.source)
+        elif self.node is not None:
+            return self.node
+        elif self.kind == IRI:
+            return URIRef(self.lexical)
+        elif self.kind == STRING:
+            return Literal(self.lexical, lang=self.lang, datatype=URIRef(self.datatype) if self.datatype is not None else None)
+        elif self.kind == BOOLEAN:
+            return Literal(self.number)
+        # the datatype of a computed number depends on the version of rdflib
+        raise NativeEvaluationError("Cannot convert a computed number into a rdflib term")
+
+
+TRUE = Term(BOOLEAN, 'true', datatype=XSD_BOOLEAN, number=True, node=Literal(True))
+FALSE = Term(BOOLEAN, 'false', datatype=XSD_BOOLEAN, number=False, node=Literal(False))
+
+
+def parse_term(value: str) -> Term:
+    """Parse a RDF term found in solution mappings, following the same rules as `to_rdflib_term`.
+
+    Argument: A RDF Term in N3 format.
+
+    Returns: The RDF Term, as manipulated by native expressions.
+    """
+    if value.startswith('"'):
+        match = _LITERAL.match(value)
+        if match is None:
+            return Term(OPAQUE, source=value)
+        lexical, lang, datatype = match.groups()
+        if datatype is None:
+            return Term(STRING, lexical, lang=lang, source=value)
+        elif datatype == XSD_STRING:
+            return Term(STRING, lexical, datatype=datatype, source=value)
+        elif datatype == XSD_INTEGER and _INTEGER.match(lexical):
+            return Term(NUMERIC, lexical, datatype=datatype, number=int(lexical), source=value)
+        elif datatype == XSD_DECIMAL and _DECIMAL.match(lexical):
+            return Term(NUMERIC, datatype=datatype, number=Decimal(lexical), source=value)
+        elif (datatype == XSD_DOUBLE or datatype == XSD_FLOAT) and _DOUBLE.match(lexical):
+            return Term(NUMERIC, datatype=datatype, number=float(lexical), source=value)
+        elif datatype == XSD_BOOLEAN and (lexical == 'true' or lexical == 'false'):
+            return Term(BOOLEAN, lexical, datatype=datatype, number=lexical == 'true', source=value)
+        return Term(OPAQUE, source=value)
+    elif value.startswith('_'):
+        return Term(OPAQUE, source=value)
+    elif value.startswith('http'):
+        return Term(IRI, value, source=value)
+    return Term(STRING, value, source=value)
+
+
+def from_rdflib(node: Union[Literal, URIRef]) -> Term:
+    """Convert a RDF term in rdflib format, found in an expression, into a RDF term manipulated by native expressions"""
+    if isinstance(node, URIRef):
+        return Term(IRI, str(node), node=node)
+    datatype = str(node.datatype) if node.datatype is not None else None
+    value = node.value
+    if datatype is None or datatype == XSD_STRING:
+        if node.language is not None and node.language != node.language.lower():
+            return Term(OPAQUE, node=node)
+        return Term(STRING, str(node), lang=node.language, datatype=datatype, node=node)
+    elif datatype == XSD_INTEGER and type(value) is int:
+        return Term(NUMERIC, str(node), datatype=datatype, number=value, node=node)
+    elif datatype == XSD_DECIMAL and isinstance(value, Decimal):
+        return Term(NUMERIC, datatype=datatype, number=value, node=node)
+    elif (datatype == XSD_DOUBLE or datatype == XSD_FLOAT) and isinstance(value, float):
+        return Term(NUMERIC, datatype=datatype, number=value, node=node)
+    elif datatype == XSD_BOOLEAN and isinstance(value, bool):
+        return Term(BOOLEAN, str(node), datatype=datatype, number=value, node=node)
+    return Term(OPAQUE, node=node)
+
+
+def ebv(term: Term) -> bool:
+    """Compute the Effective Boolean Value of a RDF term.
+
+    Throws: `NativeEvaluationError` if the EBV of the term is an error or cannot be computed natively.
+    """
+    if term.kind == BOOLEAN:
+        return term.number
+    elif term.kind == STRING:
+        return len(term.lexical) > 0
+    elif term.kind == NUMERIC:
+        return bool(term.number)
+    raise NativeEvaluationError("Cannot compute the EBV of this term")
+
+
+def equals(left: Term, right: Term) -> bool:
+    """Test if two RDF terms are equals, as the SPARQL '=' operator does"""
+    if left.kind == IRI or right.kind == IRI:
+        if left.kind == right.kind:
+            return left.lexical == right.lexical
+        elif left.kind == OPAQUE or right.kind == OPAQUE:
+            raise NativeEvaluationError("Cannot compare this term")
+        return False
+    elif left.kind != right.kind or left.kind == OPAQUE:
+        raise NativeEvaluationError("Cannot compare these terms")
+    elif left.kind == STRING:
+        if left.lang is not None or right.lang is not None:
+            raise NativeEvaluationError("Cannot compare literals with language tags")
+        return left.lexical == right.lexical
+    return left.number == right.number
+
+
+def number(term: Term) -> Union[int, float, Decimal]:
+    """Get the value of a numeric literal"""
+    if term.kind != NUMERIC:
+        raise NativeEvaluationError("Not a numeric literal")
+    return term.number
+
+
+def string(term: Term) -> Term:
+    """Ensure that a RDF term is a simple literal, a xsd:string literal or a literal with a language tag"""
+    if term.kind != STRING:
+        raise NativeEvaluationError("Not a string literal")
+    return term
+
+
+def _compile_id_equality(expr: Any, negate: bool, fallback: ExpressionFunction) -> ExpressionFunction:
+    """Compile an equality between SPARQL variables and IRIs which compares the IDs of their RDF terms, when solution mappings store IDs of a term dictionary.
+
+    Two RDF terms are the same if and only if they have the same ID, but different literals can still be equal,
+    so IDs are only compared when none of them may be a literal. Otherwise, the equality is evaluated by `fallback`.
+    """
+    operands = list()
+    for operand in [expr.expr, expr.other]:
+        if isinstance(operand, Variable):
+            operands.append(('?' + str(operand), None))
+        elif isinstance(operand, URIRef):
+            operands.append((None, str(operand)))
+        else:
+            return fallback
+    if operands[0][0] is None and operands[1][0] is None:
+        return fallback
+
+    def term_id(mappings, decoder, operand):
+        key, iri = operand
+        return mappings.raw(key) if key is not None else decoder.encode(iri)
+
+    def id_equality(mappings):
+        if type(mappings) is SolutionMappings and mappings.schema.decoder is not None:
+            decoder = mappings.schema.decoder
+            a, b = term_id(mappings, decoder, operands[0]), term_id(mappings, decoder, operands[1])
+            if type(a) is int and type(b) is int and not decoder.may_be_literal(a) and not decoder.may_be_literal(b):
+                return TRUE if (a == b) != negate else FALSE
+        return fallback(mappings)
+    return id_equality
+
+
+def _compile_relational(expr: Any) -> ExpressionFunction:
+    if expr.other is None:
+        return _compile(expr.expr)
+    op = str(expr.op)
+    left = _compile(expr.expr)
+    right = _compile(expr.other)
+    if op == '=' or op == '!=':
+        negate = op == '!='
+
+        def equality(mappings):
+            return TRUE if equals(left(mappings), right(mappings)) != negate else FALSE
+        return _compile_id_equality(expr, negate, equality)
+    elif op in _ORDERINGS:
+        compare = _ORDERINGS[op]
+
+        def ordering(mappings):
+            a, b = left(mappings), right(mappings)
+            if a.kind == NUMERIC and b.kind == NUMERIC:
+                return TRUE if compare(a.number, b.number) else FALSE
+            elif a.kind == STRING and b.kind == STRING and a.lang is None and b.lang is None:
+                return TRUE if compare(a.lexical, b.lexical) else FALSE
+            raise NativeEvaluationError("Cannot compare these terms")
+        return ordering
+    raise UnsupportedExpression(f"Unsupported operator {op}")
+
+
+def _compile_and(expr: Any) -> ExpressionFunction:
+    if expr.other is None or len(expr.other) == 0:
+        return _compile(expr.expr)
+    operands = [_compile(expr.expr)] + [_compile(other) for other in expr.other]
+
+    def conjunction(mappings):
+        # like rdflib, all operands are evaluated before computing their EBV
+        for term in [operand(mappings) for operand in operands]:
+            if not ebv(term):
+                return FALSE
+        return TRUE
+    return conjunction
+
+
+def _compile_or(expr: Any) -> ExpressionFunction:
+    if expr.other is None or len(expr.other) == 0:
+        return _compile(expr.expr)
+    operands = [_compile(expr.expr)] + [_compile(other) for other in expr.other]
+
+    def disjunction(mappings):
+        # like rdflib, all operands are evaluated before computing their EBV
+        for term in [operand(mappings) for operand in operands]:
+            if ebv(term):
+                return TRUE
+        return FALSE
+    return disjunction
+
+
+def _compile_not(expr: Any) -> ExpressionFunction:
+    operand = _compile(expr.expr)
+
+    def negation(mappings):
+        return FALSE if ebv(operand(mappings)) else TRUE
+    return negation
+
+
+def _compile_additive(expr: Any) -> ExpressionFunction:
+    if expr.other is None or len(expr.other) == 0:
+        return _compile(expr.expr)
+    first = _compile(expr.expr)
+    operands = list(zip([str(op) for op in expr.op], [_compile(other) for other in expr.other]))
+
+    def addition(mappings):
+        # same numeric promotions as rdflib
+        res = number(first(mappings))
+        for op, operand in operands:
+            n = number(operand(mappings))
+            if isinstance(n, Decimal) and isinstance(res, float):
+                n = float(n)
+            if isinstance(n, float) and isinstance(res, Decimal):
+                res = float(res)
+            res = res + n if op == '+' else res - n
+        return Term(NUMERIC, number=res)
+    return addition
+
+
+def _compile_multiplicative(expr: Any) -> ExpressionFunction:
+    if expr.other is None or len(expr.other) == 0:
+        return _compile(expr.expr)
+    first = _compile(expr.expr)
+    operands = list(zip([str(op) for op in expr.op], [_compile(other) for other in expr.other]))
+
+    def multiplication(mappings):
+        # same numeric promotions as rdflib
+        try:
+            res = Decimal(number(first(mappings)))
+            for op, operand in operands:
+                f = number(operand(mappings))
+                if type(f) == float:
+                    res = float(res)
+                if op == '*':
+                    res *= f
+                else:
+                    res /= f
+        except (InvalidOperation, ZeroDivisionError, TypeError):
+            raise NativeEvaluationError("Cannot evaluate this arithmetic expression")
+        return Term(NUMERIC, number=res)
+    return multiplication
+
+
+def _compile_regex(expr: Any) -> ExpressionFunction:
+    pattern, flags = expr.pattern, expr.flags
+    # only constant patterns and flags are precompiled
+    if not isinstance(pattern, Literal) or (flags is not None and not isinstance(flags, Literal)):
+        raise UnsupportedExpression("REGEX with a non-constant pattern")
+    if from_rdflib(pattern).kind != STRING or (flags is not None and from_rdflib(flags).kind != STRING):
+        raise UnsupportedExpression("REGEX with a non-string pattern")
+    re_flags = 0
+    if flags:
+        re_flags = reduce(or_, [_REGEX_FLAGS.get(f, 0) for f in str(flags)])
+    try:
+        regex = re.compile(str(pattern), re_flags)
+    except re.error:
+        raise UnsupportedExpression("Invalid regular expression")
+    text = _compile(expr.text)
+
+    def match(mappings):
+        return TRUE if regex.search(string(text(mappings)).lexical) else FALSE
+    return match
+
+
+def _compile_contains(expr: Any) -> ExpressionFunction:
+    left = _compile(expr.arg1)
+    right = _compile(expr.arg2)
+
+    def contains(mappings):
+        a, b = string(left(mappings)), string(right(mappings))
+        if b.lang and a.lang != b.lang:
+            raise NativeEvaluationError("Incompatible arguments to CONTAINS")
+        return TRUE if b.lexical in a.lexical else FALSE
+    return contains
+
+
+def _compile_str(expr: Any) -> ExpressionFunction:
+    operand = _compile(expr.arg)
+
+    def to_str(mappings):
+        term = operand(mappings)
+        if term.kind == OPAQUE or term.lexical is None:
+            raise NativeEvaluationError("Cannot compute the lexical form of this term")
+        return Term(STRING, term.lexical)
+    return to_str
+
+
+def _compile_lang(expr: Any) -> ExpressionFunction:
+    operand = _compile(expr.arg)
+
+    def lang(mappings):
+        term = operand(mappings)
+        if term.kind == IRI or term.kind == OPAQUE:
+            raise NativeEvaluationError("Cannot get the language tag of a non-literal")
+        return Term(STRING, term.lang or "")
+    return lang
+
+
+def _compile_datatype(expr: Any) -> ExpressionFunction:
+    operand = _compile(expr.arg)
+
+    def datatype(mappings):
+        term = operand(mappings)
+        if term.kind == STRING:
+            if term.lang:
+                return Term(IRI, RDF_LANGSTRING)
+            return Term(IRI, term.datatype or XSD_STRING)
+        elif (term.kind == NUMERIC or term.kind == BOOLEAN) and term.datatype is not None:
+            return Term(IRI, term.datatype)
+        raise NativeEvaluationError("Cannot get the datatype of this term")
+    return datatype
+
+
+def _compile_if(expr: Any) -> ExpressionFunction:
+    condition = _compile(expr.arg1)
+    then_branch = _compile(expr.arg2)
+    else_branch = _compile(expr.arg3)
+
+    def if_then_else(mappings):
+        return then_branch(mappings) if ebv(condition(mappings)) else else_branch(mappings)
+    return if_then_else
+
+
+def _compile_concat(expr: Any) -> ExpressionFunction:
+    operands = [_compile(arg) for arg in expr.arg]
+
+    def concat(mappings):
+        terms = [string(operand(mappings)) for operand in operands]
+        # datatype and language tag are kept only if they are shared by all arguments
+        datatypes = set(term.datatype for term in terms)
+        langs = set(term.lang for term in terms)
+        datatype = datatypes.pop() if len(datatypes) == 1 else None
+        lang = langs.pop() if len(langs) == 1 else None
+        return Term(STRING, "".join([term.lexical for term in terms]), lang=lang, datatype=datatype)
+    return concat
+
+
+_COMPILERS = {
+    'RelationalExpression': _compile_relational,
+    'ConditionalAndExpression': _compile_and,
+    'ConditionalOrExpression': _compile_or,
+    'UnaryNot': _compile_not,
+    'AdditiveExpression': _compile_additive,
+    'MultiplicativeExpression': _compile_multiplicative,
+    'Builtin_REGEX': _compile_regex,
+    'Builtin_CONTAINS': _compile_contains,
+    'Builtin_STR': _compile_str,
+    'Builtin_LANG': _compile_lang,
+    'Builtin_DATATYPE': _compile_datatype,
+    'Builtin_IF': _compile_if,
+    'Builtin_CONCAT': _compile_concat
+}
+
+
+def _compile(expr: Any) -> ExpressionFunction:
+    """Recursively compile a rdflib expression into a function that evaluates it on a set of solution mappings"""
+    if isinstance(expr, Variable):
+        key = '?' + str(expr)
+
+        def variable(mappings):
+            if key not in mappings:
+                raise NativeEvaluationError(f"Variable {key} is not bound")
+            return parse_term(mappings[key])
+        return variable
+    elif isinstance(expr, (Literal, URIRef)):
+        term = from_rdflib(expr)
+        if term.kind == OPAQUE:
+            raise UnsupportedExpression(f"Unsupported RDF term {expr.n3()}")
+        return lambda mappings: term
+    name = getattr(expr, 'name', None)
+    if name not in _COMPILERS:
+        raise UnsupportedExpression(f"Unsupported expression {name}")
+    return _COMPILERS[name](expr)
+
+
+def compile_native_filter(expression: Any) -> Optional[Callable[[Dict[str, str]], bool]]:
+    """Compile a SPARQL FILTER expression into a native Python function.
+
+    The native function works directly on solution mappings, without converting them to rdflib terms.
+    It supports relational operators, &&, ||, !, arithmetic, REGEX, CONTAINS, STR, LANG, DATATYPE, IF and CONCAT.
+    Its outcome is the same as the truth value of the rdflib evaluation of the expression.
+    Solution mappings that it cannot evaluate (errors, unusual RDF terms, etc.) raise a `NativeEvaluationError`,
+    and must be evaluated using rdflib.
+
+    Argument: A SPARQL FILTER expression, compiled by rdflib.
+
+    Returns: The native function, or `None` if the expression is not supported.
+    """
+    try:
+        evaluate = _compile(expression)
+    except UnsupportedExpression:
+        return None
+
+    def native_filter(mappings: Dict[str, str]) -> bool:
+        result = evaluate(mappings)
+        if result.kind == BOOLEAN or result.kind == NUMERIC:
+            return bool(result.number)
+        elif result.kind == STRING or result.kind == IRI:
+            return len(result.lexical) > 0
+        return bool(result.to_rdflib())
+    return native_filter
+
+
+def compile_native_bind(expression: Any) -> Optional[Callable[[Optional[Dict[str, str]]], Union[Literal, URIRef, BNode]]]:
+    """Compile a SPARQL BIND expression into a native Python function.
+
+    The native function supports the same expressions as `compile_native_filter`, and returns
+    the same rdflib term as the rdflib evaluation of the expression.
+
+    Argument: A SPARQL BIND expression, compiled by rdflib.
+
+    Returns: The native function, or `None` if the expression is not supported.
+    """
+    try:
+        evaluate = _compile(expression)
+    except UnsupportedExpression:
+        return None
+
+    def native_bind(mappings: Optional[Dict[str, str]]) -> Union[Literal, URIRef, BNode]:
+        return evaluate(mappings if mappings is not None else dict()).to_rdflib()
+    return native_bind
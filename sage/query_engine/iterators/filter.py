@@ -1,16 +1,21 @@
 # filter.py
 # Author: Thomas MINIER - MIT License 2017-2020
-from typing import Dict, Optional, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from rdflib import Literal, URIRef, Variable, BNode
+from rdflib import Variable
 from rdflib.plugins.sparql.algebra import translateQuery
 from rdflib.plugins.sparql.parser import parseQuery
 from rdflib.plugins.sparql.sparql import Bindings, QueryContext
-from rdflib.util import from_n3,to_term
+from rdflib.util import to_term
 from rdflib.plugins.parsers.ntriples import unquote,uriquote
 from rdflib.term import _is_valid_uri
 
+from sage.query_engine.iterators.mappings import SolutionMappings
+from sage.query_engine.exceptions import NativeEvaluationError
+from sage.query_engine.iterators.expression_compiler import compile_native_filter
 from sage.query_engine.iterators.preemptable_iterator import PreemptableIterator
+from sage.query_engine.iterators.utils import to_rdflib_term
 from sage.query_engine.primitives import PreemptiveLoop
 from sage.query_engine.protobuf.iterators_pb2 import SavedFilterIterator
 from sage.query_engine.protobuf.utils import pyDict_to_protoDict
@@ -18,51 +23,58 @@ from sage.query_engine.protobuf.utils import pyDict_to_protoDict
 import logging
 logger = logging.getLogger(__name__)
 import warnings
-import sys
 
-def to_rdflib_term(value: str) -> Union[Literal, URIRef, Variable, BNode]:
-    """Convert a N3 term to a RDFLib Term.
 
-    Argument: A RDF Term in N3 format.
+@lru_cache(maxsize=1024)
+def compile_filter_expression(expression: str) -> Tuple[Any, Any]:
+    """Compile a SPARQL FILTER expression using rdflib.
 
-    Returns: The RDF Term in rdflib format.
+    Compiled expressions are cached for the whole process, so saved plans
+    reloaded at each time quantum do not parse their FILTER expressions again.
+
+    Argument: A SPARQL FILTER expression.
+
+    Returns: A tuple (`expression`, `prologue`) where `expression` is the compiled expression,
+    which can be evaluated with a rdflib `QueryContext`, and `prologue` is the query prologue used to evaluate it.
+    """
+    compiled_expr = parseQuery(f"SELECT * WHERE {{?s ?p ?o . FILTER({expression})}}")
+    compiled_expr = translateQuery(compiled_expr)
+    return compiled_expr.algebra.p.p.expr, compiled_expr.prologue
+
+
+@lru_cache(maxsize=1024)
+def compile_native_filter_expression(expression: str) -> Optional[Callable[[Dict[str, str]], bool]]:
+    """Compile a SPARQL FILTER expression into a native Python function, see `compile_native_filter`.
+
+    Argument: A SPARQL FILTER expression.
+
+    Returns: The native function, or `None` if the expression can only be evaluated using rdflib.
     """
-# Tbe real pb:
-# From variable -> we create mappings by reading in the base
-# however:
-#  - We dont remember if it was a URI, Bnode, or litteral
-#  - And when we want to process filters, or bindings with RDFLib
-# we have to convert strings to RDFTerm in order to process them with
-# rdflib evaluation functions
-
-    ## if data has been ingested with postgres sput !!
-    if value.startswith('"'):
+    return compile_native_filter(compile_filter_expression(expression)[0])
+
+
+def evaluate_filter(bindings: SolutionMappings, compiled_expression: Any, prologue: Any, native_expression: Optional[Callable[[Dict[str, str]], bool]] = None) -> bool:
+    """Evaluate a compiled SPARQL FILTER expression with a set of solution mappings.
+
+    Args:
+      * bindings: A set of solution mappings.
+      * compiled_expression: The expression compiled using rdflib, see `compile_filter_expression`.
+      * prologue: The query prologue used to evaluate the compiled expression.
+      * native_expression: The expression compiled into a native function, see `compile_native_filter_expression`, used first if not `None`.
+
+    Returns: The outcome of evaluating the SPARQL FILTER on the input set of solution mappings.
+    """
+    if native_expression is not None:
         try:
-            return from_n3(value)
-        except:
-            return Literal(f"{sys.exc_info()[0]}")
-    elif value.startswith('_'):
-        return BNode(value)
-    elif value.startswith('http'):
-        return URIRef(value)
-    else:
-        return Literal(value)
-
-    # if value.startswith('http') or value.startswith('file') or value.startswith('mailto'):
-    #     return URIRef(value)
-    # #managing Literals
-    # #"That Seventies Show"^^<http://www.w3.org/2001/XMLSchema#string>
-    # # generate N3 repr and parse...
-    # result=None
-    # try :
-    #     if value.startswith('"'):
-    #         result=from_n3(value)
-    #     else:
-    #         result=from_n3('"'+value+'"')
-    # except:
-    #     logger.warning(f'to_rdflib_term: {value} cannot be converted to RDF term. reason: {sys.exc_info()[0]}')
-    #     result=Literal(value.encode('utf-8','replace').decode('utf-8'))
-    # return result
+            return native_expression(bindings)
+        except NativeEvaluationError:
+            # fallback to the rdflib evaluation
+            pass
+    d = {Variable(key[1:]): to_rdflib_term(value) for key, value in bindings.items()}
+    b = Bindings(d=d)
+    context = QueryContext(bindings=b)
+    context.prologue = prologue
+    return compiled_expression.eval(context)
 
 
 class FilterIterator(PreemptableIterator):
@@ -74,16 +86,14 @@ class FilterIterator(PreemptableIterator):
       * mu: Last set of mappings read by the iterator.
     """
 
-    def __init__(self, source: PreemptableIterator, expression: str, mu: Optional[Dict[str, str]] = None):
+    def __init__(self, source: PreemptableIterator, expression: str, mu: Optional[SolutionMappings] = None):
         super(FilterIterator, self).__init__()
         self._source = source
         self._raw_expression = expression
         self._mu = mu
         # compile the expression using rdflib
-        compiled_expr = parseQuery(f"SELECT * WHERE {{?s ?p ?o . FILTER({expression})}}")
-        compiled_expr = translateQuery(compiled_expr)
-        self._prologue = compiled_expr.prologue
-        self._compiled_expression = compiled_expr.algebra.p.p.expr
+        self._compiled_expression, self._prologue = compile_filter_expression(expression)
+        self._native_expression = compile_native_filter_expression(expression)
 
     def __repr__(self) -> str:
         return f"<FilterIterator '{self._raw_expression}' on {self._source}>"
@@ -92,20 +102,16 @@ class FilterIterator(PreemptableIterator):
         """Get the name of the iterator, as used in the plan serialization protocol"""
         return "filter"
 
-    def _evaluate(self, bindings: Dict[str, str]) -> bool:
+    def _evaluate(self, bindings: SolutionMappings) -> bool:
         """Evaluate the FILTER expression with a set mappings.
 
         Argument: A set of solution mappings.
 
         Returns: The outcome of evaluating the SPARQL FILTER on the input set of solution mappings.
         """
-        d = {Variable(key[1:]): to_rdflib_term(value) for key, value in bindings.items()}
-        b = Bindings(d=d)
-        context = QueryContext(bindings=b)
-        context.prologue = self._prologue
-        return self._compiled_expression.eval(context)
+        return evaluate_filter(bindings, self._compiled_expression, self._prologue, native_expression=self._native_expression)
 
-    def next_sync(self) -> Optional[Dict[str, str]]:
+    def next_sync(self) -> Optional[SolutionMappings]:
         """ Only for internal test !!
         """
         if not self.has_next():
@@ -125,12 +131,15 @@ class FilterIterator(PreemptableIterator):
         return mu
 
 
-    async def next(self) -> Optional[Dict[str, str]]:
+    async def next(self) -> Optional[SolutionMappings]:
         """Get the next item from the iterator, following the iterator protocol.
 
         This function may contains `non interruptible` clauses which must
         be atomically evaluated before preemption occurs.
 
+        If the time quantum expires while looking for solution mappings that pass the filter,
+        the iterator stops between two reads from its source, so its state can be saved exactly.
+
         Returns: A set of solution mappings, or `None` if none was produced during this call.
 
         Throws: `StopAsyncIteration` if the iterator cannot produce more items.
@@ -140,15 +149,44 @@ class FilterIterator(PreemptableIterator):
         if self._mu is None:
             self._mu = await self._source.next()
         with PreemptiveLoop() as loop:
-            while not self._evaluate(self._mu):
-                self._mu = await self._source.next()
+            while self._mu is None or not self._evaluate(self._mu):
+                # discard the rejected mappings, so they are not saved with the plan
+                self._mu = None
                 await loop.tick()
-        if not self.has_next():
-            raise StopAsyncIteration()
+                if loop.expired() or not self._source.has_next():
+                    return None
+                self._mu = await self._source.next()
         mu = self._mu
         self._mu = None
         return mu
 
+    def supports_batch(self) -> bool:
+        """Return True if the iterator implements the batch protocol"""
+        return self._source.supports_batch()
+
+    async def next_batch(self, size: int) -> List[SolutionMappings]:
+        """Get the next batch of items from the iterator.
+
+        At most `size` solution mappings are read from the source, so the batch
+        may contain less than `size` solution mappings.
+
+        Argument: The maximum number of solution mappings to produce.
+
+        Returns: A list of at most `size` solution mappings, which may be empty.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        if not self.has_next():
+            raise StopAsyncIteration()
+        candidates = list()
+        # first, evaluate the mappings left by a preempted call to next()
+        if self._mu is not None:
+            candidates.append(self._mu)
+            self._mu = None
+        if len(candidates) < size and self._source.has_next():
+            candidates += await self._source.next_batch(size - len(candidates))
+        return [mu for mu in candidates if mu is not None and self._evaluate(mu)]
+
     def has_next(self) -> bool:
         """Return True if the iterator has more item to yield"""
         return self._mu is not None or self._source.has_next()
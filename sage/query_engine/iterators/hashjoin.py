@@ -0,0 +1,252 @@
+# hashjoin.py
+# Author: Thomas MINIER - MIT License 2017-2020
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Union
+
+from sage.database.core.graph import Graph
+from sage.database.db_iterator import DBIterator
+from sage.query_engine.iterators.mappings import SolutionMappings, selector
+from sage.query_engine.iterators.nlj import IndexJoinIterator
+from sage.query_engine.iterators.preemptable_iterator import PreemptableIterator
+from sage.query_engine.iterators.utils import vars_positions
+from sage.query_engine.primitives import PreemptiveLoop
+from sage.query_engine.protobuf.iterators_pb2 import (SavedHashJoinIterator,
+                                                      SavedIndexJoinIterator,
+                                                      TriplePattern)
+from sage.query_engine.protobuf.utils import pyDict_to_protoDict
+
+# Default maximum number of solution mappings held in the hash table of a hash join
+DEFAULT_BUDGET = 10000
+
+
+class HashJoinIterator(PreemptableIterator):
+    """A HashJoinIterator implements a Hash join in a pipeline of iterators.
+
+    The inner relation, a triple pattern, is first scanned to build a hash table indexed by the join variables.
+    Then, the solution mappings of the outer relation are used to probe the hash table.
+
+    The hash table holds at most `budget` solution mappings. If the inner relation turns out to be larger
+    during the build phase, the hash table is dropped and the join continues as an Index Loop join.
+
+    The hash table is never serialized: when the join is resumed, it is rebuilt deterministically
+    by scanning the inner relation again, up to the position reached when the join was saved.
+
+    Args:
+      * source: Previous iterator in the pipeline, i.e., the outer relation of the join.
+      * build: A DBIterator that scans the inner relation from its start.
+      * innerTriple: The inner relation, i.e., a triple pattern.
+      * graph: The RDF Graph on which the join is evaluated.
+      * join_vars: SPARQL variables shared by both relations, used to index the hash table.
+      * budget: Maximum number of solution mappings held in the hash table.
+      * built: True if the hash table was completely built when the join was saved.
+      * build_last_read: The `last_read` ID of the scan of the inner relation when the join was saved, used to rebuild the hash table.
+      * currentBinding: The solution mappings being probed when the join was saved.
+      * position: Number of matches of `currentBinding` already produced when the join was saved.
+      * as_of: Perform all reads against a consistent snapshot represented by a timestamp.
+    """
+
+    def __init__(self, source: PreemptableIterator, build: DBIterator, innerTriple: Dict[str, str], graph: Graph, join_vars: List[str], budget: int = DEFAULT_BUDGET, built: bool = False, build_last_read: Optional[str] = None, currentBinding: Optional[SolutionMappings] = None, position: int = 0, as_of: Optional[datetime] = None):
+        super(HashJoinIterator, self).__init__()
+        self._source = source
+        self._build = build
+        self._innerTriple = innerTriple
+        self._variables = vars_positions(innerTriple['subject'], innerTriple['predicate'], innerTriple['object'])
+        # the hash table is indexed by IDs when the inner relation is read as triples of IDs
+        self._dictionary = build.term_dictionary()
+        self._select = selector(tuple(self._variables), self._dictionary)
+        self._graph = graph
+        self._join_vars = list(join_vars)
+        self._budget = budget
+        self._start_timestamp = as_of
+        self._table = dict()
+        self._table_size = 0
+        self._built = False
+        self._currentBinding = None
+        self._bucket = list()
+        self._position = 0
+        # the Index Loop join used when the inner relation exceeds the budget
+        self._fallback = None
+        self._db_reads = 0
+        if build_last_read is not None:
+            self._rebuild(built, build_last_read)
+        if currentBinding is not None:
+            self._currentBinding = currentBinding
+            self._bucket = self._probe(currentBinding)
+            self._position = position
+
+    def __repr__(self) -> str:
+        return f"<HashJoinIterator ({self._source} JOIN {{ {self._innerTriple['subject']} {self._innerTriple['predicate']} {self._innerTriple['object']} }})>"
+
+    def serialized_name(self) -> str:
+        """Get the name of the iterator, as used in the plan serialization protocol"""
+        if self._fallback is not None:
+            return self._fallback.serialized_name()
+        return "hashjoin"
+
+    def db_calls(self) -> int:
+        """Get the number of calls to the database (i.e., searches) issued by the iterator since its creation"""
+        if self._fallback is not None:
+            return 1 + self._fallback.db_calls()
+        return 1
+
+    def db_reads(self) -> int:
+        """Get the number of RDF triples read from the database by the iterator since its creation"""
+        if self._fallback is not None:
+            return self._db_reads + self._fallback.db_reads()
+        return self._db_reads
+
+    def has_next(self) -> bool:
+        """Return True if the iterator has more item to yield"""
+        if self._fallback is not None:
+            return self._fallback.has_next()
+        return self._source.has_next() or self._position < len(self._bucket)
+
+    def _key(self, mappings: SolutionMappings) -> Tuple[Union[int, str], ...]:
+        """Get the key of a set of solution mappings in the hash table"""
+        if self._dictionary is not None:
+            return tuple(mappings.encoded(variable, self._dictionary) for variable in self._join_vars)
+        return tuple(mappings[variable] for variable in self._join_vars)
+
+    def _insert(self, triple: Tuple[str, str, str]) -> None:
+        """Insert a RDF triple from the inner relation into the hash table"""
+        mappings = self._select(triple)
+        key = self._key(mappings)
+        if key not in self._table:
+            self._table[key] = list()
+        self._table[key].append(mappings)
+        self._table_size += 1
+
+    def _read_build(self) -> None:
+        """Read the next RDF triple from the inner relation, and switch to an Index Loop join if the budget is exceeded"""
+        if not self._build.has_next():
+            self._built = True
+            return
+        triple = next(self._build)
+        self._db_reads += 1
+        if triple is not None:
+            self._insert(triple)
+        if self._table_size > self._budget:
+            self._table = dict()
+            self._build = None
+            self._fallback = IndexJoinIterator(self._source, self._innerTriple, self._graph, as_of=self._start_timestamp, cache=self._graph.lookup_cache())
+
+    def _rebuild(self, built: bool, build_last_read: str) -> None:
+        """Rebuild the hash table as it was when the join was saved.
+
+        The budget is not enforced when the hash table was complete, as the outer relation may already have been probed.
+        """
+        while self._build.has_next() and (built or self._build.last_read() != build_last_read):
+            triple = next(self._build)
+            self._db_reads += 1
+            if triple is not None:
+                self._insert(triple)
+        self._built = built or not self._build.has_next()
+
+    def _probe(self, mappings: Optional[SolutionMappings]) -> List[SolutionMappings]:
+        """Find all solution mappings in the hash table compatible with a set of solution mappings"""
+        if mappings is None:
+            return list()
+        if all(variable in mappings for variable in self._join_vars):
+            return self._table.get(self._key(mappings), list())
+        # some join variables are unbound, so the hash table cannot be used as an index
+        return [mu for bucket in self._table.values() for mu in bucket if all(mappings.get(k, v) == v for k, v in mu.items())]
+
+    async def next(self) -> Optional[SolutionMappings]:
+        """Get the next item from the iterator, following the iterator protocol.
+
+        This function may contains `non interruptible` clauses which must
+        be atomically evaluated before preemption occurs.
+
+        Returns: A set of solution mappings, or `None` if none was produced during this call.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        if self._fallback is not None:
+            return await self._fallback.next()
+        if not self.has_next():
+            raise StopAsyncIteration()
+        with PreemptiveLoop() as loop:
+            while not self._built:
+                self._read_build()
+                await loop.tick()
+                if self._fallback is not None or loop.expired():
+                    return None
+            while self._position >= len(self._bucket):
+                self._currentBinding = await self._source.next()
+                self._bucket = self._probe(self._currentBinding)
+                self._position = 0
+                await loop.tick()
+                if loop.expired() or not self.has_next():
+                    return None
+        self._position += 1
+        return self._currentBinding.join(self._bucket[self._position - 1])
+
+    def supports_batch(self) -> bool:
+        """Return True if the iterator implements the batch protocol"""
+        return self._source.supports_batch()
+
+    async def next_batch(self, size: int) -> List[SolutionMappings]:
+        """Get the next batch of items from the iterator.
+
+        The work done during a batch is bounded: at most `size` steps are performed,
+        where a step either reads RDF triples from the inner relation to build the hash table,
+        probes the hash table with a set of mappings from the outer relation, or joins a batch of matches.
+
+        Argument: The maximum number of solution mappings to produce.
+
+        Returns: A list of at most `size` solution mappings, which may be empty.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        if self._fallback is not None:
+            return await self._fallback.next_batch(size)
+        if not self.has_next():
+            raise StopAsyncIteration()
+        batch = list()
+        steps = 0
+        while steps < size and len(batch) < size and self._fallback is None and self.has_next():
+            steps += 1
+            if not self._built:
+                for _ in range(size):
+                    self._read_build()
+                    if self._built or self._fallback is not None:
+                        break
+            elif self._position < len(self._bucket):
+                while len(batch) < size and self._position < len(self._bucket):
+                    batch.append(self._currentBinding.join(self._bucket[self._position]))
+                    self._position += 1
+            else:
+                outer = await self._source.next_batch(1)
+                if len(outer) > 0:
+                    self._currentBinding = outer[0]
+                    self._bucket = self._probe(self._currentBinding)
+                    self._position = 0
+        return batch
+
+    def save(self) -> Union[SavedHashJoinIterator, SavedIndexJoinIterator]:
+        """Save and serialize the iterator as a Protobuf message"""
+        if self._fallback is not None:
+            return self._fallback.save()
+        saved_join = SavedHashJoinIterator()
+        # save source operator
+        source_field = self._source.serialized_name() + '_source'
+        getattr(saved_join, source_field).CopyFrom(self._source.save())
+        # save inner join
+        inner = TriplePattern()
+        inner.subject = self._innerTriple['subject']
+        inner.predicate = self._innerTriple['predicate']
+        inner.object = self._innerTriple['object']
+        inner.graph = self._innerTriple['graph']
+        saved_join.inner.CopyFrom(inner)
+        saved_join.join_vars.extend(self._join_vars)
+        saved_join.budget = self._budget
+        # the hash table is rebuilt from the position reached by the scan of the inner relation
+        saved_join.built = self._built
+        if not self._built:
+            saved_join.build_last_read = self._build.last_read()
+        if self._currentBinding is not None:
+            pyDict_to_protoDict(self._currentBinding, saved_join.muc)
+        saved_join.position = self._position
+        if self._start_timestamp is not None:
+            saved_join.timestamp = self._start_timestamp.isoformat()
+        return saved_join
@@ -0,0 +1,219 @@
+# leapfrog.py
+# Author: Thomas MINIER - MIT License 2017-2020
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sage.database.core.graph import Graph
+from sage.query_engine.iterators.mappings import SolutionMappings, schema_of
+from sage.query_engine.iterators.preemptable_iterator import PreemptableIterator
+from sage.query_engine.primitives import PreemptiveLoop
+from sage.query_engine.protobuf.iterators_pb2 import (SavedLeapfrogJoinIterator,
+                                                      TriplePattern)
+
+# A cursor on the RDF terms of a SPARQL variable: (key, RDF term, position of the RDF term in the triple pattern that produced it)
+Cursor = Tuple[Any, str, str]
+
+POSITIONS = ['subject', 'predicate', 'object']
+
+
+class LeapfrogJoinIterator(PreemptableIterator):
+    """A LeapfrogJoinIterator evaluates a Basic Graph Pattern using a Leapfrog Triejoin, a worst-case optimal join algorithm.
+
+    The variables of the BGP are bound one after the other, following a global order. The RDF terms of a variable
+    are the intersection of the RDF terms of all triple patterns that contain it, given the RDF terms bound to the previous variables.
+    This intersection is computed by leapfrogging over the triple patterns: each one is asked in turn for its smallest RDF term
+    above the largest RDF term found so far (see `Graph.seek`), until they all agree.
+    Unlike a left-linear tree of joins, no intermediate results are ever produced, so cyclic BGPs are evaluated
+    in time bounded by the size of their output.
+
+    The state of the join is a cursor per variable: the RDF terms bound to the previous variables,
+    and the lower bound of the RDF terms of the variable being searched. Each step of the join issues one seek to the database.
+
+    Args:
+      * patterns: The triple patterns of the BGP, with a common graph.
+      * variables: The SPARQL variables of the BGP, in the order in which they are bound.
+      * graph: The RDF Graph on which the BGP is evaluated. It must support sorted seeks.
+      * bound: The cursors of the bound variables, used to resume query processing.
+      * lower: The lower bound of the RDF terms of the variable being searched, used to resume query processing.
+      * strict: True if the RDF term of the lower bound has already been explored, used to resume query processing.
+      * exhausted: True if the join has no more solutions mappings to produce, used to resume query processing.
+      * agreed: The number of consecutive triple patterns which agree on the lower bound, used to resume query processing.
+      * next_atom: The index of the next triple pattern to seek for the variable being searched, used to resume query processing.
+      * consistent: False if the triple patterns which agree on the lower bound found different RDF terms with the same key, used to resume query processing.
+      * as_of: Perform all reads against a consistent snapshot represented by a timestamp.
+    """
+
+    def __init__(self, patterns: List[Dict[str, str]], variables: List[str], graph: Graph, bound: List[Cursor] = list(), lower: Optional[Cursor] = None, strict: bool = False, exhausted: bool = False, agreed: int = 0, next_atom: int = 0, consistent: bool = True, as_of: Optional[datetime] = None):
+        super(LeapfrogJoinIterator, self).__init__()
+        self._patterns = patterns
+        self._variables = variables
+        self._schema = schema_of(tuple(variables))
+        self._graph = graph
+        self._start_timestamp = as_of
+        # the triple patterns and positions in which each variable appears
+        self._atoms = [[(index, position) for index, pattern in enumerate(patterns) for position in POSITIONS if pattern[position] == variable] for variable in variables]
+        self._bound = list(bound)
+        self._lower = lower
+        self._strict = strict
+        self._exhausted = exhausted
+        # the number of consecutive triple patterns which agree on the lower bound, and the next triple pattern to seek.
+        # They are saved with the plan, so a join preempted after each seek still makes progress between quanta
+        self._agreed = agreed
+        self._consistent = consistent
+        self._next_atom = next_atom
+        self._db_calls = 0
+
+    def __repr__(self) -> str:
+        patterns = ' . '.join(f"{pattern['subject']} {pattern['predicate']} {pattern['object']}" for pattern in self._patterns)
+        return f"<LeapfrogJoinIterator {{ {patterns} }} ORDER BY {' '.join(self._variables)}>"
+
+    def serialized_name(self) -> str:
+        """Get the name of the iterator, as used in the plan serialization protocol"""
+        return "leapfrog"
+
+    def db_calls(self) -> int:
+        """Get the number of calls to the database (i.e., seeks) issued by the iterator since its creation"""
+        return self._db_calls
+
+    def has_next(self) -> bool:
+        """Return True if the iterator has more item to yield"""
+        return not self._exhausted
+
+    def _substitute(self, pattern: Dict[str, str]) -> Tuple[str, str, str]:
+        """Replace the variables of a triple pattern by the RDF terms bound to them"""
+        terms = list()
+        for position in POSITIONS:
+            term = pattern[position]
+            if term in self._variables and self._variables.index(term) < len(self._bound):
+                term = self._bound[self._variables.index(term)][1]
+            terms.append(term)
+        return tuple(terms)
+
+    def _backtrack(self) -> None:
+        """Go back to the previous variable, and search for its next RDF term"""
+        if len(self._bound) == 0:
+            self._exhausted = True
+        else:
+            self._lower = self._bound.pop()
+            self._strict = True
+        self._agreed = 0
+        self._consistent = True
+        self._next_atom = 0
+
+    def _step(self) -> Optional[SolutionMappings]:
+        """Perform one step of the Leapfrog Triejoin, i.e., seek the next RDF term of a triple pattern for the variable being searched.
+
+        Returns: A set of solution mappings if all variables are bound after this step, or `None` otherwise.
+        """
+        atoms = self._atoms[len(self._bound)]
+        index, position = atoms[self._next_atom]
+        subject, predicate, obj = self._substitute(self._patterns[index])
+        lower = self._lower[0] if self._lower is not None else None
+        self._db_calls += 1
+        found = self._graph.seek(subject, predicate, obj, position, lower=lower, strict=self._strict, as_of=self._start_timestamp)
+        if found is None:
+            self._backtrack()
+            return None
+        key, term = found
+        if self._lower is None or self._strict or key != self._lower[0]:
+            # a new lower bound: the other triple patterns must catch up with it
+            self._lower = (key, term, position)
+            self._strict = False
+            self._agreed = 1
+            self._consistent = True
+        else:
+            self._agreed += 1
+            # different RDF terms may share the same key when found at different positions
+            self._consistent = self._consistent and term == self._lower[1]
+        self._next_atom = (self._next_atom + 1) % len(atoms)
+        if self._agreed < len(atoms):
+            return None
+        self._agreed = 0
+        self._next_atom = 0
+        if not self._consistent:
+            self._consistent = True
+            self._strict = True
+            return None
+        # all triple patterns agree: bind the variable, and move on to the next one
+        self._bound.append(self._lower)
+        self._lower = None
+        self._strict = False
+        if len(self._bound) < len(self._variables):
+            return None
+        mappings = SolutionMappings(self._schema, tuple([term for _, term, _ in self._bound]))
+        self._backtrack()
+        return mappings
+
+    async def next(self) -> Optional[SolutionMappings]:
+        """Get the next item from the iterator, following the iterator protocol.
+
+        This function may contains `non interruptible` clauses which must
+        be atomically evaluated before preemption occurs.
+
+        Returns: A set of solution mappings, or `None` if none was produced during this call.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        if not self.has_next():
+            raise StopAsyncIteration()
+        with PreemptiveLoop() as loop:
+            while True:
+                mappings = self._step()
+                if mappings is not None:
+                    return mappings
+                await loop.tick()
+                if loop.expired() or not self.has_next():
+                    return None
+
+    def supports_batch(self) -> bool:
+        """Return True if the iterator implements the batch protocol"""
+        return True
+
+    async def next_batch(self, size: int) -> List[SolutionMappings]:
+        """Get the next batch of items from the iterator.
+
+        The work done during a batch is bounded: at most `size` steps are performed, i.e., at most `size` seeks.
+
+        Argument: The maximum number of solution mappings to produce.
+
+        Returns: A list of at most `size` solution mappings, which may be empty.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        if not self.has_next():
+            raise StopAsyncIteration()
+        batch = list()
+        steps = 0
+        while steps < size and self.has_next():
+            steps += 1
+            mappings = self._step()
+            if mappings is not None:
+                batch.append(mappings)
+        return batch
+
+    def save(self) -> SavedLeapfrogJoinIterator:
+        """Save and serialize the iterator as a Protobuf message"""
+        saved_join = SavedLeapfrogJoinIterator()
+        for pattern in self._patterns:
+            triple = TriplePattern()
+            triple.subject = pattern['subject']
+            triple.predicate = pattern['predicate']
+            triple.object = pattern['object']
+            triple.graph = pattern['graph']
+            saved_join.patterns.append(triple)
+        saved_join.variables.extend(self._variables)
+        # keys are specific to the database, so cursors are saved as RDF terms
+        cursors = self._bound + [self._lower] if self._lower is not None else self._bound
+        for _, term, position in cursors:
+            cursor = saved_join.cursors.add()
+            cursor.term = term
+            cursor.position = position
+        saved_join.depth = len(self._bound)
+        saved_join.strict = self._strict
+        saved_join.exhausted = self._exhausted
+        saved_join.agreed = self._agreed
+        saved_join.next_atom = self._next_atom
+        saved_join.inconsistent = not self._consistent
+        if self._start_timestamp is not None:
+            saved_join.timestamp = self._start_timestamp.isoformat()
+        return saved_join
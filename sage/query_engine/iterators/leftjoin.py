@@ -0,0 +1,191 @@
+# leftjoin.py
+# Author: Thomas MINIER - MIT License 2017-2020
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from rdflib.plugins.sparql.sparql import SPARQLError
+
+from sage.database.core.graph import Graph
+from sage.database.core.lookup_cache import LookupCache
+from sage.query_engine.iterators.filter import (compile_filter_expression,
+                                                compile_native_filter_expression,
+                                                evaluate_filter)
+from sage.query_engine.iterators.mappings import SolutionMappings
+from sage.query_engine.iterators.nlj import IndexJoinIterator
+from sage.query_engine.iterators.preemptable_iterator import PreemptableIterator
+from sage.query_engine.primitives import PreemptiveLoop
+from sage.query_engine.protobuf.iterators_pb2 import (SavedLeftIndexJoinIterator,
+                                                      TriplePattern)
+from sage.query_engine.protobuf.utils import pyDict_to_protoDict
+
+
+class LeftIndexJoinIterator(IndexJoinIterator):
+    """A LeftIndexJoinIterator implements a Left outer Index Loop join in a pipeline of iterators, i.e., a SPARQL OPTIONAL clause.
+
+    Each set of solution mappings of the outer relation is joined with the matches of the inner triple pattern, like in an Index Loop join,
+    and is yielded alone if none of them is compatible with it, i.e., if the inner loop yields nothing or if the FILTER expression of the OPTIONAL clause rejects all joined solution mappings.
+    The join remembers whether the current set of solution mappings has matched yet, so it can be saved and resumed in the middle of an inner loop.
+
+    Args:
+      * source: Previous iterator in the pipeline, i.e., the outer relation of the join
+      * innerTriple: The inner relation, i.e., a triple pattern.
+      * graph: The RDF Graph on which the join is evaluated.
+      * expression: The SPARQL FILTER expression of the OPTIONAL clause, evaluated on the joined solution mappings, or `None` if there is none.
+      * currentBinding: A set of solution mappings used to resume join processing.
+      * matched: True if the set of solution mappings used to resume join processing has already been joined with a match of the inner triple pattern.
+      * last_read: An offset ID used to resume processing of an inner loop.
+      * as_of: Perform all reads against a consistent snapshot represented by a timestamp.
+      * rows_in: Number of solution mappings read from the outer relation since the start of query execution, used to resume query processing.
+      * rows_out: Number of solution mappings produced since the start of query execution, used to resume query processing.
+      * projection: SPARQL variables kept in the solution mappings produced by the join, i.e., the ones still needed downstream, or `None` to keep all of them.
+      * cache: A cache of the lookups of the inner triple pattern, or `None` to disable it.
+    """
+
+    def __init__(self, source: PreemptableIterator, innerTriple: Dict[str, str], graph: Graph, expression: Optional[str] = None, currentBinding: Optional[SolutionMappings] = None, matched: bool = False, last_read: Optional[str] = None, as_of: Optional[datetime] = None, rows_in: int = 0, rows_out: int = 0, projection: Optional[List[str]] = None, cache: Optional[LookupCache] = None):
+        super(LeftIndexJoinIterator, self).__init__(source, innerTriple, graph, currentBinding=currentBinding, last_read=last_read, as_of=as_of, rows_in=rows_in, rows_out=rows_out, projection=projection, cache=cache)
+        self._matched = matched
+        self._raw_expression = expression
+        if expression is not None:
+            self._compiled_expression, self._prologue = compile_filter_expression(expression)
+            self._native_expression = compile_native_filter_expression(expression)
+
+    def __repr__(self) -> str:
+        expression = f" FILTER({self._raw_expression})" if self._raw_expression is not None else ''
+        return f"<LeftIndexJoinIterator ({self._source} OPTIONAL {{ {self._innerTriple['subject']} {self._innerTriple['predicate']} {self._innerTriple['object']}{expression} }})>"
+
+    def serialized_name(self) -> str:
+        """Get the name of the iterator, as used in the plan serialization protocol"""
+        return "leftjoin"
+
+    def has_next(self) -> bool:
+        """Return True if the iterator has more item to yield"""
+        return super(LeftIndexJoinIterator, self).has_next() or self._unmatched()
+
+    def _unmatched(self) -> bool:
+        """Return True if the current set of solution mappings has no compatible match left, so it must be yielded alone"""
+        return self._currentBinding is not None and (not self._matched) and (self._currentIter is None or not self._currentIter.has_next())
+
+    def _project(self, mappings: SolutionMappings) -> SolutionMappings:
+        """Keep the SPARQL variables still needed downstream in a set of solution mappings"""
+        if self._projected_variables is None:
+            return mappings
+        return mappings.project(self._projected_variables)
+
+    def _left_join(self, mu: SolutionMappings) -> Optional[SolutionMappings]:
+        """Join the current binding with a set of solution mappings read from the inner loop.
+
+        Returns: The joined solution mappings, or `None` if the FILTER expression of the OPTIONAL clause rejects them.
+        """
+        if self._raw_expression is None:
+            self._matched = True
+            return self._join(mu)
+        joined = self._currentBinding.join(mu)
+        # errors, e.g., caused by unbound variables, reject the solution mappings
+        outcome = evaluate_filter(joined, self._compiled_expression, self._prologue, native_expression=self._native_expression)
+        if isinstance(outcome, SPARQLError) or not outcome:
+            return None
+        self._matched = True
+        self._rows_out += 1
+        return self._project(joined)
+
+    def _yield_unmatched(self) -> SolutionMappings:
+        """Yield the current binding alone, as it has no compatible match"""
+        self._matched = True
+        self._rows_out += 1
+        return self._project(self._currentBinding)
+
+    def _next_outer(self, mappings: Optional[SolutionMappings]) -> None:
+        """Start the inner loop of a new set of solution mappings read from the outer relation"""
+        self._currentBinding = mappings
+        self._matched = False
+        if mappings is not None:
+            self._rows_in += 1
+        self._currentIter = self._initInnerLoop(self._innerTriple, mappings)
+
+    async def next(self) -> Optional[SolutionMappings]:
+        """Get the next item from the iterator, following the iterator protocol.
+
+        This function may contains `non interruptible` clauses which must
+        be atomically evaluated before preemption occurs.
+
+        If the time quantum expires while looking for an inner loop that yields results,
+        the join stops right after having started a new inner loop, so its state can be saved exactly.
+
+        Returns: A set of solution mappings, or `None` if none was produced during this call.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        if not self.has_next():
+            raise StopAsyncIteration()
+        with PreemptiveLoop() as loop:
+            while self._currentIter is None or (not self._currentIter.has_next()):
+                if self._unmatched():
+                    return self._yield_unmatched()
+                self._next_outer(await self._source.next())
+                await loop.tick()
+                if loop.expired() or not self.has_next():
+                    return None
+        mu = await self._currentIter.next()
+        if mu is None:
+            return None
+        return self._left_join(mu)
+
+    async def next_batch(self, size: int) -> List[SolutionMappings]:
+        """Get the next batch of items from the iterator.
+
+        The work done during a batch is bounded: at most `size` steps are performed,
+        where a step either yields the current binding alone, reads one set of mappings from the outer relation
+        or reads a batch from the current inner loop.
+
+        Argument: The maximum number of solution mappings to produce.
+
+        Returns: A list of at most `size` solution mappings, which may be empty.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        if not self.has_next():
+            raise StopAsyncIteration()
+        batch = list()
+        steps = 0
+        while steps < size and len(batch) < size and self.has_next():
+            steps += 1
+            if self._unmatched():
+                batch.append(self._yield_unmatched())
+            elif self._currentIter is None or (not self._currentIter.has_next()):
+                outer = await self._source.next_batch(1)
+                if len(outer) > 0:
+                    self._next_outer(outer[0])
+            else:
+                for mu in await self._currentIter.next_batch(size - len(batch)):
+                    joined = self._left_join(mu)
+                    if joined is not None:
+                        batch.append(joined)
+        return batch
+
+    def save(self) -> SavedLeftIndexJoinIterator:
+        """Save and serialize the iterator as a Protobuf message"""
+        saved_join = SavedLeftIndexJoinIterator()
+        # save source operator
+        source_field = self._source.serialized_name() + '_source'
+        getattr(saved_join, source_field).CopyFrom(self._source.save())
+        # save inner join
+        inner = TriplePattern()
+        inner.subject = self._innerTriple['subject']
+        inner.predicate = self._innerTriple['predicate']
+        inner.object = self._innerTriple['object']
+        inner.graph = self._innerTriple['graph']
+        saved_join.inner.CopyFrom(inner)
+        if self._currentBinding is not None:
+            pyDict_to_protoDict(self._currentBinding, saved_join.muc)
+            saved_join.matched = self._matched
+        if self._currentIter is not None:
+            saved_join.last_read = self._currentIter.last_read()
+        if self._start_timestamp is not None:
+            saved_join.timestamp = self._start_timestamp.isoformat()
+        if self._raw_expression is not None:
+            saved_join.expression = self._raw_expression
+        saved_join.rows_in = self._rows_in
+        saved_join.rows_out = self._rows_out
+        if self._projection is not None:
+            saved_join.projection.extend(self._projection)
+        return saved_join
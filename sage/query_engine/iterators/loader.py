@@ -6,22 +6,38 @@ from typing import Dict, Optional, Union
 from sage.database.core.dataset import Dataset
 from sage.query_engine.iterators.filter import FilterIterator
 from sage.query_engine.iterators.bind import BindIterator
+from sage.query_engine.iterators.bindjoin import BindJoinIterator
 from sage.query_engine.iterators.construct import ConstructIterator
+from sage.query_engine.iterators.hashjoin import HashJoinIterator
+from sage.query_engine.iterators.leapfrog import LeapfrogJoinIterator
+from sage.query_engine.iterators.leftjoin import LeftIndexJoinIterator
+from sage.query_engine.iterators.mappings import SolutionMappings
+from sage.query_engine.iterators.mergejoin import MergeJoinIterator
 from sage.query_engine.iterators.nlj import IndexJoinIterator
 from sage.query_engine.iterators.preemptable_iterator import PreemptableIterator
 from sage.query_engine.iterators.projection import ProjectionIterator
 from sage.query_engine.iterators.reduced import ReducedIterator
 from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.iterators.starjoin import StarJoinIterator
 from sage.query_engine.iterators.union import BagUnionIterator
+from sage.query_engine.iterators.utils import EmptyIterator
+from sage.query_engine.optimizer.reoptimizer import reoptimize
 from sage.query_engine.protobuf.iterators_pb2 import (RootTree,
                                                       SavedBagUnionIterator,
+                                                      SavedBindJoinIterator,
                                                       SavedFilterIterator,
+                                                      SavedHashJoinIterator,
                                                       SavedIndexJoinIterator,
+                                                      SavedLeapfrogJoinIterator,
+                                                      SavedLeftIndexJoinIterator,
+                                                      SavedMergeJoinIterator,
                                                       SavedProjectionIterator,
                                                       SavedReducedIterator,
                                                       SavedScanIterator,
+                                                      SavedStarJoinIterator,
                                                       SavedBindIterator,
-                                                      SavedConstructIterator)
+                                                      SavedConstructIterator,
+                                                      SavedEmptyIterator)
 from sage.query_engine.protobuf.utils import protoTriple_to_dict
 
 import sys, traceback
@@ -31,19 +47,22 @@ import logging
 ## Don't forget to add your saved iterator here !!
 ## If you add one ....
 ###
-SavedProtobufPlan = Union[RootTree,SavedBagUnionIterator,SavedFilterIterator,SavedIndexJoinIterator,SavedProjectionIterator,SavedScanIterator,SavedBindIterator,SavedConstructIterator,SavedReducedIterator]
+SavedProtobufPlan = Union[RootTree,SavedBagUnionIterator,SavedFilterIterator,SavedIndexJoinIterator,SavedProjectionIterator,SavedScanIterator,SavedBindIterator,SavedConstructIterator,SavedReducedIterator,SavedBindJoinIterator,SavedHashJoinIterator,SavedMergeJoinIterator,SavedLeapfrogJoinIterator,SavedStarJoinIterator,SavedLeftIndexJoinIterator,SavedEmptyIterator]
 
 
-def load(saved_plan: SavedProtobufPlan, dataset: Dataset) -> PreemptableIterator:
+def load(saved_plan: SavedProtobufPlan, dataset: Dataset, adaptive: bool = False) -> PreemptableIterator:
     """Load a preemptable physical query execution plan from a saved state.
 
     Args:
       * saved_plan: Saved query execution plan.
       * dataset: RDF dataset used to execute the plan.
+      * adaptive: True to revise the join orders of the plan using the runtime counters saved with it (see `reoptimize`).
 
     Returns:
       The pipeline of iterator used to continue query execution.
     """
+    if adaptive:
+        return reoptimize(load(saved_plan, dataset), dataset)
     # unpack the plan from the serialized protobuf message
     try:
 #        print(f"...{type(saved_plan)}...")
@@ -63,12 +82,26 @@ def load(saved_plan: SavedProtobufPlan, dataset: Dataset) -> PreemptableIterator
             return load_scan(saved_plan, dataset)
         elif type(saved_plan) is SavedIndexJoinIterator:
             return load_nlj(saved_plan, dataset)
+        elif type(saved_plan) is SavedBindJoinIterator:
+            return load_bindjoin(saved_plan, dataset)
+        elif type(saved_plan) is SavedHashJoinIterator:
+            return load_hashjoin(saved_plan, dataset)
+        elif type(saved_plan) is SavedMergeJoinIterator:
+            return load_mergejoin(saved_plan, dataset)
+        elif type(saved_plan) is SavedLeapfrogJoinIterator:
+            return load_leapfrog(saved_plan, dataset)
+        elif type(saved_plan) is SavedStarJoinIterator:
+            return load_starjoin(saved_plan, dataset)
+        elif type(saved_plan) is SavedLeftIndexJoinIterator:
+            return load_leftjoin(saved_plan, dataset)
         elif type(saved_plan) is SavedBagUnionIterator:
             return load_union(saved_plan, dataset)
         elif type(saved_plan) is SavedBindIterator:
             return load_bind(saved_plan, dataset)
         elif type(saved_plan) is SavedConstructIterator:
             return load_construct(saved_plan, dataset)
+        elif type(saved_plan) is SavedEmptyIterator:
+            return EmptyIterator()
         else:
             raise Exception(f"Unknown iterator type '{type(saved_plan)}' when loading controls")
     except:
@@ -123,7 +156,7 @@ def load_filter(saved_plan: SavedFilterIterator, dataset: Dataset) -> Preemptabl
     source = load(getattr(saved_plan, sourceField), dataset)
     mu = None
     if len(saved_plan.mu) > 0:
-        mu = saved_plan.mu
+        mu = SolutionMappings.from_dict(saved_plan.mu)
     return FilterIterator(source, saved_plan.expression, mu=mu)
 
 def load_bind(saved_plan: SavedBindIterator, dataset: Dataset) -> PreemptableIterator:
@@ -144,7 +177,7 @@ def load_bind(saved_plan: SavedBindIterator, dataset: Dataset) -> PreemptableIte
 
     mu = None
     if len(saved_plan.mu) > 0:
-        mu = saved_plan.mu
+        mu = SolutionMappings.from_dict(saved_plan.mu)
     return BindIterator(source, saved_plan.bindexpr,saved_plan.bindvar, mu=mu)
 
 
@@ -180,7 +213,7 @@ def load_scan(saved_plan: SavedScanIterator, dataset: Dataset) -> PreemptableIte
     """
     triple = saved_plan.triple
     s, p, o, g = (triple.subject, triple.predicate, triple.object, triple.graph)
-    iterator, card = dataset.get_graph(g).search(s, p, o, last_read=saved_plan.last_read)
+    iterator, card = dataset.get_graph(g).search_ids(s, p, o, last_read=saved_plan.last_read)
     return ScanIterator(iterator, protoTriple_to_dict(triple), saved_plan.cardinality,saved_plan.progress)
 
 
@@ -210,9 +243,10 @@ def load_nlj(saved_plan: SavedIndexJoinIterator, dataset: Dataset) -> Preemptabl
         else:
             as_of = None
         if len(saved_plan.muc) > 0:
-            currentBinding = saved_plan.muc
+            currentBinding = SolutionMappings.from_dict(saved_plan.muc)
         graph = dataset.get_graph(innerTriple['graph'])
-        return IndexJoinIterator(source, innerTriple, graph, currentBinding=currentBinding, last_read=saved_plan.last_read, as_of=as_of)
+        projection = list(saved_plan.projection) if len(saved_plan.projection) > 0 else None
+        return IndexJoinIterator(source, innerTriple, graph, currentBinding=currentBinding, last_read=saved_plan.last_read, as_of=as_of, rows_in=saved_plan.rows_in, rows_out=saved_plan.rows_out, projection=projection, cache=graph.lookup_cache())
     except:
         exc_type, exc_value, exc_traceback = sys.exc_info()
         traceback.print_tb(exc_traceback, limit=10, file=sys.stdout)
@@ -221,6 +255,129 @@ def load_nlj(saved_plan: SavedIndexJoinIterator, dataset: Dataset) -> Preemptabl
 
 
 
+def load_leftjoin(saved_plan: SavedLeftIndexJoinIterator, dataset: Dataset) -> PreemptableIterator:
+    """Load a LeftIndexJoinIterator from a protobuf serialization.
+
+    Args:
+      * saved_plan: Saved query execution plan.
+      * dataset: RDF dataset used to execute the plan.
+
+    Returns:
+      The pipeline of iterator used to continue query execution.
+    """
+    sourceField = saved_plan.WhichOneof('source')
+    source = load(getattr(saved_plan, sourceField), dataset)
+    innerTriple = protoTriple_to_dict(saved_plan.inner)
+    as_of = datetime.fromisoformat(saved_plan.timestamp) if len(saved_plan.timestamp) > 0 else None
+    currentBinding = SolutionMappings.from_dict(saved_plan.muc) if len(saved_plan.muc) > 0 else None
+    expression = saved_plan.expression if len(saved_plan.expression) > 0 else None
+    graph = dataset.get_graph(innerTriple['graph'])
+    projection = list(saved_plan.projection) if len(saved_plan.projection) > 0 else None
+    return LeftIndexJoinIterator(source, innerTriple, graph, expression=expression, currentBinding=currentBinding, matched=saved_plan.matched, last_read=saved_plan.last_read, as_of=as_of, rows_in=saved_plan.rows_in, rows_out=saved_plan.rows_out, projection=projection, cache=graph.lookup_cache())
+
+
+def load_bindjoin(saved_plan: SavedBindJoinIterator, dataset: Dataset) -> PreemptableIterator:
+    """Load a BindJoinIterator from a protobuf serialization.
+
+    Args:
+      * saved_plan: Saved query execution plan.
+      * dataset: RDF dataset used to execute the plan.
+
+    Returns:
+      The pipeline of iterator used to continue query execution.
+    """
+    sourceField = saved_plan.WhichOneof('source')
+    source = load(getattr(saved_plan, sourceField), dataset)
+    innerTriple = protoTriple_to_dict(saved_plan.inner)
+    as_of = datetime.fromisoformat(saved_plan.timestamp) if len(saved_plan.timestamp) > 0 else None
+    block = [SolutionMappings.from_dict(mappings.mu) for mappings in saved_plan.block]
+    graph = dataset.get_graph(innerTriple['graph'])
+    projection = list(saved_plan.projection) if len(saved_plan.projection) > 0 else None
+    return BindJoinIterator(source, innerTriple, graph, block_size=saved_plan.block_size, block=block, offset=saved_plan.offset, as_of=as_of, rows_in=saved_plan.rows_in, rows_out=saved_plan.rows_out, projection=projection)
+
+
+def load_hashjoin(saved_plan: SavedHashJoinIterator, dataset: Dataset) -> PreemptableIterator:
+    """Load a HashJoinIterator from a protobuf serialization.
+
+    The hash table is rebuilt by scanning the inner triple pattern from its start.
+
+    Args:
+      * saved_plan: Saved query execution plan.
+      * dataset: RDF dataset used to execute the plan.
+
+    Returns:
+      The pipeline of iterator used to continue query execution.
+    """
+    sourceField = saved_plan.WhichOneof('source')
+    source = load(getattr(saved_plan, sourceField), dataset)
+    innerTriple = protoTriple_to_dict(saved_plan.inner)
+    as_of = datetime.fromisoformat(saved_plan.timestamp) if len(saved_plan.timestamp) > 0 else None
+    currentBinding = SolutionMappings.from_dict(saved_plan.muc) if len(saved_plan.muc) > 0 else None
+    graph = dataset.get_graph(innerTriple['graph'])
+    build, _ = graph.search_ids(innerTriple['subject'], innerTriple['predicate'], innerTriple['object'], as_of=as_of)
+    return HashJoinIterator(source, build, innerTriple, graph, saved_plan.join_vars, budget=saved_plan.budget, built=saved_plan.built, build_last_read=saved_plan.build_last_read, currentBinding=currentBinding, position=saved_plan.position, as_of=as_of)
+
+
+def load_mergejoin(saved_plan: SavedMergeJoinIterator, dataset: Dataset) -> PreemptableIterator:
+    """Load a MergeJoinIterator from a protobuf serialization.
+
+    Args:
+      * saved_plan: Saved query execution plan.
+      * dataset: RDF dataset used to execute the plan.
+
+    Returns:
+      The pipeline of iterator used to continue query execution.
+    """
+    leftField = saved_plan.WhichOneof('left')
+    left = load(getattr(saved_plan, leftField), dataset)
+    right = load(saved_plan.right, dataset)
+    left_head = SolutionMappings.from_dict(saved_plan.left_head) if len(saved_plan.left_head) > 0 else None
+    right_head = SolutionMappings.from_dict(saved_plan.right_head) if len(saved_plan.right_head) > 0 else None
+    left_group = [SolutionMappings.from_dict(mappings.mu) for mappings in saved_plan.left_group]
+    right_group = [SolutionMappings.from_dict(mappings.mu) for mappings in saved_plan.right_group]
+    return MergeJoinIterator(left, right, saved_plan.join_var, left_head=left_head, right_head=right_head, left_group=left_group, right_group=right_group, left_open=saved_plan.left_open, right_open=saved_plan.right_open, position=saved_plan.position)
+
+
+def load_leapfrog(saved_plan: SavedLeapfrogJoinIterator, dataset: Dataset) -> PreemptableIterator:
+    """Load a LeapfrogJoinIterator from a protobuf serialization.
+
+    The keys of the cursors are recomputed from their RDF terms by the database.
+
+    Args:
+      * saved_plan: Saved query execution plan.
+      * dataset: RDF dataset used to execute the plan.
+
+    Returns:
+      The pipeline of iterator used to continue query execution.
+    """
+    patterns = [protoTriple_to_dict(triple) for triple in saved_plan.patterns]
+    as_of = datetime.fromisoformat(saved_plan.timestamp) if len(saved_plan.timestamp) > 0 else None
+    graph = dataset.get_graph(patterns[0]['graph'])
+    cursors = [(graph.seek_key(cursor.term, cursor.position), cursor.term, cursor.position) for cursor in saved_plan.cursors]
+    bound = cursors[:saved_plan.depth]
+    lower = cursors[saved_plan.depth] if len(cursors) > saved_plan.depth else None
+    return LeapfrogJoinIterator(patterns, list(saved_plan.variables), graph, bound=bound, lower=lower, strict=saved_plan.strict, exhausted=saved_plan.exhausted, agreed=saved_plan.agreed, next_atom=saved_plan.next_atom, consistent=not saved_plan.inconsistent, as_of=as_of)
+
+
+def load_starjoin(saved_plan: SavedStarJoinIterator, dataset: Dataset) -> PreemptableIterator:
+    """Load a StarJoinIterator from a protobuf serialization.
+
+    Args:
+      * saved_plan: Saved query execution plan.
+      * dataset: RDF dataset used to execute the plan.
+
+    Returns:
+      The pipeline of iterator used to continue query execution.
+    """
+    sourceField = saved_plan.WhichOneof('source')
+    source = load(getattr(saved_plan, sourceField), dataset)
+    star = [protoTriple_to_dict(triple) for triple in saved_plan.star]
+    as_of = datetime.fromisoformat(saved_plan.timestamp) if len(saved_plan.timestamp) > 0 else None
+    currentBinding = SolutionMappings.from_dict(saved_plan.muc) if len(saved_plan.muc) > 0 else None
+    graph = dataset.get_graph(star[0]['graph'])
+    return StarJoinIterator(source, star, graph, currentBinding=currentBinding, position=saved_plan.position, as_of=as_of)
+
+
 def load_union(saved_plan: SavedBagUnionIterator, dataset: Dataset) -> PreemptableIterator:
     """Load a BagUnionIterator from a protobuf serialization.
 
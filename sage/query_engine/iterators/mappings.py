@@ -0,0 +1,269 @@
+# mappings.py
+# Author: Thomas MINIER - MIT License 2017-2020
+from collections.abc import Mapping
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+# Maximum number of schemas (and selections) shared between all query execution plans
+SCHEMA_CACHE_SIZE = 4096
+
+
+def _getter(positions: List[int]) -> Callable[[Tuple[str, ...]], Tuple[str, ...]]:
+    """Build a function that always returns a tuple of the values found at some positions of a tuple"""
+    if len(positions) == 0:
+        return lambda values: ()
+    elif len(positions) == 1:
+        position = positions[0]
+        return lambda values: (values[position],)
+    return itemgetter(*positions)
+
+
+class Schema(object):
+    """The SPARQL variables bound by solution mappings, in the order their values are stored.
+
+    A schema is shared by all solution mappings produced by the same operator of a query execution plan,
+    and it caches how to join, project or extend them, so these operations only build a tuple of values per solution mappings.
+    Schemas are compared by identity: use `schema_of` to get the schema of some SPARQL variables.
+
+    Values may be integer IDs of the term dictionary of a RDF graph (see `DatabaseConnector.term_dictionary`),
+    in which case the schema holds the dictionary used to decode them. Other values are RDF terms.
+
+    Args:
+      * variables: The SPARQL variables of the schema.
+      * decoder: The term dictionary used to decode the integer values, or `None` if all values are RDF terms.
+    """
+    __slots__ = ('variables', 'decoder', 'positions', '_joins', '_projections', '_extensions')
+
+    def __init__(self, variables: Tuple[str, ...], decoder: Optional[Any] = None):
+        super(Schema, self).__init__()
+        self.variables = variables
+        self.decoder = decoder
+        self.positions = {variable: position for position, variable in enumerate(variables)}
+        self._joins = dict()
+        self._projections = dict()
+        self._extensions = dict()
+
+    def __repr__(self) -> str:
+        return f"<Schema {list(self.variables)}>"
+
+    def __reduce__(self):
+        # caches are not serialized, as they are rebuilt on demand
+        return (schema_of, (self.variables, self.decoder))
+
+    def join(self, other: 'Schema', projection: Optional[FrozenSet[str]] = None) -> Tuple['Schema', Optional[Callable]]:
+        """Get the schema of the join of solution mappings with this schema and solution mappings with another schema.
+
+        Both schemas must use the same term dictionary, or at most one of them may use one.
+
+        Args:
+          * other: Schema of the right operand of the join.
+          * projection: SPARQL variables kept in the joined solution mappings, or `None` to keep all of them.
+
+        Returns: A tuple (`schema`, `getter`) where `getter` builds the values of the joined solution mappings
+        from the concatenation of the values of both operands, or is `None` if the concatenation can be used as is.
+        """
+        key = (other, projection)
+        join = self._joins.get(key)
+        if join is None:
+            variables, positions = list(), list()
+            for position, variable in enumerate(self.variables + other.variables):
+                # shared SPARQL variables are bound to the same value in compatible solution mappings
+                if variable not in variables and (projection is None or variable in projection):
+                    variables.append(variable)
+                    positions.append(position)
+            getter = None if len(positions) == len(self.variables) + len(other.variables) else _getter(positions)
+            join = self._joins[key] = (schema_of(tuple(variables), self.decoder or other.decoder), getter)
+        return join
+
+    def project(self, projection: FrozenSet[str]) -> Tuple['Schema', Callable]:
+        """Get the schema of solution mappings with this schema, restricted to some SPARQL variables.
+
+        Argument: SPARQL variables kept in the solution mappings.
+
+        Returns: A tuple (`schema`, `getter`) where `getter` builds the values of the projected solution mappings.
+        """
+        if projection not in self._projections:
+            positions = [position for position, variable in enumerate(self.variables) if variable in projection]
+            self._projections[projection] = (schema_of(tuple([self.variables[position] for position in positions]), self.decoder), _getter(positions))
+        return self._projections[projection]
+
+    def extend(self, variable: str) -> 'Schema':
+        """Get the schema of solution mappings with this schema, extended with a SPARQL variable that they do not bind"""
+        if variable not in self._extensions:
+            self._extensions[variable] = schema_of(self.variables + (variable,), self.decoder)
+        return self._extensions[variable]
+
+
+def schema_of(variables: Tuple[str, ...], decoder: Optional[Any] = None) -> Schema:
+    """Get the schema of some SPARQL variables, shared with all solution mappings which bind the same variables in the same order, using the same term dictionary"""
+    return _cached_schema(variables, decoder)
+
+
+@lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _cached_schema(variables: Tuple[str, ...], decoder: Optional[Any]) -> Schema:
+    # the decoder is always given, so the cache holds a single schema per variables and term dictionary
+    return Schema(variables, decoder)
+
+
+class SolutionMappings(Mapping):
+    """A set of solution mappings, stored as a tuple of values whose SPARQL variables are given by a shared schema.
+
+    It implements the (read-only) interface of a dictionary, which maps SPARQL variables to RDF terms,
+    but uses a fraction of its memory, and joins, projections and extensions never copy dictionaries.
+    Solution mappings are converted to dictionaries only when query results are sent to clients.
+
+    Values read from a graph that encodes its RDF terms are integer IDs, which are only decoded (and cached by the term dictionary)
+    when they are read through the dictionary interface, i.e., when query results are serialized or expressions evaluated.
+    Joins compare the IDs directly, using `raw` and `encoded`.
+
+    Args:
+      * schema: The schema of the solution mappings.
+      * values: The RDF terms bound to the SPARQL variables of the schema, in the same order.
+
+    Example:
+      >>> mu = SolutionMappings(schema_of(("?s", "?knows")), (":Ann", ":Bob"))
+      >>> mu["?s"]
+      ":Ann"
+      >>> mu.extend("?name", '"Ann"').to_dict()
+      { "?s": ":Ann", "?knows": ":Bob", "?name": '"Ann"' }
+    """
+    __slots__ = ('schema', 'values')
+
+    def __init__(self, schema: Schema, values: Tuple[str, ...]):
+        self.schema = schema
+        self.values = values
+
+    @staticmethod
+    def from_dict(mappings: Dict[str, str]) -> 'SolutionMappings':
+        """Build solution mappings from a dictionary (or a Protobuf map) of solution mappings"""
+        if type(mappings) is SolutionMappings:
+            return mappings
+        variables = tuple(mappings.keys())
+        return SolutionMappings(schema_of(variables), tuple([mappings[variable] for variable in variables]))
+
+    def __getitem__(self, variable: str) -> str:
+        value = self.values[self.schema.positions[variable]]
+        if type(value) is int:
+            return self.schema.decoder.decode(value)
+        return value
+
+    def __contains__(self, variable: str) -> bool:
+        return variable in self.schema.positions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.schema.variables)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __eq__(self, other) -> bool:
+        if type(other) is SolutionMappings and self.schema is other.schema and self.schema.decoder is None:
+            return self.values == other.values
+        return super(SolutionMappings, self).__eq__(other)
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def __reduce__(self):
+        # term dictionaries are bound to the database, so encoded values are decoded before being serialized
+        if self.schema.decoder is not None:
+            return (SolutionMappings.from_dict, (self.to_dict(),))
+        return (SolutionMappings, (self.schema, self.values))
+
+    def get(self, variable: str, default: Optional[str] = None) -> Optional[str]:
+        position = self.schema.positions.get(variable)
+        if position is None:
+            return default
+        value = self.values[position]
+        if type(value) is int:
+            return self.schema.decoder.decode(value)
+        return value
+
+    def items(self) -> List[Tuple[str, str]]:
+        if self.schema.decoder is None:
+            return list(zip(self.schema.variables, self.values))
+        decode = self.schema.decoder.decode
+        return [(variable, decode(value) if type(value) is int else value) for variable, value in zip(self.schema.variables, self.values)]
+
+    def to_dict(self) -> Dict[str, str]:
+        """Convert the solution mappings to a dictionary, decoding their values"""
+        return dict(self.items())
+
+    def raw(self, variable: str, default: Optional[Any] = None) -> Union[int, str, None]:
+        """Get the value of a SPARQL variable as stored, i.e., without decoding it if it is an ID of the term dictionary of the schema"""
+        position = self.schema.positions.get(variable)
+        return self.values[position] if position is not None else default
+
+    def encoded(self, variable: str, dictionary: Any) -> Union[int, str]:
+        """Get the value of a SPARQL variable as an ID of a term dictionary.
+
+        Args:
+          * variable: A SPARQL variable bound by the solution mappings.
+          * dictionary: The term dictionary.
+
+        Returns: The ID of the value in the term dictionary, or the RDF term itself if the dictionary does not contain it.
+        """
+        value = self.values[self.schema.positions[variable]]
+        if type(value) is int:
+            if self.schema.decoder is dictionary:
+                return value
+            value = self.schema.decoder.decode(value)
+        encoded = dictionary.encode(value)
+        return encoded if encoded is not None else value
+
+    def join(self, other: 'SolutionMappings', projection: Optional[FrozenSet[str]] = None) -> 'SolutionMappings':
+        """Join the solution mappings with compatible solution mappings.
+
+        Args:
+          * other: Solution mappings compatible with these ones, i.e., shared SPARQL variables are bound to the same RDF terms.
+          * projection: SPARQL variables kept in the joined solution mappings, or `None` to keep all of them.
+
+        Returns: The joined solution mappings.
+        """
+        # fast path: the schema of the join is already cached
+        join = self.schema._joins.get((other.schema, projection))
+        if join is None:
+            # values encoded using another term dictionary cannot be stored with this one
+            if self.schema.decoder is not None and other.schema.decoder is not None and self.schema.decoder is not other.schema.decoder:
+                return self.join(SolutionMappings.from_dict(other.to_dict()), projection)
+            join = self.schema.join(other.schema, projection)
+        values = self.values + other.values
+        return SolutionMappings(join[0], values if join[1] is None else join[1](values))
+
+    def project(self, projection: FrozenSet[str]) -> 'SolutionMappings':
+        """Restrict the solution mappings to some SPARQL variables"""
+        schema, getter = self.schema.project(projection)
+        if schema is self.schema:
+            return self
+        return SolutionMappings(schema, getter(self.values))
+
+    def extend(self, variable: str, value: str) -> 'SolutionMappings':
+        """Bind a SPARQL variable in a copy of the solution mappings, replacing its value if it is already bound"""
+        position = self.schema.positions.get(variable)
+        if position is not None:
+            return SolutionMappings(self.schema, self.values[:position] + (value,) + self.values[position + 1:])
+        return SolutionMappings(self.schema.extend(variable), self.values + (value,))
+
+
+# Solution mappings that bind no SPARQL variable
+EMPTY_MAPPINGS = SolutionMappings(schema_of(()), ())
+
+
+@lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def selector(variables: Tuple[Optional[str], str, str], decoder: Optional[Any] = None) -> Callable[[Tuple[str, str, str]], SolutionMappings]:
+    """Build the function which applies a selection on RDF triples (see `selection`), shared by all triple patterns with the same SPARQL variables.
+
+    Args:
+      * variables: The SPARQL variables of the selection, by position in the RDF triples, or `None` for bound positions.
+      * decoder: The term dictionary used to decode the RDF triples, if they are triples of IDs.
+
+    Returns: A function which produces a set of solution mappings from a RDF triple.
+    """
+    names, positions = list(), list()
+    for position, variable in enumerate(variables):
+        if variable is not None and variable not in names:
+            names.append(variable)
+            positions.append(position)
+    schema, getter = schema_of(tuple(names), decoder), _getter(positions)
+    return lambda triple: SolutionMappings(schema, getter(triple))
@@ -0,0 +1,208 @@
+# mergejoin.py
+# Author: Thomas MINIER - MIT License 2017-2020
+from typing import Any, List, Optional
+
+from sage.query_engine.iterators.mappings import SolutionMappings
+from sage.query_engine.iterators.preemptable_iterator import PreemptableIterator
+from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.primitives import PreemptiveLoop
+from sage.query_engine.protobuf.iterators_pb2 import SavedMergeJoinIterator
+from sage.query_engine.protobuf.utils import pyDict_to_protoDict
+
+
+class MergeJoinIterator(PreemptableIterator):
+    """A MergeJoinIterator implements a Merge join in a pipeline of iterators.
+
+    Both operands must yield solution mappings sorted by the join variable, i.e., the join variable
+    must come first in their `ordering()`. The operands are read in lockstep: the solution mappings
+    with the same join key are gathered into a group on each side, then the two groups are joined.
+    The join yields solution mappings sorted by the join variable, so it can be the left operand of another Merge join.
+
+    Args:
+      * left: Left operand of the join, a ScanIterator or a MergeJoinIterator.
+      * right: Right operand of the join, a ScanIterator.
+      * join_var: SPARQL variable by which both operands are sorted.
+      * left_head: Next solution mappings read from the left operand, used to resume join processing.
+      * right_head: Next solution mappings read from the right operand, used to resume join processing.
+      * left_group: Group of solution mappings from the left operand being joined, used to resume join processing.
+      * right_group: Group of solution mappings from the right operand being joined, used to resume join processing.
+      * left_open: True if the left group may still grow, used to resume join processing.
+      * right_open: True if the right group may still grow, used to resume join processing.
+      * position: Number of pairs of solution mappings from the groups already joined, used to resume join processing.
+    """
+
+    def __init__(self, left: PreemptableIterator, right: ScanIterator, join_var: str, left_head: Optional[SolutionMappings] = None, right_head: Optional[SolutionMappings] = None, left_group: List[SolutionMappings] = list(), right_group: List[SolutionMappings] = list(), left_open: bool = False, right_open: bool = False, position: int = 0):
+        super(MergeJoinIterator, self).__init__()
+        self._left = left
+        self._right = right
+        self._join_var = join_var
+        self._left_head = left_head
+        self._right_head = right_head
+        self._left_group = list(left_group)
+        self._right_group = list(right_group)
+        self._left_open = left_open
+        self._right_open = right_open
+        self._position = position
+
+    def __repr__(self) -> str:
+        return f"<MergeJoinIterator ({self._left} JOIN {self._right} ON {self._join_var})>"
+
+    def serialized_name(self) -> str:
+        """Get the name of the iterator, as used in the plan serialization protocol"""
+        return "mergejoin"
+
+    def ordering(self) -> List[str]:
+        """Get the SPARQL variables by which the solution mappings are sorted, from the most significant to the least significant"""
+        return [self._join_var]
+
+    def order_key(self, variable: str, value: str) -> Any:
+        """Get the key used to compare the values of a SPARQL variable, following the order of the iterator"""
+        return self._left.order_key(variable, value)
+
+    def _nb_pairs(self) -> int:
+        """Get the number of pairs of solution mappings in the current groups"""
+        return len(self._left_group) * len(self._right_group)
+
+    def _has_pair(self) -> bool:
+        """Return True if both groups are complete and some of their pairs have not been joined yet"""
+        return (not self._left_open) and (not self._right_open) and self._position < self._nb_pairs()
+
+    def has_next(self) -> bool:
+        """Return True if the iterator has more item to yield"""
+        if self._left_open or self._right_open or self._position < self._nb_pairs():
+            return True
+        left_available = self._left_head is not None or self._left.has_next()
+        right_available = self._right_head is not None or self._right.has_next()
+        return left_available and right_available
+
+    def _next_pair(self) -> Optional[SolutionMappings]:
+        """Join the next pair of solution mappings from the groups, or return `None` if they are not compatible"""
+        left = self._left_group[self._position // len(self._right_group)]
+        right = self._right_group[self._position % len(self._right_group)]
+        self._position += 1
+        # the groups share the join variable, but the operands may share other variables
+        for variable, value in right.items():
+            if variable in left and left[variable] != value:
+                return None
+        return left.join(right)
+
+    async def _grow(self, source: PreemptableIterator, group: List[SolutionMappings]) -> Optional[SolutionMappings]:
+        """Read the next solution mappings from an operand and add them to its group if they share the group's join key.
+
+        Returns: The solution mappings read if they do not belong to the group, i.e., the next head of the operand, or `None` otherwise.
+        """
+        mappings = await source.next()
+        if mappings is None:
+            return None
+        # keys are computed from the values as stored, so IDs of a term dictionary are never decoded
+        key = source.order_key(self._join_var, group[0].raw(self._join_var))
+        if source.order_key(self._join_var, mappings.raw(self._join_var)) == key:
+            group.append(mappings)
+            return None
+        return mappings
+
+    async def _step(self) -> None:
+        """Perform one step of the Merge join: grow a group, read a head, or compare the heads of the operands"""
+        if self._left_open:
+            if self._left.has_next():
+                self._left_head = await self._grow(self._left, self._left_group)
+            self._left_open = self._left_head is None and self._left.has_next()
+        elif self._right_open:
+            if self._right.has_next():
+                self._right_head = await self._grow(self._right, self._right_group)
+            self._right_open = self._right_head is None and self._right.has_next()
+        elif self._left_head is None:
+            self._left_head = await self._left.next()
+        elif self._right_head is None:
+            self._right_head = await self._right.next()
+        else:
+            left_key = self._left.order_key(self._join_var, self._left_head.raw(self._join_var))
+            right_key = self._right.order_key(self._join_var, self._right_head.raw(self._join_var))
+            if left_key < right_key:
+                self._left_head = None
+            elif left_key > right_key:
+                self._right_head = None
+            else:
+                # both heads share the same join key: start a new pair of groups
+                self._left_group = [self._left_head]
+                self._right_group = [self._right_head]
+                self._left_head = None
+                self._right_head = None
+                self._left_open = self._left.has_next()
+                self._right_open = self._right.has_next()
+                self._position = 0
+
+    async def next(self) -> Optional[SolutionMappings]:
+        """Get the next item from the iterator, following the iterator protocol.
+
+        This function may contains `non interruptible` clauses which must
+        be atomically evaluated before preemption occurs.
+
+        Returns: A set of solution mappings, or `None` if none was produced during this call.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        if not self.has_next():
+            raise StopAsyncIteration()
+        with PreemptiveLoop() as loop:
+            while not self._has_pair():
+                await self._step()
+                await loop.tick()
+                if loop.expired() or not self.has_next():
+                    return None
+        return self._next_pair()
+
+    def supports_batch(self) -> bool:
+        """Return True if the iterator implements the batch protocol"""
+        return True
+
+    async def next_batch(self, size: int) -> List[SolutionMappings]:
+        """Get the next batch of items from the iterator.
+
+        The work done during a batch is bounded: at most `size` steps are performed,
+        where a step either reads one set of mappings from an operand or joins a batch of pairs from the current groups.
+
+        Argument: The maximum number of solution mappings to produce.
+
+        Returns: A list of at most `size` solution mappings, which may be empty.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        if not self.has_next():
+            raise StopAsyncIteration()
+        batch = list()
+        steps = 0
+        while steps < size and len(batch) < size and self.has_next():
+            steps += 1
+            if self._has_pair():
+                while len(batch) < size and self._has_pair():
+                    mappings = self._next_pair()
+                    if mappings is not None:
+                        batch.append(mappings)
+            else:
+                await self._step()
+        return batch
+
+    def save(self) -> SavedMergeJoinIterator:
+        """Save and serialize the iterator as a Protobuf message"""
+        saved_join = SavedMergeJoinIterator()
+        # save both operands
+        left_field = self._left.serialized_name() + '_left'
+        getattr(saved_join, left_field).CopyFrom(self._left.save())
+        saved_join.right.CopyFrom(self._right.save())
+        saved_join.join_var = self._join_var
+        # save the heads and the groups read from the operands
+        if self._left_head is not None:
+            pyDict_to_protoDict(self._left_head, saved_join.left_head)
+        if self._right_head is not None:
+            pyDict_to_protoDict(self._right_head, saved_join.right_head)
+        # the pairs already joined are not needed anymore
+        first = self._position // len(self._right_group) if len(self._right_group) > 0 else 0
+        for mappings in self._left_group[first:]:
+            pyDict_to_protoDict(mappings, saved_join.left_group.add().mu)
+        for mappings in self._right_group:
+            pyDict_to_protoDict(mappings, saved_join.right_group.add().mu)
+        saved_join.left_open = self._left_open
+        saved_join.right_open = self._right_open
+        saved_join.position = self._position - first * len(self._right_group)
+        return saved_join
@@ -1,13 +1,15 @@
 # nlj.py
 # Author: Thomas MINIER - MIT License 2017-2020
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from sage.database.core.graph import Graph
+from sage.database.core.lookup_cache import CachedIterator, LookupCache
+from sage.database.db_iterator import DBIterator
+from sage.query_engine.iterators.mappings import SolutionMappings
 from sage.query_engine.iterators.preemptable_iterator import PreemptableIterator
 from sage.query_engine.iterators.scan import ScanIterator
-from sage.query_engine.iterators.utils import (EmptyIterator, find_in_mappings,
-                                               tuple_to_triple)
+from sage.query_engine.iterators.utils import encode_in_mappings, tuple_to_triple
 from sage.query_engine.primitives import PreemptiveLoop
 from sage.query_engine.protobuf.iterators_pb2 import (SavedIndexJoinIterator,
                                                       TriplePattern)
@@ -24,17 +26,34 @@ class IndexJoinIterator(PreemptableIterator):
       * currentBinding: A set of solution mappings used to resume join processing.
       * last_read: An offset ID used to resume processing of an inner loop.
       * as_of: Perform all reads against a consistent snapshot represented by a timestamp.
+      * rows_in: Number of solution mappings read from the outer relation since the start of query execution, used to resume query processing.
+      * rows_out: Number of solution mappings produced since the start of query execution, used to resume query processing.
+      * projection: SPARQL variables kept in the solution mappings produced by the join, i.e., the ones still needed downstream, or `None` to keep all of them.
+      * cache: A cache of the lookups of the inner triple pattern, so outer solution mappings that share the same join values search the graph only once, or `None` to disable it.
     """
 
-    def __init__(self, source: PreemptableIterator, innerTriple: Dict[str, str], graph: Graph, currentBinding: Optional[Dict[str, str]] = None, last_read: Optional[str] = None, as_of: Optional[datetime] = None):
+    def __init__(self, source: PreemptableIterator, innerTriple: Dict[str, str], graph: Graph, currentBinding: Optional[SolutionMappings] = None, last_read: Optional[str] = None, as_of: Optional[datetime] = None, rows_in: int = 0, rows_out: int = 0, projection: Optional[List[str]] = None, cache: Optional[LookupCache] = None):
         super(IndexJoinIterator, self).__init__()
         self._source = source
         self._innerTriple = innerTriple
         self._currentBinding = currentBinding
         self._graph = graph
+        # RDF terms are substituted by their IDs when the graph encodes them
+        self._dictionary = graph.term_dictionary()
         self._last_read = last_read
         self._start_timestamp = as_of
         self._currentIter = None
+        self._db_calls = 0
+        self._db_reads = 0
+        self._cache = cache
+        # True if the current inner loop replays a cached lookup, whose RDF triples are not read from the graph
+        self._cached_loop = False
+        # runtime counters, saved with the plan so the join order can be revised (see `reoptimize`)
+        self._rows_in = rows_in
+        self._rows_out = rows_out
+        # variables kept in the solution mappings produced
+        self._projection = projection
+        self._projected_variables = frozenset(projection) if projection is not None else None
         if self._currentBinding is not None:
             self._currentIter = self._initInnerLoop(self._innerTriple, self._currentBinding, last_read=last_read)
 
@@ -45,11 +64,26 @@ class IndexJoinIterator(PreemptableIterator):
         """Get the name of the iterator, as used in the plan serialization protocol"""
         return "join"
 
+    def db_calls(self) -> int:
+        """Get the number of calls to the database (i.e., searches) issued by the iterator since its creation"""
+        return self._db_calls
+
+    def db_reads(self) -> int:
+        """Get the number of RDF triples read from the database by the iterator since its creation"""
+        if self._currentIter is not None and not self._cached_loop:
+            return self._db_reads + self._currentIter.db_reads()
+        return self._db_reads
+
     def has_next(self) -> bool:
         """Return True if the iterator has more item to yield"""
         return self._source.has_next() or (self._currentIter is not None and self._currentIter.has_next())
 
-    def _initInnerLoop(self, triple: Dict[str, str], mappings: Optional[Dict[str, str]], last_read: Optional[str] = None) -> PreemptableIterator:
+    def _join(self, mu: SolutionMappings) -> SolutionMappings:
+        """Join the current binding with a set of solution mappings read from the inner loop, keeping the SPARQL variables still needed downstream"""
+        self._rows_out += 1
+        return self._currentBinding.join(mu, self._projected_variables)
+
+    def _initInnerLoop(self, triple: Dict[str, str], mappings: Optional[SolutionMappings], last_read: Optional[str] = None) -> Optional[PreemptableIterator]:
         """Create an iterator to evaluates an inner loop in the Index Loop join algorithm.
 
         Args:
@@ -58,17 +92,45 @@ class IndexJoinIterator(PreemptableIterator):
           * last_read: An offset ID used to resume processing of an inner loop.
 
         Returns:
-          An iterator used to evaluate the inner loop.
+          An iterator used to evaluate the inner loop, or `None` if the inner loop yields nothing.
         """
         if mappings is None:
-            return EmptyIterator(triple)
-        (s, p, o) = (find_in_mappings(triple['subject'], mappings), find_in_mappings(triple['predicate'], mappings), find_in_mappings(triple['object'], mappings))
-        iterator, card = self._graph.search(s, p, o, last_read=last_read, as_of=self._start_timestamp)
+            return None
+        # the current inner loop is about to be replaced, so keep track of its reads
+        if self._currentIter is not None and not self._cached_loop:
+            self._db_reads += self._currentIter.db_reads()
+        (s, p, o) = (encode_in_mappings(triple['subject'], mappings, self._dictionary), encode_in_mappings(triple['predicate'], mappings, self._dictionary), encode_in_mappings(triple['object'], mappings, self._dictionary))
+        iterator, card = self._search(s, p, o, last_read)
         if card == 0:
             return None
         return ScanIterator(iterator, tuple_to_triple(s, p, o), card)
 
-    async def _innerLoop(self) -> Optional[Dict[str, str]]:
+    def _search(self, s: Any, p: Any, o: Any, last_read: Optional[str]) -> Tuple[DBIterator, int]:
+        """Search the inner triple pattern, once substituted, replaying its lookup from the cache when possible.
+
+        The RDF triples replayed from the cache have the same `last_read` IDs as the ones read from the graph,
+        so the join is saved the same way in both cases. A resumed inner loop is always read from the graph.
+        Lookups are keyed on the snapshot read by the join, so a cache shared by several queries never mixes their versions of the graph.
+        """
+        self._cached_loop = False
+        if self._cache is not None and not last_read:
+            key = (s, p, o, self._start_timestamp)
+            iterator, card = self._cache.get(key)
+            if iterator is not None:
+                self._cached_loop = True
+                return iterator, card
+            self._db_calls += 1
+            iterator, card = self._graph.search_ids(s, p, o, as_of=self._start_timestamp)
+            # the RDF triples of a cached lookup are read at once
+            iterator = self._cache.put(key, iterator, card)
+            if isinstance(iterator, CachedIterator) and not iterator.has_source():
+                self._db_reads += len(iterator)
+                self._cached_loop = True
+            return iterator, card
+        self._db_calls += 1
+        return self._graph.search_ids(s, p, o, last_read=last_read, as_of=self._start_timestamp)
+
+    async def _innerLoop(self) -> Optional[SolutionMappings]:
         """Execute one set of the inner loop.
 
         Returns: A set of solution mappings, or `None` if none was produced during this call.
@@ -76,14 +138,17 @@ class IndexJoinIterator(PreemptableIterator):
         mu = await self._currentIter.next()
         if mu is None:
             return None
-        return {**self._currentBinding, **mu}
+        return self._join(mu)
 
-    async def next(self) -> Optional[Dict[str, str]]:
+    async def next(self) -> Optional[SolutionMappings]:
         """Get the next item from the iterator, following the iterator protocol.
 
         This function may contains `non interruptible` clauses which must
         be atomically evaluated before preemption occurs.
 
+        If the time quantum expires while looking for an inner loop that yields results,
+        the join stops right after having started a new inner loop, so its state can be saved exactly.
+
         Returns: A set of solution mappings, or `None` if none was produced during this call.
 
         Throws: `StopAsyncIteration` if the iterator cannot produce more items.
@@ -93,10 +158,48 @@ class IndexJoinIterator(PreemptableIterator):
         with PreemptiveLoop() as loop:
             while self._currentIter is None or (not self._currentIter.has_next()):
                 self._currentBinding = await self._source.next()
+                if self._currentBinding is not None:
+                    self._rows_in += 1
                 self._currentIter = self._initInnerLoop(self._innerTriple, self._currentBinding)
                 await loop.tick()
+                if loop.expired() or not self.has_next():
+                    return None
         return await self._innerLoop()
 
+    def supports_batch(self) -> bool:
+        """Return True if the iterator implements the batch protocol"""
+        return self._source.supports_batch()
+
+    async def next_batch(self, size: int) -> List[SolutionMappings]:
+        """Get the next batch of items from the iterator.
+
+        The work done during a batch is bounded: at most `size` steps are performed,
+        where a step either reads one set of mappings from the outer relation
+        or reads a batch from the current inner loop.
+
+        Argument: The maximum number of solution mappings to produce.
+
+        Returns: A list of at most `size` solution mappings, which may be empty.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        if not self.has_next():
+            raise StopAsyncIteration()
+        batch = list()
+        steps = 0
+        while steps < size and len(batch) < size and self.has_next():
+            steps += 1
+            if self._currentIter is None or (not self._currentIter.has_next()):
+                outer = await self._source.next_batch(1)
+                if len(outer) > 0:
+                    self._rows_in += 1
+                    self._currentBinding = outer[0]
+                    self._currentIter = self._initInnerLoop(self._innerTriple, self._currentBinding)
+            else:
+                for mu in await self._currentIter.next_batch(size - len(batch)):
+                    batch.append(self._join(mu))
+        return batch
+
     def save(self) -> SavedIndexJoinIterator:
         """Save and serialize the iterator as a Protobuf message"""
         saved_join = SavedIndexJoinIterator()
@@ -116,4 +219,8 @@ class IndexJoinIterator(PreemptableIterator):
             saved_join.last_read = self._currentIter.last_read()
         if self._start_timestamp is not None:
             saved_join.timestamp = self._start_timestamp.isoformat()
+        saved_join.rows_in = self._rows_in
+        saved_join.rows_out = self._rows_out
+        if self._projection is not None:
+            saved_join.projection.extend(self._projection)
         return saved_join
@@ -1,7 +1,9 @@
 # preemptable_iterator.py
 # Author: Thomas MINIER - MIT License 2017-2020
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, List, Optional
+
+from sage.query_engine.iterators.mappings import SolutionMappings
 
 
 class PreemptableIterator(ABC):
@@ -13,7 +15,7 @@ class PreemptableIterator(ABC):
         pass
 
     @abstractmethod
-    async def next(self) -> Optional[Dict[str, str]]:
+    async def next(self) -> Optional[SolutionMappings]:
         """Get the next item from the iterator, following the iterator protocol.
 
         This function may contains `non interruptible` clauses which must 
@@ -25,6 +27,63 @@ class PreemptableIterator(ABC):
         """
         pass
 
+    def supports_batch(self) -> bool:
+        """Return True if the iterator implements the batch protocol, i.e., the `next_batch` method.
+
+        Iterators that do not support it are evaluated one item at a time, using `next`.
+        """
+        return False
+
+    async def next_batch(self, size: int) -> List[SolutionMappings]:
+        """Get the next batch of items from the iterator.
+
+        A batch is evaluated atomically: this function never yields control to the event loop,
+        so preemption can only occur between two batches and `save` always captures
+        the exact state reached after the last batch.
+
+        Argument: The maximum number of solution mappings to produce.
+
+        Returns: A list of at most `size` solution mappings, which may be empty.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support the batch protocol")
+
+    def ordering(self) -> List[str]:
+        """Get the SPARQL variables by which the solution mappings are sorted, from the most significant to the least significant.
+
+        An empty list means that the solution mappings are not yielded in any particular order.
+        """
+        return list()
+
+    def order_key(self, variable: str, value: str) -> Any:
+        """Get the key used to compare the values of a SPARQL variable, following the order of the iterator.
+
+        Args:
+          * variable: A SPARQL variable returned by `ordering`.
+          * value: A value of the variable.
+
+        Returns: A key such that solution mappings are yielded by ascending keys.
+        """
+        return value
+
+    def children(self) -> List["PreemptableIterator"]:
+        """Get the iterators consumed by this iterator, i.e., its children in the physical query execution plan"""
+        children = list()
+        for name in ['_source', '_left', '_right']:
+            child = getattr(self, name, None)
+            if isinstance(child, PreemptableIterator):
+                children.append(child)
+        return children
+
+    def db_calls(self) -> int:
+        """Get the number of calls to the database (i.e., searches) issued by the iterator since its creation"""
+        return 0
+
+    def db_reads(self) -> int:
+        """Get the number of RDF triples read from the database by the iterator since its creation"""
+        return 0
+
     @abstractmethod
     def has_next(self) -> bool:
         """Return True if the iterator has more item to yield"""
@@ -1,7 +1,8 @@
 # projection.py
 # Author: Thomas MINIER - MIT License 2017-2020
-from typing import Dict, List, Optional
+from typing import List, Optional
 
+from sage.query_engine.iterators.mappings import SolutionMappings
 from sage.query_engine.iterators.preemptable_iterator import PreemptableIterator
 from sage.query_engine.protobuf.iterators_pb2 import SavedProjectionIterator
 
@@ -18,6 +19,7 @@ class ProjectionIterator(PreemptableIterator):
         super(ProjectionIterator, self).__init__()
         self._source = source
         self._projection = projection
+        self._projected_variables = frozenset(projection) if projection is not None else None
 
     def __repr__(self) -> str:
         return f"<ProjectionIterator SELECT {self._projection} FROM {self._source}>"
@@ -30,7 +32,7 @@ class ProjectionIterator(PreemptableIterator):
         """Return True if the iterator has more item to yield"""
         return self._source.has_next()
 
-    async def next(self) -> Optional[Dict[str, str]]:
+    async def next(self) -> Optional[SolutionMappings]:
         """Get the next item from the iterator, following the iterator protocol.
 
         This function may contains `non interruptible` clauses which must 
@@ -47,7 +49,27 @@ class ProjectionIterator(PreemptableIterator):
             return None
         elif self._projection is None:
             return mappings
-        return {k: v for k, v in mappings.items() if k in self._projection}
+        return mappings.project(self._projected_variables)
+
+    def supports_batch(self) -> bool:
+        """Return True if the iterator implements the batch protocol"""
+        return self._source.supports_batch()
+
+    async def next_batch(self, size: int) -> List[SolutionMappings]:
+        """Get the next batch of items from the iterator.
+
+        Argument: The maximum number of solution mappings to produce.
+
+        Returns: A list of at most `size` solution mappings, which may be empty.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        if not self.has_next():
+            raise StopAsyncIteration()
+        batch = await self._source.next_batch(size)
+        if self._projection is None:
+            return batch
+        return [mappings.project(self._projected_variables) for mappings in batch]
 
     def save(self) -> SavedProjectionIterator:
         """Save and serialize the iterator as a Protobuf message"""
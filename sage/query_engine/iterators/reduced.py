@@ -1,7 +1,8 @@
 # projection.py
 # Author: Thomas MINIER - MIT License 2017-2020
-from typing import Dict, List, Optional,Set
+from typing import List, Optional,Set
 
+from sage.query_engine.iterators.mappings import SolutionMappings
 from sage.query_engine.iterators.preemptable_iterator import PreemptableIterator
 from sage.query_engine.protobuf.iterators_pb2 import SavedReducedIterator
 
@@ -23,7 +24,7 @@ class ReducedIterator(PreemptableIterator):
     def results(self) -> List:
         #for m in self.mappings:
         #    print(f"...{m}...")
-        return [dict(s) for s in set(frozenset(d.items()) for d in self.mappings)]
+        return list({frozenset(mu.items()): mu for mu in self.mappings}.values())
 
     def __repr__(self) -> str:
         return f"<ReducedIterator FROM {self._source}>"
@@ -36,7 +37,7 @@ class ReducedIterator(PreemptableIterator):
         """Return True if the iterator has more item to yield"""
         return self._source.has_next()
 
-    async def next(self) -> Optional[Dict[str, str]]:
+    async def next(self) -> Optional[SolutionMappings]:
         """Get the next item from the iterator, following the iterator protocol.
 
         This function may contains `non interruptible` clauses which must
@@ -1,10 +1,11 @@
 # scan.py
 # Author: Thomas MINIER - MIT License 2017-2020
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from sage.database.db_iterator import DBIterator
 from sage.query_engine.iterators.preemptable_iterator import PreemptableIterator
-from sage.query_engine.iterators.utils import selection, vars_positions
+from sage.query_engine.iterators.mappings import SolutionMappings, selector
+from sage.query_engine.iterators.utils import vars_positions
 from sage.query_engine.protobuf.iterators_pb2 import (SavedScanIterator,
                                                       TriplePattern)
 
@@ -25,8 +26,11 @@ class ScanIterator(PreemptableIterator):
         self._source = source
         self._triple = triple
         self._variables = vars_positions(triple['subject'], triple['predicate'], triple['object'])
+        # the selection is shared by all triple patterns with the same variables, and so is the schema of the solution mappings
+        self._select = selector(tuple(self._variables), source.term_dictionary())
         self._cardinality = cardinality
         self._progress = progress
+        self._start_progress = progress
 
     def __len__(self) -> int:
         return self._cardinality
@@ -41,11 +45,37 @@ class ScanIterator(PreemptableIterator):
     def last_read(self) -> str:
         return self._source.last_read()
 
+    def db_calls(self) -> int:
+        """Get the number of calls to the database (i.e., searches) issued by the iterator since its creation"""
+        # the search has been issued when the source was opened
+        return 1
+
+    def db_reads(self) -> int:
+        """Get the number of RDF triples read from the database by the iterator since its creation"""
+        return self._progress - self._start_progress
+
     def has_next(self) -> bool:
         """Return True if the iterator has more item to yield"""
         return self._source.has_next()
 
-    def next_sync(self) -> Optional[Dict[str, str]]:
+    def ordering(self) -> List[str]:
+        """Get the SPARQL variables by which the solution mappings are sorted, from the most significant to the least significant"""
+        variables = list()
+        for position in self._source.ordering():
+            term = self._triple[position]
+            # bound positions are constant, so they do not contribute to the order
+            if type(term) is str and term.startswith('?') and term not in variables:
+                variables.append(term)
+        return variables
+
+    def order_key(self, variable: str, value: str) -> Any:
+        """Get the key used to compare the values of a SPARQL variable, following the order of the iterator"""
+        for position in ['subject', 'predicate', 'object']:
+            if self._triple[position] == variable:
+                return self._source.order_key(value, position)
+        return value
+
+    def next_sync(self) -> Optional[SolutionMappings]:
         """ test !!
         """
         if not self.has_next():
@@ -54,10 +84,10 @@ class ScanIterator(PreemptableIterator):
         self._progress+=1
         if triple is None:
             return None
-        return selection(triple, self._variables)
+        return self._select(triple)
 
 
-    async def next(self) -> Optional[Dict[str, str]]:
+    async def next(self) -> Optional[SolutionMappings]:
         """Get the next item from the iterator, following the iterator protocol.
 
         This function may contains `non interruptible` clauses which must
@@ -73,7 +103,35 @@ class ScanIterator(PreemptableIterator):
         self._progress+=1
         if triple is None:
             return None
-        return selection(triple, self._variables)
+        return self._select(triple)
+
+    def supports_batch(self) -> bool:
+        """Return True if the iterator implements the batch protocol"""
+        return True
+
+    async def next_batch(self, size: int) -> List[SolutionMappings]:
+        """Get the next batch of items from the iterator.
+
+        At most `size` RDF triples are read from the database, so the batch may
+        contain less than `size` solution mappings if some reads produced nothing.
+
+        Argument: The maximum number of solution mappings to produce.
+
+        Returns: A list of at most `size` solution mappings, which may be empty.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        if not self.has_next():
+            raise StopAsyncIteration()
+        mappings = list()
+        for _ in range(size):
+            if not self._source.has_next():
+                break
+            triple = next(self._source)
+            self._progress += 1
+            if triple is not None:
+                mappings.append(self._select(triple))
+        return mappings
 
     def save(self) -> SavedScanIterator:
         """Save and serialize the iterator as a Protobuf message"""
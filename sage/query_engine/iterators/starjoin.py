@@ -0,0 +1,196 @@
+# starjoin.py
+# Author: Thomas MINIER - MIT License 2017-2020
+from datetime import datetime
+from math import prod
+from typing import Dict, List, Optional
+
+from sage.query_engine.iterators.mappings import SolutionMappings
+from sage.database.core.graph import Graph
+from sage.query_engine.iterators.preemptable_iterator import PreemptableIterator
+from sage.query_engine.iterators.utils import find_in_mappings, selection, vars_positions
+from sage.query_engine.primitives import PreemptiveLoop
+from sage.query_engine.protobuf.iterators_pb2 import (SavedStarJoinIterator,
+                                                      TriplePattern)
+from sage.query_engine.protobuf.utils import pyDict_to_protoDict
+
+
+class StarJoinIterator(PreemptableIterator):
+    """A StarJoinIterator joins a pipeline of iterators with a star of triple patterns, i.e., triple patterns that share the same subject.
+
+    For each solution mappings of the pipeline, which binds the subject of the star, all RDF triples about the subject
+    are read using a single search `s ? ?`, then they are matched locally against every triple pattern of the star.
+    So a star of k triple patterns costs one call to the database per subject, instead of k calls with Index Loop joins.
+
+    The RDF triples of a subject are read atomically, then the star is joined as the cross product of the matches
+    of its triple patterns. The state of the join is the solution mappings of the current subject and the position
+    in the cross product: when the join is resumed, the RDF triples of the subject are read again.
+
+    Args:
+      * source: Previous iterator in the pipeline, which binds the subject of the star.
+      * star: The triple patterns of the star, which share the same subject.
+      * graph: The RDF Graph on which the join is evaluated.
+      * currentBinding: The solution mappings being joined when the join was saved.
+      * position: Position in the cross product of the matches of `currentBinding` when the join was saved.
+      * as_of: Perform all reads against a consistent snapshot represented by a timestamp.
+    """
+
+    def __init__(self, source: PreemptableIterator, star: List[Dict[str, str]], graph: Graph, currentBinding: Optional[SolutionMappings] = None, position: int = 0, as_of: Optional[datetime] = None):
+        super(StarJoinIterator, self).__init__()
+        self._source = source
+        self._star = star
+        self._subject = star[0]['subject']
+        self._graph = graph
+        self._start_timestamp = as_of
+        self._currentBinding = None
+        # matches of each triple pattern of the star for the current subject
+        self._matches = list()
+        self._position = 0
+        self._db_calls = 0
+        self._db_reads = 0
+        if currentBinding is not None:
+            self._scan(currentBinding)
+            self._position = position
+
+    def __repr__(self) -> str:
+        patterns = ' . '.join(f"{triple['subject']} {triple['predicate']} {triple['object']}" for triple in self._star)
+        return f"<StarJoinIterator ({self._source} JOIN {{ {patterns} }})>"
+
+    def serialized_name(self) -> str:
+        """Get the name of the iterator, as used in the plan serialization protocol"""
+        return "starjoin"
+
+    def db_calls(self) -> int:
+        """Get the number of calls to the database (i.e., searches) issued by the iterator since its creation"""
+        return self._db_calls
+
+    def db_reads(self) -> int:
+        """Get the number of RDF triples read from the database by the iterator since its creation"""
+        return self._db_reads
+
+    def _nb_products(self) -> int:
+        """Get the size of the cross product of the matches of the current subject"""
+        return prod(len(matches) for matches in self._matches) if len(self._matches) > 0 else 0
+
+    def has_next(self) -> bool:
+        """Return True if the iterator has more item to yield"""
+        return self._source.has_next() or self._position < self._nb_products()
+
+    def _scan(self, mappings: Optional[SolutionMappings]) -> None:
+        """Read all RDF triples about the subject bound in a set of solution mappings, and match them against the triple patterns of the star"""
+        self._currentBinding = mappings
+        self._matches = list()
+        self._position = 0
+        if mappings is None:
+            return
+        patterns = list()
+        for triple in self._star:
+            pattern = (find_in_mappings(triple['predicate'], mappings), find_in_mappings(triple['object'], mappings))
+            patterns.append((pattern, vars_positions(triple['subject'], triple['predicate'], triple['object'])))
+        self._matches = [list() for _ in self._star]
+        subject = find_in_mappings(self._subject, mappings)
+        self._db_calls += 1
+        iterator, _ = self._graph.search(subject, '?p', '?o', as_of=self._start_timestamp)
+        while iterator.has_next():
+            triple = iterator.next()
+            if triple is None:
+                continue
+            self._db_reads += 1
+            for index, ((predicate, obj), variables) in enumerate(patterns):
+                if not predicate.startswith('?') and predicate != triple[1]:
+                    continue
+                if not obj.startswith('?') and obj != triple[2]:
+                    continue
+                # the same variable may appear as the predicate and the object of the triple pattern
+                if predicate.startswith('?') and predicate == obj and triple[1] != triple[2]:
+                    continue
+                self._matches[index].append(selection(triple, variables))
+
+    def _next_product(self) -> Optional[SolutionMappings]:
+        """Join the solution mappings with the next combination of matches, or return `None` if the matches are not compatible"""
+        position = self._position
+        self._position += 1
+        mappings = self._currentBinding
+        for matches in self._matches:
+            mu = matches[position % len(matches)]
+            position //= len(matches)
+            for variable, value in mu.items():
+                if mappings.get(variable, value) != value:
+                    return None
+            mappings = mappings.join(mu)
+        return mappings
+
+    async def next(self) -> Optional[SolutionMappings]:
+        """Get the next item from the iterator, following the iterator protocol.
+
+        This function may contains `non interruptible` clauses which must
+        be atomically evaluated before preemption occurs.
+
+        Returns: A set of solution mappings, or `None` if none was produced during this call.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        if not self.has_next():
+            raise StopAsyncIteration()
+        with PreemptiveLoop() as loop:
+            while self._position >= self._nb_products():
+                self._scan(await self._source.next())
+                await loop.tick()
+                if loop.expired() or not self.has_next():
+                    return None
+        return self._next_product()
+
+    def supports_batch(self) -> bool:
+        """Return True if the iterator implements the batch protocol"""
+        return self._source.supports_batch()
+
+    async def next_batch(self, size: int) -> List[SolutionMappings]:
+        """Get the next batch of items from the iterator.
+
+        The work done during a batch is bounded: at most `size` steps are performed,
+        where a step either reads the RDF triples of the subject of one set of mappings from the pipeline,
+        or joins a batch of combinations of matches.
+
+        Argument: The maximum number of solution mappings to produce.
+
+        Returns: A list of at most `size` solution mappings, which may be empty.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        if not self.has_next():
+            raise StopAsyncIteration()
+        batch = list()
+        steps = 0
+        while steps < size and len(batch) < size and self.has_next():
+            steps += 1
+            if self._position < self._nb_products():
+                while len(batch) < size and self._position < self._nb_products():
+                    mappings = self._next_product()
+                    if mappings is not None:
+                        batch.append(mappings)
+            else:
+                outer = await self._source.next_batch(1)
+                if len(outer) > 0:
+                    self._scan(outer[0])
+        return batch
+
+    def save(self) -> SavedStarJoinIterator:
+        """Save and serialize the iterator as a Protobuf message"""
+        saved_join = SavedStarJoinIterator()
+        # save source operator
+        source_field = self._source.serialized_name() + '_source'
+        getattr(saved_join, source_field).CopyFrom(self._source.save())
+        # save the star
+        for triple in self._star:
+            pattern = TriplePattern()
+            pattern.subject = triple['subject']
+            pattern.predicate = triple['predicate']
+            pattern.object = triple['object']
+            pattern.graph = triple['graph']
+            saved_join.star.append(pattern)
+        # the matches of the current subject are read again when the join is resumed
+        if self._currentBinding is not None and self._position < self._nb_products():
+            pyDict_to_protoDict(self._currentBinding, saved_join.muc)
+            saved_join.position = self._position
+        if self._start_timestamp is not None:
+            saved_join.timestamp = self._start_timestamp.isoformat()
+        return saved_join
@@ -1,8 +1,9 @@
 # union.py
 # Author: Thomas MINIER - MIT License 2017-2020
-from typing import Dict, Optional
+from typing import List, Optional
 from random import random
 
+from sage.query_engine.iterators.mappings import SolutionMappings
 from sage.query_engine.iterators.preemptable_iterator import PreemptableIterator
 from sage.query_engine.protobuf.iterators_pb2 import SavedBagUnionIterator
 
@@ -34,7 +35,7 @@ class BagUnionIterator(PreemptableIterator):
         """Return True if the iterator has more item to yield"""
         return self._left.has_next() or self._right.has_next()
 
-    async def next(self) -> Optional[Dict[str, str]]:
+    async def next(self) -> Optional[SolutionMappings]:
         """Get the next item from the iterator, following the iterator protocol.
 
         This function may contains `non interruptible` clauses which must 
@@ -51,6 +52,26 @@ class BagUnionIterator(PreemptableIterator):
         else:
             return await self._right.next()
 
+    def supports_batch(self) -> bool:
+        """Return True if the iterator implements the batch protocol"""
+        return self._left.supports_batch() and self._right.supports_batch()
+
+    async def next_batch(self, size: int) -> List[SolutionMappings]:
+        """Get the next batch of items from the iterator.
+
+        Argument: The maximum number of solution mappings to produce.
+
+        Returns: A list of at most `size` solution mappings, which may be empty.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        if not self.has_next():
+            raise StopAsyncIteration()
+        elif self._left.has_next():
+            return await self._left.next_batch(size)
+        else:
+            return await self._right.next_batch(size)
+
     def save(self) -> SavedBagUnionIterator:
         """Save and serialize the iterator as a Protobuf message"""
         saved_union = SavedBagUnionIterator()
@@ -78,7 +99,7 @@ class RandomBagUnionIterator(BagUnionIterator):
         self._left = left
         self._right = right
 
-    async def next(self) -> Optional[Dict[str, str]]:
+    async def next(self) -> Optional[SolutionMappings]:
         """Get the next item from the iterator, following the iterator protocol.
 
         This function may contains `non interruptible` clauses which must 
@@ -100,3 +121,27 @@ class RandomBagUnionIterator(BagUnionIterator):
                 return await self._right.next()
             else:
                 return await self._left.next()
+
+    async def next_batch(self, size: int) -> List[SolutionMappings]:
+        """Get the next batch of items from the iterator.
+
+        Each batch is read from a single operand, chosen at random.
+
+        Argument: The maximum number of solution mappings to produce.
+
+        Returns: A list of at most `size` solution mappings, which may be empty.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        if not self.has_next():
+            raise StopAsyncIteration()
+        elif random() < 0.5:
+            if self._left.has_next():
+                return await self._left.next_batch(size)
+            else:
+                return await self._right.next_batch(size)
+        else:
+            if self._right.has_next():
+                return await self._right.next_batch(size)
+            else:
+                return await self._left.next_batch(size)
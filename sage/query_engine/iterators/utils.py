@@ -1,9 +1,14 @@
 # utils.py
 # Author: Thomas MINIER - MIT License 2017-2020
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 from rdflib import BNode, Literal, URIRef, Variable
+from rdflib.util import from_n3
 import hashlib
 import re
+import sys
+
+from sage.query_engine.iterators.mappings import SolutionMappings, selector
+from sage.query_engine.protobuf.iterators_pb2 import SavedEmptyIterator
 
 
 class EmptyIterator(object):
@@ -15,10 +20,22 @@ class EmptyIterator(object):
     def __len__(self) -> int:
         return 0
 
+    def serialized_name(self) -> str:
+        """Get the name of the iterator, as used in the plan serialization protocol"""
+        return "empty"
+
     def has_next(self) -> bool:
         """Return True if the iterator has more item to yield"""
         return False
 
+    def save(self) -> SavedEmptyIterator:
+        """Save and serialize the iterator as a Protobuf message"""
+        return SavedEmptyIterator()
+
+    def ordering(self) -> List[str]:
+        """Get the variables or positions by which the items are sorted, i.e., none as the iterator yields nothing"""
+        return list()
+
     async def next(self) -> None:
         """Get the next item from the iterator, following the iterator protocol.
 
@@ -31,6 +48,17 @@ class EmptyIterator(object):
         """
         raise StopAsyncIteration()
 
+    def supports_batch(self) -> bool:
+        """Return True if the iterator implements the batch protocol"""
+        return True
+
+    async def next_batch(self, size: int) -> List[SolutionMappings]:
+        """Get the next batch of items from the iterator.
+
+        Throws: `StopAsyncIteration` if the iterator cannot produce more items.
+        """
+        raise StopAsyncIteration()
+
 
 
 class ArrayIterator(object):
@@ -39,7 +67,7 @@ class ArrayIterator(object):
     Argument: List of solution mappings.
     """
 
-    def __init__(self, array: List[Dict[str, str]]):
+    def __init__(self, array: List[SolutionMappings]):
         super(ArrayIterator, self).__init__()
         self._array = array
 
@@ -47,7 +75,7 @@ class ArrayIterator(object):
         """Return True if the iterator has more item to yield"""
         return len(self._array) > 0
 
-    def next(self) -> Optional[Dict[str, str]]:
+    def next(self) -> Optional[SolutionMappings]:
         """Get the next item from the iterator, following the iterator protocol.
 
         This function may contains `non interruptible` clauses which must
@@ -63,7 +91,7 @@ class ArrayIterator(object):
         return mu
 
 
-def selection(triple: Tuple[str, str, str], variables: List[str]) -> Dict[str, str]:
+def selection(triple: Tuple[str, str, str], variables: List[str]) -> SolutionMappings:
     """Apply a selection on a RDF triple, producing a set of solution mappings.
 
     Args:
@@ -79,14 +107,7 @@ def selection(triple: Tuple[str, str, str], variables: List[str]) -> Dict[str, s
       >>> selection(triple, variables)
       { "?s": ":Ann", "?knows": ":Bob" }
     """
-    bindings = dict()
-    if variables[0] is not None:
-        bindings[variables[0]] = triple[0]
-    if variables[1] is not None:
-        bindings[variables[1]] = triple[1]
-    if variables[2] is not None:
-        bindings[variables[2]] = triple[2]
-    return bindings
+    return selector(tuple(variables))(triple)
 
 
 def find_in_mappings(variable: str, mappings: Dict[str, str] = dict()) -> str:
@@ -108,7 +129,23 @@ def find_in_mappings(variable: str, mappings: Dict[str, str] = dict()) -> str:
     """
     if not variable.startswith('?'):
         return variable
-    return mappings[variable] if variable in mappings else variable
+    return mappings.get(variable, variable)
+
+
+def encode_in_mappings(term: str, mappings: SolutionMappings, dictionary: Optional[Any]) -> Union[int, str]:
+    """Find a substitution for a SPARQL variable in a set of solution mappings, as an ID of a term dictionary when possible.
+
+    Args:
+      * term: SPARQL variable to look for, or RDF term.
+      * mappings: Set of solution mappings to search in.
+      * dictionary: Term dictionary of the RDF graph searched with the substitution, or `None` if the graph does not encode RDF terms.
+
+    Returns:
+      The ID that can be substituted for this variable, or the same value as `find_in_mappings` if the variable is unbound or the value cannot be encoded.
+    """
+    if dictionary is None or type(mappings) is not SolutionMappings or not term.startswith('?') or term not in mappings:
+        return find_in_mappings(term, mappings)
+    return mappings.encoded(term, dictionary)
 
 
 def vars_positions(subject: str, predicate: str, obj: str) -> List[str]:
@@ -120,7 +157,7 @@ def vars_positions(subject: str, predicate: str, obj: str) -> List[str]:
       * obj: Object of the triple pattern.
 
     Returns:
-      The positions of SPARQL variables in the input triple pattern.
+      The positions of SPARQL variables in the input triple pattern. Bound positions may hold IDs of a term dictionary.
 
     Example:
       >>> vars_positions("?s", "http://xmlns.com/foaf/0.1/name", '"Ann"@en')
@@ -128,7 +165,7 @@ def vars_positions(subject: str, predicate: str, obj: str) -> List[str]:
       >>> vars_positions("?s", "http://xmlns.com/foaf/0.1/name", "?name")
       [ "?s", None, "?name" ]
     """
-    return [var if var.startswith('?') else None for var in [subject, predicate, obj]]
+    return [var if type(var) is str and var.startswith('?') else None for var in [subject, predicate, obj]]
 
 
 def tuple_to_triple(s: str, p: str, o: str) -> Dict[str, str]:
@@ -196,3 +233,48 @@ def mappings_to_ctx(mappings: Dict[str, str]) -> {}:
         else:
             ctx[Variable(key)]=Literal(value)
     return ctx
+
+
+def to_rdflib_term(value: str) -> Union[Literal, URIRef, Variable, BNode]:
+    """Convert a N3 term to a RDFLib Term.
+
+    Argument: A RDF Term in N3 format.
+
+    Returns: The RDF Term in rdflib format.
+    """
+# Tbe real pb:
+# From variable -> we create mappings by reading in the base
+# however:
+#  - We dont remember if it was a URI, Bnode, or litteral
+#  - And when we want to process filters, or bindings with RDFLib
+# we have to convert strings to RDFTerm in order to process them with
+# rdflib evaluation functions
+
+    ## if data has been ingested with postgres sput !!
+    if value.startswith('"'):
+        try:
+            return from_n3(value)
+        except:
+            return Literal(f"{sys.exc_info()[0]}")
+    elif value.startswith('_'):
+        return BNode(value)
+    elif value.startswith('http'):
+        return URIRef(value)
+    else:
+        return Literal(value)
+
+    # if value.startswith('http') or value.startswith('file') or value.startswith('mailto'):
+    #     return URIRef(value)
+    # #managing Literals
+    # #"That Seventies Show"^^<http://www.w3.org/2001/XMLSchema#string>
+    # # generate N3 repr and parse...
+    # result=None
+    # try :
+    #     if value.startswith('"'):
+    #         result=from_n3(value)
+    #     else:
+    #         result=from_n3('"'+value+'"')
+    # except:
+    #     logger.warning(f'to_rdflib_term: {value} cannot be converted to RDF term. reason: {sys.exc_info()[0]}')
+    #     result=Literal(value.encode('utf-8','replace').decode('utf-8'))
+    # return result
@@ -1,32 +1,265 @@
 # join_builder.py
 # Author: Thomas MINIER - MIT License 2017-2020
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from sage.database.core.dataset import Dataset
+from sage.database.db_iterator import DBIterator
+from sage.database.db_iterator import EmptyIterator as EmptyDBIterator
+from sage.query_engine.iterators.bindjoin import BindJoinIterator
 from sage.query_engine.iterators.filter import FilterIterator
+from sage.query_engine.iterators.hashjoin import DEFAULT_BUDGET, HashJoinIterator
+from sage.query_engine.iterators.leapfrog import LeapfrogJoinIterator
+from sage.query_engine.iterators.mergejoin import MergeJoinIterator
 from sage.query_engine.iterators.nlj import IndexJoinIterator
 from sage.query_engine.iterators.preemptable_iterator import PreemptableIterator
 from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.iterators.starjoin import StarJoinIterator
 from sage.query_engine.iterators.utils import EmptyIterator
-from sage.query_engine.optimizer.utils import (equality_variables,
-                                               find_connected_pattern,
-                                               get_vars)
+from sage.query_engine.optimizer.join_order import (distinct_values,
+                                                    estimate_pattern,
+                                                    extend_estimate,
+                                                    order_joins,
+                                                    sample_fanouts,
+                                                    star_fanouts)
+from sage.query_engine.optimizer.utils import (equality_variables, get_vars,
+                                               is_cyclic, variable_order)
 
 
-def build_left_join_tree(bgp: List[Dict[str, str]], dataset: Dataset, default_graph: str, as_of: Optional[datetime] = None) -> Tuple[PreemptableIterator, List[str], Dict[str, str]]:
+# Number of RDF triples that can be read from the database for the cost of a single search.
+# Used to compare the cost of an Index Loop join (one search per outer solution mappings)
+# with the cost of a Hash join (one scan of the inner triple pattern).
+READS_PER_SEARCH = 10
+
+
+def _scan_position(pipeline: PreemptableIterator, variable: str) -> Optional[str]:
+    """Get the position of a SPARQL variable in the triple pattern that sorts a pipeline of Scans and Merge joins"""
+    while type(pipeline) is MergeJoinIterator:
+        pipeline = pipeline._left
+    for position in ['subject', 'predicate', 'object']:
+        if pipeline._triple[position] == variable:
+            return position
+    return None
+
+
+def open_scan(pattern: Dict[str, Any], dataset: Dataset, as_of: Optional[datetime] = None) -> DBIterator:
+    """Get the iterator that scans a triple pattern, searching the database the first time it is requested.
+
+    Triple patterns are analyzed using cardinality estimations only, so the database is only searched
+    for the triple patterns whose scan is executed, i.e., the first triple pattern of the join tree, and the inner triple patterns of Merge and Hash joins.
+    RDF triples are read as triples of IDs when the graph encodes its RDF terms (see `Graph.search_ids`).
+
+    Args:
+      * pattern: Triple pattern to scan, with its cardinality. The iterator is stored under the 'iterator' key.
+      * dataset: RDF dataset on which the triple pattern is evaluated.
+      * as_of: A timestamp used to perform all reads against a consistent version of the dataset.
+
+    Returns: The iterator that scans the triple pattern.
+    """
+    if 'iterator' not in pattern:
+        triple = pattern['triple']
+        if dataset.has_graph(triple['graph']):
+            pattern['iterator'], _ = dataset.get_graph(triple['graph']).search_ids(triple['subject'], triple['predicate'], triple['object'], as_of=as_of)
+        else:
+            pattern['iterator'] = EmptyDBIterator(triple)
+    return pattern['iterator']
+
+
+def build_merge_join(source: PreemptableIterator, pattern: Dict[str, Any], dataset: Dataset, as_of: Optional[datetime] = None) -> Optional[MergeJoinIterator]:
+    """Try to build a Merge join between a pipeline of iterators and a triple pattern.
+
+    A Merge join is possible when both the pipeline and the scan of the triple pattern are sorted on the same join variable.
+    Predicates and subjects/objects are not encoded in the same way by all backends, so the join variable
+    must appear as a predicate on both sides or on none.
+
+    Args:
+      * source: Pipeline of iterators used as the left operand of the join.
+      * pattern: Triple pattern used as the right operand of the join, with its cardinality.
+      * dataset: RDF dataset on which the join is evaluated.
+      * as_of: A timestamp used to perform all reads against a consistent version of the dataset.
+
+    Returns: The Merge join, or `None` if the inputs are not sorted on a common join variable.
+    """
+    if type(source) not in [ScanIterator, MergeJoinIterator] or len(source.ordering()) == 0:
+        return None
+    triple = pattern['triple']
+    if not dataset.has_graph(triple['graph']):
+        return None
+    # a scan cannot check that a variable repeated in the triple pattern binds to the same value
+    eq_expr, _ = equality_variables(triple['subject'], triple['predicate'], triple['object'])
+    if eq_expr is not None:
+        return None
+    # the order of the scan is checked before searching the database, so no iterator is opened in vain
+    join_var = source.ordering()[0]
+    positions = [position for position in dataset.get_graph(triple['graph']).search_ordering(triple['subject'], triple['predicate'], triple['object']) if triple[position].startswith('?')]
+    if len(positions) == 0 or triple[positions[0]] != join_var:
+        return None
+    if (_scan_position(source, join_var) == 'predicate') != (positions[0] == 'predicate'):
+        return None
+    scan = ScanIterator(open_scan(pattern, dataset, as_of=as_of), triple, pattern['cardinality'])
+    return MergeJoinIterator(source, scan, join_var)
+
+
+def build_join(source: PreemptableIterator, pattern: Dict[str, Any], outer_cardinality: Optional[float], outer_vars: Set[str], dataset: Dataset, as_of: Optional[datetime] = None, projection: Optional[List[str]] = None) -> PreemptableIterator:
+    """Build a join between a pipeline of iterators and a triple pattern.
+
+    A Merge join is used when both the pipeline and the scan of the triple pattern are sorted on the join variable.
+    Otherwise, a Hash join is used when scanning the triple pattern once costs less than searching it for each solution mappings
+    of the pipeline, and the triple pattern fits in the hash table's budget.
+    Otherwise, a Bind join is used when the graph of the triple pattern supports batched lookups, so the pattern is resolved
+    for a whole block of solution mappings per call to the database. Otherwise, an Index Loop join is used.
+
+    Args:
+      * source: Pipeline of iterators used as the outer relation of the join.
+      * pattern: Triple pattern used as the inner relation of the join, with its cardinality.
+      * outer_cardinality: Estimated cardinality of the pipeline, or `None` if it is unknown.
+      * outer_vars: SPARQL variables bound by the pipeline.
+      * dataset: RDF dataset on which the join is evaluated.
+      * as_of: A timestamp used to perform all reads against a consistent version of the dataset.
+      * projection: SPARQL variables still needed downstream, which are the only ones kept by Bind and Index Loop joins, or `None` to keep all variables.
+
+    Returns: The root of the join.
+    """
+    triple = pattern['triple']
+    graph = dataset.get_graph(triple['graph'])
+    join_vars = sorted(get_vars(triple) & outer_vars)
+    merge_join = build_merge_join(source, pattern, dataset, as_of=as_of)
+    if merge_join is not None:
+        return merge_join
+    if outer_cardinality is not None and len(join_vars) > 0 and pattern['cardinality'] <= DEFAULT_BUDGET and pattern['cardinality'] < outer_cardinality * READS_PER_SEARCH:
+        return HashJoinIterator(source, open_scan(pattern, dataset, as_of=as_of), triple, graph, join_vars, as_of=as_of)
+    if graph.supports_batched_lookups():
+        return BindJoinIterator(source, triple, graph, as_of=as_of, projection=projection)
+    return IndexJoinIterator(source, triple, graph, as_of=as_of, projection=projection, cache=graph.lookup_cache())
+
+
+def build_star_join(source: PreemptableIterator, pattern: Dict[str, Any], triples: List[Dict[str, Any]], outer_vars: Set[str], dataset: Dataset, as_of: Optional[datetime] = None) -> Tuple[Optional[StarJoinIterator], List[Dict[str, Any]]]:
+    """Try to build a Star join between a pipeline of iterators and all triple patterns that share the subject of a triple pattern.
+
+    A Star join is used when the subject is bound by the pipeline and shared by several triple patterns,
+    unless the triple pattern can be evaluated using a Merge join, which issues even fewer calls to the database.
+
+    Args:
+      * source: Pipeline of iterators used as the outer relation of the join.
+      * pattern: Triple pattern to join with the pipeline.
+      * triples: Remaining triple patterns of the BGP, including `pattern`.
+      * outer_vars: SPARQL variables bound by the pipeline.
+      * dataset: RDF dataset on which the join is evaluated.
+      * as_of: A timestamp used to perform all reads against a consistent version of the dataset.
+
+    Returns: A tuple (`join`, `star`) where `join` is the Star join, or `None` if it cannot be used, and `star` is the list of triple patterns joined.
+    """
+    subject = pattern['triple']['subject']
+    if subject not in outer_vars:
+        return None, list()
+    star = [p for p in triples if p['triple']['subject'] == subject and p['triple']['graph'] == pattern['triple']['graph']]
+    if len(star) < 2 or build_merge_join(source, pattern, dataset, as_of=as_of) is not None:
+        return None, list()
+    graph = dataset.get_graph(pattern['triple']['graph'])
+    return StarJoinIterator(source, [p['triple'] for p in star], graph, as_of=as_of), star
+
+
+def build_leapfrog_join(bgp: List[Dict[str, str]], dataset: Dataset, as_of: Optional[datetime] = None) -> Optional[LeapfrogJoinIterator]:
+    """Try to evaluate a cyclic Basic Graph pattern using a Leapfrog Triejoin.
+
+    Left-linear trees of joins produce large intermediate results on cyclic BGPs (triangles, cliques, etc),
+    while a Leapfrog Triejoin is bounded by the size of its output. It requires all triple patterns to be evaluated
+    on the same graph, which must support sorted seeks.
+
+    Args:
+      * bgp: Basic Graph pattern to evaluate, where the graph of each triple pattern is set.
+      * dataset: RDF dataset on which the BGP is evaluated.
+      * as_of: A timestamp used to perform all reads against a consistent version of the dataset.
+
+    Returns: The Leapfrog Triejoin, or `None` if the BGP is acyclic or cannot be evaluated using a Leapfrog Triejoin.
+    """
+    graphs = set([triple['graph'] for triple in bgp])
+    if not is_cyclic(bgp) or len(graphs) > 1 or not dataset.has_graph(bgp[0]['graph']):
+        return None
+    graph = dataset.get_graph(bgp[0]['graph'])
+    if not graph.supports_sorted_seek():
+        return None
+    predicates, others = set(), set()
+    for triple in bgp:
+        triple_vars = [triple[position] for position in ['subject', 'predicate', 'object'] if triple[position].startswith('?')]
+        # each variable must appear at most once per triple pattern
+        if len(triple_vars) == 0 or len(triple_vars) > len(set(triple_vars)):
+            return None
+        if triple['predicate'].startswith('?'):
+            predicates.add(triple['predicate'])
+        others |= set([triple['subject'], triple['object']])
+    # predicates and subjects/objects are not compared using the same keys
+    if len(predicates & others) > 0:
+        return None
+    patterns = [{k: triple[k] for k in ['subject', 'predicate', 'object', 'graph']} for triple in bgp]
+    return LeapfrogJoinIterator(patterns, variable_order(patterns), graph, as_of=as_of)
+
+
+def apply_filters(pipeline: PreemptableIterator, filters: List[Tuple[str, Set[str]]], bound_vars: Optional[Set[str]] = None) -> PreemptableIterator:
+    """Evaluate FILTER expressions on a pipeline of iterators, as soon as all their SPARQL variables are bound.
+
+    Args:
+      * pipeline: Pipeline of iterators on which the FILTER expressions are evaluated.
+      * filters: List of tuples (`expression`, `variables`), where `variables` is the set of SPARQL variables of the FILTER expression `expression`.
+        The FILTER expressions evaluated are removed from the list.
+      * bound_vars: SPARQL variables bound by the pipeline, or `None` to evaluate all FILTER expressions.
+
+    Returns: The pipeline of iterators, with the FILTER expressions evaluated.
+    """
+    for expression, variables in list(filters):
+        if bound_vars is None or variables <= bound_vars:
+            pipeline = FilterIterator(pipeline, expression)
+            filters.remove((expression, variables))
+    return pipeline
+
+
+def downstream_vars(required_vars: Optional[Set[str]], triples: List[Dict[str, Any]], filters: List[Tuple[str, Set[str]]], pipeline_vars: Set[str]) -> Optional[List[str]]:
+    """Get the SPARQL variables of a pipeline of iterators which are still needed downstream.
+
+    Args:
+      * required_vars: SPARQL variables required by the parents of the join tree, or `None` if all variables are required.
+      * triples: Triple patterns not yet joined with the pipeline.
+      * filters: FILTER expressions not yet evaluated on the pipeline, as tuples (`expression`, `variables`).
+      * pipeline_vars: SPARQL variables bound by the pipeline.
+
+    Returns: The sorted list of the SPARQL variables to keep, or `None` if all variables of the pipeline must be kept.
+    """
+    if required_vars is None:
+        return None
+    needed = set(required_vars)
+    for pattern in triples:
+        needed |= get_vars(pattern['triple'])
+    for _, variables in filters:
+        needed |= variables
+    kept = needed & pipeline_vars
+    if len(kept) == 0 or kept == pipeline_vars:
+        return None
+    return sorted(kept)
+
+
+def build_left_join_tree(bgp: List[Dict[str, str]], dataset: Dataset, default_graph: str, as_of: Optional[datetime] = None, filters: List[Tuple[str, Set[str]]] = list(), required_vars: Optional[Set[str]] = None) -> Tuple[PreemptableIterator, List[str], Dict[str, str]]:
     """Build a Left-linear join tree from a Basic Graph pattern.
 
+    FILTER expressions evaluated on the BGP are placed at the lowest join that binds all their SPARQL variables,
+    so no search is issued for solution mappings that they reject. They are only delayed after a Merge join, which issues no search per solution mappings
+    and requires its inputs to be sorted Scans or Merge joins.
+
+    Bind and Index Loop joins only keep the SPARQL variables still needed downstream, i.e., required by the parents of the join tree,
+    by the triple patterns joined later or by the FILTER expressions evaluated later, so smaller solution mappings are copied and saved.
+
     Args:
       * bgp: Basic Graph pattern used to build the join tree.
       * dataset: RDF dataset on which the BGPC is evaluated.
       * default_graph: URI of the default graph used for BGP evaluation.
       * as_of: A timestamp used to perform all reads against a consistent version of the dataset. If `None`, use the latest version of the dataset, which does not guarantee snapshot isolation.
+      * filters: FILTER expressions evaluated on the BGP, as tuples (`expression`, `variables`) where `variables` is the set of SPARQL variables of `expression`.
+      * required_vars: SPARQL variables required by the parents of the join tree, or `None` if all variables are required.
 
     Returns: A tuple (`iterator`, `query_vars`, `cardinalities`) where:
       * `iterator` is the root of the Left-linear join tree.
       * `query_vars` is the list of all SPARQL variables found in the BGP.
-      * `cardinalities` is the list of estimated cardinalities of all triple patterns in the BGP.
+      * `cardinalities` is the list of estimated cardinalities of all triple patterns in the BGP. The triple patterns probed using a sample of the first one,
+        or estimated using characteristic sets, also have a `bound_cardinality`, i.e., their estimated number of matches per solution mappings that bind their join variables.
     """
     # gather metadata about triple patterns
     triples = []
@@ -42,18 +275,40 @@ def build_left_join_tree(bgp: List[Dict[str, str]], dataset: Dataset, default_gr
         # select the graph used to evaluate the pattern
         graph_uri = triple['graph'] if 'graph' in triple and len(triple['graph']) > 0 else default_graph
         triple['graph'] = graph_uri
-        # get iterator and statistics about the pattern
+        # get statistics about the pattern, without searching the database
         if dataset.has_graph(graph_uri):
-            it, c = dataset.get_graph(graph_uri).search(triple['subject'], triple['predicate'], triple['object'], as_of=as_of)
+            graph = dataset.get_graph(graph_uri)
+            c = graph.estimate(triple['subject'], triple['predicate'], triple['object'], as_of=as_of)
         else:
-            it, c = EmptyIterator(), 0
-        triples += [{'triple': triple, 'cardinality': c, 'iterator': it}]
+            graph = None
+            c = 0
+        triples += [{'triple': triple, 'cardinality': c, 'distinct': distinct_values(triple, c, graph)}]
         cardinalities += [{'triple': triple, 'cardinality': c}]
 
-    # sort triples by ascending cardinality
-    triples = sorted(triples, key=lambda v: v['cardinality'])
+    # evaluate cyclic BGPs using a Leapfrog Triejoin, when possible
+    leapfrog = build_leapfrog_join(bgp, dataset, as_of=as_of)
+    if leapfrog is not None:
+        query_vars = set()
+        for triple in bgp:
+            query_vars |= get_vars(triple)
+        return apply_filters(leapfrog, list(filters)), query_vars, cardinalities
+
+    # estimate the star-shaped joins using the characteristic sets of the graphs, if any
+    star_fanouts(triples, dataset)
+
+    # order the triple patterns using the cost model, starting from the most selective ones in case of ties
+    triples = order_joins(sorted(triples, key=lambda v: v['cardinality']))
 
-    # start the pipeline with the Scan with the most selective pattern
+    # sample the first triple pattern to estimate the triple patterns joined with it, then order them again
+    if sample_fanouts(triples, dataset, as_of=as_of):
+        triples = order_joins(triples, first=triples[0])
+    for pattern in triples:
+        if 'fanout' in pattern:
+            for cardinality in cardinalities:
+                if cardinality['triple'] is pattern['triple']:
+                    cardinality['bound_cardinality'] = pattern['fanout'][1]
+
+    # start the pipeline with the Scan of the first pattern
     pattern = triples.pop(0)
     query_vars = get_vars(pattern['triple'])
 
@@ -67,27 +322,50 @@ def build_left_join_tree(bgp: List[Dict[str, str]], dataset: Dataset, default_gr
         triple["predicate"] = new_pattern[1]
         triple["object"] = new_pattern[2]
         # build a pipline with Index Scan + Equality filter
-        pipeline = ScanIterator(pattern['iterator'], triple, pattern['cardinality'])
+        pipeline = ScanIterator(open_scan(pattern, dataset, as_of=as_of), triple, pattern['cardinality'])
         pipeline = FilterIterator(pipeline, eq_expr)
         # update query variables
         query_vars = query_vars | get_vars(triple)
     else:
-        pipeline = ScanIterator(pattern['iterator'], pattern['triple'], pattern['cardinality'])
+        pipeline = ScanIterator(open_scan(pattern, dataset, as_of=as_of), pattern['triple'], pattern['cardinality'])
+
+    # estimation of the cardinality of the pipeline, used to select the join algorithms
+    outer_estimate = estimate_pattern(pattern)
+
+    # FILTER expressions not yet evaluated
+    filters = list(filters)
+
+    # SPARQL variables bound by the pipeline, i.e., the variables of the BGP not yet dropped
+    pipeline_vars = query_vars
 
     # build the left linear tree of joins
     while len(triples) > 0:
-        pattern, pos, query_vars = find_connected_pattern(query_vars, triples)
-        # no connected pattern = disconnected BGP => pick the first remaining pattern in the BGP
-        if pattern is None:
-            pattern = triples[0]
-            query_vars = query_vars | get_vars(pattern['triple'])
-            pos = 0
-        graph_uri = pattern['triple']['graph']
-        pipeline = IndexJoinIterator(pipeline, pattern['triple'], dataset.get_graph(graph_uri), as_of=as_of)
-        triples.pop(pos)
-    return pipeline, query_vars, cardinalities
+        outer_vars = query_vars
+        pattern, pos = triples[0], 0
+        query_vars = query_vars | get_vars(pattern['triple'])
+        pipeline_vars = pipeline_vars | get_vars(pattern['triple'])
+        # evaluate the FILTER expressions before the join, unless it is a Merge join
+        if type(pipeline) not in [ScanIterator, MergeJoinIterator] or build_merge_join(pipeline, pattern, dataset, as_of=as_of) is None:
+            pipeline = apply_filters(pipeline, filters, outer_vars)
+        star_join, star = build_star_join(pipeline, pattern, triples, outer_vars, dataset, as_of=as_of)
+        if star_join is not None:
+            pipeline = star_join
+            for star_pattern in star:
+                query_vars = query_vars | get_vars(star_pattern['triple'])
+                pipeline_vars = pipeline_vars | get_vars(star_pattern['triple'])
+                outer_estimate = extend_estimate(outer_estimate, star_pattern)
+                triples.remove(star_pattern)
+        else:
+            projection = downstream_vars(required_vars, triples[1:], filters, pipeline_vars)
+            pipeline = build_join(pipeline, pattern, outer_estimate[0], outer_vars, dataset, as_of=as_of, projection=projection)
+            if projection is not None and type(pipeline) in [BindJoinIterator, IndexJoinIterator]:
+                pipeline_vars = set(projection)
+            outer_estimate = extend_estimate(outer_estimate, pattern)
+            triples.pop(pos)
+    # FILTER expressions over SPARQL variables not bound by the BGP are evaluated last
+    return apply_filters(pipeline, filters), query_vars, cardinalities
 
-def continue_left_join_tree(iterator: PreemptableIterator, query_vars : List[str], bgp: List[Dict[str, str]], dataset: Dataset, default_graph: str, as_of: Optional[datetime] = None) -> Tuple[PreemptableIterator, List[str], Dict[str, str]]:
+def continue_left_join_tree(iterator: PreemptableIterator, query_vars : List[str], bgp: List[Dict[str, str]], dataset: Dataset, default_graph: str, as_of: Optional[datetime] = None, required_vars: Optional[Set[str]] = None) -> Tuple[PreemptableIterator, List[str], Dict[str, str]]:
     """Build a Left-linear join tree from a Basic Graph pattern.
 
     Args:
@@ -95,6 +373,7 @@ def continue_left_join_tree(iterator: PreemptableIterator, query_vars : List[str
       * dataset: RDF dataset on which the BGPC is evaluated.
       * default_graph: URI of the default graph used for BGP evaluation.
       * as_of: A timestamp used to perform all reads against a consistent version of the dataset. If `None`, use the latest version of the dataset, which does not guarantee snapshot isolation.
+      * required_vars: SPARQL variables required by the parents of the join tree, or `None` if all variables are required.
 
     Returns: A tuple (`iterator`, `query_vars`, `cardinalities`) where:
       * `iterator` is the root of the Left-linear join tree.
@@ -110,28 +389,45 @@ def continue_left_join_tree(iterator: PreemptableIterator, query_vars : List[str
         # select the graph used to evaluate the pattern
         graph_uri = triple['graph'] if 'graph' in triple and len(triple['graph']) > 0 else default_graph
         triple['graph'] = graph_uri
-        # get iterator and statistics about the pattern
+        # get statistics about the pattern, without searching the database
         if dataset.has_graph(graph_uri):
-            it, c = dataset.get_graph(graph_uri).search(triple['subject'], triple['predicate'], triple['object'], as_of=as_of)
+            graph = dataset.get_graph(graph_uri)
+            c = graph.estimate(triple['subject'], triple['predicate'], triple['object'], as_of=as_of)
         else:
-            it, c = EmptyIterator(), 0
-        triples += [{'triple': triple, 'cardinality': c, 'iterator': it}]
+            graph = None
+            c = 0
+        triples += [{'triple': triple, 'cardinality': c, 'distinct': distinct_values(triple, c, graph)}]
         cardinalities += [{'triple': triple, 'cardinality': c}]
 
-    # sort triples by ascending cardinality
-    triples = sorted(triples, key=lambda v: v['cardinality'])
+    # estimate the star-shaped joins using the characteristic sets of the graphs, if any
+    star_fanouts(triples, dataset)
+
+    # order the triple patterns using the cost model, given the variables bound by the pipeline
+    triples = order_joins(sorted(triples, key=lambda v: v['cardinality']), bound_vars=set(query_vars))
 
     pipeline=iterator;
+    # the cardinality of the pipeline is unknown
+    outer_cardinality = None
+    # SPARQL variables bound by the pipeline, i.e., the variables not yet dropped
+    pipeline_vars = set(query_vars)
 
     # build the left linear tree of joins
     while len(triples) > 0:
-        pattern, pos, query_vars = find_connected_pattern(query_vars, triples)
-        # no connected pattern = disconnected BGP => pick the first remaining pattern in the BGP
-        if pattern is None:
-            pattern = triples[0]
-            query_vars = query_vars | get_vars(pattern['triple'])
-            pos = 0
-        graph_uri = pattern['triple']['graph']
-        pipeline = IndexJoinIterator(pipeline, pattern['triple'], dataset.get_graph(graph_uri), as_of=as_of)
-        triples.pop(pos)
+        outer_vars = query_vars
+        pattern, pos = triples[0], 0
+        query_vars = query_vars | get_vars(pattern['triple'])
+        pipeline_vars = pipeline_vars | get_vars(pattern['triple'])
+        star_join, star = build_star_join(pipeline, pattern, triples, outer_vars, dataset, as_of=as_of)
+        if star_join is not None:
+            pipeline = star_join
+            for star_pattern in star:
+                query_vars = query_vars | get_vars(star_pattern['triple'])
+                pipeline_vars = pipeline_vars | get_vars(star_pattern['triple'])
+                triples.remove(star_pattern)
+        else:
+            projection = downstream_vars(required_vars, triples[1:], list(), pipeline_vars)
+            pipeline = build_join(pipeline, pattern, outer_cardinality, outer_vars, dataset, as_of=as_of, projection=projection)
+            if projection is not None and type(pipeline) in [BindJoinIterator, IndexJoinIterator]:
+                pipeline_vars = set(projection)
+            triples.pop(pos)
     return pipeline, query_vars, cardinalities
@@ -0,0 +1,273 @@
+# join_order.py
+# Author: Thomas MINIER - MIT License 2017-2020
+from datetime import datetime
+from time import monotonic
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sage.database.core.dataset import Dataset
+from sage.database.core.graph import Graph
+from sage.query_engine.iterators.utils import find_in_mappings, selection, vars_positions
+from sage.query_engine.optimizer.utils import get_vars
+
+# Maximum number of triple patterns in a BGP ordered using dynamic programming. Larger BGPs are ordered greedily.
+DP_THRESHOLD = 10
+
+# Maximum number of RDF triples sampled from the first triple pattern of a BGP, to probe the triple patterns joined with it
+SAMPLE_SIZE = 16
+
+# Maximum time (in seconds) spent sampling and probing the triple patterns of a BGP
+SAMPLE_BUDGET = 0.005
+
+# The estimated cardinality of a relation, and the estimated number of distinct values of each of its variables
+Estimate = Tuple[float, Dict[str, float]]
+
+
+def distinct_values(triple: Dict[str, str], cardinality: int, graph: Optional[Graph]) -> Dict[str, int]:
+    """Estimate the number of distinct values of each SPARQL variable of a triple pattern, using the statistics of its graph.
+
+    Args:
+      * triple: A triple pattern.
+      * cardinality: The cardinality of the triple pattern.
+      * graph: The RDF Graph on which the triple pattern is evaluated, or `None` if it does not exist.
+
+    Returns: The estimated number of distinct values of each SPARQL variable of the triple pattern.
+    """
+    distinct = dict()
+    for position in ['subject', 'predicate', 'object']:
+        variable = triple[position]
+        if not variable.startswith('?'):
+            continue
+        if graph is None:
+            count = 1
+        else:
+            count = graph.distinct_values(triple['subject'], triple['predicate'], triple['object'], position, cardinality)
+        distinct[variable] = min(count, distinct.get(variable, count))
+    return distinct
+
+
+def estimate_pattern(pattern: Dict[str, Any]) -> Estimate:
+    """Get the estimate of a triple pattern, with its cardinality and the distinct values of its variables"""
+    distinct = pattern['distinct'] if 'distinct' in pattern else {v: pattern['cardinality'] for v in get_vars(pattern['triple'])}
+    return (pattern['cardinality'], {variable: max(1, count) for variable, count in distinct.items()})
+
+
+def estimate_join(left: Estimate, right: Estimate) -> Estimate:
+    """Estimate the cardinality of the join of two relations.
+
+    Values of the join variables are assumed to be uniformly distributed and contained in the relation
+    with the most distinct values, so each join variable divides the size of the cross product by
+    the largest number of distinct values of this variable.
+
+    Args:
+      * left: Estimate of the left relation.
+      * right: Estimate of the right relation.
+
+    Returns: The estimate of the join.
+    """
+    left_card, left_distinct = left
+    right_card, right_distinct = right
+    cardinality = left_card * right_card
+    for variable in left_distinct.keys() & right_distinct.keys():
+        cardinality /= max(left_distinct[variable], right_distinct[variable])
+    distinct = dict()
+    for variable in left_distinct.keys() | right_distinct.keys():
+        count = min([d[variable] for d in [left_distinct, right_distinct] if variable in d])
+        distinct[variable] = max(1, min(count, cardinality))
+    return (cardinality, distinct)
+
+
+def join_cost(patterns: List[Dict[str, Any]]) -> float:
+    """Get the cost of a join order, i.e., the sum of the estimated cardinalities of its intermediate results.
+
+    Args:
+      * patterns: The triple patterns of a BGP, in join order.
+
+    Returns: The cost of the join order, as minimized by `order_joins`.
+    """
+    estimate = None
+    cost = 0
+    for pattern in patterns:
+        estimate = extend_estimate(estimate, pattern)
+        cost += estimate[0]
+    return cost
+
+
+def _candidates(estimate: Optional[Estimate], remaining: List[int], patterns_vars: List[Set[str]]) -> List[int]:
+    """Get the triple patterns that can extend a relation without a cross product, or all remaining patterns if there are none"""
+    if estimate is None:
+        return remaining
+    connected = [index for index in remaining if len(patterns_vars[index] & estimate[1].keys()) > 0]
+    return connected if len(connected) > 0 else remaining
+
+
+def order_joins(patterns: List[Dict[str, Any]], bound_vars: Set[str] = set(), first: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Order the triple patterns of a BGP to build a Left-linear tree of joins.
+
+    The cost of a join order is the sum of the estimated cardinalities of its intermediate results.
+    BGPs with at most `DP_THRESHOLD` triple patterns are ordered using dynamic programming, which finds the join order with the minimal cost,
+    and larger BGPs are ordered greedily, by picking the triple pattern that yields the smallest intermediate result at each step.
+    Cross products are only considered when a BGP is disconnected.
+
+    All join operators of the engine join a pipeline with a triple pattern, so only Left-linear trees are considered.
+
+    Args:
+      * patterns: The triple patterns of the BGP, each with its cardinality and the distinct values of its variables.
+      * bound_vars: SPARQL variables already bound when the BGP is evaluated, e.g., by a pipeline that the join tree continues.
+      * first: A triple pattern of `patterns` that must be evaluated first, e.g., the triple pattern used to sample the others.
+
+    Returns: The triple patterns of the BGP, in join order. Ties are broken using the input order.
+    """
+    start = (1, {variable: 1 for variable in bound_vars}) if len(bound_vars) > 0 else None
+    head = list()
+    if first is not None:
+        start = extend_estimate(start, first)
+        head = [first]
+        patterns = [pattern for pattern in patterns if pattern is not first]
+    if len(patterns) <= 1:
+        return head + list(patterns)
+    if len(patterns) <= DP_THRESHOLD:
+        order = _dynamic_programming(patterns, start)
+    else:
+        order = _greedy(patterns, start)
+    return head + [patterns[index] for index in order]
+
+
+def star_fanouts(patterns: List[Dict[str, Any]], dataset: Dataset) -> bool:
+    """Estimate the cardinality of the triple patterns of a BGP that share the same subject, using the characteristic sets of their graph.
+
+    The triple patterns with a variable subject and a bound predicate are grouped by subject, into stars.
+    The fanout of each triple pattern of a star is the ratio between the estimated cardinality of the star and the one of the star without this triple pattern,
+    i.e., its number of matches per subject once the other triple patterns of the star are joined.
+    It is stored under the 'fanout' key of the triple pattern, as done by `sample_fanouts`.
+
+    Args:
+      * patterns: The triple patterns of the BGP.
+      * dataset: RDF dataset on which the BGP is evaluated.
+
+    Returns: True if the fanout of at least one triple pattern has been estimated, False otherwise.
+    """
+    stars = dict()
+    for pattern in patterns:
+        triple = pattern['triple']
+        if triple['subject'].startswith('?') and not triple['predicate'].startswith('?') and triple['subject'] != triple['object'] and dataset.has_graph(triple['graph']):
+            stars.setdefault((triple['graph'], triple['subject']), list()).append(pattern)
+    estimated = False
+    for (graph_uri, subject), star in stars.items():
+        if len(star) < 2:
+            continue
+        catalog = dataset.get_graph(graph_uri).characteristic_sets()
+        if catalog is None:
+            continue
+        shape = [(pattern['triple']['predicate'], not pattern['triple']['object'].startswith('?')) for pattern in star]
+        cardinality = catalog.star_cardinality(shape)
+        for index, pattern in enumerate(star):
+            others = catalog.star_cardinality(shape[:index] + shape[index + 1:])
+            pattern['fanout'] = (frozenset([subject]), cardinality / others if others > 0 else 0)
+        estimated = True
+    return estimated
+
+
+def sample_fanouts(patterns: List[Dict[str, Any]], dataset: Dataset, as_of: Optional[datetime] = None, size: int = SAMPLE_SIZE, budget: float = SAMPLE_BUDGET) -> bool:
+    """Estimate the cardinality of the triple patterns of a BGP once they are joined with its first triple pattern, using sampling.
+
+    RDF triples are sampled from the first triple pattern, then each triple pattern that shares variables with it is probed
+    with the RDF terms of the sample, using cardinality estimations only, so no iterator is opened.
+    The average number of matches per probe, i.e., the fanout of the triple pattern, is stored under the 'fanout' key of the triple pattern,
+    with the SPARQL variables bound by the probes, and then used by `order_joins` instead of the distinct values of these variables.
+    The fanouts already estimated using the characteristic sets of the graph (see `star_fanouts`) are kept.
+
+    Args:
+      * patterns: The triple patterns of the BGP, where the first one is sampled.
+      * dataset: RDF dataset on which the BGP is evaluated.
+      * as_of: A timestamp used to perform all reads against a consistent version of the dataset.
+      * size: The maximum number of RDF triples sampled from the first triple pattern.
+      * budget: The maximum time (in seconds) spent sampling and probing. Probing stops when it is exhausted.
+
+    Returns: True if the fanout of at least one triple pattern has been estimated, False otherwise.
+    """
+    if len(patterns) < 2 or not dataset.has_graph(patterns[0]['triple']['graph']):
+        return False
+    deadline = monotonic() + budget
+    first = patterns[0]['triple']
+    graph = dataset.get_graph(first['graph'])
+    variables = vars_positions(first['subject'], first['predicate'], first['object'])
+    sample = [selection(triple, variables) for triple in graph.sample(first['subject'], first['predicate'], first['object'], size, as_of=as_of)]
+    if len(sample) == 0:
+        return False
+    sampled = False
+    for pattern in patterns[1:]:
+        triple = pattern['triple']
+        join_vars = get_vars(triple) & get_vars(first)
+        if len(join_vars) == 0 or 'fanout' in pattern or not dataset.has_graph(triple['graph']):
+            continue
+        graph = dataset.get_graph(triple['graph'])
+        probes = list()
+        for mappings in sample:
+            if monotonic() > deadline:
+                break
+            probes.append(graph.estimate(find_in_mappings(triple['subject'], mappings), find_in_mappings(triple['predicate'], mappings), find_in_mappings(triple['object'], mappings), as_of=as_of))
+        if len(probes) > 0:
+            pattern['fanout'] = (frozenset(join_vars), sum(probes) / len(probes))
+            sampled = True
+    return sampled
+
+
+def extend_estimate(estimate: Optional[Estimate], pattern: Dict[str, Any]) -> Estimate:
+    """Estimate the join of a relation, if any, with a triple pattern.
+
+    The sampled fanout of the triple pattern is used when the relation binds its sampled variables.
+
+    Args:
+      * estimate: Estimate of the relation, or `None` if the triple pattern is the first one.
+      * pattern: The triple pattern, with its cardinality, the distinct values of its variables and its fanout, if any.
+
+    Returns: The estimate of the join.
+    """
+    if estimate is None:
+        return estimate_pattern(pattern)
+    joined = estimate_join(estimate, estimate_pattern(pattern))
+    if 'fanout' not in pattern or not pattern['fanout'][0] <= estimate[1].keys():
+        return joined
+    sampled_vars, fanout = pattern['fanout']
+    cardinality = estimate[0] * fanout
+    # the other join variables are not covered by the sample
+    right_distinct = estimate_pattern(pattern)[1]
+    for variable in (estimate[1].keys() & right_distinct.keys()) - sampled_vars:
+        cardinality /= max(estimate[1][variable], right_distinct[variable])
+    return (cardinality, {variable: max(1, min(count, cardinality)) for variable, count in joined[1].items()})
+
+
+def _dynamic_programming(patterns: List[Dict[str, Any]], start: Optional[Estimate]) -> List[int]:
+    """Find the Left-linear join order with the minimal cost using dynamic programming over the subsets of triple patterns"""
+    patterns_vars = [get_vars(pattern['triple']) for pattern in patterns]
+    # best plan for each subset of triple patterns: (cost, estimate, join order)
+    best = dict()
+    for index in _candidates(start, list(range(len(patterns))), patterns_vars):
+        estimate = extend_estimate(start, patterns[index])
+        best[frozenset([index])] = (estimate[0], estimate, [index])
+    for _ in range(len(patterns) - 1):
+        extended = dict()
+        for subset, (cost, estimate, order) in best.items():
+            remaining = [index for index in range(len(patterns)) if index not in subset]
+            for index in _candidates(estimate, remaining, patterns_vars):
+                joined = extend_estimate(estimate, patterns[index])
+                key = subset | {index}
+                if key not in extended or cost + joined[0] < extended[key][0]:
+                    extended[key] = (cost + joined[0], joined, order + [index])
+        best = extended
+    return best[frozenset(range(len(patterns)))][2]
+
+
+def _greedy(patterns: List[Dict[str, Any]], start: Optional[Estimate]) -> List[int]:
+    """Find a Left-linear join order by picking, at each step, the triple pattern that yields the smallest intermediate result"""
+    patterns_vars = [get_vars(pattern['triple']) for pattern in patterns]
+    remaining = list(range(len(patterns)))
+    estimate = start
+    order = list()
+    while len(remaining) > 0:
+        candidates = _candidates(estimate, remaining, patterns_vars)
+        index = min(candidates, key=lambda i: extend_estimate(estimate, patterns[i])[0])
+        estimate = extend_estimate(estimate, patterns[index])
+        order.append(index)
+        remaining.remove(index)
+    return order
@@ -0,0 +1,128 @@
+# query_cache.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import re
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+# Lexical tokens of a SPARQL query, in the order the SPARQL grammar matches them:
+# long strings, short strings, IRIs, comments, whitespaces, then any other sequence of characters
+_TOKENS = re.compile(r'''
+    (\"\"\"(?:[^"\\]|\\.|"(?!""))*\"\"\")
+  | (\'\'\'(?:[^'\\]|\\.|'(?!''))*\'\'\')
+  | ("(?:[^"\\\n]|\\.)*")
+  | ('(?:[^'\\\n]|\\.)*')
+  | (<[^<>"{}|^`\\\x00-\x20]*>)
+  | (?P<comment>\#[^\n]*)
+  | (?P<space>\s+)
+  | ([^\s"'<\#]+|.)
+''', re.VERBOSE | re.DOTALL)
+
+
+def normalize_query(query: str) -> str:
+    """Normalize the text of a SPARQL query, so that queries that only differ by their layout share the same text.
+
+    Comments are removed and runs of whitespaces are collapsed into a single space,
+    while RDF literals and IRIs are kept untouched.
+
+    Argument: The SPARQL query to normalize.
+
+    Returns: The normalized SPARQL query.
+    """
+    tokens = list()
+    for match in _TOKENS.finditer(query):
+        if match.group('comment') is not None:
+            continue
+        elif match.group('space') is not None:
+            if len(tokens) > 0 and tokens[-1] != ' ':
+                tokens.append(' ')
+        else:
+            tokens.append(match.group(0))
+    return ''.join(tokens).strip()
+
+
+class QueryCache(object):
+    """A bounded LRU cache of SPARQL queries translated into the rdflib logical plans.
+
+    Logical plans are keyed by the normalized text of the query and the URI of the default graph.
+    Physical plans are never cached, as they hold cursors on the RDF graphs.
+
+    Args:
+      * max_size: Maximum number of logical plans kept in the cache. A cache with a size of zero is disabled.
+
+    Example:
+      >>> cache = QueryCache(max_size=2)
+      >>> key = cache.key("SELECT * WHERE { ?s ?p ?o }", "http://localhost:8000/sparql/dbpedia")
+      >>> cache.get(key) is None
+      True
+      >>> cache.put(key, logical_plan)
+      >>> cache.get(key) is logical_plan
+      True
+      >>> cache.hits, cache.misses
+      (1, 1)
+    """
+
+    def __init__(self, max_size: int = 512):
+        super(QueryCache, self).__init__()
+        self._max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups that found a logical plan in the cache"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups that did not find a logical plan in the cache"""
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, query: str, default_graph: str) -> Tuple[str, str]:
+        """Build the cache key of a SPARQL query executed against a default RDF graph"""
+        return (normalize_query(query), default_graph)
+
+    def get(self, key: Tuple[str, str]) -> Optional[Any]:
+        """Get the logical plan stored under a key, or `None` if it is not in the cache"""
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self._misses += 1
+            return None
+
+    def put(self, key: Tuple[str, str], logical_plan: Any) -> None:
+        """Store a logical plan in the cache, evicting the least recently used plans if the cache is full"""
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = logical_plan
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all logical plans from the cache and reset its counters"""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """Get the counters of the cache, as a dictionnary with the keys `hits`, `misses`, `size` and `max_size`"""
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'size': len(self._entries),
+            'max_size': self._max_size
+        }
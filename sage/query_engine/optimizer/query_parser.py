@@ -2,7 +2,7 @@
 # Author: Thomas MINIER - MIT License 2017-2020
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Iterable, List, Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import pyparsing
 from pyparsing import ParseException
@@ -14,6 +14,7 @@ from rdflib import BNode, Literal, URIRef, Variable
 from sage.database.core.dataset import Dataset
 from sage.query_engine.exceptions import UnsupportedSPARQL
 from sage.query_engine.iterators.filter import FilterIterator
+from sage.query_engine.iterators.leftjoin import LeftIndexJoinIterator
 from sage.query_engine.iterators.preemptable_iterator import PreemptableIterator
 from sage.query_engine.iterators.projection import ProjectionIterator
 from sage.query_engine.iterators.union import BagUnionIterator
@@ -23,6 +24,9 @@ from sage.query_engine.iterators.reduced import ReducedIterator
 from sage.query_engine.iterators.utils import EmptyIterator
 from sage.query_engine.optimizer.join_builder import build_left_join_tree
 from sage.query_engine.optimizer.join_builder import continue_left_join_tree
+from sage.query_engine.optimizer.query_cache import QueryCache
+from sage.query_engine.optimizer.rewriter import expression_vars, rewrite_plan
+from sage.query_engine.optimizer.utils import get_vars
 from sage.query_engine.update.delete import DeleteOperator
 from sage.query_engine.update.if_exists import IfExistsOperator
 from sage.query_engine.update.insert import InsertOperator
@@ -32,6 +36,9 @@ from sage.query_engine.update.update_sequence import UpdateSequenceOperator
 # enable Packrat optimization for the rdflib SPARQL parser
 pyparsing.ParserElement.enablePackrat()
 
+# cache of the logical plans of the read-only SPARQL queries parsed by the current process
+query_cache = QueryCache()
+
 
 class ConsistencyLevel(Enum):
     """The consistency level choosen for executing the query"""
@@ -226,13 +233,20 @@ def parse_query(query: str, dataset: Dataset, default_graph: str) -> Tuple[Preem
       * `cardinalities` is the list of estimated cardinalities of all triple patterns in the query.
 
     Throws: `UnsupportedSPARQL` is the SPARQL query contains features not supported by the SaGe query engine.
+
+    Logical plans of read-only queries are rewritten using `rewrite_plan`, then kept in `query_cache`,
+    so a query issued again against the same default graph is not parsed twice.
     """
     # transaction timestamp
     start_timestamp = datetime.now()
     # rdflib has no tool for parsing both read and update query,
     # so we must rely on a try/catch dirty trick...
     try:
-        logical_plan = translateQuery(parseQuery(query)).algebra
+        key = query_cache.key(query, default_graph)
+        logical_plan = query_cache.get(key)
+        if logical_plan is None:
+            logical_plan = rewrite_plan(translateQuery(parseQuery(query)).algebra)
+            query_cache.put(key, logical_plan)
         cardinalities = list()
         iterator = parse_query_alt(logical_plan, dataset, [default_graph], cardinalities, as_of=start_timestamp)
         return iterator, cardinalities
@@ -289,7 +303,7 @@ def parse_query_node(node: dict, dataset: Dataset, current_graphs: List[str], ca
     else:
         raise UnsupportedSPARQL(f"Unsupported SPARQL feature: {node.name}")
 
-def parse_query_alt(node: dict, dataset: Dataset, current_graphs: List[str], cardinalities: dict, as_of: Optional[datetime] = None) -> PreemptableIterator:
+def parse_query_alt(node: dict, dataset: Dataset, current_graphs: List[str], cardinalities: dict, as_of: Optional[datetime] = None, required_vars: Optional[Set[str]] = None) -> PreemptableIterator:
     """Recursively parse node in the query logical plan to build a preemptable physical query execution plan.
 
     Args:
@@ -298,6 +312,7 @@ def parse_query_alt(node: dict, dataset: Dataset, current_graphs: List[str], car
       * current_graphs: List of IRI of the current RDF graphs queried.
       * cardinalities: A dict used to track triple patterns cardinalities.
       * as_of: A timestamp used to perform all reads against a consistent version of the dataset. If `None`, use the latest version of the dataset, which does not guarantee snapshot isolation.
+      * required_vars: SPARQL variables required by the parents of the node, or `None` if all variables are required. The join trees only keep the variables still needed downstream.
 
     Returns: An iterator used to evaluate the input node.
 
@@ -308,37 +323,55 @@ def parse_query_alt(node: dict, dataset: Dataset, current_graphs: List[str], car
         graphs = current_graphs
         if node.datasetClause is not None:
             graphs = [format_term(graph_iri.default) for graph_iri in node.datasetClause]
-        return parse_query_alt(node.p, dataset, graphs, cardinalities, as_of=as_of)
+        return parse_query_alt(node.p, dataset, graphs, cardinalities, as_of=as_of, required_vars=required_vars)
     elif node.name == 'ConstructQuery':
         graphs = current_graphs
         if node.datasetClause is not None:
             graphs = [format_term(graph_iri.default) for graph_iri in node.datasetClause]
-        child=parse_query_alt(node.p, dataset, graphs, cardinalities, as_of=as_of)
+        template_vars = set([term.n3() for triple in node.template for term in triple if type(term) is Variable])
+        child=parse_query_alt(node.p, dataset, graphs, cardinalities, as_of=as_of, required_vars=template_vars)
         return ConstructIterator(child,convert_construct_template(node.template))
     elif node.name == 'Reduced':
-        child = parse_query_alt(node.p, dataset, current_graphs, cardinalities, as_of=as_of)
+        child = parse_query_alt(node.p, dataset, current_graphs, cardinalities, as_of=as_of, required_vars=required_vars)
         return ReducedIterator(child)
     elif node.name == 'Project':
         query_vars = list(map(lambda t: '?' + str(t), node.PV))
-        child = parse_query_alt(node.p, dataset, current_graphs, cardinalities, as_of=as_of)
+        child = parse_query_alt(node.p, dataset, current_graphs, cardinalities, as_of=as_of, required_vars=set(query_vars))
         return ProjectionIterator(child, query_vars)
     elif node.name == 'BGP':
         # bgp_vars = node._vars
         triples = list(localize_triples(node.triples, current_graphs))
-        iterator, query_vars, c = build_left_join_tree(triples, dataset, current_graphs, as_of=as_of)
+        iterator, query_vars, c = build_left_join_tree(triples, dataset, current_graphs, as_of=as_of, required_vars=required_vars)
         # track cardinalities of every triple pattern
         cardinalities += c
         return iterator
     elif node.name == 'Union':
-        left = parse_query_alt(node.p1, dataset, current_graphs, cardinalities, as_of=as_of)
-        right = parse_query_alt(node.p2, dataset, current_graphs, cardinalities, as_of=as_of)
+        left = parse_query_alt(node.p1, dataset, current_graphs, cardinalities, as_of=as_of, required_vars=required_vars)
+        right = parse_query_alt(node.p2, dataset, current_graphs, cardinalities, as_of=as_of, required_vars=required_vars)
         return BagUnionIterator(left, right)
     elif node.name == 'Filter':
-        expression = parse_filter_expr(node.expr)
-        iterator = parse_query_alt(node.p, dataset, current_graphs, cardinalities, as_of=as_of)
-        return FilterIterator(iterator, expression)
+        # collect the chain of FILTER clauses evaluated on the same node (see `rewrite_plan`)
+        filters = list()
+        while node.name == 'Filter':
+            filters.append((parse_filter_expr(node.expr), expression_vars(node.expr)))
+            node = node.p
+        if node.name == 'BGP' and len(node.triples) > 0:
+            # the FILTER clauses are evaluated at the lowest join that binds all their variables
+            triples = list(localize_triples(node.triples, current_graphs))
+            iterator, query_vars, c = build_left_join_tree(triples, dataset, current_graphs, as_of=as_of, filters=list(reversed(filters)), required_vars=required_vars)
+            cardinalities += c
+            return iterator
+        if required_vars is not None:
+            for _, variables in filters:
+                required_vars = required_vars | variables
+        iterator = parse_query_alt(node, dataset, current_graphs, cardinalities, as_of=as_of, required_vars=required_vars)
+        for expression, _ in reversed(filters):
+            iterator = FilterIterator(iterator, expression)
+        return iterator
     elif node.name == 'Extend':
-        bgp_iterator=parse_query_alt(node.p,dataset,current_graphs,cardinalities,as_of=as_of)
+        if required_vars is not None:
+            required_vars = required_vars | expression_vars(node.expr)
+        bgp_iterator=parse_query_alt(node.p,dataset,current_graphs,cardinalities,as_of=as_of,required_vars=required_vars)
         expression = parse_bind_expr(node.expr)
         #print("expression:"+str(expression))
         if isinstance(bgp_iterator,EmptyIterator):
@@ -346,16 +379,43 @@ def parse_query_alt(node: dict, dataset: Dataset, current_graphs: List[str], car
         else:
             return BindIterator(bgp_iterator,expression,'?'+node.var)
     elif node.name == 'Join':
-        left=parse_query_alt(node.p1, dataset, current_graphs, cardinalities, as_of=as_of)
         if node.p2.name=='BGP':
             triples=list(localize_triples(node.p2.triples, current_graphs))
+            # the variables of the BGP are joined with the left node, so they are required by the left node
+            left_vars = required_vars
+            if required_vars is not None:
+                for triple in triples:
+                    left_vars = left_vars | get_vars(triple)
+            left=parse_query_alt(node.p1, dataset, current_graphs, cardinalities, as_of=as_of, required_vars=left_vars)
             variables=set(map(lambda t: t.n3(), node.p1._vars))
             #print("Join P1 _vars"+str(variables))
-            iterator, query_vars, c=continue_left_join_tree(left,variables,triples,dataset,current_graphs)
+            iterator, query_vars, c=continue_left_join_tree(left,variables,triples,dataset,current_graphs,required_vars=required_vars)
             cardinalities += c
             return iterator
         else:
             raise UnsupportedSPARQL(f"Join Unsupported SPARQL feature: {node.p2.name}")
+    elif node.name == 'LeftJoin':
+        # OPTIONAL clauses are evaluated using a Left outer Index Loop join, whose inner relation is a single triple pattern
+        triples = list(localize_triples(node.p2.triples, current_graphs)) if node.p2.name == 'BGP' else list()
+        if len(triples) != 1:
+            raise UnsupportedSPARQL("Unsupported SPARQL feature: a Sage engine can only evaluate OPTIONAL clauses made of a single triple pattern")
+        if node.p1.name == 'BGP' and len(node.p1.triples) == 0:
+            raise UnsupportedSPARQL("Unsupported SPARQL feature: a Sage engine can only evaluate OPTIONAL clauses after a non-empty graph pattern")
+        triple = triples[0]
+        expression = None
+        filter_vars = set()
+        if node.expr.name != 'TrueFilter':
+            expression = parse_filter_expr(node.expr)
+            filter_vars = expression_vars(node.expr)
+        # the variables of the OPTIONAL clause are joined with the left node, so they are required by the left node
+        left_vars = required_vars
+        if required_vars is not None:
+            left_vars = required_vars | get_vars(triple) | filter_vars
+        left = parse_query_alt(node.p1, dataset, current_graphs, cardinalities, as_of=as_of, required_vars=left_vars)
+        graph = dataset.get_graph(triple['graph'])
+        cardinalities += [{'triple': triple, 'cardinality': graph.estimate(triple['subject'], triple['predicate'], triple['object'], as_of=as_of)}]
+        projection = sorted(required_vars) if required_vars is not None else None
+        return LeftIndexJoinIterator(left, triple, graph, expression=expression, as_of=as_of, projection=projection, cache=graph.lookup_cache())
     else:
         raise UnsupportedSPARQL(f"Unsupported SPARQL feature: {node.name}")
 
@@ -405,7 +465,7 @@ def parse_update(query: dict, dataset: Dataset, default_graph: str, as_of: Optio
         if consistency_level == "serializable":
             # build the read iterator
             cardinalities = list()
-            read_iterator = parse_query_alt(where_root, dataset, [default_graph], cardinalities, as_of=as_of)
+            read_iterator = parse_query_alt(rewrite_plan(where_root), dataset, [default_graph], cardinalities, as_of=as_of)
             # get the delete and/or insert templates
             #print("read iterator:"+str(read_iterator))
             delete_templates = list()
@@ -0,0 +1,116 @@
+# reoptimizer.py
+# Author: Thomas MINIER - MIT License 2017-2020
+from typing import Any, Dict, Optional
+
+from sage.database.core.dataset import Dataset
+from sage.query_engine.iterators.bind import BindIterator
+from sage.query_engine.iterators.bindjoin import BindJoinIterator
+from sage.query_engine.iterators.construct import ConstructIterator
+from sage.query_engine.iterators.filter import FilterIterator
+from sage.query_engine.iterators.leftjoin import LeftIndexJoinIterator
+from sage.query_engine.iterators.nlj import IndexJoinIterator
+from sage.query_engine.iterators.preemptable_iterator import PreemptableIterator
+from sage.query_engine.iterators.projection import ProjectionIterator
+from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.iterators.union import BagUnionIterator
+from sage.query_engine.iterators.utils import EmptyIterator
+from sage.query_engine.optimizer.join_builder import build_join
+from sage.query_engine.optimizer.join_order import (distinct_values,
+                                                    extend_estimate,
+                                                    join_cost, order_joins)
+from sage.query_engine.optimizer.utils import get_vars
+
+# Minimum number of solution mappings read by a join from its outer relation before its observed fanout is used
+MIN_OBSERVED_ROWS = 50
+
+# A join tree is re-planned only if the estimated cost of the new join order is below this fraction of the cost of the current one
+REOPTIMIZATION_GAIN = 0.5
+
+# Iterators whose source can be replaced by a union when a join tree is re-planned, as allowed by the plan serialization protocol
+UNION_PARENTS = [BagUnionIterator, BindIterator, ConstructIterator, FilterIterator, LeftIndexJoinIterator, ProjectionIterator]
+
+# Joins of the Left-linear trees which can be re-planned
+INDEX_JOINS = [IndexJoinIterator, BindJoinIterator]
+
+
+def reoptimize(plan: PreemptableIterator, dataset: Dataset) -> PreemptableIterator:
+    """Revise the join orders of a physical query execution plan, using the runtime counters saved with it.
+
+    A Left-linear tree of Index Loop or Bind joins over a Scan is re-planned when the fanouts observed during the previous quanta,
+    i.e., the number of solution mappings produced by each join per solution mappings read from its outer relation,
+    show that another join order is much cheaper. The tree is split at the current position of the Scan:
+
+      * The solution mappings already read from the Scan are still joined by the current joins, whose source is replaced by an empty iterator.
+      * The RDF triples not yet read from the Scan are joined using the new join order.
+
+    Both parts are evaluated one after the other using a union, so results are complete and duplicate-free.
+
+    Args:
+      * plan: The physical query execution plan, as loaded from its saved state.
+      * dataset: RDF dataset used to execute the plan.
+
+    Returns: The physical query execution plan, with revised join orders.
+    """
+    if type(plan) in INDEX_JOINS:
+        return _reoptimize_tree(plan, dataset)
+    for name in ['_source', '_left', '_right']:
+        child = getattr(plan, name, None)
+        if not isinstance(child, PreemptableIterator):
+            continue
+        if type(child) in INDEX_JOINS and type(plan) in UNION_PARENTS:
+            setattr(plan, name, _reoptimize_tree(child, dataset))
+        else:
+            reoptimize(child, dataset)
+    return plan
+
+
+def _pattern(triple: Dict[str, str], dataset: Dataset, cardinality: Optional[int] = None) -> Dict[str, Any]:
+    """Gather the statistics about a triple pattern used to order joins"""
+    graph = dataset.get_graph(triple['graph']) if dataset.has_graph(triple['graph']) else None
+    if cardinality is None:
+        cardinality = graph.estimate(triple['subject'], triple['predicate'], triple['object']) if graph is not None else 0
+    return {'triple': triple, 'cardinality': cardinality, 'distinct': distinct_values(triple, cardinality, graph)}
+
+
+def _reoptimize_tree(root: PreemptableIterator, dataset: Dataset) -> PreemptableIterator:
+    """Re-plan a Left-linear tree of Index Loop or Bind joins over a Scan, if the observed fanouts of its joins call for it"""
+    # the joins of the tree, from the first one to the root
+    joins = list()
+    pipeline = root
+    while type(pipeline) in INDEX_JOINS:
+        joins.insert(0, pipeline)
+        pipeline = pipeline._source
+    scan = pipeline
+    if type(scan) is not ScanIterator or len(joins) < 2:
+        return root
+    # only the RDF triples not yet read from the Scan are joined using the new join order
+    first = _pattern(scan._triple, dataset, cardinality=max(1, scan._cardinality - scan._progress))
+    patterns = [first]
+    bound_vars = get_vars(scan._triple)
+    observed = False
+    for join in joins:
+        pattern = _pattern(join._innerTriple, dataset)
+        if join._rows_in >= MIN_OBSERVED_ROWS:
+            pattern['fanout'] = (frozenset(get_vars(join._innerTriple) & bound_vars), join._rows_out / join._rows_in)
+            observed = True
+        bound_vars = bound_vars | get_vars(join._innerTriple)
+        patterns.append(pattern)
+    if not observed:
+        return root
+    order = order_joins(patterns, first=first)
+    if [p['triple'] for p in order] == [p['triple'] for p in patterns] or join_cost(order) >= join_cost(patterns) * REOPTIMIZATION_GAIN:
+        return root
+    # the solution mappings already read from the Scan are joined using the current join order
+    joins[0]._source = EmptyIterator()
+    # the RDF triples not yet read from the Scan are joined using the new join order
+    as_of = root._start_timestamp
+    pipeline = scan
+    outer_vars = get_vars(scan._triple)
+    outer_estimate = extend_estimate(None, first)
+    for pattern in order[1:]:
+        pipeline = build_join(pipeline, pattern, outer_estimate[0], outer_vars, dataset, as_of=as_of)
+        outer_estimate = extend_estimate(outer_estimate, pattern)
+        outer_vars = outer_vars | get_vars(pattern['triple'])
+    if not root.has_next():
+        return pipeline
+    return BagUnionIterator(root, pipeline)
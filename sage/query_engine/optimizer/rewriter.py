@@ -0,0 +1,116 @@
+# rewriter.py
+# Author: Thomas MINIER - MIT License 2017-2020
+from typing import Dict, List, Optional, Set, Tuple
+
+from rdflib import BNode, URIRef, Variable
+from rdflib.plugins.sparql.parserutils import CompValue
+
+# Keys of the children of a node in a logical query execution plan (in rdflib format)
+CHILDREN = ['p', 'p1', 'p2']
+
+
+def rewrite_plan(node: CompValue) -> CompValue:
+    """Rewrite a logical query execution plan (in rdflib format) before the physical query execution plan is built.
+
+    The following rules are applied, bottom-up, to the FILTER clauses evaluated on a BGP:
+
+      * Conjunctive expressions are split into a chain of FILTER clauses, so each one can be evaluated as soon as its SPARQL variables are bound.
+      * An equality between a SPARQL variable of the BGP and an IRI is removed, the IRI is substituted to the variable in the triple patterns,
+        and the variable is bound to the IRI on top of the BGP, using a BIND clause.
+        Only IRIs are substituted, as other RDF terms can be equal without being the same RDF term.
+
+    The physical query execution plan then evaluates each FILTER clause over a BGP at the lowest join that binds all its SPARQL variables.
+
+    Argument: The root of the logical query execution plan, which is left untouched.
+
+    Returns: The root of the rewritten logical query execution plan.
+    """
+    children = {key: rewrite_plan(node[key]) for key in CHILDREN if isinstance(node.get(key), CompValue)}
+    if len(children) > 0:
+        node = _copy(node, **children)
+    if node.name == 'Filter':
+        return _rewrite_filter(node)
+    return node
+
+
+def expression_vars(expr) -> Set[str]:
+    """Get the SPARQL variables of an expression (in rdflib format)"""
+    if type(expr) is Variable:
+        return {'?' + str(expr)}
+    elif type(expr) is BNode:
+        return {f"?v_{expr}"}
+    elif isinstance(expr, CompValue):
+        variables = set()
+        for key, value in expr.items():
+            if not key.startswith('_'):
+                variables |= expression_vars(value)
+        return variables
+    elif type(expr) is list:
+        variables = set()
+        for value in expr:
+            variables |= expression_vars(value)
+        return variables
+    return set()
+
+
+def _copy(node: CompValue, **values) -> CompValue:
+    """Copy a node of a logical query execution plan, replacing some of its values"""
+    copy = CompValue(node.name, **node)
+    copy.update(values)
+    return copy
+
+
+def _split_conjunction(expr) -> List:
+    """Split a conjunctive expression into the list of its operands"""
+    if isinstance(expr, CompValue) and expr.name == 'ConditionalAndExpression' and expr.other is not None:
+        conjuncts = _split_conjunction(expr.expr)
+        for other in expr.other:
+            conjuncts += _split_conjunction(other)
+        return conjuncts
+    return [expr]
+
+
+def _constant_equality(expr) -> Optional[Tuple[Variable, URIRef]]:
+    """Get the SPARQL variable and the IRI of an expression `?var = <iri>` (or `<iri> = ?var`), or `None` if the expression is not one"""
+    if not isinstance(expr, CompValue) or expr.name != 'RelationalExpression' or expr.op != '=':
+        return None
+    if type(expr.expr) is Variable and type(expr.other) is URIRef:
+        return expr.expr, expr.other
+    elif type(expr.expr) is URIRef and type(expr.other) is Variable:
+        return expr.other, expr.expr
+    return None
+
+
+def _filters(node: CompValue, conjuncts: List, variables: Set[Variable]) -> CompValue:
+    """Evaluate a list of expressions on a node, using a chain of FILTER clauses where the first expression is the innermost one"""
+    for expr in conjuncts:
+        node = CompValue('Filter', expr=expr, p=node, _vars=variables)
+    return node
+
+
+def _rewrite_filter(node: CompValue) -> CompValue:
+    """Split the expression of a FILTER clause and substitute its equalities with IRIs in the BGP it is evaluated on, if any"""
+    variables = node.get('_vars', set())
+    conjuncts = _split_conjunction(node.expr)
+    child = node.p
+    if child.name != 'BGP':
+        return _filters(child, conjuncts, variables)
+    bgp_vars = set([term for triple in child.triples for term in triple if type(term) is Variable])
+    substitutions: Dict[Variable, URIRef] = dict()
+    remaining = list()
+    for expr in conjuncts:
+        equality = _constant_equality(expr)
+        if equality is not None and equality[0] in bgp_vars and equality[0] not in substitutions:
+            substitutions[equality[0]] = equality[1]
+        else:
+            remaining.append(expr)
+    if len(substitutions) == 0:
+        return _filters(child, conjuncts, variables)
+    triples = [tuple([substitutions.get(term, term) for term in triple]) for triple in child.triples]
+    plan = _copy(child, triples=triples)
+    # the expressions over the substituted variables can only be evaluated once they are bound again
+    substituted = set(['?' + str(variable) for variable in substitutions.keys()])
+    plan = _filters(plan, [expr for expr in remaining if len(expression_vars(expr) & substituted) == 0], variables)
+    for variable, iri in substitutions.items():
+        plan = CompValue('Extend', p=plan, expr=iri, var=variable, _vars=variables)
+    return _filters(plan, [expr for expr in remaining if len(expression_vars(expr) & substituted) > 0], variables)
@@ -30,3 +30,46 @@ def equality_variables(subject: str, predicate: str, obj: str) -> Tuple[str, Tup
     elif predicate == obj:
         return f"{predicate} = {obj + '__2'}", (subject, predicate, obj + '__2')
     return None, (subject, predicate, obj)
+
+
+def is_cyclic(triples: List[Dict[str, str]]) -> bool:
+    """Test if a set of triple patterns is cyclic, i.e., if its join graph (where variables are nodes and triple patterns connect their variables) contains a cycle"""
+    parents = dict()
+
+    def find(variable: str) -> str:
+        while parents.setdefault(variable, variable) != variable:
+            variable = parents[variable]
+        return variable
+
+    for triple in triples:
+        variables = sorted(get_vars(triple))
+        for first, second in zip(variables, variables[1:]):
+            first, second = find(first), find(second)
+            if first == second:
+                return True
+            parents[first] = second
+    return False
+
+
+def variable_order(triples: List[Dict[str, str]]) -> List[str]:
+    """Order the variables of a set of triple patterns for a Leapfrog Triejoin.
+
+    The variable which appears in the most triple patterns comes first, then the variables connected to the previous ones
+    are picked by decreasing number of occurrences, so each variable restricts the RDF terms of the following ones.
+    """
+    occurrences = dict()
+    for triple in triples:
+        for variable in sorted(get_vars(triple)):
+            occurrences[variable] = occurrences.get(variable, 0) + 1
+    order = list()
+    while len(order) < len(occurrences):
+        connected = set()
+        for triple in triples:
+            if len(get_vars(triple) & set(order)) > 0:
+                connected |= get_vars(triple)
+        candidates = [v for v in occurrences if v not in order and (v in connected or len(connected) == 0)]
+        # disconnected variables are bound last
+        if len(candidates) == 0:
+            candidates = [v for v in occurrences if v not in order]
+        order.append(max(candidates, key=lambda v: occurrences[v]))
+    return order
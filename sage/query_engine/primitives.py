@@ -1,48 +1,92 @@
 # primitives.py
 # Author: Thomas MINIER - MIT License 2017-2020
 from asyncio import sleep
+from contextvars import ContextVar
+from math import inf
+from time import monotonic
+from typing import Optional
+
+# The outermost PreemptiveLoop running in the current task, if any
+_current_loop: ContextVar[Optional["PreemptiveLoop"]] = ContextVar("current_preemptive_loop", default=None)
+
 
 class PreemptiveLoop(object):
     """Utility context manager to run loops in a preemptive env. with asyncio.
 
-    Basically, this class allows one to trigger `asyncio.sleep(0)` at fixed interval,
+    Basically, this class allows one to trigger `asyncio.sleep(0)` at regular interval,
     to yield control to the scheduler in loops that run in an event loop.
     Otherwise, such loops never yield back to the scheduler, which breaks the Round-Robin
     scheduling algorithm of the preemptive Web server.
     Yielding is performed using the `tick()` method.
 
     However, a call to `asyncio.sleep(0)` costs a lot in term of performance, so we only
-    trigger every `threshold` calls to the tick() method.
-    **This parameter defaults to 50 cycles**.
-    So, to optimize query execution performance, on need to minimize
-    the use of loops in the pipeline of iterators and optimize the `threshold` value.
+    trigger it every `threshold` calls to the tick() method.
+    The threshold starts at 50 ticks, and is then tuned at each yield from the measured cost
+    of a tick, so that control is yielded roughly every `yield_interval` seconds, whatever
+    the cost of a tick.
+
+    A loop also carries the deadline of the current time quantum, which iterators check using
+    `expired()` to stop at a point where their state can be saved exactly.
+    Loops are nested: a loop created while another loop is running in the same task shares
+    its ticks, threshold and deadline, as they all belong to the same pipeline of iterators.
 
-    Argument: Number of ticks between each call to asyncio.sleep
+    Args:
+      * threshold: Initial number of ticks between each call to asyncio.sleep.
+      * deadline: Time (as given by `time.monotonic`) at which the current time quantum ends.
+        Ignored for nested loops, which inherit the deadline of the outermost loop.
+      * yield_interval: Targeted duration between two calls to asyncio.sleep, in seconds.
 
     Example:
       >>> with PreemptiveLoop() as loop:
       >>>   for i in range(10):
       >>>     print(i)
       >>>     await loop.tick()
+      >>>     if loop.expired():
+      >>>       break
     """
 
-    def __init__(self, threshold=50):
+    def __init__(self, threshold: int = 50, deadline: float = inf, yield_interval: float = 0.001):
         super(PreemptiveLoop, self).__init__()
         self._cpt = 0
-        #print(f" !!! threshold:{threshold}")
         self._threshold = threshold
+        self._deadline = deadline
+        self._yield_interval = yield_interval
+        self._last_yield = monotonic()
+        self._token = None
+        # the outermost loop that holds the state shared by all nested loops
+        self._root = _current_loop.get() or self
 
     def __enter__(self):
+        if self._root is self:
+            self._token = _current_loop.set(self)
         return self
 
     def __exit__(self, type, value, traceback):
-        pass
+        if self._token is not None:
+            _current_loop.reset(self._token)
+            self._token = None
+
+    @property
+    def threshold(self) -> int:
+        """Current number of ticks between each call to asyncio.sleep"""
+        return self._root._threshold
+
+    def expired(self) -> bool:
+        """Return True if the deadline of the current time quantum has passed"""
+        deadline = self._root._deadline
+        return deadline < inf and monotonic() >= deadline
 
     async def tick(self) -> None:
         """Move to the next iteration and allow interruption of the current loop (if required)"""
-        self._cpt += 1
+        root = self._root
+        root._cpt += 1
         # WARNING: await sleep(0) cost a lot, so we only trigger it at fixed interval.
         # Additionnaly, there may be other call to tick() in other iterators in the pipeline.
-        if self._cpt > self._threshold:
-            self._cpt = 0
+        if root._cpt >= root._threshold:
+            # tune the threshold using the average cost of a tick since the last yield
+            tick_cost = (monotonic() - root._last_yield) / root._cpt
+            if tick_cost > 0:
+                root._threshold = max(1, min(10000, int(root._yield_interval / tick_cost)))
+            root._cpt = 0
             await sleep(0)
+            root._last_yield = monotonic()
@@ -0,0 +1,107 @@
+# process_pool.py
+# Author: Thomas MINIER - MIT License 2017-2020
+from asyncio import AbstractEventLoop, get_event_loop, new_event_loop
+from concurrent.futures import ProcessPoolExecutor
+from math import inf
+from multiprocessing import get_context
+from time import time
+from typing import List, Optional, Tuple
+
+from sage.database.core.dataset import Dataset
+from sage.database.core.yaml_config import load_config
+from sage.query_engine.iterators.loader import load
+from sage.query_engine.iterators.mappings import SolutionMappings
+from sage.query_engine.optimizer.query_parser import parse_query
+from sage.query_engine.profiler import PlanProfiler
+from sage.query_engine.sage_engine import SageEngine
+
+# Results of a job: (bindings, saved_plan, is_done, abort_reason, cardinalities, loading_time, operators)
+JobResults = Tuple[List[SolutionMappings], Optional[bytes], bool, Optional[str], dict, float, Optional[dict]]
+
+# RDF dataset and event loop owned by a worker process
+_dataset: Optional[Dataset] = None
+_loop: Optional[AbstractEventLoop] = None
+
+
+def _init_worker(config_file: str) -> None:
+    """Initialize a worker process, by loading its own RDF dataset from the configuration file"""
+    global _dataset, _loop
+    _dataset = load_config(config_file)
+    _loop = new_event_loop()
+
+
+def execute_job(query: Optional[str], default_graph_uri: str, saved_plan: Optional[bytes], quantum: float, limit=inf, batch_size: int = 1, profile: bool = False) -> JobResults:
+    """Execute a query for one time quantum in a worker process.
+
+    The transaction opened by the quantum is committed (or aborted) by the worker,
+    as database connections are bound to the process that opened them.
+
+    Args:
+      * query: SPARQL query to execute. Ignored if a saved plan is given.
+      * default_graph_uri: URI of the default RDF graph.
+      * saved_plan: Saved plan (a serialized `RootTree`) used to resume query execution, or `None` to start it.
+      * quantum: Time quantum, in seconds.
+      * limit: Maximum number of query results to fetch.
+      * batch_size: Maximum number of solution mappings fetched per batch.
+      * profile: True to collect per-operator execution statistics.
+
+    Returns: A tuple (`bindings`, `saved_plan`, `is_done`, `abort_reason`, `cardinalities`, `loading_time`, `operators`),
+    where `saved_plan` is a serialized `RootTree`, `loading_time` is expressed in milliseconds
+    and `operators` is the tree of per-operator statistics (`None` if `profile` is False).
+
+    Throws: Any exception that have occured during query execution.
+    """
+    graph = _dataset.get_graph(default_graph_uri)
+    try:
+        cardinalities = dict()
+        start = time()
+        if saved_plan is not None:
+            plan = load(saved_plan, _dataset, adaptive=graph.adaptive)
+        else:
+            plan, cardinalities = parse_query(query, _dataset, default_graph_uri)
+        loading_time = (time() - start) * 1000
+        profiler = PlanProfiler() if profile else None
+        bindings, root, is_done, abort_reason = _loop.run_until_complete(SageEngine().execute(plan, quantum, limit, batch_size=batch_size, profiler=profiler))
+        if abort_reason is not None:
+            graph.abort()
+        else:
+            graph.commit()
+        saved_plan = root.SerializeToString() if root is not None else None
+        operators = profiler.tree() if profile else None
+        return (bindings, saved_plan, is_done, abort_reason, cardinalities, loading_time, operators)
+    except Exception as err:
+        graph.abort()
+        raise err
+
+
+class EngineProcessPool(object):
+    """A pool of worker processes used to execute queries on several CPU cores.
+
+    Each worker loads its own RDF dataset from the configuration file, so only
+    saved plans (as protobuf bytes) and query results cross the process boundary.
+
+    Args:
+      * config_file: Path to the SaGe configuration file, in YAML format.
+      * nb_workers: Number of worker processes.
+    """
+
+    def __init__(self, config_file: str, nb_workers: int):
+        super(EngineProcessPool, self).__init__()
+        self._nb_workers = nb_workers
+        # workers are spawned, so they do not inherit the event loop and connections of the server
+        self._executor = ProcessPoolExecutor(max_workers=nb_workers, mp_context=get_context("spawn"), initializer=_init_worker, initargs=(config_file,))
+
+    @property
+    def nb_workers(self) -> int:
+        return self._nb_workers
+
+    async def execute(self, query: Optional[str], default_graph_uri: str, saved_plan: Optional[bytes], quantum: float, limit=inf, batch_size: int = 1, profile: bool = False) -> JobResults:
+        """Execute a query for one time quantum using a worker process.
+
+        See `execute_job` for details about the arguments and return values.
+        """
+        return await get_event_loop().run_in_executor(self._executor, execute_job, query, default_graph_uri, saved_plan, quantum, limit, batch_size, profile)
+
+    def shutdown(self) -> None:
+        """Stop all worker processes"""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,115 @@
+# profiler.py
+# Author: Thomas MINIER - MIT License 2017-2020
+from time import perf_counter
+from typing import Any, Dict, Optional
+
+from sage.query_engine.iterators.preemptable_iterator import PreemptableIterator
+
+
+class OperatorStats(object):
+    """Execution statistics of a preemptable iterator during a time quantum"""
+
+    def __init__(self):
+        super(OperatorStats, self).__init__()
+        self.rows_out = 0
+        self.time = 0.0
+
+
+class PlanProfiler(object):
+    """A PlanProfiler collects per-operator statistics during the execution of a physical query execution plan.
+
+    Once attached to a plan, it records for each iterator of the plan the number of solution mappings
+    it produced (rows out), the time spent in its `next` and `next_batch` methods, and the number of
+    calls and reads made to the database. The statistics are then exported as a tree that mirrors the plan.
+    As plans are built or loaded at the beginning of each quantum, database counters,
+    which are cumulated since the creation of each iterator, are also per quantum.
+
+    Profiling is done by wrapping the `next` and `next_batch` methods of each iterator, so iterators
+    of plans that are not profiled do not pay any overhead.
+
+    Example:
+      >>> profiler = PlanProfiler()
+      >>> await SageEngine().execute(plan, 0.075, profiler=profiler)
+      >>> profiler.tree()
+      { "operator": "proj", "rows_in": 10, "rows_out": 10, ..., "children": [ ... ] }
+    """
+
+    def __init__(self):
+        super(PlanProfiler, self).__init__()
+        self._root: Optional[PreemptableIterator] = None
+        self._stats: Dict[int, OperatorStats] = dict()
+
+    def attach(self, plan: PreemptableIterator) -> None:
+        """Start profiling a physical query execution plan.
+
+        Argument: Root of the pipeline of iterators.
+        """
+        self._root = plan
+        self._instrument(plan)
+
+    def _instrument(self, iterator: PreemptableIterator) -> None:
+        """Wrap the methods of an iterator and of its children to record their statistics"""
+        stats = OperatorStats()
+        self._stats[id(iterator)] = stats
+        next_item = iterator.next
+        next_batch = iterator.next_batch
+
+        async def profiled_next():
+            start = perf_counter()
+            try:
+                value = await next_item()
+            finally:
+                stats.time += perf_counter() - start
+            if value is not None:
+                stats.rows_out += 1
+            return value
+
+        async def profiled_next_batch(size):
+            start = perf_counter()
+            try:
+                values = await next_batch(size)
+            finally:
+                stats.time += perf_counter() - start
+            stats.rows_out += len(values)
+            return values
+
+        iterator.next = profiled_next
+        iterator.next_batch = profiled_next_batch
+        for child in iterator.children():
+            self._instrument(child)
+
+    def _export(self, iterator: PreemptableIterator) -> Dict[str, Any]:
+        """Export the statistics of an iterator and of its children"""
+        stats = self._stats[id(iterator)]
+        children = [self._export(child) for child in iterator.children()]
+        children_time = sum([child['time'] for child in children])
+        return {
+            'operator': iterator.serialized_name(),
+            'rows_in': sum([child['rows_out'] for child in children]) if len(children) > 0 else iterator.db_reads(),
+            'rows_out': stats.rows_out,
+            'db_calls': iterator.db_calls(),
+            'db_reads': iterator.db_reads(),
+            'time': stats.time * 1000,
+            'self_time': max(0.0, stats.time * 1000 - children_time),
+            'children': children
+        }
+
+    def tree(self) -> Optional[Dict[str, Any]]:
+        """Get the statistics collected so far, as a tree that mirrors the physical query execution plan.
+
+        Each node of the tree is a dictionnary with the following keys:
+          * operator: The name of the iterator, as used in the plan serialization protocol.
+          * rows_in: Number of solution mappings produced by the children of the iterator,
+            or number of RDF triples read from the database for iterators without children.
+          * rows_out: Number of solution mappings produced by the iterator.
+          * db_calls: Number of calls to the database (i.e., searches) issued by the iterator.
+          * db_reads: Number of RDF triples read from the database by the iterator.
+          * time: Time spent in the iterator and its children, in milliseconds.
+          * self_time: Time spent in the iterator only, in milliseconds.
+          * children: Statistics of the children of the iterator.
+
+        Returns: The tree of statistics, or `None` if the profiler is not attached to a plan.
+        """
+        if self._root is None:
+            return None
+        return self._export(self._root)
@@ -18,7 +18,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   package='iterators',
   syntax='proto3',
   serialized_options=None,
-  serialized_pb=b'\n\x0fiterators.proto\x12\titerators\"R\n\rTriplePattern\x12\x0f\n\x07subject\x18\x01 \x01(\t\x12\x11\n\tpredicate\x18\x02 \x01(\t\x12\x0e\n\x06object\x18\x03 \x01(\t\x12\r\n\x05graph\x18\x04 \x01(\t\"w\n\x11SavedScanIterator\x12(\n\x06triple\x18\x01 \x01(\x0b\x32\x18.iterators.TriplePattern\x12\x11\n\tlast_read\x18\x02 \x01(\t\x12\x13\n\x0b\x63\x61rdinality\x18\x03 \x01(\x03\x12\x10\n\x08progress\x18\x04 \x01(\x03\"[\n\x14SavedReducedIterator\x12\x39\n\x0bproj_source\x18\x01 \x01(\x0b\x32\".iterators.SavedProjectionIteratorH\x00\x42\x08\n\x06source\"\xca\x02\n\x17SavedProjectionIterator\x12\x0e\n\x06values\x18\x01 \x03(\t\x12\x33\n\x0bscan_source\x18\x02 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x00\x12\x38\n\x0bjoin_source\x18\x03 \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x00\x12\x38\n\x0cunion_source\x18\x04 \x01(\x0b\x32 .iterators.SavedBagUnionIteratorH\x00\x12\x37\n\rfilter_source\x18\x05 \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x00\x12\x33\n\x0b\x62ind_source\x18\x06 \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x00\x42\x08\n\x06source\"\xb3\x03\n\x16SavedIndexJoinIterator\x12\x33\n\x0bscan_source\x18\x01 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x00\x12\x38\n\x0bjoin_source\x18\x02 \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x00\x12\x37\n\rfilter_source\x18\x03 \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x00\x12\x33\n\x0b\x62ind_source\x18\x04 \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x00\x12\'\n\x05inner\x18\x05 \x01(\x0b\x32\x18.iterators.TriplePattern\x12\x37\n\x03muc\x18\x06 \x03(\x0b\x32*.iterators.SavedIndexJoinIterator.MucEntry\x12\x11\n\tlast_read\x18\x07 \x01(\t\x12\x11\n\ttimestamp\x18\x08 \x01(\t\x1a*\n\x08MucEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\x08\n\x06source\"\xc8\x05\n\x15SavedBagUnionIterator\x12\x31\n\tscan_left\x18\x01 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x00\x12\x37\n\tproj_left\x18\x02 \x01(\x0b\x32\".iterators.SavedProjectionIteratorH\x00\x12\x36\n\nunion_left\x18\x03 \x01(\x0b\x32 .iterators.SavedBagUnionIteratorH\x00\x12\x36\n\tjoin_left\x18\x04 \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x00\x12\x35\n\x0b\x66ilter_left\x18\x05 \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x00\x12\x38\n\x10\x62ind_source_left\x18\x06 \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x00\x12\x32\n\nscan_right\x18\x07 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x01\x12\x38\n\nproj_right\x18\x08 \x01(\x0b\x32\".iterators.SavedProjectionIteratorH\x01\x12\x37\n\x0bunion_right\x18\t \x01(\x0b\x32 .iterators.SavedBagUnionIteratorH\x01\x12\x37\n\njoin_right\x18\n \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x01\x12\x36\n\x0c\x66ilter_right\x18\x0b \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x01\x12\x39\n\x11\x62ind_source_right\x18\x0c \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x01\x42\x06\n\x04leftB\x07\n\x05right\"\xaa\x03\n\x13SavedFilterIterator\x12\x33\n\x0bscan_source\x18\x01 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x00\x12\x39\n\x0bproj_source\x18\x02 \x01(\x0b\x32\".iterators.SavedProjectionIteratorH\x00\x12\x37\n\rfilter_source\x18\x03 \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x00\x12\x38\n\x0bjoin_source\x18\x04 \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x00\x12\x33\n\x0b\x62ind_source\x18\x05 \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x00\x12\x12\n\nexpression\x18\x06 \x01(\t\x12\x32\n\x02mu\x18\x07 \x03(\x0b\x32&.iterators.SavedFilterIterator.MuEntry\x1a)\n\x07MuEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\x08\n\x06source\"\xb5\x03\n\x11SavedBindIterator\x12\x33\n\x0bscan_source\x18\x01 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x00\x12\x39\n\x0bproj_source\x18\x02 \x01(\x0b\x32\".iterators.SavedProjectionIteratorH\x00\x12\x37\n\rfilter_source\x18\x03 \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x00\x12\x38\n\x0bjoin_source\x18\x04 \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x00\x12\x33\n\x0b\x62ind_source\x18\x05 \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x00\x12\x10\n\x08\x62indexpr\x18\x06 \x01(\t\x12\x0f\n\x07\x62indvar\x18\x07 \x01(\t\x12\x30\n\x02mu\x18\x08 \x03(\x0b\x32$.iterators.SavedBindIterator.MuEntry\x1a)\n\x07MuEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\x08\n\x06source\"\xa0\x03\n\x16SavedConstructIterator\x12\x33\n\x0bscan_source\x18\x01 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x00\x12\x39\n\x0bproj_source\x18\x02 \x01(\x0b\x32\".iterators.SavedProjectionIteratorH\x00\x12\x38\n\x0bjoin_source\x18\x03 \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x00\x12\x38\n\x0cunion_source\x18\x04 \x01(\x0b\x32 .iterators.SavedBagUnionIteratorH\x00\x12\x37\n\rfilter_source\x18\x05 \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x00\x12\x33\n\x0b\x62ind_source\x18\x06 \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x00\x12*\n\x08template\x18\x07 \x03(\x0b\x32\x18.iterators.TriplePatternB\x08\n\x06source\"\x85\x01\n\x0fSavedInsertData\x12?\n\x0bnb_inserted\x18\x01 \x03(\x0b\x32*.iterators.SavedInsertData.NbInsertedEntry\x1a\x31\n\x0fNbInsertedEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x04:\x02\x38\x01\"\x85\x01\n\x0fSavedDeleteData\x12?\n\x0bnb_inserted\x18\x01 \x03(\x0b\x32*.iterators.SavedDeleteData.NbInsertedEntry\x1a\x31\n\x0fNbInsertedEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x04:\x02\x38\x01\"\xc8\x04\n\x08RootTree\x12\x33\n\x0bscan_source\x18\x01 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x00\x12\x39\n\x0bproj_source\x18\x02 \x01(\x0b\x32\".iterators.SavedProjectionIteratorH\x00\x12\x38\n\x0bjoin_source\x18\x03 \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x00\x12\x38\n\x0cunion_source\x18\x04 \x01(\x0b\x32 .iterators.SavedBagUnionIteratorH\x00\x12\x37\n\rfilter_source\x18\x05 \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x00\x12\x33\n\rinsert_source\x18\x06 \x01(\x0b\x32\x1a.iterators.SavedInsertDataH\x00\x12\x33\n\rdelete_source\x18\x07 \x01(\x0b\x32\x1a.iterators.SavedDeleteDataH\x00\x12\x33\n\x0b\x62ind_source\x18\x08 \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x00\x12=\n\x10\x63onstruct_source\x18\t \x01(\x0b\x32!.iterators.SavedConstructIteratorH\x00\x12\x37\n\x0creduc_source\x18\n \x01(\x0b\x32\x1f.iterators.SavedReducedIteratorH\x00\x42\x08\n\x06sourceb\x06proto3'
+  serialized_pb=b'\n\x0fiterators.proto\x12\titerators\"R\n\rTriplePattern\x12\x0f\n\x07subject\x18\x01 \x01(\t\x12\x11\n\tpredicate\x18\x02 \x01(\t\x12\x0e\n\x06object\x18\x03 \x01(\t\x12\r\n\x05graph\x18\x04 \x01(\t\"w\n\x11SavedScanIterator\x12(\n\x06triple\x18\x01 \x01(\x0b\x32\x18.iterators.TriplePattern\x12\x11\n\tlast_read\x18\x02 \x01(\t\x12\x13\n\x0b\x63\x61rdinality\x18\x03 \x01(\x03\x12\x10\n\x08progress\x18\x04 \x01(\x03\"[\n\x14SavedReducedIterator\x12\x39\n\x0bproj_source\x18\x01 \x01(\x0b\x32\".iterators.SavedProjectionIteratorH\x00\x42\x08\n\x06source\"\xc3\x05\n\x17SavedProjectionIterator\x12\x0e\n\x06values\x18\x01 \x03(\t\x12\x33\n\x0bscan_source\x18\x02 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x00\x12\x38\n\x0bjoin_source\x18\x03 \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x00\x12\x38\n\x0cunion_source\x18\x04 \x01(\x0b\x32 .iterators.SavedBagUnionIteratorH\x00\x12\x37\n\rfilter_source\x18\x05 \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x00\x12\x33\n\x0b\x62ind_source\x18\x06 \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x00\x12;\n\x0f\x62indjoin_source\x18\x07 \x01(\x0b\x32 .iterators.SavedBindJoinIteratorH\x00\x12;\n\x0fhashjoin_source\x18\x08 \x01(\x0b\x32 .iterators.SavedHashJoinIteratorH\x00\x12=\n\x10mergejoin_source\x18\t \x01(\x0b\x32!.iterators.SavedMergeJoinIteratorH\x00\x12?\n\x0fleapfrog_source\x18\n \x01(\x0b\x32$.iterators.SavedLeapfrogJoinIteratorH\x00\x12;\n\x0fstarjoin_source\x18\x0b \x01(\x0b\x32 .iterators.SavedStarJoinIteratorH\x00\x12@\n\x0fleftjoin_source\x18\x0c \x01(\x0b\x32%.iterators.SavedLeftIndexJoinIteratorH\x00\x42\x08\n\x06source\"\x9a\x07\n\x16SavedIndexJoinIterator\x12\x33\n\x0bscan_source\x18\x01 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x00\x12\x38\n\x0bjoin_source\x18\x02 \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x00\x12\x37\n\rfilter_source\x18\x03 \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x00\x12\x33\n\x0b\x62ind_source\x18\x04 \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x00\x12;\n\x0f\x62indjoin_source\x18\t \x01(\x0b\x32 .iterators.SavedBindJoinIteratorH\x00\x12;\n\x0fhashjoin_source\x18\n \x01(\x0b\x32 .iterators.SavedHashJoinIteratorH\x00\x12=\n\x10mergejoin_source\x18\x0b \x01(\x0b\x32!.iterators.SavedMergeJoinIteratorH\x00\x12?\n\x0fleapfrog_source\x18\x0c \x01(\x0b\x32$.iterators.SavedLeapfrogJoinIteratorH\x00\x12;\n\x0fstarjoin_source\x18\r \x01(\x0b\x32 .iterators.SavedStarJoinIteratorH\x00\x12\x35\n\x0c\x65mpty_source\x18\x0e \x01(\x0b\x32\x1d.iterators.SavedEmptyIteratorH\x00\x12@\n\x0fleftjoin_source\x18\x12 \x01(\x0b\x32%.iterators.SavedLeftIndexJoinIteratorH\x00\x12\'\n\x05inner\x18\x05 \x01(\x0b\x32\x18.iterators.TriplePattern\x12\x37\n\x03muc\x18\x06 \x03(\x0b\x32*.iterators.SavedIndexJoinIterator.MucEntry\x12\x11\n\tlast_read\x18\x07 \x01(\t\x12\x11\n\ttimestamp\x18\x08 \x01(\t\x12\x0f\n\x07rows_in\x18\x0f \x01(\x03\x12\x10\n\x08rows_out\x18\x10 \x01(\x03\x12\x12\n\nprojection\x18\x11 \x03(\t\x1a*\n\x08MucEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\x08\n\x06source\"\x81\x08\n\x1aSavedLeftIndexJoinIterator\x12\x33\n\x0bscan_source\x18\x01 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x00\x12\x38\n\x0bjoin_source\x18\x02 \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x00\x12\x37\n\rfilter_source\x18\x03 \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x00\x12\x33\n\x0b\x62ind_source\x18\x04 \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x00\x12;\n\x0f\x62indjoin_source\x18\x05 \x01(\x0b\x32 .iterators.SavedBindJoinIteratorH\x00\x12;\n\x0fhashjoin_source\x18\x06 \x01(\x0b\x32 .iterators.SavedHashJoinIteratorH\x00\x12=\n\x10mergejoin_source\x18\x07 \x01(\x0b\x32!.iterators.SavedMergeJoinIteratorH\x00\x12?\n\x0fleapfrog_source\x18\x08 \x01(\x0b\x32$.iterators.SavedLeapfrogJoinIteratorH\x00\x12;\n\x0fstarjoin_source\x18\t \x01(\x0b\x32 .iterators.SavedStarJoinIteratorH\x00\x12\x35\n\x0c\x65mpty_source\x18\n \x01(\x0b\x32\x1d.iterators.SavedEmptyIteratorH\x00\x12@\n\x0fleftjoin_source\x18\x0b \x01(\x0b\x32%.iterators.SavedLeftIndexJoinIteratorH\x00\x12\x38\n\x0cunion_source\x18\x0c \x01(\x0b\x32 .iterators.SavedBagUnionIteratorH\x00\x12\'\n\x05inner\x18\r \x01(\x0b\x32\x18.iterators.TriplePattern\x12;\n\x03muc\x18\x0e \x03(\x0b\x32..iterators.SavedLeftIndexJoinIterator.MucEntry\x12\x11\n\tlast_read\x18\x0f \x01(\t\x12\x11\n\ttimestamp\x18\x10 \x01(\t\x12\x0f\n\x07rows_in\x18\x11 \x01(\x03\x12\x10\n\x08rows_out\x18\x12 \x01(\x03\x12\x12\n\nprojection\x18\x13 \x03(\t\x12\x12\n\nexpression\x18\x14 \x01(\t\x12\x0f\n\x07matched\x18\x15 \x01(\x08\x1a*\n\x08MucEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\x08\n\x06source\"\x14\n\x12SavedEmptyIterator\"n\n\x10SolutionMappings\x12/\n\x02mu\x18\x01 \x03(\x0b\x32#.iterators.SolutionMappings.MuEntry\x1a)\n\x07MuEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xf1\x06\n\x15SavedBindJoinIterator\x12\x33\n\x0bscan_source\x18\x01 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x00\x12\x38\n\x0bjoin_source\x18\x02 \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x00\x12\x37\n\rfilter_source\x18\x03 \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x00\x12\x33\n\x0b\x62ind_source\x18\x04 \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x00\x12;\n\x0f\x62indjoin_source\x18\x05 \x01(\x0b\x32 .iterators.SavedBindJoinIteratorH\x00\x12;\n\x0fhashjoin_source\x18\x0b \x01(\x0b\x32 .iterators.SavedHashJoinIteratorH\x00\x12=\n\x10mergejoin_source\x18\x0c \x01(\x0b\x32!.iterators.SavedMergeJoinIteratorH\x00\x12?\n\x0fleapfrog_source\x18\r \x01(\x0b\x32$.iterators.SavedLeapfrogJoinIteratorH\x00\x12;\n\x0fstarjoin_source\x18\x0e \x01(\x0b\x32 .iterators.SavedStarJoinIteratorH\x00\x12\x35\n\x0c\x65mpty_source\x18\x0f \x01(\x0b\x32\x1d.iterators.SavedEmptyIteratorH\x00\x12@\n\x0fleftjoin_source\x18\x13 \x01(\x0b\x32%.iterators.SavedLeftIndexJoinIteratorH\x00\x12\'\n\x05inner\x18\x06 \x01(\x0b\x32\x18.iterators.TriplePattern\x12*\n\x05\x62lock\x18\x07 \x03(\x0b\x32\x1b.iterators.SolutionMappings\x12\x0e\n\x06offset\x18\x08 \x01(\x03\x12\x12\n\nblock_size\x18\t \x01(\x03\x12\x11\n\ttimestamp\x18\n \x01(\t\x12\x0f\n\x07rows_in\x18\x10 \x01(\x03\x12\x10\n\x08rows_out\x18\x11 \x01(\x03\x12\x12\n\nprojection\x18\x12 \x03(\tB\x08\n\x06source\"\xf4\x06\n\x15SavedHashJoinIterator\x12\x33\n\x0bscan_source\x18\x01 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x00\x12\x38\n\x0bjoin_source\x18\x02 \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x00\x12\x37\n\rfilter_source\x18\x03 \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x00\x12\x33\n\x0b\x62ind_source\x18\x04 \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x00\x12;\n\x0f\x62indjoin_source\x18\x05 \x01(\x0b\x32 .iterators.SavedBindJoinIteratorH\x00\x12;\n\x0fhashjoin_source\x18\x06 \x01(\x0b\x32 .iterators.SavedHashJoinIteratorH\x00\x12=\n\x10mergejoin_source\x18\x0f \x01(\x0b\x32!.iterators.SavedMergeJoinIteratorH\x00\x12?\n\x0fleapfrog_source\x18\x10 \x01(\x0b\x32$.iterators.SavedLeapfrogJoinIteratorH\x00\x12;\n\x0fstarjoin_source\x18\x11 \x01(\x0b\x32 .iterators.SavedStarJoinIteratorH\x00\x12@\n\x0fleftjoin_source\x18\x12 \x01(\x0b\x32%.iterators.SavedLeftIndexJoinIteratorH\x00\x12\'\n\x05inner\x18\x07 \x01(\x0b\x32\x18.iterators.TriplePattern\x12\x11\n\tjoin_vars\x18\x08 \x03(\t\x12\x0e\n\x06\x62udget\x18\t \x01(\x03\x12\r\n\x05\x62uilt\x18\n \x01(\x08\x12\x17\n\x0f\x62uild_last_read\x18\x0b \x01(\t\x12\x36\n\x03muc\x18\x0c \x03(\x0b\x32).iterators.SavedHashJoinIterator.MucEntry\x12\x10\n\x08position\x18\r \x01(\x03\x12\x11\n\ttimestamp\x18\x0e \x01(\t\x1a*\n\x08MucEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\x08\n\x06source\"\xd8\x04\n\x16SavedMergeJoinIterator\x12\x31\n\tscan_left\x18\x01 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x00\x12;\n\x0emergejoin_left\x18\x02 \x01(\x0b\x32!.iterators.SavedMergeJoinIteratorH\x00\x12+\n\x05right\x18\x03 \x01(\x0b\x32\x1c.iterators.SavedScanIterator\x12\x10\n\x08join_var\x18\x04 \x01(\t\x12\x42\n\tleft_head\x18\x05 \x03(\x0b\x32/.iterators.SavedMergeJoinIterator.LeftHeadEntry\x12\x44\n\nright_head\x18\x06 \x03(\x0b\x32\x30.iterators.SavedMergeJoinIterator.RightHeadEntry\x12/\n\nleft_group\x18\x07 \x03(\x0b\x32\x1b.iterators.SolutionMappings\x12\x30\n\x0bright_group\x18\x08 \x03(\x0b\x32\x1b.iterators.SolutionMappings\x12\x11\n\tleft_open\x18\t \x01(\x08\x12\x12\n\nright_open\x18\n \x01(\x08\x12\x10\n\x08position\x18\x0b \x01(\x03\x1a/\n\rLeftHeadEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x30\n\x0eRightHeadEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\x06\n\x04left\"\xa8\x06\n\x15SavedStarJoinIterator\x12\x33\n\x0bscan_source\x18\x01 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x00\x12\x38\n\x0bjoin_source\x18\x02 \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x00\x12\x37\n\rfilter_source\x18\x03 \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x00\x12\x33\n\x0b\x62ind_source\x18\x04 \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x00\x12;\n\x0f\x62indjoin_source\x18\x05 \x01(\x0b\x32 .iterators.SavedBindJoinIteratorH\x00\x12;\n\x0fhashjoin_source\x18\x06 \x01(\x0b\x32 .iterators.SavedHashJoinIteratorH\x00\x12=\n\x10mergejoin_source\x18\x07 \x01(\x0b\x32!.iterators.SavedMergeJoinIteratorH\x00\x12?\n\x0fleapfrog_source\x18\x08 \x01(\x0b\x32$.iterators.SavedLeapfrogJoinIteratorH\x00\x12;\n\x0fstarjoin_source\x18\t \x01(\x0b\x32 .iterators.SavedStarJoinIteratorH\x00\x12@\n\x0fleftjoin_source\x18\x0e \x01(\x0b\x32%.iterators.SavedLeftIndexJoinIteratorH\x00\x12&\n\x04star\x18\n \x03(\x0b\x32\x18.iterators.TriplePattern\x12\x36\n\x03muc\x18\x0b \x03(\x0b\x32).iterators.SavedStarJoinIterator.MucEntry\x12\x10\n\x08position\x18\x0c \x01(\x03\x12\x11\n\ttimestamp\x18\r \x01(\t\x1a*\n\x08MucEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\x08\n\x06source\"0\n\x0eLeapfrogCursor\x12\x0c\n\x04term\x18\x01 \x01(\t\x12\x10\n\x08position\x18\x02 \x01(\t\"\x84\x02\n\x19SavedLeapfrogJoinIterator\x12*\n\x08patterns\x18\x01 \x03(\x0b\x32\x18.iterators.TriplePattern\x12\x11\n\tvariables\x18\x02 \x03(\t\x12*\n\x07\x63ursors\x18\x03 \x03(\x0b\x32\x19.iterators.LeapfrogCursor\x12\r\n\x05\x64\x65pth\x18\x04 \x01(\x03\x12\x0e\n\x06strict\x18\x05 \x01(\x08\x12\x11\n\texhausted\x18\x06 \x01(\x08\x12\x11\n\ttimestamp\x18\x07 \x01(\t\x12\x0e\n\x06\x61greed\x18\x08 \x01(\x03\x12\x11\n\tnext_atom\x18\t \x01(\x03\x12\x14\n\x0cinconsistent\x18\n \x01(\x08\"\xa8\x0b\n\x15SavedBagUnionIterator\x12\x31\n\tscan_left\x18\x01 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x00\x12\x37\n\tproj_left\x18\x02 \x01(\x0b\x32\".iterators.SavedProjectionIteratorH\x00\x12\x36\n\nunion_left\x18\x03 \x01(\x0b\x32 .iterators.SavedBagUnionIteratorH\x00\x12\x36\n\tjoin_left\x18\x04 \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x00\x12\x35\n\x0b\x66ilter_left\x18\x05 \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x00\x12\x38\n\x10\x62ind_source_left\x18\x06 \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x00\x12\x39\n\rbindjoin_left\x18\r \x01(\x0b\x32 .iterators.SavedBindJoinIteratorH\x00\x12\x39\n\rhashjoin_left\x18\x0f \x01(\x0b\x32 .iterators.SavedHashJoinIteratorH\x00\x12;\n\x0emergejoin_left\x18\x11 \x01(\x0b\x32!.iterators.SavedMergeJoinIteratorH\x00\x12=\n\rleapfrog_left\x18\x13 \x01(\x0b\x32$.iterators.SavedLeapfrogJoinIteratorH\x00\x12\x39\n\rstarjoin_left\x18\x15 \x01(\x0b\x32 .iterators.SavedStarJoinIteratorH\x00\x12>\n\rleftjoin_left\x18\x17 \x01(\x0b\x32%.iterators.SavedLeftIndexJoinIteratorH\x00\x12\x32\n\nscan_right\x18\x07 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x01\x12\x38\n\nproj_right\x18\x08 \x01(\x0b\x32\".iterators.SavedProjectionIteratorH\x01\x12\x37\n\x0bunion_right\x18\t \x01(\x0b\x32 .iterators.SavedBagUnionIteratorH\x01\x12\x37\n\njoin_right\x18\n \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x01\x12\x36\n\x0c\x66ilter_right\x18\x0b \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x01\x12\x39\n\x11\x62ind_source_right\x18\x0c \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x01\x12:\n\x0e\x62indjoin_right\x18\x0e \x01(\x0b\x32 .iterators.SavedBindJoinIteratorH\x01\x12:\n\x0ehashjoin_right\x18\x10 \x01(\x0b\x32 .iterators.SavedHashJoinIteratorH\x01\x12<\n\x0fmergejoin_right\x18\x12 \x01(\x0b\x32!.iterators.SavedMergeJoinIteratorH\x01\x12>\n\x0eleapfrog_right\x18\x14 \x01(\x0b\x32$.iterators.SavedLeapfrogJoinIteratorH\x01\x12:\n\x0estarjoin_right\x18\x16 \x01(\x0b\x32 .iterators.SavedStarJoinIteratorH\x01\x12?\n\x0eleftjoin_right\x18\x18 \x01(\x0b\x32%.iterators.SavedLeftIndexJoinIteratorH\x01\x42\x06\n\x04leftB\x07\n\x05right\"\xdd\x06\n\x13SavedFilterIterator\x12\x33\n\x0bscan_source\x18\x01 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x00\x12\x39\n\x0bproj_source\x18\x02 \x01(\x0b\x32\".iterators.SavedProjectionIteratorH\x00\x12\x37\n\rfilter_source\x18\x03 \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x00\x12\x38\n\x0bjoin_source\x18\x04 \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x00\x12\x33\n\x0b\x62ind_source\x18\x05 \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x00\x12;\n\x0f\x62indjoin_source\x18\x08 \x01(\x0b\x32 .iterators.SavedBindJoinIteratorH\x00\x12;\n\x0fhashjoin_source\x18\t \x01(\x0b\x32 .iterators.SavedHashJoinIteratorH\x00\x12=\n\x10mergejoin_source\x18\n \x01(\x0b\x32!.iterators.SavedMergeJoinIteratorH\x00\x12?\n\x0fleapfrog_source\x18\x0b \x01(\x0b\x32$.iterators.SavedLeapfrogJoinIteratorH\x00\x12;\n\x0fstarjoin_source\x18\x0c \x01(\x0b\x32 .iterators.SavedStarJoinIteratorH\x00\x12\x38\n\x0cunion_source\x18\r \x01(\x0b\x32 .iterators.SavedBagUnionIteratorH\x00\x12@\n\x0fleftjoin_source\x18\x0e \x01(\x0b\x32%.iterators.SavedLeftIndexJoinIteratorH\x00\x12\x12\n\nexpression\x18\x06 \x01(\t\x12\x32\n\x02mu\x18\x07 \x03(\x0b\x32&.iterators.SavedFilterIterator.MuEntry\x1a)\n\x07MuEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\x08\n\x06source\"\xe8\x06\n\x11SavedBindIterator\x12\x33\n\x0bscan_source\x18\x01 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x00\x12\x39\n\x0bproj_source\x18\x02 \x01(\x0b\x32\".iterators.SavedProjectionIteratorH\x00\x12\x37\n\rfilter_source\x18\x03 \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x00\x12\x38\n\x0bjoin_source\x18\x04 \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x00\x12\x33\n\x0b\x62ind_source\x18\x05 \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x00\x12;\n\x0f\x62indjoin_source\x18\t \x01(\x0b\x32 .iterators.SavedBindJoinIteratorH\x00\x12;\n\x0fhashjoin_source\x18\n \x01(\x0b\x32 .iterators.SavedHashJoinIteratorH\x00\x12=\n\x10mergejoin_source\x18\x0b \x01(\x0b\x32!.iterators.SavedMergeJoinIteratorH\x00\x12?\n\x0fleapfrog_source\x18\x0c \x01(\x0b\x32$.iterators.SavedLeapfrogJoinIteratorH\x00\x12;\n\x0fstarjoin_source\x18\r \x01(\x0b\x32 .iterators.SavedStarJoinIteratorH\x00\x12\x38\n\x0cunion_source\x18\x0e \x01(\x0b\x32 .iterators.SavedBagUnionIteratorH\x00\x12@\n\x0fleftjoin_source\x18\x0f \x01(\x0b\x32%.iterators.SavedLeftIndexJoinIteratorH\x00\x12\x10\n\x08\x62indexpr\x18\x06 \x01(\t\x12\x0f\n\x07\x62indvar\x18\x07 \x01(\t\x12\x30\n\x02mu\x18\x08 \x03(\x0b\x32$.iterators.SavedBindIterator.MuEntry\x1a)\n\x07MuEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\x08\n\x06source\"\x99\x06\n\x16SavedConstructIterator\x12\x33\n\x0bscan_source\x18\x01 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x00\x12\x39\n\x0bproj_source\x18\x02 \x01(\x0b\x32\".iterators.SavedProjectionIteratorH\x00\x12\x38\n\x0bjoin_source\x18\x03 \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x00\x12\x38\n\x0cunion_source\x18\x04 \x01(\x0b\x32 .iterators.SavedBagUnionIteratorH\x00\x12\x37\n\rfilter_source\x18\x05 \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x00\x12\x33\n\x0b\x62ind_source\x18\x06 \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x00\x12;\n\x0f\x62indjoin_source\x18\x08 \x01(\x0b\x32 .iterators.SavedBindJoinIteratorH\x00\x12;\n\x0fhashjoin_source\x18\t \x01(\x0b\x32 .iterators.SavedHashJoinIteratorH\x00\x12=\n\x10mergejoin_source\x18\n \x01(\x0b\x32!.iterators.SavedMergeJoinIteratorH\x00\x12?\n\x0fleapfrog_source\x18\x0b \x01(\x0b\x32$.iterators.SavedLeapfrogJoinIteratorH\x00\x12;\n\x0fstarjoin_source\x18\x0c \x01(\x0b\x32 .iterators.SavedStarJoinIteratorH\x00\x12@\n\x0fleftjoin_source\x18\r \x01(\x0b\x32%.iterators.SavedLeftIndexJoinIteratorH\x00\x12*\n\x08template\x18\x07 \x03(\x0b\x32\x18.iterators.TriplePatternB\x08\n\x06source\"\x85\x01\n\x0fSavedInsertData\x12?\n\x0bnb_inserted\x18\x01 \x03(\x0b\x32*.iterators.SavedInsertData.NbInsertedEntry\x1a\x31\n\x0fNbInsertedEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x04:\x02\x38\x01\"\x85\x01\n\x0fSavedDeleteData\x12?\n\x0bnb_inserted\x18\x01 \x03(\x0b\x32*.iterators.SavedDeleteData.NbInsertedEntry\x1a\x31\n\x0fNbInsertedEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x04:\x02\x38\x01\"\xc1\x07\n\x08RootTree\x12\x33\n\x0bscan_source\x18\x01 \x01(\x0b\x32\x1c.iterators.SavedScanIteratorH\x00\x12\x39\n\x0bproj_source\x18\x02 \x01(\x0b\x32\".iterators.SavedProjectionIteratorH\x00\x12\x38\n\x0bjoin_source\x18\x03 \x01(\x0b\x32!.iterators.SavedIndexJoinIteratorH\x00\x12\x38\n\x0cunion_source\x18\x04 \x01(\x0b\x32 .iterators.SavedBagUnionIteratorH\x00\x12\x37\n\rfilter_source\x18\x05 \x01(\x0b\x32\x1e.iterators.SavedFilterIteratorH\x00\x12\x33\n\rinsert_source\x18\x06 \x01(\x0b\x32\x1a.iterators.SavedInsertDataH\x00\x12\x33\n\rdelete_source\x18\x07 \x01(\x0b\x32\x1a.iterators.SavedDeleteDataH\x00\x12\x33\n\x0b\x62ind_source\x18\x08 \x01(\x0b\x32\x1c.iterators.SavedBindIteratorH\x00\x12=\n\x10\x63onstruct_source\x18\t \x01(\x0b\x32!.iterators.SavedConstructIteratorH\x00\x12\x37\n\x0creduc_source\x18\n \x01(\x0b\x32\x1f.iterators.SavedReducedIteratorH\x00\x12;\n\x0f\x62indjoin_source\x18\x0b \x01(\x0b\x32 .iterators.SavedBindJoinIteratorH\x00\x12;\n\x0fhashjoin_source\x18\x0c \x01(\x0b\x32 .iterators.SavedHashJoinIteratorH\x00\x12=\n\x10mergejoin_source\x18\r \x01(\x0b\x32!.iterators.SavedMergeJoinIteratorH\x00\x12?\n\x0fleapfrog_source\x18\x0e \x01(\x0b\x32$.iterators.SavedLeapfrogJoinIteratorH\x00\x12;\n\x0fstarjoin_source\x18\x0f \x01(\x0b\x32 .iterators.SavedStarJoinIteratorH\x00\x12@\n\x0fleftjoin_source\x18\x10 \x01(\x0b\x32%.iterators.SavedLeftIndexJoinIteratorH\x00\x42\x08\n\x06sourceb\x06proto3'
 )
 
 
@@ -211,6 +211,48 @@ _SAVEDPROJECTIONITERATOR = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bindjoin_source', full_name='iterators.SavedProjectionIterator.bindjoin_source', index=6,
+      number=7, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='hashjoin_source', full_name='iterators.SavedProjectionIterator.hashjoin_source', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='mergejoin_source', full_name='iterators.SavedProjectionIterator.mergejoin_source', index=8,
+      number=9, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leapfrog_source', full_name='iterators.SavedProjectionIterator.leapfrog_source', index=9,
+      number=10, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='starjoin_source', full_name='iterators.SavedProjectionIterator.starjoin_source', index=10,
+      number=11, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leftjoin_source', full_name='iterators.SavedProjectionIterator.leftjoin_source', index=11,
+      number=12, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -227,7 +269,7 @@ _SAVEDPROJECTIONITERATOR = _descriptor.Descriptor(
       index=0, containing_type=None, fields=[]),
   ],
   serialized_start=329,
-  serialized_end=659,
+  serialized_end=1036,
 )
 
 
@@ -264,8 +306,8 @@ _SAVEDINDEXJOINITERATOR_MUCENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1045,
-  serialized_end=1087,
+  serialized_start=1909,
+  serialized_end=1951,
 )
 
 _SAVEDINDEXJOINITERATOR = _descriptor.Descriptor(
@@ -304,33 +346,103 @@ _SAVEDINDEXJOINITERATOR = _descriptor.Descriptor(
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='inner', full_name='iterators.SavedIndexJoinIterator.inner', index=4,
+      name='bindjoin_source', full_name='iterators.SavedIndexJoinIterator.bindjoin_source', index=4,
+      number=9, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='hashjoin_source', full_name='iterators.SavedIndexJoinIterator.hashjoin_source', index=5,
+      number=10, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='mergejoin_source', full_name='iterators.SavedIndexJoinIterator.mergejoin_source', index=6,
+      number=11, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leapfrog_source', full_name='iterators.SavedIndexJoinIterator.leapfrog_source', index=7,
+      number=12, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='starjoin_source', full_name='iterators.SavedIndexJoinIterator.starjoin_source', index=8,
+      number=13, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='empty_source', full_name='iterators.SavedIndexJoinIterator.empty_source', index=9,
+      number=14, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leftjoin_source', full_name='iterators.SavedIndexJoinIterator.leftjoin_source', index=10,
+      number=18, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='inner', full_name='iterators.SavedIndexJoinIterator.inner', index=11,
       number=5, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='muc', full_name='iterators.SavedIndexJoinIterator.muc', index=5,
+      name='muc', full_name='iterators.SavedIndexJoinIterator.muc', index=12,
       number=6, type=11, cpp_type=10, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='last_read', full_name='iterators.SavedIndexJoinIterator.last_read', index=6,
+      name='last_read', full_name='iterators.SavedIndexJoinIterator.last_read', index=13,
       number=7, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='timestamp', full_name='iterators.SavedIndexJoinIterator.timestamp', index=7,
+      name='timestamp', full_name='iterators.SavedIndexJoinIterator.timestamp', index=14,
       number=8, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='rows_in', full_name='iterators.SavedIndexJoinIterator.rows_in', index=15,
+      number=15, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='rows_out', full_name='iterators.SavedIndexJoinIterator.rows_out', index=16,
+      number=16, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='projection', full_name='iterators.SavedIndexJoinIterator.projection', index=17,
+      number=17, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -346,98 +458,1307 @@ _SAVEDINDEXJOINITERATOR = _descriptor.Descriptor(
       name='source', full_name='iterators.SavedIndexJoinIterator.source',
       index=0, containing_type=None, fields=[]),
   ],
-  serialized_start=662,
-  serialized_end=1097,
+  serialized_start=1039,
+  serialized_end=1961,
 )
 
 
-_SAVEDBAGUNIONITERATOR = _descriptor.Descriptor(
-  name='SavedBagUnionIterator',
-  full_name='iterators.SavedBagUnionIterator',
+_SAVEDLEFTINDEXJOINITERATOR_MUCENTRY = _descriptor.Descriptor(
+  name='MucEntry',
+  full_name='iterators.SavedLeftIndexJoinIterator.MucEntry',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='scan_left', full_name='iterators.SavedBagUnionIterator.scan_left', index=0,
+      name='key', full_name='iterators.SavedLeftIndexJoinIterator.MucEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='iterators.SavedLeftIndexJoinIterator.MucEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1909,
+  serialized_end=1951,
+)
+
+_SAVEDLEFTINDEXJOINITERATOR = _descriptor.Descriptor(
+  name='SavedLeftIndexJoinIterator',
+  full_name='iterators.SavedLeftIndexJoinIterator',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='scan_source', full_name='iterators.SavedLeftIndexJoinIterator.scan_source', index=0,
       number=1, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='proj_left', full_name='iterators.SavedBagUnionIterator.proj_left', index=1,
+      name='join_source', full_name='iterators.SavedLeftIndexJoinIterator.join_source', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='union_left', full_name='iterators.SavedBagUnionIterator.union_left', index=2,
+      name='filter_source', full_name='iterators.SavedLeftIndexJoinIterator.filter_source', index=2,
       number=3, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='join_left', full_name='iterators.SavedBagUnionIterator.join_left', index=3,
+      name='bind_source', full_name='iterators.SavedLeftIndexJoinIterator.bind_source', index=3,
       number=4, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='filter_left', full_name='iterators.SavedBagUnionIterator.filter_left', index=4,
+      name='bindjoin_source', full_name='iterators.SavedLeftIndexJoinIterator.bindjoin_source', index=4,
       number=5, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='bind_source_left', full_name='iterators.SavedBagUnionIterator.bind_source_left', index=5,
+      name='hashjoin_source', full_name='iterators.SavedLeftIndexJoinIterator.hashjoin_source', index=5,
       number=6, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='scan_right', full_name='iterators.SavedBagUnionIterator.scan_right', index=6,
+      name='mergejoin_source', full_name='iterators.SavedLeftIndexJoinIterator.mergejoin_source', index=6,
       number=7, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='proj_right', full_name='iterators.SavedBagUnionIterator.proj_right', index=7,
+      name='leapfrog_source', full_name='iterators.SavedLeftIndexJoinIterator.leapfrog_source', index=7,
       number=8, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='union_right', full_name='iterators.SavedBagUnionIterator.union_right', index=8,
-      number=9, type=11, cpp_type=10, label=1,
+      name='starjoin_source', full_name='iterators.SavedLeftIndexJoinIterator.starjoin_source', index=8,
+      number=9, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='empty_source', full_name='iterators.SavedLeftIndexJoinIterator.empty_source', index=9,
+      number=10, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leftjoin_source', full_name='iterators.SavedLeftIndexJoinIterator.leftjoin_source', index=10,
+      number=11, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='union_source', full_name='iterators.SavedLeftIndexJoinIterator.union_source', index=11,
+      number=12, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='inner', full_name='iterators.SavedLeftIndexJoinIterator.inner', index=12,
+      number=13, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='muc', full_name='iterators.SavedLeftIndexJoinIterator.muc', index=13,
+      number=14, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='last_read', full_name='iterators.SavedLeftIndexJoinIterator.last_read', index=14,
+      number=15, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='iterators.SavedLeftIndexJoinIterator.timestamp', index=15,
+      number=16, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='rows_in', full_name='iterators.SavedLeftIndexJoinIterator.rows_in', index=16,
+      number=17, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='rows_out', full_name='iterators.SavedLeftIndexJoinIterator.rows_out', index=17,
+      number=18, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='projection', full_name='iterators.SavedLeftIndexJoinIterator.projection', index=18,
+      number=19, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='expression', full_name='iterators.SavedLeftIndexJoinIterator.expression', index=19,
+      number=20, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='matched', full_name='iterators.SavedLeftIndexJoinIterator.matched', index=20,
+      number=21, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_SAVEDLEFTINDEXJOINITERATOR_MUCENTRY, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='source', full_name='iterators.SavedLeftIndexJoinIterator.source',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=1964,
+  serialized_end=2989,
+)
+
+
+_SAVEDEMPTYITERATOR = _descriptor.Descriptor(
+  name='SavedEmptyIterator',
+  full_name='iterators.SavedEmptyIterator',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2991,
+  serialized_end=3011,
+)
+
+
+_SOLUTIONMAPPINGS_MUENTRY = _descriptor.Descriptor(
+  name='MuEntry',
+  full_name='iterators.SolutionMappings.MuEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='iterators.SolutionMappings.MuEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='iterators.SolutionMappings.MuEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3082,
+  serialized_end=3123,
+)
+
+_SOLUTIONMAPPINGS = _descriptor.Descriptor(
+  name='SolutionMappings',
+  full_name='iterators.SolutionMappings',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='mu', full_name='iterators.SolutionMappings.mu', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_SOLUTIONMAPPINGS_MUENTRY, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3013,
+  serialized_end=3123,
+)
+
+
+_SAVEDBINDJOINITERATOR = _descriptor.Descriptor(
+  name='SavedBindJoinIterator',
+  full_name='iterators.SavedBindJoinIterator',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='scan_source', full_name='iterators.SavedBindJoinIterator.scan_source', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='join_source', full_name='iterators.SavedBindJoinIterator.join_source', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='filter_source', full_name='iterators.SavedBindJoinIterator.filter_source', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bind_source', full_name='iterators.SavedBindJoinIterator.bind_source', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bindjoin_source', full_name='iterators.SavedBindJoinIterator.bindjoin_source', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='hashjoin_source', full_name='iterators.SavedBindJoinIterator.hashjoin_source', index=5,
+      number=11, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='mergejoin_source', full_name='iterators.SavedBindJoinIterator.mergejoin_source', index=6,
+      number=12, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leapfrog_source', full_name='iterators.SavedBindJoinIterator.leapfrog_source', index=7,
+      number=13, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='starjoin_source', full_name='iterators.SavedBindJoinIterator.starjoin_source', index=8,
+      number=14, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='empty_source', full_name='iterators.SavedBindJoinIterator.empty_source', index=9,
+      number=15, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leftjoin_source', full_name='iterators.SavedBindJoinIterator.leftjoin_source', index=10,
+      number=19, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='inner', full_name='iterators.SavedBindJoinIterator.inner', index=11,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='block', full_name='iterators.SavedBindJoinIterator.block', index=12,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='iterators.SavedBindJoinIterator.offset', index=13,
+      number=8, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='block_size', full_name='iterators.SavedBindJoinIterator.block_size', index=14,
+      number=9, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='iterators.SavedBindJoinIterator.timestamp', index=15,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='rows_in', full_name='iterators.SavedBindJoinIterator.rows_in', index=16,
+      number=16, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='rows_out', full_name='iterators.SavedBindJoinIterator.rows_out', index=17,
+      number=17, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='projection', full_name='iterators.SavedBindJoinIterator.projection', index=18,
+      number=18, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='source', full_name='iterators.SavedBindJoinIterator.source',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=3126,
+  serialized_end=4007,
+)
+
+
+_SAVEDHASHJOINITERATOR_MUCENTRY = _descriptor.Descriptor(
+  name='MucEntry',
+  full_name='iterators.SavedHashJoinIterator.MucEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='iterators.SavedHashJoinIterator.MucEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='iterators.SavedHashJoinIterator.MucEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1909,
+  serialized_end=1951,
+)
+
+_SAVEDHASHJOINITERATOR = _descriptor.Descriptor(
+  name='SavedHashJoinIterator',
+  full_name='iterators.SavedHashJoinIterator',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='scan_source', full_name='iterators.SavedHashJoinIterator.scan_source', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='join_source', full_name='iterators.SavedHashJoinIterator.join_source', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='filter_source', full_name='iterators.SavedHashJoinIterator.filter_source', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bind_source', full_name='iterators.SavedHashJoinIterator.bind_source', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bindjoin_source', full_name='iterators.SavedHashJoinIterator.bindjoin_source', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='hashjoin_source', full_name='iterators.SavedHashJoinIterator.hashjoin_source', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='mergejoin_source', full_name='iterators.SavedHashJoinIterator.mergejoin_source', index=6,
+      number=15, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leapfrog_source', full_name='iterators.SavedHashJoinIterator.leapfrog_source', index=7,
+      number=16, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='starjoin_source', full_name='iterators.SavedHashJoinIterator.starjoin_source', index=8,
+      number=17, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leftjoin_source', full_name='iterators.SavedHashJoinIterator.leftjoin_source', index=9,
+      number=18, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='inner', full_name='iterators.SavedHashJoinIterator.inner', index=10,
+      number=7, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='join_vars', full_name='iterators.SavedHashJoinIterator.join_vars', index=11,
+      number=8, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='budget', full_name='iterators.SavedHashJoinIterator.budget', index=12,
+      number=9, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='built', full_name='iterators.SavedHashJoinIterator.built', index=13,
+      number=10, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='build_last_read', full_name='iterators.SavedHashJoinIterator.build_last_read', index=14,
+      number=11, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='muc', full_name='iterators.SavedHashJoinIterator.muc', index=15,
+      number=12, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='position', full_name='iterators.SavedHashJoinIterator.position', index=16,
+      number=13, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='iterators.SavedHashJoinIterator.timestamp', index=17,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_SAVEDHASHJOINITERATOR_MUCENTRY, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='source', full_name='iterators.SavedHashJoinIterator.source',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=4010,
+  serialized_end=4894,
+)
+
+
+_SAVEDMERGEJOINITERATOR_LEFTHEADENTRY = _descriptor.Descriptor(
+  name='LeftHeadEntry',
+  full_name='iterators.SavedMergeJoinIterator.LeftHeadEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='iterators.SavedMergeJoinIterator.LeftHeadEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='iterators.SavedMergeJoinIterator.LeftHeadEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5392,
+  serialized_end=5439,
+)
+
+_SAVEDMERGEJOINITERATOR_RIGHTHEADENTRY = _descriptor.Descriptor(
+  name='RightHeadEntry',
+  full_name='iterators.SavedMergeJoinIterator.RightHeadEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='iterators.SavedMergeJoinIterator.RightHeadEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='iterators.SavedMergeJoinIterator.RightHeadEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5441,
+  serialized_end=5489,
+)
+
+_SAVEDMERGEJOINITERATOR = _descriptor.Descriptor(
+  name='SavedMergeJoinIterator',
+  full_name='iterators.SavedMergeJoinIterator',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='scan_left', full_name='iterators.SavedMergeJoinIterator.scan_left', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='mergejoin_left', full_name='iterators.SavedMergeJoinIterator.mergejoin_left', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='right', full_name='iterators.SavedMergeJoinIterator.right', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='join_var', full_name='iterators.SavedMergeJoinIterator.join_var', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='left_head', full_name='iterators.SavedMergeJoinIterator.left_head', index=4,
+      number=5, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='right_head', full_name='iterators.SavedMergeJoinIterator.right_head', index=5,
+      number=6, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='left_group', full_name='iterators.SavedMergeJoinIterator.left_group', index=6,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='right_group', full_name='iterators.SavedMergeJoinIterator.right_group', index=7,
+      number=8, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='left_open', full_name='iterators.SavedMergeJoinIterator.left_open', index=8,
+      number=9, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='right_open', full_name='iterators.SavedMergeJoinIterator.right_open', index=9,
+      number=10, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='position', full_name='iterators.SavedMergeJoinIterator.position', index=10,
+      number=11, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_SAVEDMERGEJOINITERATOR_LEFTHEADENTRY, _SAVEDMERGEJOINITERATOR_RIGHTHEADENTRY, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='left', full_name='iterators.SavedMergeJoinIterator.left',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=4897,
+  serialized_end=5497,
+)
+
+
+_SAVEDSTARJOINITERATOR_MUCENTRY = _descriptor.Descriptor(
+  name='MucEntry',
+  full_name='iterators.SavedStarJoinIterator.MucEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='iterators.SavedStarJoinIterator.MucEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='iterators.SavedStarJoinIterator.MucEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1909,
+  serialized_end=1951,
+)
+
+_SAVEDSTARJOINITERATOR = _descriptor.Descriptor(
+  name='SavedStarJoinIterator',
+  full_name='iterators.SavedStarJoinIterator',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='scan_source', full_name='iterators.SavedStarJoinIterator.scan_source', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='join_source', full_name='iterators.SavedStarJoinIterator.join_source', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='filter_source', full_name='iterators.SavedStarJoinIterator.filter_source', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bind_source', full_name='iterators.SavedStarJoinIterator.bind_source', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bindjoin_source', full_name='iterators.SavedStarJoinIterator.bindjoin_source', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='hashjoin_source', full_name='iterators.SavedStarJoinIterator.hashjoin_source', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='mergejoin_source', full_name='iterators.SavedStarJoinIterator.mergejoin_source', index=6,
+      number=7, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leapfrog_source', full_name='iterators.SavedStarJoinIterator.leapfrog_source', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='starjoin_source', full_name='iterators.SavedStarJoinIterator.starjoin_source', index=8,
+      number=9, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leftjoin_source', full_name='iterators.SavedStarJoinIterator.leftjoin_source', index=9,
+      number=14, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='star', full_name='iterators.SavedStarJoinIterator.star', index=10,
+      number=10, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='muc', full_name='iterators.SavedStarJoinIterator.muc', index=11,
+      number=11, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='position', full_name='iterators.SavedStarJoinIterator.position', index=12,
+      number=12, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='iterators.SavedStarJoinIterator.timestamp', index=13,
+      number=13, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_SAVEDSTARJOINITERATOR_MUCENTRY, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='source', full_name='iterators.SavedStarJoinIterator.source',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=5500,
+  serialized_end=6308,
+)
+
+
+_LEAPFROGCURSOR = _descriptor.Descriptor(
+  name='LeapfrogCursor',
+  full_name='iterators.LeapfrogCursor',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='term', full_name='iterators.LeapfrogCursor.term', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='position', full_name='iterators.LeapfrogCursor.position', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6310,
+  serialized_end=6358,
+)
+
+
+_SAVEDLEAPFROGJOINITERATOR = _descriptor.Descriptor(
+  name='SavedLeapfrogJoinIterator',
+  full_name='iterators.SavedLeapfrogJoinIterator',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='patterns', full_name='iterators.SavedLeapfrogJoinIterator.patterns', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='variables', full_name='iterators.SavedLeapfrogJoinIterator.variables', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='cursors', full_name='iterators.SavedLeapfrogJoinIterator.cursors', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='depth', full_name='iterators.SavedLeapfrogJoinIterator.depth', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='strict', full_name='iterators.SavedLeapfrogJoinIterator.strict', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='exhausted', full_name='iterators.SavedLeapfrogJoinIterator.exhausted', index=5,
+      number=6, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='iterators.SavedLeapfrogJoinIterator.timestamp', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='agreed', full_name='iterators.SavedLeapfrogJoinIterator.agreed', index=7,
+      number=8, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='next_atom', full_name='iterators.SavedLeapfrogJoinIterator.next_atom', index=8,
+      number=9, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='inconsistent', full_name='iterators.SavedLeapfrogJoinIterator.inconsistent', index=9,
+      number=10, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6361,
+  serialized_end=6621,
+)
+
+
+_SAVEDBAGUNIONITERATOR = _descriptor.Descriptor(
+  name='SavedBagUnionIterator',
+  full_name='iterators.SavedBagUnionIterator',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='scan_left', full_name='iterators.SavedBagUnionIterator.scan_left', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='proj_left', full_name='iterators.SavedBagUnionIterator.proj_left', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='union_left', full_name='iterators.SavedBagUnionIterator.union_left', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='join_left', full_name='iterators.SavedBagUnionIterator.join_left', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='filter_left', full_name='iterators.SavedBagUnionIterator.filter_left', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bind_source_left', full_name='iterators.SavedBagUnionIterator.bind_source_left', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bindjoin_left', full_name='iterators.SavedBagUnionIterator.bindjoin_left', index=6,
+      number=13, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='hashjoin_left', full_name='iterators.SavedBagUnionIterator.hashjoin_left', index=7,
+      number=15, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='mergejoin_left', full_name='iterators.SavedBagUnionIterator.mergejoin_left', index=8,
+      number=17, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leapfrog_left', full_name='iterators.SavedBagUnionIterator.leapfrog_left', index=9,
+      number=19, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='starjoin_left', full_name='iterators.SavedBagUnionIterator.starjoin_left', index=10,
+      number=21, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leftjoin_left', full_name='iterators.SavedBagUnionIterator.leftjoin_left', index=11,
+      number=23, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='scan_right', full_name='iterators.SavedBagUnionIterator.scan_right', index=12,
+      number=7, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='proj_right', full_name='iterators.SavedBagUnionIterator.proj_right', index=13,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='union_right', full_name='iterators.SavedBagUnionIterator.union_right', index=14,
+      number=9, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='join_right', full_name='iterators.SavedBagUnionIterator.join_right', index=15,
+      number=10, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='filter_right', full_name='iterators.SavedBagUnionIterator.filter_right', index=16,
+      number=11, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bind_source_right', full_name='iterators.SavedBagUnionIterator.bind_source_right', index=17,
+      number=12, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bindjoin_right', full_name='iterators.SavedBagUnionIterator.bindjoin_right', index=18,
+      number=14, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='hashjoin_right', full_name='iterators.SavedBagUnionIterator.hashjoin_right', index=19,
+      number=16, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='mergejoin_right', full_name='iterators.SavedBagUnionIterator.mergejoin_right', index=20,
+      number=18, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='join_right', full_name='iterators.SavedBagUnionIterator.join_right', index=9,
-      number=10, type=11, cpp_type=10, label=1,
+      name='leapfrog_right', full_name='iterators.SavedBagUnionIterator.leapfrog_right', index=21,
+      number=20, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='filter_right', full_name='iterators.SavedBagUnionIterator.filter_right', index=10,
-      number=11, type=11, cpp_type=10, label=1,
+      name='starjoin_right', full_name='iterators.SavedBagUnionIterator.starjoin_right', index=22,
+      number=22, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='bind_source_right', full_name='iterators.SavedBagUnionIterator.bind_source_right', index=11,
-      number=12, type=11, cpp_type=10, label=1,
+      name='leftjoin_right', full_name='iterators.SavedBagUnionIterator.leftjoin_right', index=23,
+      number=24, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
@@ -460,8 +1781,8 @@ _SAVEDBAGUNIONITERATOR = _descriptor.Descriptor(
       name='right', full_name='iterators.SavedBagUnionIterator.right',
       index=1, containing_type=None, fields=[]),
   ],
-  serialized_start=1100,
-  serialized_end=1812,
+  serialized_start=6624,
+  serialized_end=8072,
 )
 
 
@@ -498,8 +1819,8 @@ _SAVEDFILTERITERATOR_MUENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2190,
-  serialized_end=2231,
+  serialized_start=3082,
+  serialized_end=3123,
 )
 
 _SAVEDFILTERITERATOR = _descriptor.Descriptor(
@@ -545,14 +1866,63 @@ _SAVEDFILTERITERATOR = _descriptor.Descriptor(
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='expression', full_name='iterators.SavedFilterIterator.expression', index=5,
+      name='bindjoin_source', full_name='iterators.SavedFilterIterator.bindjoin_source', index=5,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='hashjoin_source', full_name='iterators.SavedFilterIterator.hashjoin_source', index=6,
+      number=9, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='mergejoin_source', full_name='iterators.SavedFilterIterator.mergejoin_source', index=7,
+      number=10, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leapfrog_source', full_name='iterators.SavedFilterIterator.leapfrog_source', index=8,
+      number=11, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='starjoin_source', full_name='iterators.SavedFilterIterator.starjoin_source', index=9,
+      number=12, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='union_source', full_name='iterators.SavedFilterIterator.union_source', index=10,
+      number=13, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leftjoin_source', full_name='iterators.SavedFilterIterator.leftjoin_source', index=11,
+      number=14, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='expression', full_name='iterators.SavedFilterIterator.expression', index=12,
       number=6, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='mu', full_name='iterators.SavedFilterIterator.mu', index=6,
+      name='mu', full_name='iterators.SavedFilterIterator.mu', index=13,
       number=7, type=11, cpp_type=10, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
@@ -573,8 +1943,8 @@ _SAVEDFILTERITERATOR = _descriptor.Descriptor(
       name='source', full_name='iterators.SavedFilterIterator.source',
       index=0, containing_type=None, fields=[]),
   ],
-  serialized_start=1815,
-  serialized_end=2241,
+  serialized_start=8075,
+  serialized_end=8936,
 )
 
 
@@ -611,8 +1981,8 @@ _SAVEDBINDITERATOR_MUENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2190,
-  serialized_end=2231,
+  serialized_start=3082,
+  serialized_end=3123,
 )
 
 _SAVEDBINDITERATOR = _descriptor.Descriptor(
@@ -658,21 +2028,70 @@ _SAVEDBINDITERATOR = _descriptor.Descriptor(
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='bindexpr', full_name='iterators.SavedBindIterator.bindexpr', index=5,
+      name='bindjoin_source', full_name='iterators.SavedBindIterator.bindjoin_source', index=5,
+      number=9, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='hashjoin_source', full_name='iterators.SavedBindIterator.hashjoin_source', index=6,
+      number=10, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='mergejoin_source', full_name='iterators.SavedBindIterator.mergejoin_source', index=7,
+      number=11, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leapfrog_source', full_name='iterators.SavedBindIterator.leapfrog_source', index=8,
+      number=12, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='starjoin_source', full_name='iterators.SavedBindIterator.starjoin_source', index=9,
+      number=13, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='union_source', full_name='iterators.SavedBindIterator.union_source', index=10,
+      number=14, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leftjoin_source', full_name='iterators.SavedBindIterator.leftjoin_source', index=11,
+      number=15, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bindexpr', full_name='iterators.SavedBindIterator.bindexpr', index=12,
       number=6, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='bindvar', full_name='iterators.SavedBindIterator.bindvar', index=6,
+      name='bindvar', full_name='iterators.SavedBindIterator.bindvar', index=13,
       number=7, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='mu', full_name='iterators.SavedBindIterator.mu', index=7,
+      name='mu', full_name='iterators.SavedBindIterator.mu', index=14,
       number=8, type=11, cpp_type=10, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
@@ -693,8 +2112,8 @@ _SAVEDBINDITERATOR = _descriptor.Descriptor(
       name='source', full_name='iterators.SavedBindIterator.source',
       index=0, containing_type=None, fields=[]),
   ],
-  serialized_start=2244,
-  serialized_end=2681,
+  serialized_start=8939,
+  serialized_end=9811,
 )
 
 
@@ -748,7 +2167,49 @@ _SAVEDCONSTRUCTITERATOR = _descriptor.Descriptor(
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='template', full_name='iterators.SavedConstructIterator.template', index=6,
+      name='bindjoin_source', full_name='iterators.SavedConstructIterator.bindjoin_source', index=6,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='hashjoin_source', full_name='iterators.SavedConstructIterator.hashjoin_source', index=7,
+      number=9, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='mergejoin_source', full_name='iterators.SavedConstructIterator.mergejoin_source', index=8,
+      number=10, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leapfrog_source', full_name='iterators.SavedConstructIterator.leapfrog_source', index=9,
+      number=11, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='starjoin_source', full_name='iterators.SavedConstructIterator.starjoin_source', index=10,
+      number=12, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leftjoin_source', full_name='iterators.SavedConstructIterator.leftjoin_source', index=11,
+      number=13, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='template', full_name='iterators.SavedConstructIterator.template', index=12,
       number=7, type=11, cpp_type=10, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
@@ -769,8 +2230,8 @@ _SAVEDCONSTRUCTITERATOR = _descriptor.Descriptor(
       name='source', full_name='iterators.SavedConstructIterator.source',
       index=0, containing_type=None, fields=[]),
   ],
-  serialized_start=2684,
-  serialized_end=3100,
+  serialized_start=9814,
+  serialized_end=10607,
 )
 
 
@@ -807,8 +2268,8 @@ _SAVEDINSERTDATA_NBINSERTEDENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3187,
-  serialized_end=3236,
+  serialized_start=10694,
+  serialized_end=10743,
 )
 
 _SAVEDINSERTDATA = _descriptor.Descriptor(
@@ -837,8 +2298,8 @@ _SAVEDINSERTDATA = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3103,
-  serialized_end=3236,
+  serialized_start=10610,
+  serialized_end=10743,
 )
 
 
@@ -875,8 +2336,8 @@ _SAVEDDELETEDATA_NBINSERTEDENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3187,
-  serialized_end=3236,
+  serialized_start=10694,
+  serialized_end=10743,
 )
 
 _SAVEDDELETEDATA = _descriptor.Descriptor(
@@ -905,8 +2366,8 @@ _SAVEDDELETEDATA = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3239,
-  serialized_end=3372,
+  serialized_start=10746,
+  serialized_end=10879,
 )
 
 
@@ -987,6 +2448,48 @@ _ROOTTREE = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bindjoin_source', full_name='iterators.RootTree.bindjoin_source', index=10,
+      number=11, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='hashjoin_source', full_name='iterators.RootTree.hashjoin_source', index=11,
+      number=12, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='mergejoin_source', full_name='iterators.RootTree.mergejoin_source', index=12,
+      number=13, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leapfrog_source', full_name='iterators.RootTree.leapfrog_source', index=13,
+      number=14, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='starjoin_source', full_name='iterators.RootTree.starjoin_source', index=14,
+      number=15, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='leftjoin_source', full_name='iterators.RootTree.leftjoin_source', index=15,
+      number=16, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -1002,8 +2505,8 @@ _ROOTTREE = _descriptor.Descriptor(
       name='source', full_name='iterators.RootTree.source',
       index=0, containing_type=None, fields=[]),
   ],
-  serialized_start=3375,
-  serialized_end=3959,
+  serialized_start=10882,
+  serialized_end=11843,
 )
 
 _SAVEDSCANITERATOR.fields_by_name['triple'].message_type = _TRIPLEPATTERN
@@ -1016,6 +2519,12 @@ _SAVEDPROJECTIONITERATOR.fields_by_name['join_source'].message_type = _SAVEDINDE
 _SAVEDPROJECTIONITERATOR.fields_by_name['union_source'].message_type = _SAVEDBAGUNIONITERATOR
 _SAVEDPROJECTIONITERATOR.fields_by_name['filter_source'].message_type = _SAVEDFILTERITERATOR
 _SAVEDPROJECTIONITERATOR.fields_by_name['bind_source'].message_type = _SAVEDBINDITERATOR
+_SAVEDPROJECTIONITERATOR.fields_by_name['bindjoin_source'].message_type = _SAVEDBINDJOINITERATOR
+_SAVEDPROJECTIONITERATOR.fields_by_name['hashjoin_source'].message_type = _SAVEDHASHJOINITERATOR
+_SAVEDPROJECTIONITERATOR.fields_by_name['mergejoin_source'].message_type = _SAVEDMERGEJOINITERATOR
+_SAVEDPROJECTIONITERATOR.fields_by_name['leapfrog_source'].message_type = _SAVEDLEAPFROGJOINITERATOR
+_SAVEDPROJECTIONITERATOR.fields_by_name['starjoin_source'].message_type = _SAVEDSTARJOINITERATOR
+_SAVEDPROJECTIONITERATOR.fields_by_name['leftjoin_source'].message_type = _SAVEDLEFTINDEXJOINITERATOR
 _SAVEDPROJECTIONITERATOR.oneofs_by_name['source'].fields.append(
   _SAVEDPROJECTIONITERATOR.fields_by_name['scan_source'])
 _SAVEDPROJECTIONITERATOR.fields_by_name['scan_source'].containing_oneof = _SAVEDPROJECTIONITERATOR.oneofs_by_name['source']
@@ -1031,11 +2540,36 @@ _SAVEDPROJECTIONITERATOR.fields_by_name['filter_source'].containing_oneof = _SAV
 _SAVEDPROJECTIONITERATOR.oneofs_by_name['source'].fields.append(
   _SAVEDPROJECTIONITERATOR.fields_by_name['bind_source'])
 _SAVEDPROJECTIONITERATOR.fields_by_name['bind_source'].containing_oneof = _SAVEDPROJECTIONITERATOR.oneofs_by_name['source']
+_SAVEDPROJECTIONITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDPROJECTIONITERATOR.fields_by_name['bindjoin_source'])
+_SAVEDPROJECTIONITERATOR.fields_by_name['bindjoin_source'].containing_oneof = _SAVEDPROJECTIONITERATOR.oneofs_by_name['source']
+_SAVEDPROJECTIONITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDPROJECTIONITERATOR.fields_by_name['hashjoin_source'])
+_SAVEDPROJECTIONITERATOR.fields_by_name['hashjoin_source'].containing_oneof = _SAVEDPROJECTIONITERATOR.oneofs_by_name['source']
+_SAVEDPROJECTIONITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDPROJECTIONITERATOR.fields_by_name['mergejoin_source'])
+_SAVEDPROJECTIONITERATOR.fields_by_name['mergejoin_source'].containing_oneof = _SAVEDPROJECTIONITERATOR.oneofs_by_name['source']
+_SAVEDPROJECTIONITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDPROJECTIONITERATOR.fields_by_name['leapfrog_source'])
+_SAVEDPROJECTIONITERATOR.fields_by_name['leapfrog_source'].containing_oneof = _SAVEDPROJECTIONITERATOR.oneofs_by_name['source']
+_SAVEDPROJECTIONITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDPROJECTIONITERATOR.fields_by_name['starjoin_source'])
+_SAVEDPROJECTIONITERATOR.fields_by_name['starjoin_source'].containing_oneof = _SAVEDPROJECTIONITERATOR.oneofs_by_name['source']
+_SAVEDPROJECTIONITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDPROJECTIONITERATOR.fields_by_name['leftjoin_source'])
+_SAVEDPROJECTIONITERATOR.fields_by_name['leftjoin_source'].containing_oneof = _SAVEDPROJECTIONITERATOR.oneofs_by_name['source']
 _SAVEDINDEXJOINITERATOR_MUCENTRY.containing_type = _SAVEDINDEXJOINITERATOR
 _SAVEDINDEXJOINITERATOR.fields_by_name['scan_source'].message_type = _SAVEDSCANITERATOR
 _SAVEDINDEXJOINITERATOR.fields_by_name['join_source'].message_type = _SAVEDINDEXJOINITERATOR
 _SAVEDINDEXJOINITERATOR.fields_by_name['filter_source'].message_type = _SAVEDFILTERITERATOR
 _SAVEDINDEXJOINITERATOR.fields_by_name['bind_source'].message_type = _SAVEDBINDITERATOR
+_SAVEDINDEXJOINITERATOR.fields_by_name['bindjoin_source'].message_type = _SAVEDBINDJOINITERATOR
+_SAVEDINDEXJOINITERATOR.fields_by_name['hashjoin_source'].message_type = _SAVEDHASHJOINITERATOR
+_SAVEDINDEXJOINITERATOR.fields_by_name['mergejoin_source'].message_type = _SAVEDMERGEJOINITERATOR
+_SAVEDINDEXJOINITERATOR.fields_by_name['leapfrog_source'].message_type = _SAVEDLEAPFROGJOINITERATOR
+_SAVEDINDEXJOINITERATOR.fields_by_name['starjoin_source'].message_type = _SAVEDSTARJOINITERATOR
+_SAVEDINDEXJOINITERATOR.fields_by_name['empty_source'].message_type = _SAVEDEMPTYITERATOR
+_SAVEDINDEXJOINITERATOR.fields_by_name['leftjoin_source'].message_type = _SAVEDLEFTINDEXJOINITERATOR
 _SAVEDINDEXJOINITERATOR.fields_by_name['inner'].message_type = _TRIPLEPATTERN
 _SAVEDINDEXJOINITERATOR.fields_by_name['muc'].message_type = _SAVEDINDEXJOINITERATOR_MUCENTRY
 _SAVEDINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
@@ -1050,18 +2584,253 @@ _SAVEDINDEXJOINITERATOR.fields_by_name['filter_source'].containing_oneof = _SAVE
 _SAVEDINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
   _SAVEDINDEXJOINITERATOR.fields_by_name['bind_source'])
 _SAVEDINDEXJOINITERATOR.fields_by_name['bind_source'].containing_oneof = _SAVEDINDEXJOINITERATOR.oneofs_by_name['source']
+_SAVEDINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDINDEXJOINITERATOR.fields_by_name['bindjoin_source'])
+_SAVEDINDEXJOINITERATOR.fields_by_name['bindjoin_source'].containing_oneof = _SAVEDINDEXJOINITERATOR.oneofs_by_name['source']
+_SAVEDINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDINDEXJOINITERATOR.fields_by_name['hashjoin_source'])
+_SAVEDINDEXJOINITERATOR.fields_by_name['hashjoin_source'].containing_oneof = _SAVEDINDEXJOINITERATOR.oneofs_by_name['source']
+_SAVEDINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDINDEXJOINITERATOR.fields_by_name['mergejoin_source'])
+_SAVEDINDEXJOINITERATOR.fields_by_name['mergejoin_source'].containing_oneof = _SAVEDINDEXJOINITERATOR.oneofs_by_name['source']
+_SAVEDINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDINDEXJOINITERATOR.fields_by_name['leapfrog_source'])
+_SAVEDINDEXJOINITERATOR.fields_by_name['leapfrog_source'].containing_oneof = _SAVEDINDEXJOINITERATOR.oneofs_by_name['source']
+_SAVEDINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDINDEXJOINITERATOR.fields_by_name['starjoin_source'])
+_SAVEDINDEXJOINITERATOR.fields_by_name['starjoin_source'].containing_oneof = _SAVEDINDEXJOINITERATOR.oneofs_by_name['source']
+_SAVEDINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDINDEXJOINITERATOR.fields_by_name['empty_source'])
+_SAVEDINDEXJOINITERATOR.fields_by_name['empty_source'].containing_oneof = _SAVEDINDEXJOINITERATOR.oneofs_by_name['source']
+_SAVEDINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDINDEXJOINITERATOR.fields_by_name['leftjoin_source'])
+_SAVEDINDEXJOINITERATOR.fields_by_name['leftjoin_source'].containing_oneof = _SAVEDINDEXJOINITERATOR.oneofs_by_name['source']
+_SAVEDLEFTINDEXJOINITERATOR_MUCENTRY.containing_type = _SAVEDLEFTINDEXJOINITERATOR
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['scan_source'].message_type = _SAVEDSCANITERATOR
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['join_source'].message_type = _SAVEDINDEXJOINITERATOR
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['filter_source'].message_type = _SAVEDFILTERITERATOR
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['bind_source'].message_type = _SAVEDBINDITERATOR
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['bindjoin_source'].message_type = _SAVEDBINDJOINITERATOR
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['hashjoin_source'].message_type = _SAVEDHASHJOINITERATOR
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['mergejoin_source'].message_type = _SAVEDMERGEJOINITERATOR
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['leapfrog_source'].message_type = _SAVEDLEAPFROGJOINITERATOR
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['starjoin_source'].message_type = _SAVEDSTARJOINITERATOR
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['empty_source'].message_type = _SAVEDEMPTYITERATOR
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['leftjoin_source'].message_type = _SAVEDLEFTINDEXJOINITERATOR
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['union_source'].message_type = _SAVEDBAGUNIONITERATOR
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['inner'].message_type = _TRIPLEPATTERN
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['muc'].message_type = _SAVEDLEFTINDEXJOINITERATOR_MUCENTRY
+_SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDLEFTINDEXJOINITERATOR.fields_by_name['scan_source'])
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['scan_source'].containing_oneof = _SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source']
+_SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDLEFTINDEXJOINITERATOR.fields_by_name['join_source'])
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['join_source'].containing_oneof = _SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source']
+_SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDLEFTINDEXJOINITERATOR.fields_by_name['filter_source'])
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['filter_source'].containing_oneof = _SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source']
+_SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDLEFTINDEXJOINITERATOR.fields_by_name['bind_source'])
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['bind_source'].containing_oneof = _SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source']
+_SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDLEFTINDEXJOINITERATOR.fields_by_name['bindjoin_source'])
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['bindjoin_source'].containing_oneof = _SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source']
+_SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDLEFTINDEXJOINITERATOR.fields_by_name['hashjoin_source'])
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['hashjoin_source'].containing_oneof = _SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source']
+_SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDLEFTINDEXJOINITERATOR.fields_by_name['mergejoin_source'])
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['mergejoin_source'].containing_oneof = _SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source']
+_SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDLEFTINDEXJOINITERATOR.fields_by_name['leapfrog_source'])
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['leapfrog_source'].containing_oneof = _SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source']
+_SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDLEFTINDEXJOINITERATOR.fields_by_name['starjoin_source'])
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['starjoin_source'].containing_oneof = _SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source']
+_SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDLEFTINDEXJOINITERATOR.fields_by_name['empty_source'])
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['empty_source'].containing_oneof = _SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source']
+_SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDLEFTINDEXJOINITERATOR.fields_by_name['leftjoin_source'])
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['leftjoin_source'].containing_oneof = _SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source']
+_SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDLEFTINDEXJOINITERATOR.fields_by_name['union_source'])
+_SAVEDLEFTINDEXJOINITERATOR.fields_by_name['union_source'].containing_oneof = _SAVEDLEFTINDEXJOINITERATOR.oneofs_by_name['source']
+_SOLUTIONMAPPINGS_MUENTRY.containing_type = _SOLUTIONMAPPINGS
+_SOLUTIONMAPPINGS.fields_by_name['mu'].message_type = _SOLUTIONMAPPINGS_MUENTRY
+_SAVEDBINDJOINITERATOR.fields_by_name['scan_source'].message_type = _SAVEDSCANITERATOR
+_SAVEDBINDJOINITERATOR.fields_by_name['join_source'].message_type = _SAVEDINDEXJOINITERATOR
+_SAVEDBINDJOINITERATOR.fields_by_name['filter_source'].message_type = _SAVEDFILTERITERATOR
+_SAVEDBINDJOINITERATOR.fields_by_name['bind_source'].message_type = _SAVEDBINDITERATOR
+_SAVEDBINDJOINITERATOR.fields_by_name['bindjoin_source'].message_type = _SAVEDBINDJOINITERATOR
+_SAVEDBINDJOINITERATOR.fields_by_name['hashjoin_source'].message_type = _SAVEDHASHJOINITERATOR
+_SAVEDBINDJOINITERATOR.fields_by_name['mergejoin_source'].message_type = _SAVEDMERGEJOINITERATOR
+_SAVEDBINDJOINITERATOR.fields_by_name['leapfrog_source'].message_type = _SAVEDLEAPFROGJOINITERATOR
+_SAVEDBINDJOINITERATOR.fields_by_name['starjoin_source'].message_type = _SAVEDSTARJOINITERATOR
+_SAVEDBINDJOINITERATOR.fields_by_name['empty_source'].message_type = _SAVEDEMPTYITERATOR
+_SAVEDBINDJOINITERATOR.fields_by_name['leftjoin_source'].message_type = _SAVEDLEFTINDEXJOINITERATOR
+_SAVEDBINDJOINITERATOR.fields_by_name['inner'].message_type = _TRIPLEPATTERN
+_SAVEDBINDJOINITERATOR.fields_by_name['block'].message_type = _SOLUTIONMAPPINGS
+_SAVEDBINDJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDBINDJOINITERATOR.fields_by_name['scan_source'])
+_SAVEDBINDJOINITERATOR.fields_by_name['scan_source'].containing_oneof = _SAVEDBINDJOINITERATOR.oneofs_by_name['source']
+_SAVEDBINDJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDBINDJOINITERATOR.fields_by_name['join_source'])
+_SAVEDBINDJOINITERATOR.fields_by_name['join_source'].containing_oneof = _SAVEDBINDJOINITERATOR.oneofs_by_name['source']
+_SAVEDBINDJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDBINDJOINITERATOR.fields_by_name['filter_source'])
+_SAVEDBINDJOINITERATOR.fields_by_name['filter_source'].containing_oneof = _SAVEDBINDJOINITERATOR.oneofs_by_name['source']
+_SAVEDBINDJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDBINDJOINITERATOR.fields_by_name['bind_source'])
+_SAVEDBINDJOINITERATOR.fields_by_name['bind_source'].containing_oneof = _SAVEDBINDJOINITERATOR.oneofs_by_name['source']
+_SAVEDBINDJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDBINDJOINITERATOR.fields_by_name['bindjoin_source'])
+_SAVEDBINDJOINITERATOR.fields_by_name['bindjoin_source'].containing_oneof = _SAVEDBINDJOINITERATOR.oneofs_by_name['source']
+_SAVEDBINDJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDBINDJOINITERATOR.fields_by_name['hashjoin_source'])
+_SAVEDBINDJOINITERATOR.fields_by_name['hashjoin_source'].containing_oneof = _SAVEDBINDJOINITERATOR.oneofs_by_name['source']
+_SAVEDBINDJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDBINDJOINITERATOR.fields_by_name['mergejoin_source'])
+_SAVEDBINDJOINITERATOR.fields_by_name['mergejoin_source'].containing_oneof = _SAVEDBINDJOINITERATOR.oneofs_by_name['source']
+_SAVEDBINDJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDBINDJOINITERATOR.fields_by_name['leapfrog_source'])
+_SAVEDBINDJOINITERATOR.fields_by_name['leapfrog_source'].containing_oneof = _SAVEDBINDJOINITERATOR.oneofs_by_name['source']
+_SAVEDBINDJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDBINDJOINITERATOR.fields_by_name['starjoin_source'])
+_SAVEDBINDJOINITERATOR.fields_by_name['starjoin_source'].containing_oneof = _SAVEDBINDJOINITERATOR.oneofs_by_name['source']
+_SAVEDBINDJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDBINDJOINITERATOR.fields_by_name['empty_source'])
+_SAVEDBINDJOINITERATOR.fields_by_name['empty_source'].containing_oneof = _SAVEDBINDJOINITERATOR.oneofs_by_name['source']
+_SAVEDBINDJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDBINDJOINITERATOR.fields_by_name['leftjoin_source'])
+_SAVEDBINDJOINITERATOR.fields_by_name['leftjoin_source'].containing_oneof = _SAVEDBINDJOINITERATOR.oneofs_by_name['source']
+_SAVEDHASHJOINITERATOR_MUCENTRY.containing_type = _SAVEDHASHJOINITERATOR
+_SAVEDHASHJOINITERATOR.fields_by_name['scan_source'].message_type = _SAVEDSCANITERATOR
+_SAVEDHASHJOINITERATOR.fields_by_name['join_source'].message_type = _SAVEDINDEXJOINITERATOR
+_SAVEDHASHJOINITERATOR.fields_by_name['filter_source'].message_type = _SAVEDFILTERITERATOR
+_SAVEDHASHJOINITERATOR.fields_by_name['bind_source'].message_type = _SAVEDBINDITERATOR
+_SAVEDHASHJOINITERATOR.fields_by_name['bindjoin_source'].message_type = _SAVEDBINDJOINITERATOR
+_SAVEDHASHJOINITERATOR.fields_by_name['hashjoin_source'].message_type = _SAVEDHASHJOINITERATOR
+_SAVEDHASHJOINITERATOR.fields_by_name['mergejoin_source'].message_type = _SAVEDMERGEJOINITERATOR
+_SAVEDHASHJOINITERATOR.fields_by_name['leapfrog_source'].message_type = _SAVEDLEAPFROGJOINITERATOR
+_SAVEDHASHJOINITERATOR.fields_by_name['starjoin_source'].message_type = _SAVEDSTARJOINITERATOR
+_SAVEDHASHJOINITERATOR.fields_by_name['leftjoin_source'].message_type = _SAVEDLEFTINDEXJOINITERATOR
+_SAVEDHASHJOINITERATOR.fields_by_name['inner'].message_type = _TRIPLEPATTERN
+_SAVEDHASHJOINITERATOR.fields_by_name['muc'].message_type = _SAVEDHASHJOINITERATOR_MUCENTRY
+_SAVEDHASHJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDHASHJOINITERATOR.fields_by_name['scan_source'])
+_SAVEDHASHJOINITERATOR.fields_by_name['scan_source'].containing_oneof = _SAVEDHASHJOINITERATOR.oneofs_by_name['source']
+_SAVEDHASHJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDHASHJOINITERATOR.fields_by_name['join_source'])
+_SAVEDHASHJOINITERATOR.fields_by_name['join_source'].containing_oneof = _SAVEDHASHJOINITERATOR.oneofs_by_name['source']
+_SAVEDHASHJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDHASHJOINITERATOR.fields_by_name['filter_source'])
+_SAVEDHASHJOINITERATOR.fields_by_name['filter_source'].containing_oneof = _SAVEDHASHJOINITERATOR.oneofs_by_name['source']
+_SAVEDHASHJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDHASHJOINITERATOR.fields_by_name['bind_source'])
+_SAVEDHASHJOINITERATOR.fields_by_name['bind_source'].containing_oneof = _SAVEDHASHJOINITERATOR.oneofs_by_name['source']
+_SAVEDHASHJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDHASHJOINITERATOR.fields_by_name['bindjoin_source'])
+_SAVEDHASHJOINITERATOR.fields_by_name['bindjoin_source'].containing_oneof = _SAVEDHASHJOINITERATOR.oneofs_by_name['source']
+_SAVEDHASHJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDHASHJOINITERATOR.fields_by_name['hashjoin_source'])
+_SAVEDHASHJOINITERATOR.fields_by_name['hashjoin_source'].containing_oneof = _SAVEDHASHJOINITERATOR.oneofs_by_name['source']
+_SAVEDHASHJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDHASHJOINITERATOR.fields_by_name['mergejoin_source'])
+_SAVEDHASHJOINITERATOR.fields_by_name['mergejoin_source'].containing_oneof = _SAVEDHASHJOINITERATOR.oneofs_by_name['source']
+_SAVEDHASHJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDHASHJOINITERATOR.fields_by_name['leapfrog_source'])
+_SAVEDHASHJOINITERATOR.fields_by_name['leapfrog_source'].containing_oneof = _SAVEDHASHJOINITERATOR.oneofs_by_name['source']
+_SAVEDHASHJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDHASHJOINITERATOR.fields_by_name['starjoin_source'])
+_SAVEDHASHJOINITERATOR.fields_by_name['starjoin_source'].containing_oneof = _SAVEDHASHJOINITERATOR.oneofs_by_name['source']
+_SAVEDHASHJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDHASHJOINITERATOR.fields_by_name['leftjoin_source'])
+_SAVEDHASHJOINITERATOR.fields_by_name['leftjoin_source'].containing_oneof = _SAVEDHASHJOINITERATOR.oneofs_by_name['source']
+_SAVEDMERGEJOINITERATOR_LEFTHEADENTRY.containing_type = _SAVEDMERGEJOINITERATOR
+_SAVEDMERGEJOINITERATOR_RIGHTHEADENTRY.containing_type = _SAVEDMERGEJOINITERATOR
+_SAVEDMERGEJOINITERATOR.fields_by_name['scan_left'].message_type = _SAVEDSCANITERATOR
+_SAVEDMERGEJOINITERATOR.fields_by_name['mergejoin_left'].message_type = _SAVEDMERGEJOINITERATOR
+_SAVEDMERGEJOINITERATOR.fields_by_name['right'].message_type = _SAVEDSCANITERATOR
+_SAVEDMERGEJOINITERATOR.fields_by_name['left_head'].message_type = _SAVEDMERGEJOINITERATOR_LEFTHEADENTRY
+_SAVEDMERGEJOINITERATOR.fields_by_name['right_head'].message_type = _SAVEDMERGEJOINITERATOR_RIGHTHEADENTRY
+_SAVEDMERGEJOINITERATOR.fields_by_name['left_group'].message_type = _SOLUTIONMAPPINGS
+_SAVEDMERGEJOINITERATOR.fields_by_name['right_group'].message_type = _SOLUTIONMAPPINGS
+_SAVEDMERGEJOINITERATOR.oneofs_by_name['left'].fields.append(
+  _SAVEDMERGEJOINITERATOR.fields_by_name['scan_left'])
+_SAVEDMERGEJOINITERATOR.fields_by_name['scan_left'].containing_oneof = _SAVEDMERGEJOINITERATOR.oneofs_by_name['left']
+_SAVEDMERGEJOINITERATOR.oneofs_by_name['left'].fields.append(
+  _SAVEDMERGEJOINITERATOR.fields_by_name['mergejoin_left'])
+_SAVEDMERGEJOINITERATOR.fields_by_name['mergejoin_left'].containing_oneof = _SAVEDMERGEJOINITERATOR.oneofs_by_name['left']
+_SAVEDSTARJOINITERATOR_MUCENTRY.containing_type = _SAVEDSTARJOINITERATOR
+_SAVEDSTARJOINITERATOR.fields_by_name['scan_source'].message_type = _SAVEDSCANITERATOR
+_SAVEDSTARJOINITERATOR.fields_by_name['join_source'].message_type = _SAVEDINDEXJOINITERATOR
+_SAVEDSTARJOINITERATOR.fields_by_name['filter_source'].message_type = _SAVEDFILTERITERATOR
+_SAVEDSTARJOINITERATOR.fields_by_name['bind_source'].message_type = _SAVEDBINDITERATOR
+_SAVEDSTARJOINITERATOR.fields_by_name['bindjoin_source'].message_type = _SAVEDBINDJOINITERATOR
+_SAVEDSTARJOINITERATOR.fields_by_name['hashjoin_source'].message_type = _SAVEDHASHJOINITERATOR
+_SAVEDSTARJOINITERATOR.fields_by_name['mergejoin_source'].message_type = _SAVEDMERGEJOINITERATOR
+_SAVEDSTARJOINITERATOR.fields_by_name['leapfrog_source'].message_type = _SAVEDLEAPFROGJOINITERATOR
+_SAVEDSTARJOINITERATOR.fields_by_name['starjoin_source'].message_type = _SAVEDSTARJOINITERATOR
+_SAVEDSTARJOINITERATOR.fields_by_name['leftjoin_source'].message_type = _SAVEDLEFTINDEXJOINITERATOR
+_SAVEDSTARJOINITERATOR.fields_by_name['star'].message_type = _TRIPLEPATTERN
+_SAVEDSTARJOINITERATOR.fields_by_name['muc'].message_type = _SAVEDSTARJOINITERATOR_MUCENTRY
+_SAVEDSTARJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDSTARJOINITERATOR.fields_by_name['scan_source'])
+_SAVEDSTARJOINITERATOR.fields_by_name['scan_source'].containing_oneof = _SAVEDSTARJOINITERATOR.oneofs_by_name['source']
+_SAVEDSTARJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDSTARJOINITERATOR.fields_by_name['join_source'])
+_SAVEDSTARJOINITERATOR.fields_by_name['join_source'].containing_oneof = _SAVEDSTARJOINITERATOR.oneofs_by_name['source']
+_SAVEDSTARJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDSTARJOINITERATOR.fields_by_name['filter_source'])
+_SAVEDSTARJOINITERATOR.fields_by_name['filter_source'].containing_oneof = _SAVEDSTARJOINITERATOR.oneofs_by_name['source']
+_SAVEDSTARJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDSTARJOINITERATOR.fields_by_name['bind_source'])
+_SAVEDSTARJOINITERATOR.fields_by_name['bind_source'].containing_oneof = _SAVEDSTARJOINITERATOR.oneofs_by_name['source']
+_SAVEDSTARJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDSTARJOINITERATOR.fields_by_name['bindjoin_source'])
+_SAVEDSTARJOINITERATOR.fields_by_name['bindjoin_source'].containing_oneof = _SAVEDSTARJOINITERATOR.oneofs_by_name['source']
+_SAVEDSTARJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDSTARJOINITERATOR.fields_by_name['hashjoin_source'])
+_SAVEDSTARJOINITERATOR.fields_by_name['hashjoin_source'].containing_oneof = _SAVEDSTARJOINITERATOR.oneofs_by_name['source']
+_SAVEDSTARJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDSTARJOINITERATOR.fields_by_name['mergejoin_source'])
+_SAVEDSTARJOINITERATOR.fields_by_name['mergejoin_source'].containing_oneof = _SAVEDSTARJOINITERATOR.oneofs_by_name['source']
+_SAVEDSTARJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDSTARJOINITERATOR.fields_by_name['leapfrog_source'])
+_SAVEDSTARJOINITERATOR.fields_by_name['leapfrog_source'].containing_oneof = _SAVEDSTARJOINITERATOR.oneofs_by_name['source']
+_SAVEDSTARJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDSTARJOINITERATOR.fields_by_name['starjoin_source'])
+_SAVEDSTARJOINITERATOR.fields_by_name['starjoin_source'].containing_oneof = _SAVEDSTARJOINITERATOR.oneofs_by_name['source']
+_SAVEDSTARJOINITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDSTARJOINITERATOR.fields_by_name['leftjoin_source'])
+_SAVEDSTARJOINITERATOR.fields_by_name['leftjoin_source'].containing_oneof = _SAVEDSTARJOINITERATOR.oneofs_by_name['source']
+_SAVEDLEAPFROGJOINITERATOR.fields_by_name['patterns'].message_type = _TRIPLEPATTERN
+_SAVEDLEAPFROGJOINITERATOR.fields_by_name['cursors'].message_type = _LEAPFROGCURSOR
 _SAVEDBAGUNIONITERATOR.fields_by_name['scan_left'].message_type = _SAVEDSCANITERATOR
 _SAVEDBAGUNIONITERATOR.fields_by_name['proj_left'].message_type = _SAVEDPROJECTIONITERATOR
 _SAVEDBAGUNIONITERATOR.fields_by_name['union_left'].message_type = _SAVEDBAGUNIONITERATOR
 _SAVEDBAGUNIONITERATOR.fields_by_name['join_left'].message_type = _SAVEDINDEXJOINITERATOR
 _SAVEDBAGUNIONITERATOR.fields_by_name['filter_left'].message_type = _SAVEDFILTERITERATOR
 _SAVEDBAGUNIONITERATOR.fields_by_name['bind_source_left'].message_type = _SAVEDBINDITERATOR
+_SAVEDBAGUNIONITERATOR.fields_by_name['bindjoin_left'].message_type = _SAVEDBINDJOINITERATOR
+_SAVEDBAGUNIONITERATOR.fields_by_name['hashjoin_left'].message_type = _SAVEDHASHJOINITERATOR
+_SAVEDBAGUNIONITERATOR.fields_by_name['mergejoin_left'].message_type = _SAVEDMERGEJOINITERATOR
+_SAVEDBAGUNIONITERATOR.fields_by_name['leapfrog_left'].message_type = _SAVEDLEAPFROGJOINITERATOR
+_SAVEDBAGUNIONITERATOR.fields_by_name['starjoin_left'].message_type = _SAVEDSTARJOINITERATOR
+_SAVEDBAGUNIONITERATOR.fields_by_name['leftjoin_left'].message_type = _SAVEDLEFTINDEXJOINITERATOR
 _SAVEDBAGUNIONITERATOR.fields_by_name['scan_right'].message_type = _SAVEDSCANITERATOR
 _SAVEDBAGUNIONITERATOR.fields_by_name['proj_right'].message_type = _SAVEDPROJECTIONITERATOR
 _SAVEDBAGUNIONITERATOR.fields_by_name['union_right'].message_type = _SAVEDBAGUNIONITERATOR
 _SAVEDBAGUNIONITERATOR.fields_by_name['join_right'].message_type = _SAVEDINDEXJOINITERATOR
 _SAVEDBAGUNIONITERATOR.fields_by_name['filter_right'].message_type = _SAVEDFILTERITERATOR
 _SAVEDBAGUNIONITERATOR.fields_by_name['bind_source_right'].message_type = _SAVEDBINDITERATOR
+_SAVEDBAGUNIONITERATOR.fields_by_name['bindjoin_right'].message_type = _SAVEDBINDJOINITERATOR
+_SAVEDBAGUNIONITERATOR.fields_by_name['hashjoin_right'].message_type = _SAVEDHASHJOINITERATOR
+_SAVEDBAGUNIONITERATOR.fields_by_name['mergejoin_right'].message_type = _SAVEDMERGEJOINITERATOR
+_SAVEDBAGUNIONITERATOR.fields_by_name['leapfrog_right'].message_type = _SAVEDLEAPFROGJOINITERATOR
+_SAVEDBAGUNIONITERATOR.fields_by_name['starjoin_right'].message_type = _SAVEDSTARJOINITERATOR
+_SAVEDBAGUNIONITERATOR.fields_by_name['leftjoin_right'].message_type = _SAVEDLEFTINDEXJOINITERATOR
 _SAVEDBAGUNIONITERATOR.oneofs_by_name['left'].fields.append(
   _SAVEDBAGUNIONITERATOR.fields_by_name['scan_left'])
 _SAVEDBAGUNIONITERATOR.fields_by_name['scan_left'].containing_oneof = _SAVEDBAGUNIONITERATOR.oneofs_by_name['left']
@@ -1080,6 +2849,24 @@ _SAVEDBAGUNIONITERATOR.fields_by_name['filter_left'].containing_oneof = _SAVEDBA
 _SAVEDBAGUNIONITERATOR.oneofs_by_name['left'].fields.append(
   _SAVEDBAGUNIONITERATOR.fields_by_name['bind_source_left'])
 _SAVEDBAGUNIONITERATOR.fields_by_name['bind_source_left'].containing_oneof = _SAVEDBAGUNIONITERATOR.oneofs_by_name['left']
+_SAVEDBAGUNIONITERATOR.oneofs_by_name['left'].fields.append(
+  _SAVEDBAGUNIONITERATOR.fields_by_name['bindjoin_left'])
+_SAVEDBAGUNIONITERATOR.fields_by_name['bindjoin_left'].containing_oneof = _SAVEDBAGUNIONITERATOR.oneofs_by_name['left']
+_SAVEDBAGUNIONITERATOR.oneofs_by_name['left'].fields.append(
+  _SAVEDBAGUNIONITERATOR.fields_by_name['hashjoin_left'])
+_SAVEDBAGUNIONITERATOR.fields_by_name['hashjoin_left'].containing_oneof = _SAVEDBAGUNIONITERATOR.oneofs_by_name['left']
+_SAVEDBAGUNIONITERATOR.oneofs_by_name['left'].fields.append(
+  _SAVEDBAGUNIONITERATOR.fields_by_name['mergejoin_left'])
+_SAVEDBAGUNIONITERATOR.fields_by_name['mergejoin_left'].containing_oneof = _SAVEDBAGUNIONITERATOR.oneofs_by_name['left']
+_SAVEDBAGUNIONITERATOR.oneofs_by_name['left'].fields.append(
+  _SAVEDBAGUNIONITERATOR.fields_by_name['leapfrog_left'])
+_SAVEDBAGUNIONITERATOR.fields_by_name['leapfrog_left'].containing_oneof = _SAVEDBAGUNIONITERATOR.oneofs_by_name['left']
+_SAVEDBAGUNIONITERATOR.oneofs_by_name['left'].fields.append(
+  _SAVEDBAGUNIONITERATOR.fields_by_name['starjoin_left'])
+_SAVEDBAGUNIONITERATOR.fields_by_name['starjoin_left'].containing_oneof = _SAVEDBAGUNIONITERATOR.oneofs_by_name['left']
+_SAVEDBAGUNIONITERATOR.oneofs_by_name['left'].fields.append(
+  _SAVEDBAGUNIONITERATOR.fields_by_name['leftjoin_left'])
+_SAVEDBAGUNIONITERATOR.fields_by_name['leftjoin_left'].containing_oneof = _SAVEDBAGUNIONITERATOR.oneofs_by_name['left']
 _SAVEDBAGUNIONITERATOR.oneofs_by_name['right'].fields.append(
   _SAVEDBAGUNIONITERATOR.fields_by_name['scan_right'])
 _SAVEDBAGUNIONITERATOR.fields_by_name['scan_right'].containing_oneof = _SAVEDBAGUNIONITERATOR.oneofs_by_name['right']
@@ -1098,12 +2885,37 @@ _SAVEDBAGUNIONITERATOR.fields_by_name['filter_right'].containing_oneof = _SAVEDB
 _SAVEDBAGUNIONITERATOR.oneofs_by_name['right'].fields.append(
   _SAVEDBAGUNIONITERATOR.fields_by_name['bind_source_right'])
 _SAVEDBAGUNIONITERATOR.fields_by_name['bind_source_right'].containing_oneof = _SAVEDBAGUNIONITERATOR.oneofs_by_name['right']
+_SAVEDBAGUNIONITERATOR.oneofs_by_name['right'].fields.append(
+  _SAVEDBAGUNIONITERATOR.fields_by_name['bindjoin_right'])
+_SAVEDBAGUNIONITERATOR.fields_by_name['bindjoin_right'].containing_oneof = _SAVEDBAGUNIONITERATOR.oneofs_by_name['right']
+_SAVEDBAGUNIONITERATOR.oneofs_by_name['right'].fields.append(
+  _SAVEDBAGUNIONITERATOR.fields_by_name['hashjoin_right'])
+_SAVEDBAGUNIONITERATOR.fields_by_name['hashjoin_right'].containing_oneof = _SAVEDBAGUNIONITERATOR.oneofs_by_name['right']
+_SAVEDBAGUNIONITERATOR.oneofs_by_name['right'].fields.append(
+  _SAVEDBAGUNIONITERATOR.fields_by_name['mergejoin_right'])
+_SAVEDBAGUNIONITERATOR.fields_by_name['mergejoin_right'].containing_oneof = _SAVEDBAGUNIONITERATOR.oneofs_by_name['right']
+_SAVEDBAGUNIONITERATOR.oneofs_by_name['right'].fields.append(
+  _SAVEDBAGUNIONITERATOR.fields_by_name['leapfrog_right'])
+_SAVEDBAGUNIONITERATOR.fields_by_name['leapfrog_right'].containing_oneof = _SAVEDBAGUNIONITERATOR.oneofs_by_name['right']
+_SAVEDBAGUNIONITERATOR.oneofs_by_name['right'].fields.append(
+  _SAVEDBAGUNIONITERATOR.fields_by_name['starjoin_right'])
+_SAVEDBAGUNIONITERATOR.fields_by_name['starjoin_right'].containing_oneof = _SAVEDBAGUNIONITERATOR.oneofs_by_name['right']
+_SAVEDBAGUNIONITERATOR.oneofs_by_name['right'].fields.append(
+  _SAVEDBAGUNIONITERATOR.fields_by_name['leftjoin_right'])
+_SAVEDBAGUNIONITERATOR.fields_by_name['leftjoin_right'].containing_oneof = _SAVEDBAGUNIONITERATOR.oneofs_by_name['right']
 _SAVEDFILTERITERATOR_MUENTRY.containing_type = _SAVEDFILTERITERATOR
 _SAVEDFILTERITERATOR.fields_by_name['scan_source'].message_type = _SAVEDSCANITERATOR
 _SAVEDFILTERITERATOR.fields_by_name['proj_source'].message_type = _SAVEDPROJECTIONITERATOR
 _SAVEDFILTERITERATOR.fields_by_name['filter_source'].message_type = _SAVEDFILTERITERATOR
 _SAVEDFILTERITERATOR.fields_by_name['join_source'].message_type = _SAVEDINDEXJOINITERATOR
 _SAVEDFILTERITERATOR.fields_by_name['bind_source'].message_type = _SAVEDBINDITERATOR
+_SAVEDFILTERITERATOR.fields_by_name['bindjoin_source'].message_type = _SAVEDBINDJOINITERATOR
+_SAVEDFILTERITERATOR.fields_by_name['hashjoin_source'].message_type = _SAVEDHASHJOINITERATOR
+_SAVEDFILTERITERATOR.fields_by_name['mergejoin_source'].message_type = _SAVEDMERGEJOINITERATOR
+_SAVEDFILTERITERATOR.fields_by_name['leapfrog_source'].message_type = _SAVEDLEAPFROGJOINITERATOR
+_SAVEDFILTERITERATOR.fields_by_name['starjoin_source'].message_type = _SAVEDSTARJOINITERATOR
+_SAVEDFILTERITERATOR.fields_by_name['union_source'].message_type = _SAVEDBAGUNIONITERATOR
+_SAVEDFILTERITERATOR.fields_by_name['leftjoin_source'].message_type = _SAVEDLEFTINDEXJOINITERATOR
 _SAVEDFILTERITERATOR.fields_by_name['mu'].message_type = _SAVEDFILTERITERATOR_MUENTRY
 _SAVEDFILTERITERATOR.oneofs_by_name['source'].fields.append(
   _SAVEDFILTERITERATOR.fields_by_name['scan_source'])
@@ -1120,12 +2932,40 @@ _SAVEDFILTERITERATOR.fields_by_name['join_source'].containing_oneof = _SAVEDFILT
 _SAVEDFILTERITERATOR.oneofs_by_name['source'].fields.append(
   _SAVEDFILTERITERATOR.fields_by_name['bind_source'])
 _SAVEDFILTERITERATOR.fields_by_name['bind_source'].containing_oneof = _SAVEDFILTERITERATOR.oneofs_by_name['source']
+_SAVEDFILTERITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDFILTERITERATOR.fields_by_name['bindjoin_source'])
+_SAVEDFILTERITERATOR.fields_by_name['bindjoin_source'].containing_oneof = _SAVEDFILTERITERATOR.oneofs_by_name['source']
+_SAVEDFILTERITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDFILTERITERATOR.fields_by_name['hashjoin_source'])
+_SAVEDFILTERITERATOR.fields_by_name['hashjoin_source'].containing_oneof = _SAVEDFILTERITERATOR.oneofs_by_name['source']
+_SAVEDFILTERITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDFILTERITERATOR.fields_by_name['mergejoin_source'])
+_SAVEDFILTERITERATOR.fields_by_name['mergejoin_source'].containing_oneof = _SAVEDFILTERITERATOR.oneofs_by_name['source']
+_SAVEDFILTERITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDFILTERITERATOR.fields_by_name['leapfrog_source'])
+_SAVEDFILTERITERATOR.fields_by_name['leapfrog_source'].containing_oneof = _SAVEDFILTERITERATOR.oneofs_by_name['source']
+_SAVEDFILTERITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDFILTERITERATOR.fields_by_name['starjoin_source'])
+_SAVEDFILTERITERATOR.fields_by_name['starjoin_source'].containing_oneof = _SAVEDFILTERITERATOR.oneofs_by_name['source']
+_SAVEDFILTERITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDFILTERITERATOR.fields_by_name['union_source'])
+_SAVEDFILTERITERATOR.fields_by_name['union_source'].containing_oneof = _SAVEDFILTERITERATOR.oneofs_by_name['source']
+_SAVEDFILTERITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDFILTERITERATOR.fields_by_name['leftjoin_source'])
+_SAVEDFILTERITERATOR.fields_by_name['leftjoin_source'].containing_oneof = _SAVEDFILTERITERATOR.oneofs_by_name['source']
 _SAVEDBINDITERATOR_MUENTRY.containing_type = _SAVEDBINDITERATOR
 _SAVEDBINDITERATOR.fields_by_name['scan_source'].message_type = _SAVEDSCANITERATOR
 _SAVEDBINDITERATOR.fields_by_name['proj_source'].message_type = _SAVEDPROJECTIONITERATOR
 _SAVEDBINDITERATOR.fields_by_name['filter_source'].message_type = _SAVEDFILTERITERATOR
 _SAVEDBINDITERATOR.fields_by_name['join_source'].message_type = _SAVEDINDEXJOINITERATOR
 _SAVEDBINDITERATOR.fields_by_name['bind_source'].message_type = _SAVEDBINDITERATOR
+_SAVEDBINDITERATOR.fields_by_name['bindjoin_source'].message_type = _SAVEDBINDJOINITERATOR
+_SAVEDBINDITERATOR.fields_by_name['hashjoin_source'].message_type = _SAVEDHASHJOINITERATOR
+_SAVEDBINDITERATOR.fields_by_name['mergejoin_source'].message_type = _SAVEDMERGEJOINITERATOR
+_SAVEDBINDITERATOR.fields_by_name['leapfrog_source'].message_type = _SAVEDLEAPFROGJOINITERATOR
+_SAVEDBINDITERATOR.fields_by_name['starjoin_source'].message_type = _SAVEDSTARJOINITERATOR
+_SAVEDBINDITERATOR.fields_by_name['union_source'].message_type = _SAVEDBAGUNIONITERATOR
+_SAVEDBINDITERATOR.fields_by_name['leftjoin_source'].message_type = _SAVEDLEFTINDEXJOINITERATOR
 _SAVEDBINDITERATOR.fields_by_name['mu'].message_type = _SAVEDBINDITERATOR_MUENTRY
 _SAVEDBINDITERATOR.oneofs_by_name['source'].fields.append(
   _SAVEDBINDITERATOR.fields_by_name['scan_source'])
@@ -1142,12 +2982,39 @@ _SAVEDBINDITERATOR.fields_by_name['join_source'].containing_oneof = _SAVEDBINDIT
 _SAVEDBINDITERATOR.oneofs_by_name['source'].fields.append(
   _SAVEDBINDITERATOR.fields_by_name['bind_source'])
 _SAVEDBINDITERATOR.fields_by_name['bind_source'].containing_oneof = _SAVEDBINDITERATOR.oneofs_by_name['source']
+_SAVEDBINDITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDBINDITERATOR.fields_by_name['bindjoin_source'])
+_SAVEDBINDITERATOR.fields_by_name['bindjoin_source'].containing_oneof = _SAVEDBINDITERATOR.oneofs_by_name['source']
+_SAVEDBINDITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDBINDITERATOR.fields_by_name['hashjoin_source'])
+_SAVEDBINDITERATOR.fields_by_name['hashjoin_source'].containing_oneof = _SAVEDBINDITERATOR.oneofs_by_name['source']
+_SAVEDBINDITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDBINDITERATOR.fields_by_name['mergejoin_source'])
+_SAVEDBINDITERATOR.fields_by_name['mergejoin_source'].containing_oneof = _SAVEDBINDITERATOR.oneofs_by_name['source']
+_SAVEDBINDITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDBINDITERATOR.fields_by_name['leapfrog_source'])
+_SAVEDBINDITERATOR.fields_by_name['leapfrog_source'].containing_oneof = _SAVEDBINDITERATOR.oneofs_by_name['source']
+_SAVEDBINDITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDBINDITERATOR.fields_by_name['starjoin_source'])
+_SAVEDBINDITERATOR.fields_by_name['starjoin_source'].containing_oneof = _SAVEDBINDITERATOR.oneofs_by_name['source']
+_SAVEDBINDITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDBINDITERATOR.fields_by_name['union_source'])
+_SAVEDBINDITERATOR.fields_by_name['union_source'].containing_oneof = _SAVEDBINDITERATOR.oneofs_by_name['source']
+_SAVEDBINDITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDBINDITERATOR.fields_by_name['leftjoin_source'])
+_SAVEDBINDITERATOR.fields_by_name['leftjoin_source'].containing_oneof = _SAVEDBINDITERATOR.oneofs_by_name['source']
 _SAVEDCONSTRUCTITERATOR.fields_by_name['scan_source'].message_type = _SAVEDSCANITERATOR
 _SAVEDCONSTRUCTITERATOR.fields_by_name['proj_source'].message_type = _SAVEDPROJECTIONITERATOR
 _SAVEDCONSTRUCTITERATOR.fields_by_name['join_source'].message_type = _SAVEDINDEXJOINITERATOR
 _SAVEDCONSTRUCTITERATOR.fields_by_name['union_source'].message_type = _SAVEDBAGUNIONITERATOR
 _SAVEDCONSTRUCTITERATOR.fields_by_name['filter_source'].message_type = _SAVEDFILTERITERATOR
 _SAVEDCONSTRUCTITERATOR.fields_by_name['bind_source'].message_type = _SAVEDBINDITERATOR
+_SAVEDCONSTRUCTITERATOR.fields_by_name['bindjoin_source'].message_type = _SAVEDBINDJOINITERATOR
+_SAVEDCONSTRUCTITERATOR.fields_by_name['hashjoin_source'].message_type = _SAVEDHASHJOINITERATOR
+_SAVEDCONSTRUCTITERATOR.fields_by_name['mergejoin_source'].message_type = _SAVEDMERGEJOINITERATOR
+_SAVEDCONSTRUCTITERATOR.fields_by_name['leapfrog_source'].message_type = _SAVEDLEAPFROGJOINITERATOR
+_SAVEDCONSTRUCTITERATOR.fields_by_name['starjoin_source'].message_type = _SAVEDSTARJOINITERATOR
+_SAVEDCONSTRUCTITERATOR.fields_by_name['leftjoin_source'].message_type = _SAVEDLEFTINDEXJOINITERATOR
 _SAVEDCONSTRUCTITERATOR.fields_by_name['template'].message_type = _TRIPLEPATTERN
 _SAVEDCONSTRUCTITERATOR.oneofs_by_name['source'].fields.append(
   _SAVEDCONSTRUCTITERATOR.fields_by_name['scan_source'])
@@ -1167,6 +3034,24 @@ _SAVEDCONSTRUCTITERATOR.fields_by_name['filter_source'].containing_oneof = _SAVE
 _SAVEDCONSTRUCTITERATOR.oneofs_by_name['source'].fields.append(
   _SAVEDCONSTRUCTITERATOR.fields_by_name['bind_source'])
 _SAVEDCONSTRUCTITERATOR.fields_by_name['bind_source'].containing_oneof = _SAVEDCONSTRUCTITERATOR.oneofs_by_name['source']
+_SAVEDCONSTRUCTITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDCONSTRUCTITERATOR.fields_by_name['bindjoin_source'])
+_SAVEDCONSTRUCTITERATOR.fields_by_name['bindjoin_source'].containing_oneof = _SAVEDCONSTRUCTITERATOR.oneofs_by_name['source']
+_SAVEDCONSTRUCTITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDCONSTRUCTITERATOR.fields_by_name['hashjoin_source'])
+_SAVEDCONSTRUCTITERATOR.fields_by_name['hashjoin_source'].containing_oneof = _SAVEDCONSTRUCTITERATOR.oneofs_by_name['source']
+_SAVEDCONSTRUCTITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDCONSTRUCTITERATOR.fields_by_name['mergejoin_source'])
+_SAVEDCONSTRUCTITERATOR.fields_by_name['mergejoin_source'].containing_oneof = _SAVEDCONSTRUCTITERATOR.oneofs_by_name['source']
+_SAVEDCONSTRUCTITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDCONSTRUCTITERATOR.fields_by_name['leapfrog_source'])
+_SAVEDCONSTRUCTITERATOR.fields_by_name['leapfrog_source'].containing_oneof = _SAVEDCONSTRUCTITERATOR.oneofs_by_name['source']
+_SAVEDCONSTRUCTITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDCONSTRUCTITERATOR.fields_by_name['starjoin_source'])
+_SAVEDCONSTRUCTITERATOR.fields_by_name['starjoin_source'].containing_oneof = _SAVEDCONSTRUCTITERATOR.oneofs_by_name['source']
+_SAVEDCONSTRUCTITERATOR.oneofs_by_name['source'].fields.append(
+  _SAVEDCONSTRUCTITERATOR.fields_by_name['leftjoin_source'])
+_SAVEDCONSTRUCTITERATOR.fields_by_name['leftjoin_source'].containing_oneof = _SAVEDCONSTRUCTITERATOR.oneofs_by_name['source']
 _SAVEDINSERTDATA_NBINSERTEDENTRY.containing_type = _SAVEDINSERTDATA
 _SAVEDINSERTDATA.fields_by_name['nb_inserted'].message_type = _SAVEDINSERTDATA_NBINSERTEDENTRY
 _SAVEDDELETEDATA_NBINSERTEDENTRY.containing_type = _SAVEDDELETEDATA
@@ -1181,6 +3066,12 @@ _ROOTTREE.fields_by_name['delete_source'].message_type = _SAVEDDELETEDATA
 _ROOTTREE.fields_by_name['bind_source'].message_type = _SAVEDBINDITERATOR
 _ROOTTREE.fields_by_name['construct_source'].message_type = _SAVEDCONSTRUCTITERATOR
 _ROOTTREE.fields_by_name['reduc_source'].message_type = _SAVEDREDUCEDITERATOR
+_ROOTTREE.fields_by_name['bindjoin_source'].message_type = _SAVEDBINDJOINITERATOR
+_ROOTTREE.fields_by_name['hashjoin_source'].message_type = _SAVEDHASHJOINITERATOR
+_ROOTTREE.fields_by_name['mergejoin_source'].message_type = _SAVEDMERGEJOINITERATOR
+_ROOTTREE.fields_by_name['leapfrog_source'].message_type = _SAVEDLEAPFROGJOINITERATOR
+_ROOTTREE.fields_by_name['starjoin_source'].message_type = _SAVEDSTARJOINITERATOR
+_ROOTTREE.fields_by_name['leftjoin_source'].message_type = _SAVEDLEFTINDEXJOINITERATOR
 _ROOTTREE.oneofs_by_name['source'].fields.append(
   _ROOTTREE.fields_by_name['scan_source'])
 _ROOTTREE.fields_by_name['scan_source'].containing_oneof = _ROOTTREE.oneofs_by_name['source']
@@ -1211,11 +3102,38 @@ _ROOTTREE.fields_by_name['construct_source'].containing_oneof = _ROOTTREE.oneofs
 _ROOTTREE.oneofs_by_name['source'].fields.append(
   _ROOTTREE.fields_by_name['reduc_source'])
 _ROOTTREE.fields_by_name['reduc_source'].containing_oneof = _ROOTTREE.oneofs_by_name['source']
+_ROOTTREE.oneofs_by_name['source'].fields.append(
+  _ROOTTREE.fields_by_name['bindjoin_source'])
+_ROOTTREE.fields_by_name['bindjoin_source'].containing_oneof = _ROOTTREE.oneofs_by_name['source']
+_ROOTTREE.oneofs_by_name['source'].fields.append(
+  _ROOTTREE.fields_by_name['hashjoin_source'])
+_ROOTTREE.fields_by_name['hashjoin_source'].containing_oneof = _ROOTTREE.oneofs_by_name['source']
+_ROOTTREE.oneofs_by_name['source'].fields.append(
+  _ROOTTREE.fields_by_name['mergejoin_source'])
+_ROOTTREE.fields_by_name['mergejoin_source'].containing_oneof = _ROOTTREE.oneofs_by_name['source']
+_ROOTTREE.oneofs_by_name['source'].fields.append(
+  _ROOTTREE.fields_by_name['leapfrog_source'])
+_ROOTTREE.fields_by_name['leapfrog_source'].containing_oneof = _ROOTTREE.oneofs_by_name['source']
+_ROOTTREE.oneofs_by_name['source'].fields.append(
+  _ROOTTREE.fields_by_name['starjoin_source'])
+_ROOTTREE.fields_by_name['starjoin_source'].containing_oneof = _ROOTTREE.oneofs_by_name['source']
+_ROOTTREE.oneofs_by_name['source'].fields.append(
+  _ROOTTREE.fields_by_name['leftjoin_source'])
+_ROOTTREE.fields_by_name['leftjoin_source'].containing_oneof = _ROOTTREE.oneofs_by_name['source']
 DESCRIPTOR.message_types_by_name['TriplePattern'] = _TRIPLEPATTERN
 DESCRIPTOR.message_types_by_name['SavedScanIterator'] = _SAVEDSCANITERATOR
 DESCRIPTOR.message_types_by_name['SavedReducedIterator'] = _SAVEDREDUCEDITERATOR
 DESCRIPTOR.message_types_by_name['SavedProjectionIterator'] = _SAVEDPROJECTIONITERATOR
 DESCRIPTOR.message_types_by_name['SavedIndexJoinIterator'] = _SAVEDINDEXJOINITERATOR
+DESCRIPTOR.message_types_by_name['SavedLeftIndexJoinIterator'] = _SAVEDLEFTINDEXJOINITERATOR
+DESCRIPTOR.message_types_by_name['SavedEmptyIterator'] = _SAVEDEMPTYITERATOR
+DESCRIPTOR.message_types_by_name['SolutionMappings'] = _SOLUTIONMAPPINGS
+DESCRIPTOR.message_types_by_name['SavedBindJoinIterator'] = _SAVEDBINDJOINITERATOR
+DESCRIPTOR.message_types_by_name['SavedHashJoinIterator'] = _SAVEDHASHJOINITERATOR
+DESCRIPTOR.message_types_by_name['SavedMergeJoinIterator'] = _SAVEDMERGEJOINITERATOR
+DESCRIPTOR.message_types_by_name['SavedStarJoinIterator'] = _SAVEDSTARJOINITERATOR
+DESCRIPTOR.message_types_by_name['LeapfrogCursor'] = _LEAPFROGCURSOR
+DESCRIPTOR.message_types_by_name['SavedLeapfrogJoinIterator'] = _SAVEDLEAPFROGJOINITERATOR
 DESCRIPTOR.message_types_by_name['SavedBagUnionIterator'] = _SAVEDBAGUNIONITERATOR
 DESCRIPTOR.message_types_by_name['SavedFilterIterator'] = _SAVEDFILTERITERATOR
 DESCRIPTOR.message_types_by_name['SavedBindIterator'] = _SAVEDBINDITERATOR
@@ -1268,6 +3186,117 @@ SavedIndexJoinIterator = _reflection.GeneratedProtocolMessageType('SavedIndexJoi
 _sym_db.RegisterMessage(SavedIndexJoinIterator)
 _sym_db.RegisterMessage(SavedIndexJoinIterator.MucEntry)
 
+SavedLeftIndexJoinIterator = _reflection.GeneratedProtocolMessageType('SavedLeftIndexJoinIterator', (_message.Message,), {
+
+  'MucEntry' : _reflection.GeneratedProtocolMessageType('MucEntry', (_message.Message,), {
+    'DESCRIPTOR' : _SAVEDLEFTINDEXJOINITERATOR_MUCENTRY,
+    '__module__' : 'iterators_pb2'
+    # @@protoc_insertion_point(class_scope:iterators.SavedLeftIndexJoinIterator.MucEntry)
+    })
+  ,
+  'DESCRIPTOR' : _SAVEDLEFTINDEXJOINITERATOR,
+  '__module__' : 'iterators_pb2'
+  # @@protoc_insertion_point(class_scope:iterators.SavedLeftIndexJoinIterator)
+  })
+_sym_db.RegisterMessage(SavedLeftIndexJoinIterator)
+_sym_db.RegisterMessage(SavedLeftIndexJoinIterator.MucEntry)
+
+SavedEmptyIterator = _reflection.GeneratedProtocolMessageType('SavedEmptyIterator', (_message.Message,), {
+  'DESCRIPTOR' : _SAVEDEMPTYITERATOR,
+  '__module__' : 'iterators_pb2'
+  # @@protoc_insertion_point(class_scope:iterators.SavedEmptyIterator)
+  })
+_sym_db.RegisterMessage(SavedEmptyIterator)
+
+SolutionMappings = _reflection.GeneratedProtocolMessageType('SolutionMappings', (_message.Message,), {
+
+  'MuEntry' : _reflection.GeneratedProtocolMessageType('MuEntry', (_message.Message,), {
+    'DESCRIPTOR' : _SOLUTIONMAPPINGS_MUENTRY,
+    '__module__' : 'iterators_pb2'
+    # @@protoc_insertion_point(class_scope:iterators.SolutionMappings.MuEntry)
+    })
+  ,
+  'DESCRIPTOR' : _SOLUTIONMAPPINGS,
+  '__module__' : 'iterators_pb2'
+  # @@protoc_insertion_point(class_scope:iterators.SolutionMappings)
+  })
+_sym_db.RegisterMessage(SolutionMappings)
+_sym_db.RegisterMessage(SolutionMappings.MuEntry)
+
+SavedBindJoinIterator = _reflection.GeneratedProtocolMessageType('SavedBindJoinIterator', (_message.Message,), {
+  'DESCRIPTOR' : _SAVEDBINDJOINITERATOR,
+  '__module__' : 'iterators_pb2'
+  # @@protoc_insertion_point(class_scope:iterators.SavedBindJoinIterator)
+  })
+_sym_db.RegisterMessage(SavedBindJoinIterator)
+
+SavedHashJoinIterator = _reflection.GeneratedProtocolMessageType('SavedHashJoinIterator', (_message.Message,), {
+
+  'MucEntry' : _reflection.GeneratedProtocolMessageType('MucEntry', (_message.Message,), {
+    'DESCRIPTOR' : _SAVEDHASHJOINITERATOR_MUCENTRY,
+    '__module__' : 'iterators_pb2'
+    # @@protoc_insertion_point(class_scope:iterators.SavedHashJoinIterator.MucEntry)
+    })
+  ,
+  'DESCRIPTOR' : _SAVEDHASHJOINITERATOR,
+  '__module__' : 'iterators_pb2'
+  # @@protoc_insertion_point(class_scope:iterators.SavedHashJoinIterator)
+  })
+_sym_db.RegisterMessage(SavedHashJoinIterator)
+_sym_db.RegisterMessage(SavedHashJoinIterator.MucEntry)
+
+SavedMergeJoinIterator = _reflection.GeneratedProtocolMessageType('SavedMergeJoinIterator', (_message.Message,), {
+
+  'LeftHeadEntry' : _reflection.GeneratedProtocolMessageType('LeftHeadEntry', (_message.Message,), {
+    'DESCRIPTOR' : _SAVEDMERGEJOINITERATOR_LEFTHEADENTRY,
+    '__module__' : 'iterators_pb2'
+    # @@protoc_insertion_point(class_scope:iterators.SavedMergeJoinIterator.LeftHeadEntry)
+    })
+  ,
+
+  'RightHeadEntry' : _reflection.GeneratedProtocolMessageType('RightHeadEntry', (_message.Message,), {
+    'DESCRIPTOR' : _SAVEDMERGEJOINITERATOR_RIGHTHEADENTRY,
+    '__module__' : 'iterators_pb2'
+    # @@protoc_insertion_point(class_scope:iterators.SavedMergeJoinIterator.RightHeadEntry)
+    })
+  ,
+  'DESCRIPTOR' : _SAVEDMERGEJOINITERATOR,
+  '__module__' : 'iterators_pb2'
+  # @@protoc_insertion_point(class_scope:iterators.SavedMergeJoinIterator)
+  })
+_sym_db.RegisterMessage(SavedMergeJoinIterator)
+_sym_db.RegisterMessage(SavedMergeJoinIterator.LeftHeadEntry)
+_sym_db.RegisterMessage(SavedMergeJoinIterator.RightHeadEntry)
+
+SavedStarJoinIterator = _reflection.GeneratedProtocolMessageType('SavedStarJoinIterator', (_message.Message,), {
+
+  'MucEntry' : _reflection.GeneratedProtocolMessageType('MucEntry', (_message.Message,), {
+    'DESCRIPTOR' : _SAVEDSTARJOINITERATOR_MUCENTRY,
+    '__module__' : 'iterators_pb2'
+    # @@protoc_insertion_point(class_scope:iterators.SavedStarJoinIterator.MucEntry)
+    })
+  ,
+  'DESCRIPTOR' : _SAVEDSTARJOINITERATOR,
+  '__module__' : 'iterators_pb2'
+  # @@protoc_insertion_point(class_scope:iterators.SavedStarJoinIterator)
+  })
+_sym_db.RegisterMessage(SavedStarJoinIterator)
+_sym_db.RegisterMessage(SavedStarJoinIterator.MucEntry)
+
+LeapfrogCursor = _reflection.GeneratedProtocolMessageType('LeapfrogCursor', (_message.Message,), {
+  'DESCRIPTOR' : _LEAPFROGCURSOR,
+  '__module__' : 'iterators_pb2'
+  # @@protoc_insertion_point(class_scope:iterators.LeapfrogCursor)
+  })
+_sym_db.RegisterMessage(LeapfrogCursor)
+
+SavedLeapfrogJoinIterator = _reflection.GeneratedProtocolMessageType('SavedLeapfrogJoinIterator', (_message.Message,), {
+  'DESCRIPTOR' : _SAVEDLEAPFROGJOINITERATOR,
+  '__module__' : 'iterators_pb2'
+  # @@protoc_insertion_point(class_scope:iterators.SavedLeapfrogJoinIterator)
+  })
+_sym_db.RegisterMessage(SavedLeapfrogJoinIterator)
+
 SavedBagUnionIterator = _reflection.GeneratedProtocolMessageType('SavedBagUnionIterator', (_message.Message,), {
   'DESCRIPTOR' : _SAVEDBAGUNIONITERATOR,
   '__module__' : 'iterators_pb2'
@@ -1351,6 +3380,12 @@ _sym_db.RegisterMessage(RootTree)
 
 
 _SAVEDINDEXJOINITERATOR_MUCENTRY._options = None
+_SAVEDLEFTINDEXJOINITERATOR_MUCENTRY._options = None
+_SOLUTIONMAPPINGS_MUENTRY._options = None
+_SAVEDHASHJOINITERATOR_MUCENTRY._options = None
+_SAVEDMERGEJOINITERATOR_LEFTHEADENTRY._options = None
+_SAVEDMERGEJOINITERATOR_RIGHTHEADENTRY._options = None
+_SAVEDSTARJOINITERATOR_MUCENTRY._options = None
 _SAVEDFILTERITERATOR_MUENTRY._options = None
 _SAVEDBINDITERATOR_MUENTRY._options = None
 _SAVEDINSERTDATA_NBINSERTEDENTRY._options = None
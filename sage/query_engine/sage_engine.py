@@ -1,45 +1,92 @@
 # sage_engine.py
 # Author: Thomas MINIER - MIT License 2017-2020
-from asyncio import Queue
-from asyncio import TimeoutError as asyncTimeoutError
-from asyncio import get_event_loop, wait_for
 from math import inf
-from typing import Dict, List, Optional, Tuple
+from time import monotonic
+from typing import List, Optional, Tuple
 
 from rdflib import BNode, Literal, URIRef, Variable
 from rdflib import Graph
 from rdflib.plugins.serializers.nt import _quoteLiteral
 
-from sage.query_engine.exceptions import DeleteInsertConflict, TooManyResults
+from sage.query_engine.exceptions import DeleteInsertConflict
+from sage.query_engine.iterators.mappings import SolutionMappings
 from sage.query_engine.iterators.preemptable_iterator import PreemptableIterator
 from sage.query_engine.primitives import PreemptiveLoop
+from sage.query_engine.profiler import PlanProfiler
 from sage.query_engine.protobuf.iterators_pb2 import RootTree
 
-ExecutionResults = Tuple[List[Dict[str, str]], Optional[RootTree], bool, Optional[str]]
+ExecutionResults = Tuple[List[SolutionMappings], Optional[RootTree], bool, Optional[str]]
 
 
-async def executor(pipeline: PreemptableIterator, queue: Queue, limit: int) -> None:
-    """Execute a pipeline of iterator under a time quantum.
+class Executor(object):
+    """Execute a pipeline of iterators until a deadline, and collect the query results.
+
+    The executor checks the deadline after each tick, where a tick is a call to ``next``
+    or ``next_batch`` on the root of the pipeline. Once the deadline has passed, execution
+    stops between two such calls, so the pipeline is always interrupted at a clean operator
+    boundary, where it can be saved. The deadline is shared with the ``PreemptiveLoop``
+    used by the iterators, so they can also stop early when the time quantum is over.
+
+    If the pipeline supports the batch protocol and ``batch_size`` is greater than one,
+    solution mappings are fetched by batches, using ``next_batch``.
+    Otherwise, they are fetched one at a time, using ``next``.
 
     Args:
       * pipeline: Root of the pipeline of iterator.
-      * queue: Async queue used to store query results.
+      * deadline: Time (as given by ``time.monotonic``) at which the execution must stop.
       * limit: Maximum number of query results to fetch from the pipeline.
-
-    Throws: Any exception raised during query execution.
+      * batch_size: Maximum number of solution mappings fetched per batch.
     """
-    try:
-        with PreemptiveLoop() as loop:
-            while pipeline.has_next():
-                value = await pipeline.next()
-                # discard null values
-                if value is not None:
-                    await queue.put(value)
-                if queue.qsize() >= limit:
-                    raise TooManyResults()
-                await loop.tick()
-    except StopAsyncIteration:
-        pass
+
+    def __init__(self, pipeline: PreemptableIterator, deadline: float, limit=inf, batch_size: int = 1):
+        super(Executor, self).__init__()
+        self._pipeline = pipeline
+        self._deadline = deadline
+        self._limit = limit
+        self._batch_size = batch_size
+        self._results: List[SolutionMappings] = list()
+
+    async def run(self) -> bool:
+        """Execute the pipeline until it completes, the deadline passes or the limit of results is reached.
+
+        Returns: True if the pipeline has completed, False otherwise.
+
+        Throws: Any exception raised during query execution.
+        """
+        pipeline = self._pipeline
+        results = self._results
+        use_batches = self._batch_size > 1 and pipeline.supports_batch()
+        try:
+            with PreemptiveLoop(deadline=self._deadline) as loop:
+                while pipeline.has_next():
+                    if use_batches:
+                        # never fetch more results than allowed
+                        results.extend(await pipeline.next_batch(min(self._batch_size, self._limit - len(results))))
+                    else:
+                        value = await pipeline.next()
+                        # discard null values
+                        if value is not None:
+                            results.append(value)
+                    if len(results) >= self._limit:
+                        return not pipeline.has_next()
+                    await loop.tick()
+                    if loop.expired():
+                        return not pipeline.has_next()
+        except StopAsyncIteration:
+            pass
+        return True
+
+    def results(self) -> List[SolutionMappings]:
+        """Get the query results found during query execution.
+
+        When the root of the pipeline is a CONSTRUCT or a REDUCED iterator, results
+        are read from the iterator itself rather than from the solution mappings it produced.
+        """
+        if self._pipeline.serialized_name() == 'construct':
+            return [{'s': s.n3(), 'p': p.n3(), 'o': o.n3()} for s, p, o in self._pipeline.graph()]
+        elif self._pipeline.serialized_name() == 'reduc':
+            return self._pipeline.results()
+        return self._results
 
 
 class SageEngine(object):
@@ -48,12 +95,15 @@ class SageEngine(object):
     def __init__(self):
         super(SageEngine, self).__init__()
 
-    async def execute(self, plan: PreemptableIterator, quantum: int, limit=inf) -> ExecutionResults:
+    async def execute(self, plan: PreemptableIterator, quantum: int, limit=inf, batch_size: int = 1, profiler: Optional[PlanProfiler] = None) -> ExecutionResults:
         """Execute a preemptable physical query execution plan under a time quantum.
 
         Args:
           * plan: Root of the pipeline of iterator.
           * quantum: Time quantum used to execute the query.
+          * limit: Maximum number of query results to fetch.
+          * batch_size: Maximum number of solution mappings fetched per batch (1 disables batching).
+          * profiler: (Optional) A profiler used to collect per-operator statistics during query execution.
 
         Returns: A tuple (``results``, ``saved_plan``, ``is_done``, ``abort_reason``) where:
           * ``results`` is a list of solution mappings found during query execution
@@ -63,35 +113,17 @@ class SageEngine(object):
 
         Throws: Any exception raised during query execution.
         """
-        results: List[Dict[str, str]] = list()
-        queue = Queue()
-        loop = get_event_loop()
+        if profiler is not None:
+            profiler.attach(plan)
+        executor = Executor(plan, monotonic() + quantum, limit=limit, batch_size=batch_size)
         query_done = False
         root = None
         abort_reason = None
         try:
-            await wait_for(executor(plan, queue, limit), timeout=quantum)
-            # loop.run_until_complete(task)
-            query_done = True
-        except StopAsyncIteration:
-            pass
-        except asyncTimeoutError:
-            pass
-        except TooManyResults:
-            pass
+            query_done = await executor.run()
         except DeleteInsertConflict as err:
             abort_reason = str(err)
-        finally:
-            if plan.serialized_name()=='construct':
-                for s,p,o in plan.graph():
-                        results.append({'s':s.n3(),'p':p.n3(),'o':o.n3()})
-            elif plan.serialized_name()=='reduc':
-                #print(str(plan.results()))
-                for b in plan.results():
-                    results.append(b)
-            else:
-                while not queue.empty():
-                    results.append(queue.get_nowait())
+        results = executor.results()
         # save the plan if query execution is not done yet and no abort has occurred
         if (not query_done) and abort_reason is None:
             root = RootTree()
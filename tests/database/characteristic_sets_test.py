@@ -0,0 +1,93 @@
+# characteristic_sets_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+from sage.cli.statistics import scan_graph
+from sage.database.core.characteristic_sets import CharacteristicSets, DistinctSketch, catalog_path
+from sage.database.core.graph import Graph
+from sage.database.hdt.connector import HDTFileConnector
+from sage.query_engine.optimizer.join_order import star_fanouts
+from sage.query_engine.optimizer.query_parser import parse_query
+from tests.utils import DummyDataset
+
+hdtDoc = HDTFileConnector('tests/data/test.hdt')
+
+# two persons with a name and one or two emails, and one person with a name only
+triples = [
+    ('a', 'name', '"A"'), ('a', 'email', 'a1'), ('a', 'email', 'a2'),
+    ('b', 'name', '"B"'), ('b', 'email', 'b1'),
+    ('c', 'name', '"C"')
+]
+
+
+def test_build():
+    catalog = CharacteristicSets.build(triples)
+    assert len(catalog) == 2
+    assert catalog.nb_subjects({'name'}) == 3
+    assert catalog.nb_subjects({'name', 'email'}) == 2
+    assert catalog.nb_subjects({'unknown'}) == 0
+    assert catalog.star_cardinality([('name', False), ('email', False)]) == 3
+    assert catalog.star_cardinality([('name', False)]) == 3
+    assert catalog.star_cardinality([('name', True), ('email', False)]) == 1.5
+    # RDF triples not grouped by subject
+    unsorted = CharacteristicSets.build(reversed(triples), subject_sorted=False)
+    assert unsorted.star_cardinality([('name', False), ('email', False)]) == 3
+
+
+def test_distinct_sketch():
+    sketch = DistinctSketch(size=64)
+    for value in range(50):
+        sketch.add(f"o{value % 25}")
+    # the count is exact while the sketch is not full
+    assert len(sketch) == 25
+    for value in range(10000):
+        sketch.add(f"o{value}")
+    assert len(sketch._heap) == 64
+    assert 7000 <= len(sketch) <= 13000
+
+
+def test_build_many_objects():
+    catalog = CharacteristicSets.build([('s', 'p', f"o{value}") for value in range(20000)])
+    (nb_subjects, predicates), = catalog._sets
+    occurrences, distinct = predicates['p']
+    assert nb_subjects == 1 and occurrences == 20000
+    assert 18000 <= distinct <= 22000
+
+
+def test_save_load(tmp_path):
+    path = str(tmp_path / 'test.cs.json')
+    CharacteristicSets.build(triples).save(path)
+    catalog = CharacteristicSets.load(path)
+    assert len(catalog) == 2
+    assert catalog.star_cardinality([('name', False), ('email', False)]) == 3
+
+
+def test_catalog_path():
+    assert catalog_path({'file': 'data.hdt'}) == 'data.hdt.cs.json'
+    assert catalog_path({'file': 'data.hdt', 'statistics': 'stats.json'}) == 'stats.json'
+    assert catalog_path({'dbname': 'sage'}) is None
+
+
+def test_graph_lazy_loading(tmp_path):
+    path = str(tmp_path / 'test.hdt.cs.json')
+    graph = Graph('watdiv100', 'watdiv100', 'test graph', hdtDoc, statistics=path)
+    assert graph.characteristic_sets() is None
+    CharacteristicSets.build(scan_graph(hdtDoc)).save(path)
+    catalog = graph.characteristic_sets()
+    assert catalog is not None
+    assert graph.characteristic_sets() is catalog
+    assert catalog.nb_subjects({'http://example.org/p1'}) == 2
+
+
+def test_star_fanouts(tmp_path):
+    path = str(tmp_path / 'test.hdt.cs.json')
+    CharacteristicSets.build(scan_graph(hdtDoc)).save(path)
+    dataset = DummyDataset(Graph('watdiv100', 'watdiv100', 'test graph', hdtDoc, statistics=path), 'watdiv100')
+    patterns = [
+        {'triple': {'subject': '?s', 'predicate': 'http://example.org/p1', 'object': '?o', 'graph': 'watdiv100'}, 'cardinality': 110},
+        {'triple': {'subject': '?s', 'predicate': 'http://example.org/p3', 'object': '?x', 'graph': 'watdiv100'}, 'cardinality': 12}
+    ]
+    assert star_fanouts(patterns, dataset)
+    # no subject has both predicates
+    assert [pattern['fanout'] for pattern in patterns] == [(frozenset(['?s']), 0), (frozenset(['?s']), 0)]
+    query = "SELECT * WHERE { ?s <http://example.org/p1> ?o . ?s <http://example.org/p3> ?x . }"
+    _, cardinalities = parse_query(query, dataset, 'watdiv100')
+    assert all(cardinality['bound_cardinality'] == 0 for cardinality in cardinalities)
@@ -0,0 +1,68 @@
+# hdt_dictionary_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pytest
+from sage.database.hdt.connector import HDTFileConnector
+
+hdtDoc = HDTFileConnector('tests/data/test.hdt')
+dictionary = hdtDoc.term_dictionary()
+
+
+def decode(triple):
+    return tuple(dictionary.decode(term) for term in triple)
+
+
+def read_all(iterator):
+    triples = list()
+    while iterator.has_next():
+        triple = iterator.next()
+        if triple is not None:
+            triples.append(triple)
+    return triples
+
+
+def test_global_ids():
+    iterator, _ = hdtDoc.search_ids('?s', '?p', '?o')
+    ids = set([term for triple in read_all(iterator) for term in triple])
+    # each RDF term has a single ID, whatever its positions
+    assert len(ids) == len(set([dictionary.decode(term) for term in ids]))
+    assert all(dictionary.encode(dictionary.decode(term)) == term for term in ids)
+    assert dictionary.encode('http://example.org/unknown') is None
+    subject = dictionary.encode('http://example.org/s1')
+    assert dictionary.local(subject, 'subject') is not None and dictionary.local(subject, 'object') is None
+    assert not dictionary.may_be_literal(subject) and dictionary.may_be_literal(dictionary.encode('http://example.org/o001'))
+
+
+@pytest.mark.parametrize("subj,pred,obj", [
+    ('?s', '?p', '?o'),
+    ('?s', 'http://example.org/p1', '?o'),
+    ('http://example.org/s3', '?p', '?o'),
+    ('?s', '?p', 'http://example.org/o001'),
+    ('?s', 'http://example.org/unknown', '?o')
+])
+def test_search_ids(subj, pred, obj):
+    iterator, cardinality = hdtDoc.search(subj, pred, obj)
+    expected = read_all(iterator)
+    iterator, id_cardinality = hdtDoc.search_ids(subj, pred, obj)
+    assert id_cardinality == cardinality
+    assert [decode(triple) for triple in read_all(iterator)] == expected
+    # the RDF terms of the triple pattern can also be given by their IDs
+    ids = [term if term.startswith('?') else dictionary.encode(term) for term in [subj, pred, obj]]
+    if None not in ids:
+        iterator, _ = hdtDoc.search_ids(*ids)
+        assert [decode(triple) for triple in read_all(iterator)] == expected
+
+
+def test_resume_search_ids():
+    iterator, _ = hdtDoc.search('http://example.org/s1', '?p', '?o')
+    expected = read_all(iterator)
+    iterator, _ = hdtDoc.search_ids('http://example.org/s1', '?p', '?o')
+    first = [decode(iterator.next()) for _ in range(10)]
+    # both kinds of searches share the same last_read IDs
+    iterator, _ = hdtDoc.search('http://example.org/s1', '?p', '?o', last_read=iterator.last_read())
+    assert first + read_all(iterator) == expected
+
+
+def test_search_many_ids():
+    patterns = [('http://example.org/s2', '?p', '?o'), (dictionary.encode('http://example.org/s3'), '?p', '?o'), ('http://example.org/unknown', '?p', '?o')]
+    expected = list(hdtDoc.search_many([(patterns[0][0], '?p', '?o'), ('http://example.org/s3', '?p', '?o')]))
+    assert [(index, decode(triple)) for index, triple in hdtDoc.search_many_ids(patterns)] == expected
@@ -0,0 +1,51 @@
+# process_pool_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pytest
+from os.path import abspath
+from sage.http_server.server import run_app
+from starlette.testclient import TestClient
+from tests.http.utils import post_sparql
+
+config = f"""
+name: SaGe Test server
+quota: 10
+max_results: 4
+graphs:
+-
+  name: testdata
+  uri: http://localhost:8000/sparql/testdata
+  backend: hdt-file
+  file: {abspath('tests/data/test.hdt')}
+"""
+
+queries = [
+    ("SELECT * WHERE { ?s ?p ?o }", 132),
+    ("SELECT * WHERE { ?s1 <http://example.org/p1> ?common . ?s2 <http://example.org/p2> ?common }", 20)
+]
+
+
+class TestProcessPool(object):
+    @pytest.fixture(scope="class")
+    def client(self, tmp_path_factory):
+        config_file = tmp_path_factory.mktemp("config") / "config.yaml"
+        config_file.write_text(config)
+        with TestClient(run_app(str(config_file), pool_size=2)) as client:
+            yield client
+
+    @pytest.mark.parametrize("query,cardinality", queries)
+    def test_process_pool_interface(self, client, query, cardinality):
+        results = list()
+        nbCalls = 0
+        hasNext = True
+        next_link = None
+        while hasNext:
+            response = post_sparql(client, query, next_link, 'http://localhost:8000/sparql/testdata')
+            assert response.status_code == 200
+            response = response.json()
+            results += response['bindings']
+            hasNext = response['hasNext']
+            next_link = response['next']
+            nbCalls += 1
+        assert len(results) == cardinality
+        assert len(set(tuple(sorted(mu.items())) for mu in results)) == cardinality
+        assert nbCalls > 1
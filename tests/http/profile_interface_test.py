@@ -0,0 +1,56 @@
+# profile_interface_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pytest
+from os.path import abspath
+from xml.etree import ElementTree
+from sage.http_server.server import run_app
+from starlette.testclient import TestClient
+from tests.http.utils import post_sparql
+
+config = f"""
+name: SaGe Test server
+quota: 75
+max_results: 500
+graphs:
+-
+  name: testdata
+  uri: http://localhost:8000/sparql/testdata
+  backend: hdt-file
+  file: {abspath('tests/data/test.hdt')}
+"""
+
+query = "SELECT * WHERE { ?s1 <http://example.org/p1> ?common . ?s2 <http://example.org/p2> ?common }"
+
+
+class TestProfileInterface(object):
+    @pytest.fixture(scope="class")
+    def client(self, tmp_path_factory):
+        config_file = tmp_path_factory.mktemp("config") / "config.yaml"
+        config_file.write_text(config)
+        with TestClient(run_app(str(config_file))) as client:
+            yield client
+
+    def test_no_profile(self, client):
+        response = post_sparql(client, query, None, 'http://localhost:8000/sparql/testdata')
+        assert response.status_code == 200
+        assert 'operators' not in response.json()['stats']
+
+    def test_json_profile(self, client):
+        params = {"query": query, "default-graph-uri": "http://localhost:8000/sparql/testdata", "profile": True}
+        response = client.get('/sparql', params=params, headers={"Accept": "application/json"})
+        assert response.status_code == 200
+        operators = response.json()['stats']['operators']
+        assert operators['operator'] == 'proj'
+        assert operators['rows_out'] == 20
+        join = operators['children'][0]
+        assert join['operator'] == 'join'
+        assert join['children'][0]['operator'] == 'scan'
+
+    def test_xml_profile(self, client):
+        params = {"query": query, "default-graph-uri": "http://localhost:8000/sparql/testdata", "profile": True}
+        response = client.get('/sparql', params=params, headers={"Accept": "application/xml"})
+        assert response.status_code == 200
+        root = ElementTree.fromstring(response.text)
+        operators = root.findall(".//{http://www.w3.org/2005/sparql-results#}operator")
+        assert [op.get('operator') for op in operators] == ['proj', 'join', 'scan']
+        assert operators[0].get('rows_out') == '20'
@@ -0,0 +1,100 @@
+# batch_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pytest
+from sage.query_engine.sage_engine import SageEngine
+from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.iterators.nlj import IndexJoinIterator
+from sage.query_engine.iterators.filter import FilterIterator
+from sage.query_engine.iterators.projection import ProjectionIterator
+from sage.query_engine.iterators.loader import load
+from sage.query_engine.protobuf.iterators_pb2 import RootTree
+from sage.database.hdt.connector import HDTFileConnector
+from tests.utils import DummyDataset
+
+hdtDoc = HDTFileConnector('tests/data/test.hdt')
+engine = SageEngine()
+triple = {
+    'subject': '?s1',
+    'predicate': 'http://example.org/p1',
+    'object': '?common',
+    'graph': 'watdiv100'
+}
+innerTriple = {
+    'subject': '?s2',
+    'predicate': 'http://example.org/p2',
+    'object': '?common',
+    'graph': 'watdiv100'
+}
+
+
+def build_join():
+    iterator, card = hdtDoc.search(triple['subject'], triple['predicate'], triple['object'])
+    scan = ScanIterator(iterator, triple, card)
+    return IndexJoinIterator(scan, innerTriple, hdtDoc)
+
+
+def as_set(results):
+    return set(tuple(sorted(mu.items())) for mu in results)
+
+
+def reload(plan):
+    root = RootTree()
+    getattr(root, plan.serialized_name() + '_source').CopyFrom(plan.save())
+    return load(root.SerializeToString(), DummyDataset(hdtDoc, 'watdiv100'))
+
+
+@pytest.mark.asyncio
+async def test_scan_batch_read():
+    iterator, card = hdtDoc.search(triple['subject'], triple['predicate'], triple['object'])
+    scan = ScanIterator(iterator, triple, card)
+    assert scan.supports_batch()
+    batch = await scan.next_batch(3)
+    assert len(batch) == 3
+    (results, saved, done, _) = await engine.execute(scan, 10e7, batch_size=4)
+    assert len(batch) + len(results) == card
+    assert done
+
+
+@pytest.mark.asyncio
+async def test_nlj_batch_read():
+    join = build_join()
+    (expected, _, _, _) = await engine.execute(build_join(), 10e7)
+    (results, saved, done, _) = await engine.execute(join, 10e7, batch_size=7)
+    assert len(results) == 20
+    assert as_set(results) == as_set(expected)
+    assert done
+
+
+@pytest.mark.asyncio
+async def test_batch_limit():
+    (results, saved, done, _) = await engine.execute(build_join(), 10e7, limit=5, batch_size=7)
+    assert len(results) == 5
+    assert not done
+    assert saved is not None
+
+
+@pytest.mark.asyncio
+async def test_filter_projection_batch_read():
+    expression = "?s1 = <http://example.org/s1>"
+    plan = ProjectionIterator(FilterIterator(build_join(), expression), ['?s2'])
+    (expected, _, _, _) = await engine.execute(ProjectionIterator(FilterIterator(build_join(), expression), ['?s2']), 10e7)
+    (results, saved, done, _) = await engine.execute(plan, 10e7, batch_size=3)
+    assert done
+    assert sorted(mu['?s2'] for mu in results) == sorted(mu['?s2'] for mu in expected)
+    for mu in results:
+        assert list(mu.keys()) == ['?s2']
+
+
+@pytest.mark.asyncio
+async def test_nlj_batch_resume():
+    join = build_join()
+    results = list()
+    # interrupt the join after a few partially consumed batches
+    for size in [5, 1, 3]:
+        results += await join.next_batch(size)
+    join = reload(join)
+    while join.has_next():
+        results += await join.next_batch(2)
+        join = reload(join)
+    assert len(results) == 20
+    assert len(as_set(results)) == 20
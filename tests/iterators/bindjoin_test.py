@@ -0,0 +1,108 @@
+# bindjoin_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pytest
+from sage.query_engine.sage_engine import SageEngine
+from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.iterators.bindjoin import BindJoinIterator
+from sage.query_engine.iterators.nlj import IndexJoinIterator
+from sage.query_engine.iterators.loader import load
+from sage.query_engine.optimizer.query_parser import parse_query
+from sage.database.core.graph import Graph
+from sage.database.hdt.connector import HDTFileConnector
+from tests.utils import DummyDataset, MemoryDatabase
+
+class BatchedHDTConnector(HDTFileConnector):
+    """A HDTFileConnector that reports batched lookups, like a backend resolving a block of triple patterns per call"""
+
+    def supports_batched_lookups(self):
+        return True
+
+
+hdtDoc = HDTFileConnector('tests/data/test.hdt')
+dataset = DummyDataset(hdtDoc, 'watdiv100')
+engine = SageEngine()
+triple = {
+    'subject': '?s1',
+    'predicate': 'http://example.org/p1',
+    'object': '?common',
+    'graph': 'watdiv100'
+}
+innerTriple = {
+    'subject': '?s2',
+    'predicate': 'http://example.org/p2',
+    'object': '?common',
+    'graph': 'watdiv100'
+}
+
+
+def build_scan():
+    iterator, card = hdtDoc.search(triple['subject'], triple['predicate'], triple['object'])
+    return ScanIterator(iterator, triple, card)
+
+
+async def expected_results():
+    (results, _, _, _) = await engine.execute(IndexJoinIterator(build_scan(), innerTriple, hdtDoc), 10e7)
+    return sorted(tuple(sorted(mu.items())) for mu in results)
+
+
+def test_hdt_search_many():
+    patterns = [('?s', 'http://example.org/p2', 'http://example.org/o001'), ('?s', 'http://example.org/p1', '?o'), ('?s', 'http://example.org/p2', '?o')]
+    matches = list(hdtDoc.search_many(patterns))
+    expected = [(index, t) for index, pattern in enumerate(patterns) for t in hdtDoc.search(*pattern)[0]]
+    assert matches == expected
+    # the offset skips the matches of the first pattern only
+    first = len(list(hdtDoc.search(*patterns[0])[0]))
+    assert list(hdtDoc.search_many(patterns[1:], offset=2)) == [(index - 1, t) for index, t in expected if index > 0][2:]
+    assert list(hdtDoc.search_many(patterns, offset=first)) == expected[first:]
+
+
+@pytest.mark.asyncio
+async def test_bindjoin_read():
+    join = BindJoinIterator(build_scan(), innerTriple, hdtDoc, block_size=7)
+    (results, saved, done, _) = await engine.execute(join, 10e7)
+    assert done
+    assert sorted(tuple(sorted(mu.items())) for mu in results) == await expected_results()
+    # the 110 solution mappings of the outer relation are resolved in blocks of 7
+    assert join.db_calls() == 16
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_size", [1, 4])
+async def test_bindjoin_reload(batch_size):
+    plan = BindJoinIterator(build_scan(), innerTriple, hdtDoc, block_size=7)
+    results = list()
+    done = False
+    while not done:
+        (values, saved, done, _) = await engine.execute(plan, 10e7, limit=1, batch_size=batch_size)
+        results += values
+        if not done:
+            plan = load(saved.SerializeToString(), dataset)
+            assert type(plan) is BindJoinIterator
+    assert sorted(tuple(sorted(mu.items())) for mu in results) == await expected_results()
+
+
+@pytest.mark.asyncio
+async def test_bindjoin_interrupt():
+    plan = BindJoinIterator(build_scan(), innerTriple, hdtDoc)
+    results = list()
+    done = False
+    while not done:
+        (values, saved, done, _) = await engine.execute(plan, 10e-5)
+        results += values
+        if not done:
+            plan = load(saved.SerializeToString(), dataset)
+    assert sorted(tuple(sorted(mu.items())) for mu in results) == await expected_results()
+
+
+def test_join_builder_selects_bindjoin():
+    query = "SELECT * WHERE { ?s1 <http://example.org/p1> ?common . ?s2 <http://example.org/p2> ?common . }"
+    plan, _ = parse_query(query, DummyDataset(BatchedHDTConnector('tests/data/test.hdt'), 'watdiv100'), 'watdiv100')
+    assert any(type(child) is BindJoinIterator for child in plan.children())
+    # caching lookups does not disable Bind joins
+    graph = Graph('http://localhost:8000/sparql/watdiv100', 'watdiv100', '', BatchedHDTConnector('tests/data/test.hdt'), lookup_cache=True)
+    plan, _ = parse_query(query, DummyDataset(graph, 'watdiv100'), 'watdiv100')
+    assert any(type(child) is BindJoinIterator for child in plan.children())
+    # backends without batched lookups keep using Index Loop joins, including HDT, which searches the patterns one after the other
+    for graph in [hdtDoc, MemoryDatabase()]:
+        plan, _ = parse_query(query, DummyDataset(graph, 'watdiv100'), 'watdiv100')
+        assert all(type(child) is not BindJoinIterator for child in plan.children())
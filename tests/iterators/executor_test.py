@@ -0,0 +1,94 @@
+# executor_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pytest
+from time import monotonic
+from sage.query_engine.sage_engine import Executor, SageEngine
+from sage.query_engine.primitives import PreemptiveLoop
+from sage.query_engine.iterators.filter import FilterIterator
+from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.iterators.nlj import IndexJoinIterator
+from sage.query_engine.iterators.loader import load
+from sage.database.hdt.connector import HDTFileConnector
+from tests.utils import DummyDataset
+
+hdtDoc = HDTFileConnector('tests/data/test.hdt')
+engine = SageEngine()
+triple = {
+    'subject': '?s1',
+    'predicate': 'http://example.org/p1',
+    'object': '?common',
+    'graph': 'watdiv100'
+}
+innerTriple = {
+    'subject': '?s2',
+    'predicate': 'http://example.org/p2',
+    'object': '?common',
+    'graph': 'watdiv100'
+}
+
+
+def build_scan(t=triple):
+    iterator, card = hdtDoc.search(t['subject'], t['predicate'], t['object'])
+    return ScanIterator(iterator, t, card)
+
+
+@pytest.mark.asyncio
+async def test_executor_stops_at_deadline():
+    spo = {'subject': '?s', 'predicate': '?p', 'object': '?o', 'graph': 'watdiv100'}
+    executor = Executor(build_scan(spo), monotonic() - 1)
+    done = await executor.run()
+    assert not done
+    assert len(executor.results()) == 1
+
+
+@pytest.mark.asyncio
+async def test_executor_limit():
+    executor = Executor(IndexJoinIterator(build_scan(), innerTriple, hdtDoc), monotonic() + 10, limit=3)
+    done = await executor.run()
+    assert not done
+    assert len(executor.results()) == 3
+
+
+@pytest.mark.asyncio
+async def test_execute_resume_by_quanta():
+    plan = IndexJoinIterator(build_scan(), innerTriple, hdtDoc)
+    results = list()
+    done = False
+    while not done:
+        (values, saved, done, _) = await engine.execute(plan, 0, limit=4)
+        results += values
+        if not done:
+            plan = load(saved.SerializeToString(), DummyDataset(hdtDoc, 'watdiv100'))
+    assert len(results) == 20
+    assert len(set(tuple(sorted(mu.items())) for mu in results)) == 20
+
+
+@pytest.mark.asyncio
+async def test_nested_loops_share_deadline():
+    with PreemptiveLoop(deadline=monotonic() - 1) as loop:
+        with PreemptiveLoop() as nested:
+            assert nested.expired()
+        assert loop.expired()
+    with PreemptiveLoop() as loop:
+        assert not loop.expired()
+
+
+@pytest.mark.asyncio
+async def test_loop_tunes_threshold():
+    with PreemptiveLoop(threshold=10, yield_interval=10) as loop:
+        for _ in range(10):
+            await loop.tick()
+        # ticks are much cheaper than the yield interval
+        assert loop.threshold > 10
+
+
+@pytest.mark.asyncio
+async def test_filter_stops_at_deadline():
+    spo = {'subject': '?s', 'predicate': '?p', 'object': '?o', 'graph': 'watdiv100'}
+    scan = build_scan(spo)
+    iterator = FilterIterator(scan, "?o = <http://example.org/unknown>")
+    with PreemptiveLoop(deadline=monotonic() - 1):
+        assert await iterator.next() is None
+    # the rejected mappings are not kept in the saved state
+    assert len(iterator.save().mu) == 0
+    assert scan.save().progress == 1
@@ -0,0 +1,51 @@
+# expression_cache_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pytest
+from sage.query_engine.sage_engine import SageEngine
+from sage.query_engine.iterators.bind import BindIterator, compile_bind_expression
+from sage.query_engine.iterators.filter import FilterIterator, compile_filter_expression
+from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.iterators.loader import load
+from sage.database.hdt.connector import HDTFileConnector
+from tests.utils import DummyDataset
+
+hdtDoc = HDTFileConnector('tests/data/test.hdt')
+dataset = DummyDataset(hdtDoc, 'watdiv100')
+engine = SageEngine()
+triple = {
+    'subject': '?s1',
+    'predicate': 'http://example.org/p1',
+    'object': '?common',
+    'graph': 'watdiv100'
+}
+
+
+def build_scan():
+    iterator, card = hdtDoc.search(triple['subject'], triple['predicate'], triple['object'])
+    return ScanIterator(iterator, triple, card)
+
+
+@pytest.mark.asyncio
+async def test_filter_reload_uses_compiled_expression():
+    expression = "?s1 = <http://example.org/s1>"
+    plan = FilterIterator(build_scan(), expression)
+    misses = compile_filter_expression.cache_info().misses
+    results = list()
+    done = False
+    while not done:
+        (values, saved, done, _) = await engine.execute(plan, 0, limit=1)
+        results += values
+        if not done:
+            plan = load(saved.SerializeToString(), dataset)
+    assert len(results) > 0
+    assert all(mu['?s1'] == 'http://example.org/s1' for mu in results)
+    # the expression is compiled once, whatever the number of reloads
+    assert compile_filter_expression.cache_info().misses == misses
+    assert compile_filter_expression(expression) == (plan._compiled_expression, plan._prologue)
+
+
+def test_bind_expression_cache():
+    first = BindIterator(build_scan(), "STR(?s1)", "?z")
+    second = BindIterator(build_scan(), "STR(?s1)", "?z")
+    assert first._compiled_expression is second._compiled_expression
+    assert compile_bind_expression.cache_info().hits > 0
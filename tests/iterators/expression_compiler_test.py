@@ -0,0 +1,162 @@
+# expression_compiler_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pytest
+from itertools import product
+from rdflib import Variable
+from rdflib.plugins.sparql.sparql import Bindings, QueryContext, SPARQLError
+from sage.query_engine.exceptions import NativeEvaluationError
+from sage.query_engine.iterators.bind import compile_bind_expression, compile_native_bind_expression
+from sage.query_engine.iterators.filter import FilterIterator, compile_filter_expression, compile_native_filter_expression
+from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.iterators.utils import to_rdflib_term
+from sage.database.hdt.connector import HDTFileConnector
+
+XSD = 'http://www.w3.org/2001/XMLSchema#'
+
+terms = [
+    'http://example.org/s1',
+    'http://example.org/a',
+    'urn:example',
+    '_:b1',
+    'abc',
+    '',
+    '"abc"',
+    '"Abc"',
+    '"bc"',
+    '""',
+    '"abc"@en',
+    '"bc"@en',
+    '"abc"@fr',
+    '"abc"@EN',
+    '"a\\"bc"',
+    f'"abc"^^<{XSD}string>',
+    f'"12"^^<{XSD}integer>',
+    f'"012"^^<{XSD}integer>',
+    f'"-3"^^<{XSD}integer>',
+    f'"0"^^<{XSD}integer>',
+    f'"12"^^<{XSD}int>',
+    f'"1.50"^^<{XSD}decimal>',
+    f'"2.5E1"^^<{XSD}double>',
+    f'"12"^^<{XSD}float>',
+    f'"true"^^<{XSD}boolean>',
+    f'"false"^^<{XSD}boolean>',
+    f'"2020-01-01"^^<{XSD}date>',
+    '"x"^^<http://example.org/type>'
+]
+
+expressions = [
+    '?x = ?y',
+    '?x != ?y',
+    '?x < ?y',
+    '?x > ?y',
+    '?x <= ?y',
+    '?x >= ?y',
+    '?x = <http://example.org/s1>',
+    '?x != <http://example.org/s1>',
+    '?x = "abc"',
+    '?x > 10',
+    '?x < 2.5',
+    '?x >= 1.5e0',
+    '(?x > 1 && ?y < 20)',
+    '(?x = ?y || ?x > 1)',
+    '!(?x = ?y)',
+    '?x + ?y > 3',
+    '?x * 2 = ?y',
+    '?x - 1 < ?y / 2',
+    '?x / ?y = 1',
+    '?x + 1',
+    '?x * 2',
+    'REGEX(?x, "^a")',
+    'REGEX(?x, "B", "i")',
+    'CONTAINS(?x, "b")',
+    'CONTAINS(?x, ?y)',
+    'STR(?x)',
+    'STR(?x) = "abc"',
+    'LANG(?x)',
+    'LANG(?x) = "en"',
+    'DATATYPE(?x)',
+    f'DATATYPE(?x) = <{XSD}integer>',
+    'IF(?x > 1, "big", "small")',
+    'IF(?x, ?x, ?y)',
+    'CONCAT(?x, ?y)',
+    'CONCAT(STR(?x), "-", ?y)',
+    '(?x && ?y)',
+    '(?x || ?y)'
+]
+
+mappings = [{'?x': x, '?y': y} for x, y in product(terms, terms)] + [{'?x': x} for x in terms]
+
+
+def rdflib_evaluate(expression, prologue, mu):
+    """Evaluate an expression using rdflib, like the iterators do without native expressions"""
+    d = {Variable(key[1:]): to_rdflib_term(value) for key, value in mu.items()}
+    context = QueryContext(bindings=Bindings(d=d))
+    context.prologue = prologue
+    return expression.eval(context)
+
+
+@pytest.mark.parametrize("expression", expressions)
+def test_native_filter_matches_rdflib(expression):
+    native = compile_native_filter_expression(expression)
+    assert native is not None
+    compiled, prologue = compile_filter_expression(expression)
+    nb_native = 0
+    for mu in mappings:
+        try:
+            expected = bool(rdflib_evaluate(compiled, prologue, mu))
+        except Exception:
+            with pytest.raises(NativeEvaluationError):
+                native(mu)
+            continue
+        try:
+            assert native(mu) == expected, f"{expression} on {mu}"
+            nb_native += 1
+        except NativeEvaluationError:
+            pass
+    # the native function must evaluate the common cases by itself
+    assert nb_native > 0
+
+
+@pytest.mark.parametrize("expression", expressions)
+def test_native_bind_matches_rdflib(expression):
+    native = compile_native_bind_expression(expression, '?r')
+    assert native is not None
+    compiled, prologue = compile_bind_expression(expression, '?r')
+    for mu in mappings:
+        try:
+            expected = rdflib_evaluate(compiled, prologue, mu)
+        except Exception:
+            with pytest.raises(NativeEvaluationError):
+                native(mu)
+            continue
+        try:
+            value = native(mu)
+        except NativeEvaluationError:
+            continue
+        assert not isinstance(expected, SPARQLError), f"{expression} on {mu}"
+        assert type(value) == type(expected) and value == expected, f"{expression} on {mu}"
+        assert str(value) == str(expected) and bool(value) == bool(expected), f"{expression} on {mu}"
+
+
+def test_unsupported_expressions():
+    assert compile_native_filter_expression('STRLEN(?x) > 2') is None
+    assert compile_native_filter_expression('?x IN (1, 2)') is None
+    assert compile_native_bind_expression('<http://example.org/f>(?x)', '?r') is None
+
+
+@pytest.mark.asyncio
+async def test_filter_falls_back_on_rdflib():
+    hdtDoc = HDTFileConnector('tests/data/test.hdt')
+    triple = {'subject': '?s', 'predicate': '?p', 'object': '?o', 'graph': 'watdiv100'}
+    results = list()
+    for expression in ['?o = <http://example.org/o001>', '?o = <http://example.org/o001> && STRLEN(STR(?o)) >= 0']:
+        iterator, card = hdtDoc.search(triple['subject'], triple['predicate'], triple['object'])
+        filter_iterator = FilterIterator(ScanIterator(iterator, triple, card), expression)
+        values = list()
+        while filter_iterator.has_next():
+            value = await filter_iterator.next()
+            if value is not None:
+                values.append(value)
+        results.append(values)
+    assert len(results[0]) > 0
+    assert results[0] == results[1]
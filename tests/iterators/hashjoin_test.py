@@ -0,0 +1,114 @@
+# hashjoin_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pytest
+from sage.query_engine.sage_engine import SageEngine
+from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.iterators.hashjoin import HashJoinIterator
+from sage.query_engine.iterators.nlj import IndexJoinIterator
+from sage.query_engine.iterators.loader import load
+from sage.query_engine.optimizer.query_parser import parse_query
+from sage.query_engine.protobuf.iterators_pb2 import RootTree
+from sage.database.hdt.connector import HDTFileConnector
+from tests.utils import DummyDataset
+
+hdtDoc = HDTFileConnector('tests/data/test.hdt')
+dataset = DummyDataset(hdtDoc, 'watdiv100')
+engine = SageEngine()
+p1 = {
+    'subject': '?s1',
+    'predicate': 'http://example.org/p1',
+    'object': '?common',
+    'graph': 'watdiv100'
+}
+p2 = {
+    'subject': '?s2',
+    'predicate': 'http://example.org/p2',
+    'object': '?common',
+    'graph': 'watdiv100'
+}
+
+
+def build_scan(triple):
+    iterator, card = hdtDoc.search(triple['subject'], triple['predicate'], triple['object'])
+    return ScanIterator(iterator, triple, card)
+
+
+def build_join(outer, inner, budget=1000):
+    build, _ = hdtDoc.search(inner['subject'], inner['predicate'], inner['object'])
+    return HashJoinIterator(build_scan(outer), build, inner, hdtDoc, ['?common'], budget=budget)
+
+
+def as_sorted(results):
+    return sorted(tuple(sorted(mu.items())) for mu in results)
+
+
+def reload(plan):
+    root = RootTree()
+    getattr(root, plan.serialized_name() + '_source').CopyFrom(plan.save())
+    return load(root.SerializeToString(), dataset)
+
+
+async def expected_results():
+    (results, _, _, _) = await engine.execute(IndexJoinIterator(build_scan(p1), p2, hdtDoc), 10e7)
+    return as_sorted(results)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("outer,inner", [(p1, p2), (p2, p1)])
+async def test_hashjoin_read(outer, inner):
+    (results, saved, done, _) = await engine.execute(build_join(outer, inner), 10e7)
+    assert done
+    assert as_sorted(results) == await expected_results()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_size", [1, 4])
+async def test_hashjoin_reload(batch_size):
+    plan = build_join(p1, p2)
+    results = list()
+    done = False
+    while not done:
+        (values, saved, done, _) = await engine.execute(plan, 10e7, limit=1, batch_size=batch_size)
+        results += values
+        if not done:
+            plan = load(saved.SerializeToString(), dataset)
+            assert type(plan) is HashJoinIterator
+    assert as_sorted(results) == await expected_results()
+
+
+@pytest.mark.asyncio
+async def test_hashjoin_reload_during_build():
+    plan = build_join(p2, p1)
+    assert await plan.next_batch(3) == []
+    saved = plan.save()
+    assert not saved.built and saved.build_last_read == '9'
+    plan = reload(plan)
+    assert plan._table_size == 9
+    (results, _, done, _) = await engine.execute(plan, 10e7)
+    assert done
+    assert as_sorted(results) == await expected_results()
+
+
+@pytest.mark.asyncio
+async def test_hashjoin_budget_exceeded():
+    plan = build_join(p2, p1, budget=5)
+    (results, _, done, _) = await engine.execute(plan, 10e7, limit=3)
+    # the hash table exceeds the budget, so the join continues as an Index Loop join
+    assert plan.serialized_name() == 'join'
+    plan = reload(plan)
+    assert type(plan) is IndexJoinIterator
+    (values, _, done, _) = await engine.execute(plan, 10e7)
+    assert done
+    assert as_sorted(results + values) == await expected_results()
+
+
+@pytest.mark.asyncio
+async def test_join_builder_selects_hashjoin():
+    query = "SELECT * WHERE { ?s1 <http://example.org/p1> ?common . ?s2 ?p ?common . }"
+    plan, _ = parse_query(query, dataset, 'watdiv100')
+    assert any(type(child) is HashJoinIterator for child in plan.children())
+    (results, _, done, _) = await engine.execute(plan, 10e7)
+    assert done
+    (expected, _, _, _) = await engine.execute(IndexJoinIterator(build_scan(p1), {'subject': '?s2', 'predicate': '?p', 'object': '?common', 'graph': 'watdiv100'}, hdtDoc), 10e7)
+    assert len(results) > 0
+    assert as_sorted(results) == as_sorted(expected)
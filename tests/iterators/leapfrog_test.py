@@ -0,0 +1,130 @@
+# leapfrog_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pytest
+from sage.query_engine.sage_engine import SageEngine
+from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.iterators.leapfrog import LeapfrogJoinIterator
+from sage.query_engine.iterators.nlj import IndexJoinIterator
+from sage.query_engine.iterators.loader import load
+from sage.query_engine.optimizer.query_parser import parse_query
+from sage.query_engine.optimizer.utils import is_cyclic, variable_order
+from sage.database.hdt.connector import HDTFileConnector
+from tests.utils import DummyDataset, MemoryDatabase
+
+hdtDoc = HDTFileConnector('tests/data/test.hdt')
+dataset = DummyDataset(hdtDoc, 'watdiv100')
+engine = SageEngine()
+
+
+def triple(subject, predicate, obj):
+    return {'subject': subject, 'predicate': predicate, 'object': obj, 'graph': 'watdiv100'}
+
+
+# ?s1 and ?s2 share objects, which ?s2 links using any predicate
+cycle = [triple('?s1', 'http://example.org/p1', '?o'), triple('?s2', 'http://example.org/p2', '?o'), triple('?s2', '?p', '?o')]
+# pairs of predicates linking the same subject and object
+parallel = [triple('?s', '?p', '?o'), triple('?s', '?q', '?o')]
+
+
+def as_sorted(results):
+    return sorted(tuple(sorted(mu.items())) for mu in results)
+
+
+async def expected_results(graph, patterns):
+    iterator, card = graph.search(patterns[0]['subject'], patterns[0]['predicate'], patterns[0]['object'])
+    plan = ScanIterator(iterator, patterns[0], card)
+    for pattern in patterns[1:]:
+        plan = IndexJoinIterator(plan, pattern, graph)
+    (results, _, _, _) = await engine.execute(plan, 10e7)
+    return as_sorted(results)
+
+
+def test_is_cyclic():
+    assert is_cyclic(cycle)
+    assert is_cyclic(parallel)
+    assert not is_cyclic(cycle[:2])
+    assert variable_order(cycle) == ['?o', '?s2', '?s1', '?p']
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("patterns", [cycle, parallel])
+async def test_leapfrog_read(patterns):
+    join = LeapfrogJoinIterator(patterns, variable_order(patterns), hdtDoc)
+    (results, _, done, _) = await engine.execute(join, 10e7)
+    assert done
+    assert len(results) > 0
+    assert as_sorted(results) == await expected_results(hdtDoc, patterns)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_size", [1, 5])
+async def test_leapfrog_reload(batch_size):
+    plan = LeapfrogJoinIterator(parallel, variable_order(parallel), hdtDoc)
+    results = list()
+    done = False
+    while not done:
+        (values, saved, done, _) = await engine.execute(plan, 10e7, limit=7, batch_size=batch_size)
+        results += values
+        if not done:
+            plan = load(saved.SerializeToString(), dataset)
+            assert type(plan) is LeapfrogJoinIterator
+    assert as_sorted(results) == await expected_results(hdtDoc, parallel)
+
+
+@pytest.mark.asyncio
+async def test_leapfrog_interrupt():
+    plan = LeapfrogJoinIterator(cycle, variable_order(cycle), hdtDoc)
+    results = list()
+    done = False
+    while not done:
+        (values, saved, done, _) = await engine.execute(plan, 10e-5)
+        results += values
+        if not done:
+            plan = load(saved.SerializeToString(), dataset)
+    assert as_sorted(results) == await expected_results(hdtDoc, cycle)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("patterns", [
+    cycle,
+    parallel,
+    [triple('?s', '?p', '?o'), triple('?o', '?p2', '?o2'), triple('?s', '?p3', '?o2')]
+])
+async def test_leapfrog_tiny_quantum(patterns):
+    # a null quantum lets the join perform a single seek per quantum, so the progress made by each seek must be saved
+    plan = LeapfrogJoinIterator(patterns, variable_order(patterns), hdtDoc)
+    results = list()
+    done = False
+    nb_quanta = 0
+    while not done:
+        nb_quanta += 1
+        assert nb_quanta < 10000
+        (values, saved, done, _) = await engine.execute(plan, 0)
+        results += values
+        if not done:
+            plan = load(saved.SerializeToString(), dataset)
+    assert as_sorted(results) == await expected_results(hdtDoc, patterns)
+
+
+@pytest.mark.asyncio
+async def test_leapfrog_memory_triangles():
+    db = MemoryDatabase()
+    for s, o in [('a', 'b'), ('b', 'c'), ('a', 'c'), ('c', 'd'), ('b', 'd'), ('d', 'a')]:
+        db.insert(f"http://example.org/{s}", 'http://example.org/knows', f"http://example.org/{o}")
+    triangle = [triple('?x', 'http://example.org/knows', '?y'), triple('?y', 'http://example.org/knows', '?z'), triple('?x', 'http://example.org/knows', '?z')]
+    (results, _, done, _) = await engine.execute(LeapfrogJoinIterator(triangle, variable_order(triangle), db), 10e7)
+    assert done
+    assert as_sorted(results) == as_sorted([
+        {'?x': 'http://example.org/a', '?y': 'http://example.org/b', '?z': 'http://example.org/c'},
+        {'?x': 'http://example.org/b', '?y': 'http://example.org/c', '?z': 'http://example.org/d'}
+    ])
+
+
+def test_join_builder_selects_leapfrog():
+    query = "SELECT * WHERE { ?s1 <http://example.org/p1> ?o . ?s2 <http://example.org/p2> ?o . ?s2 ?p ?o . }"
+    plan, _ = parse_query(query, dataset, 'watdiv100')
+    assert any(type(child) is LeapfrogJoinIterator for child in plan.children())
+    # acyclic BGPs keep using left-linear trees of joins
+    query = "SELECT * WHERE { ?s1 <http://example.org/p1> ?o . ?s2 <http://example.org/p2> ?o . }"
+    plan, _ = parse_query(query, dataset, 'watdiv100')
+    assert all(type(child) is not LeapfrogJoinIterator for child in plan.children())
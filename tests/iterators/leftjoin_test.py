@@ -0,0 +1,118 @@
+# leftjoin_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pytest
+from sage.query_engine.exceptions import UnsupportedSPARQL
+from sage.query_engine.sage_engine import SageEngine
+from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.iterators.leftjoin import LeftIndexJoinIterator
+from sage.query_engine.iterators.loader import load
+from sage.query_engine.optimizer.query_parser import parse_query
+from sage.database.hdt.connector import HDTFileConnector
+from tests.utils import DummyDataset
+
+hdtDoc = HDTFileConnector('tests/data/test.hdt')
+dataset = DummyDataset(hdtDoc, 'watdiv100')
+engine = SageEngine()
+# s1, s2 and s4 have no p2, while s3 has 10 of them
+triple = {
+    'subject': '?s',
+    'predicate': '?p',
+    'object': '?o',
+    'graph': 'watdiv100'
+}
+innerTriple = {
+    'subject': '?s',
+    'predicate': 'http://example.org/p2',
+    'object': '?x',
+    'graph': 'watdiv100'
+}
+
+
+def make_join(expression=None):
+    iterator, card = hdtDoc.search_ids(triple['subject'], triple['predicate'], triple['object'])
+    scan = ScanIterator(iterator, triple, card)
+    return LeftIndexJoinIterator(scan, innerTriple, hdtDoc, expression=expression)
+
+
+def as_sorted(results):
+    return sorted([sorted(mu.items()) for mu in results])
+
+
+async def execute_with_reloads(plan, limit, batch_size=1):
+    results = list()
+    done = False
+    while not done:
+        (values, saved, done, _) = await engine.execute(plan, 10e7, limit=limit, batch_size=batch_size)
+        results += values
+        if not done:
+            plan = load(saved.SerializeToString(), dataset)
+    return results
+
+
+@pytest.mark.asyncio
+async def test_leftjoin_read():
+    (results, _, done, _) = await engine.execute(make_join(), 10e7)
+    assert done
+    # 122 triples are not about s3 and have no match, the 10 triples about s3 have 10 matches each
+    assert len(results) == 222
+    assert len([mu for mu in results if '?x' not in mu]) == 122
+    for mu in results:
+        assert ('?x' in mu) == (mu['?s'] == 'http://example.org/s3')
+
+
+@pytest.mark.asyncio
+async def test_leftjoin_filter():
+    # the FILTER expression rejects one match per triple about s3
+    (results, _, done, _) = await engine.execute(make_join(expression='?x != ?o'), 10e7)
+    assert done
+    assert len(results) == 212
+    assert all([mu['?x'] != mu['?o'] for mu in results if '?x' in mu])
+    # when the FILTER expression rejects all matches, the solution mappings are yielded alone
+    (results, _, done, _) = await engine.execute(make_join(expression='?x = "nothing"'), 10e7)
+    assert len(results) == 132
+    assert all(['?x' not in mu for mu in results])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit,batch_size", [(1, 1), (7, 1), (7, 4), (50, 16)])
+async def test_leftjoin_reload(limit, batch_size):
+    (expected, _, _, _) = await engine.execute(make_join(expression='?x != ?o'), 10e7)
+    results = await execute_with_reloads(make_join(expression='?x != ?o'), limit, batch_size=batch_size)
+    assert as_sorted(results) == as_sorted(expected)
+
+
+@pytest.mark.asyncio
+async def test_leftjoin_save_matched():
+    # stop in the inner loop of the first triple about s3, once it has matched
+    plan = make_join()
+    results = list()
+    while len(results) == 0 or '?x' not in results[-1]:
+        (results, saved, done, _) = await engine.execute(plan, 10e7, limit=1)
+    saved_join = saved.leftjoin_source
+    assert saved_join.matched
+    assert saved_join.muc['?s'] == 'http://example.org/s3'
+    assert len(saved_join.last_read) > 0
+    reloaded = load(saved.SerializeToString(), dataset)
+    assert reloaded._matched
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query,cardinality", [
+    ("SELECT * WHERE { ?s ?p ?o OPTIONAL { ?s <http://example.org/p2> ?x } }", 222),
+    ("SELECT ?s ?x WHERE { ?s ?p ?o OPTIONAL { ?s <http://example.org/p2> ?x FILTER(?x != ?o) } }", 212),
+    ("SELECT ?s WHERE { { ?s <http://example.org/p2> ?o } UNION { ?s <http://example.org/p3> ?o } OPTIONAL { ?s <http://example.org/p3> ?y } }", 154),
+    ("SELECT * WHERE { ?s <http://example.org/p2> ?o OPTIONAL { ?s <http://example.org/p3> ?y } ?s <http://example.org/p2> ?z }", 100)
+])
+async def test_optional_query(query, cardinality):
+    plan, _ = parse_query(query, dataset, 'watdiv100')
+    results = await execute_with_reloads(plan, 13)
+    assert len(results) == cardinality
+
+
+@pytest.mark.parametrize("query", [
+    "SELECT * WHERE { ?s ?p ?o OPTIONAL { ?s <http://example.org/p2> ?x . ?x ?p2 ?y } }",
+    "SELECT * WHERE { OPTIONAL { ?s <http://example.org/p2> ?x } }"
+])
+def test_unsupported_optional(query):
+    with pytest.raises(UnsupportedSPARQL):
+        parse_query(query, dataset, 'watdiv100')
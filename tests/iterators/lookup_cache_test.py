@@ -0,0 +1,147 @@
+# lookup_cache_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pytest
+from datetime import datetime
+from sage.query_engine.sage_engine import SageEngine
+from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.iterators.nlj import IndexJoinIterator
+from sage.query_engine.iterators.loader import load
+from sage.query_engine.optimizer.join_builder import build_left_join_tree
+from sage.database.core.graph import Graph
+from sage.database.core.lookup_cache import LookupCache
+from sage.database.hdt.connector import HDTFileConnector
+from tests.utils import DummyDataset
+
+
+class CachedHDTConnector(HDTFileConnector):
+    """A HDTFileConnector that gives a new lookup cache to each Index Loop join, like a graph with `lookup_cache` enabled"""
+
+    def lookup_cache(self) -> LookupCache:
+        return LookupCache()
+
+
+hdtDoc = HDTFileConnector('tests/data/test.hdt')
+dataset = DummyDataset(CachedHDTConnector('tests/data/test.hdt'), 'watdiv100')
+engine = SageEngine()
+# ?s only takes 4 values, so the inner triple pattern is searched 4 times at most with a cache
+outerTriple = {
+    'subject': '?s',
+    'predicate': '?p',
+    'object': '?o',
+    'graph': 'watdiv100'
+}
+innerTriple = {
+    'subject': '?s',
+    'predicate': 'http://example.org/p2',
+    'object': '?x',
+    'graph': 'watdiv100'
+}
+
+
+def make_join(cache=None):
+    iterator, card = hdtDoc.search_ids(outerTriple['subject'], outerTriple['predicate'], outerTriple['object'])
+    scan = ScanIterator(iterator, outerTriple, card)
+    return IndexJoinIterator(scan, innerTriple, hdtDoc, cache=cache)
+
+
+def as_sorted(results):
+    return sorted([sorted(mu.items()) for mu in results])
+
+
+@pytest.mark.asyncio
+async def test_cached_nlj_read():
+    cache = LookupCache()
+    join = make_join(cache=cache)
+    (results, _, done, _) = await engine.execute(join, 10e7)
+    assert done
+    (expected, _, _, _) = await engine.execute(make_join(), 10e7)
+    assert len(results) == 100
+    assert as_sorted(results) == as_sorted(expected)
+    assert join._db_calls == 4
+    assert cache.misses == 4 and cache.hits == 128
+    assert len(cache) == 4
+
+
+@pytest.mark.asyncio
+async def test_cached_nlj_save():
+    # RDF triples replayed from the cache have the same last_read IDs as the ones read from the database
+    (_, saved, done, _) = await engine.execute(make_join(cache=LookupCache()), 10e7, limit=37)
+    (_, expected, _, _) = await engine.execute(make_join(), 10e7, limit=37)
+    assert not done
+    assert saved.SerializeToString() == expected.SerializeToString()
+
+
+@pytest.mark.asyncio
+async def test_cached_nlj_reload():
+    (expected, _, _, _) = await engine.execute(make_join(), 10e7)
+    plan = make_join(cache=LookupCache())
+    results = list()
+    done = False
+    while not done:
+        (values, saved, done, _) = await engine.execute(plan, 10e7, limit=15)
+        results += values
+        if not done:
+            plan = load(saved.SerializeToString(), dataset)
+            assert plan._cache is not None
+    assert as_sorted(results) == as_sorted(expected)
+
+
+@pytest.mark.asyncio
+async def test_join_builder_uses_cache():
+    # the 10 triples with the predicate p2 are all about s3, so the inner triple pattern is searched once
+    bgp = [
+        {'subject': '?s', 'predicate': 'http://example.org/p2', 'object': '?x', 'graph': 'watdiv100'},
+        {'subject': '?s2', 'predicate': '?q', 'object': '?s', 'graph': 'watdiv100'}
+    ]
+    graph = Graph('http://localhost:8000/sparql/watdiv100', 'watdiv100', '', HDTFileConnector('tests/data/test.hdt'), lookup_cache=True)
+    graph_dataset = DummyDataset(graph, 'watdiv100')
+    plan, _, _ = build_left_join_tree(bgp, graph_dataset, 'watdiv100')
+    assert type(plan) is IndexJoinIterator
+    cache = graph.lookup_cache()
+    assert plan._cache is cache
+    # the cache is shared by the quanta of the query, so the lookup is not searched again after a reload
+    results = list()
+    done = False
+    while not done:
+        (values, saved, done, _) = await engine.execute(plan, 10e7, limit=1)
+        results += values
+        if not done:
+            plan = load(saved.SerializeToString(), graph_dataset)
+            assert plan._cache is cache
+    assert cache.misses == 1 and cache.hits == 9
+    (expected, _, _, _) = await engine.execute(build_left_join_tree(bgp, DummyDataset(hdtDoc, 'watdiv100'), 'watdiv100')[0], 10e7)
+    assert as_sorted(results) == as_sorted(expected)
+    # the cache is shared by the queries on the graph, but not by different snapshots of the graph
+    (_, _, done, _) = await engine.execute(build_left_join_tree(bgp, graph_dataset, 'watdiv100')[0], 10e7)
+    assert done
+    assert cache.misses == 1 and cache.hits == 19
+    (_, _, done, _) = await engine.execute(build_left_join_tree(bgp, graph_dataset, 'watdiv100', as_of=datetime.now())[0], 10e7)
+    assert done
+    assert cache.misses == 2 and cache.hits == 28
+
+
+def test_lookup_cache_bounds():
+    cache = LookupCache(max_entries=2)
+    for subject in ['http://example.org/s2', 'http://example.org/s3', 'http://example.org/s4']:
+        iterator, card = hdtDoc.search_ids(subject, '?p', '?o')
+        iterator = cache.put(subject, iterator, card)
+        assert len(iterator) == card
+    # the least recently used lookup is evicted
+    assert len(cache) == 2
+    assert cache.get('http://example.org/s2') == (None, 0)
+    iterator, card = cache.get('http://example.org/s3')
+    assert card == 10
+    assert len([iterator.next() for _ in range(card)]) == 10 and not iterator.has_next()
+    # lookups with too many matches are not cached
+    iterator, card = hdtDoc.search_ids('http://example.org/s1', '?p', '?o')
+    assert cache.put('http://example.org/s1', iterator, card) is iterator
+    assert len(cache) == 2
+
+
+def test_lookup_cache_max_bytes():
+    iterator, card = hdtDoc.search_ids('http://example.org/s3', '?p', '?o')
+    cache = LookupCache(max_bytes=100)
+    iterator = cache.put('http://example.org/s3', iterator, card)
+    # the lookup is too large to be cached, but its RDF triples are still read
+    assert len(cache) == 0 and cache.nb_bytes == 0
+    assert len([iterator.next() for _ in range(card)]) == 10
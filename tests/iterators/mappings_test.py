@@ -0,0 +1,122 @@
+# mappings_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pickle
+import sys
+
+import pytest
+from sage.query_engine.sage_engine import SageEngine
+from sage.query_engine.iterators.mappings import EMPTY_MAPPINGS, SolutionMappings, schema_of
+from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.iterators.nlj import IndexJoinIterator
+from sage.query_engine.iterators.projection import ProjectionIterator
+from sage.query_engine.iterators.loader import load
+from sage.query_engine.iterators.utils import selection
+from sage.query_engine.optimizer.query_parser import parse_query
+from sage.database.db_connector import DatabaseConnector
+from sage.database.hdt.connector import HDTFileConnector
+from tests.utils import DummyDataset
+
+
+class StringHDTConnector(HDTFileConnector):
+    """A HDTFileConnector that does not encode RDF terms, so RDF triples are always read as RDF terms"""
+    term_dictionary = DatabaseConnector.term_dictionary
+    search_ids = DatabaseConnector.search_ids
+    search_many_ids = DatabaseConnector.search_many_ids
+
+
+hdtDoc = HDTFileConnector('tests/data/test.hdt')
+dataset = DummyDataset(hdtDoc, 'watdiv100')
+string_dataset = DummyDataset(StringHDTConnector('tests/data/test.hdt'), 'watdiv100')
+engine = SageEngine()
+
+
+def as_sorted(results):
+    return sorted(tuple(sorted(mu.items())) for mu in results)
+
+
+def test_selection():
+    mu = selection((':Ann', 'foaf:knows', ':Bob'), ['?s', None, '?knows'])
+    assert mu == {'?s': ':Ann', '?knows': ':Bob'}
+    assert {'?s': ':Ann', '?knows': ':Bob'} == mu
+    assert mu['?s'] == ':Ann' and '?knows' in mu and '?o' not in mu
+    assert mu.get('?o') is None and mu.get('?o', '?o') == '?o'
+    assert list(mu.keys()) == ['?s', '?knows'] and len(mu) == 2
+    # selections with the same variables share the same schema
+    assert selection((':Bob', 'foaf:knows', ':Carol'), ['?s', None, '?knows']).schema is mu.schema
+    with pytest.raises(KeyError):
+        mu['?o']
+
+
+def test_join_project_extend():
+    left = SolutionMappings(schema_of(('?s', '?o')), (':Ann', ':Bob'))
+    right = SolutionMappings(schema_of(('?o', '?name')), (':Bob', '"Bob"'))
+    assert left.join(right) == {'?s': ':Ann', '?o': ':Bob', '?name': '"Bob"'}
+    assert left.join(right, frozenset(['?s', '?name'])) == {'?s': ':Ann', '?name': '"Bob"'}
+    # schemas of joined solution mappings are computed once
+    assert left.join(right).schema is left.join(right).schema
+    assert left.project(frozenset(['?o'])) == {'?o': ':Bob'}
+    assert left.project(frozenset(['?s', '?o'])) is left
+    assert left.extend('?name', '"Ann"') == {'?s': ':Ann', '?o': ':Bob', '?name': '"Ann"'}
+    assert left.extend('?o', ':Carol') == {'?s': ':Ann', '?o': ':Carol'}
+    assert left == {'?s': ':Ann', '?o': ':Bob'}
+    assert EMPTY_MAPPINGS.extend('?x', '1').to_dict() == {'?x': '1'}
+
+
+def test_from_dict_pickle():
+    mu = SolutionMappings.from_dict({'?s': ':Ann', '?o': ':Bob'})
+    assert SolutionMappings.from_dict(mu) is mu
+    copy = pickle.loads(pickle.dumps(mu))
+    assert copy == mu and copy.schema is mu.schema
+    assert sys.getsizeof(mu) + sys.getsizeof(mu.values) < sys.getsizeof(mu.to_dict())
+
+
+@pytest.mark.asyncio
+async def test_pipeline_schema():
+    iterator, card = hdtDoc.search('?s', 'http://example.org/p3', '?o')
+    scan = ScanIterator(iterator, {'subject': '?s', 'predicate': 'http://example.org/p3', 'object': '?o', 'graph': 'watdiv100'}, card)
+    join = IndexJoinIterator(scan, {'subject': '?s', 'predicate': '?p', 'object': '?x', 'graph': 'watdiv100'}, hdtDoc)
+    plan = ProjectionIterator(join, ['?s', '?x'])
+    (results, _, done, _) = await engine.execute(plan, 10e7)
+    assert done
+    assert len(results) == 144
+    # all solution mappings produced by the pipeline share a single schema
+    assert all(type(mu) is SolutionMappings and mu.schema is results[0].schema for mu in results)
+    assert list(results[0].keys()) == ['?s', '?x']
+
+
+def test_encoded_mappings():
+    dictionary = hdtDoc.term_dictionary()
+    ids = (dictionary.encode('http://example.org/s1'), dictionary.encode('http://example.org/o001'))
+    mu = SolutionMappings(schema_of(('?s', '?o'), dictionary), ids)
+    # values are decoded when read, and compared as IDs when joined
+    assert mu == {'?s': 'http://example.org/s1', '?o': 'http://example.org/o001'}
+    assert mu.raw('?s') == ids[0] and mu.encoded('?o', dictionary) == ids[1]
+    assert mu.join(SolutionMappings.from_dict({'?x': '"1"'})) == {'?s': 'http://example.org/s1', '?o': 'http://example.org/o001', '?x': '"1"'}
+    assert SolutionMappings.from_dict(mu.to_dict()).encoded('?s', dictionary) == ids[0]
+    # term dictionaries are not serialized
+    copy = pickle.loads(pickle.dumps(mu))
+    assert copy.schema.decoder is None and copy == mu
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query", [
+    "SELECT * WHERE { ?s <http://example.org/p1> ?o . ?s ?p ?o2 }",
+    "SELECT * WHERE { ?s <http://example.org/p3> ?x . ?s ?p ?o FILTER(?x = ?o) }",
+    "SELECT * WHERE { ?s ?p ?o . ?s2 ?p ?o2 FILTER(?s != ?s2 && ?p != <http://example.org/p2>) }",
+    "SELECT ?o WHERE { ?s <http://example.org/p1> ?o . ?s2 <http://example.org/p2> ?o . ?s2 ?p ?x }"
+])
+async def test_encoded_pipeline(query):
+    (expected, _, done, _) = await engine.execute(parse_query(query, string_dataset, 'watdiv100')[0], 10e7)
+    assert done
+    plan, _ = parse_query(query, dataset, 'watdiv100')
+    # the plan is saved and reloaded several times, so encoded and decoded solution mappings are joined together
+    results = list()
+    done = False
+    while not done:
+        (values, saved, done, _) = await engine.execute(plan, 10e7, limit=50)
+        results += values
+        if not done:
+            plan = load(saved.SerializeToString(), dataset)
+    assert as_sorted(results) == as_sorted(expected)
+    # the RDF terms read from the database were only decoded when serialized
+    assert any(type(mu) is SolutionMappings and mu.schema.decoder is not None for mu in results)
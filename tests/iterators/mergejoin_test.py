@@ -0,0 +1,101 @@
+# mergejoin_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pytest
+from sage.query_engine.sage_engine import SageEngine
+from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.iterators.mergejoin import MergeJoinIterator
+from sage.query_engine.iterators.nlj import IndexJoinIterator
+from sage.query_engine.iterators.loader import load
+from sage.query_engine.optimizer.query_parser import parse_query
+from sage.database.hdt.connector import HDTFileConnector
+from tests.utils import DummyDataset
+
+hdtDoc = HDTFileConnector('tests/data/test.hdt')
+dataset = DummyDataset(hdtDoc, 'watdiv100')
+engine = SageEngine()
+spo = {
+    'subject': '?s',
+    'predicate': '?p',
+    'object': '?o',
+    'graph': 'watdiv100'
+}
+p1 = {
+    'subject': '?s',
+    'predicate': 'http://example.org/p1',
+    'object': '?a',
+    'graph': 'watdiv100'
+}
+p3 = {
+    'subject': '?s',
+    'predicate': 'http://example.org/p3',
+    'object': '?x',
+    'graph': 'watdiv100'
+}
+
+
+def build_scan(triple):
+    iterator, card = hdtDoc.search(triple['subject'], triple['predicate'], triple['object'])
+    return ScanIterator(iterator, triple, card)
+
+
+def as_sorted(results):
+    return sorted(tuple(sorted(mu.items())) for mu in results)
+
+
+async def expected_results(left, right):
+    (results, _, _, _) = await engine.execute(IndexJoinIterator(build_scan(left), right, hdtDoc), 10e7)
+    return as_sorted(results)
+
+
+def test_scan_ordering():
+    assert build_scan(spo).ordering() == ['?s', '?p', '?o']
+    assert build_scan(p1).ordering() == ['?s', '?a']
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("left,right,cardinality", [(spo, p3, 144), (p3, spo, 144), (p1, spo, 10100)])
+async def test_mergejoin_read(left, right, cardinality):
+    join = MergeJoinIterator(build_scan(left), build_scan(right), '?s')
+    (results, saved, done, _) = await engine.execute(join, 10e7)
+    assert done
+    assert len(results) == cardinality
+    assert as_sorted(results) == await expected_results(left, right)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_size", [1, 7])
+async def test_mergejoin_reload(batch_size):
+    plan = MergeJoinIterator(build_scan(p1), build_scan(spo), '?s')
+    results = list()
+    done = False
+    while not done:
+        (values, saved, done, _) = await engine.execute(plan, 10e7, limit=500, batch_size=batch_size)
+        results += values
+        if not done:
+            plan = load(saved.SerializeToString(), dataset)
+            assert type(plan) is MergeJoinIterator
+    assert as_sorted(results) == await expected_results(p1, spo)
+
+
+@pytest.mark.asyncio
+async def test_mergejoin_interrupt():
+    p3_bis = {**p3, 'object': '?y'}
+    plan = MergeJoinIterator(MergeJoinIterator(build_scan(p3), build_scan(spo), '?s'), build_scan(p3_bis), '?s')
+    results = list()
+    done = False
+    while not done:
+        (values, saved, done, _) = await engine.execute(plan, 10e-5)
+        results += values
+        if not done:
+            plan = load(saved.SerializeToString(), dataset)
+    assert len(results) == 144 * 12
+
+
+@pytest.mark.asyncio
+async def test_join_builder_selects_mergejoin():
+    query = "SELECT * WHERE { ?s <http://example.org/p3> ?x . ?s ?p ?o . }"
+    plan, _ = parse_query(query, dataset, 'watdiv100')
+    assert any(type(child) is MergeJoinIterator for child in plan.children())
+    (results, _, done, _) = await engine.execute(plan, 10e7)
+    assert done
+    assert as_sorted(results) == await expected_results(p3, spo)
@@ -0,0 +1,60 @@
+# profiler_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pytest
+from sage.query_engine.sage_engine import SageEngine
+from sage.query_engine.profiler import PlanProfiler
+from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.iterators.nlj import IndexJoinIterator
+from sage.query_engine.iterators.projection import ProjectionIterator
+from sage.database.hdt.connector import HDTFileConnector
+
+hdtDoc = HDTFileConnector('tests/data/test.hdt')
+engine = SageEngine()
+triple = {
+    'subject': '?s1',
+    'predicate': 'http://example.org/p1',
+    'object': '?common',
+    'graph': 'watdiv100'
+}
+innerTriple = {
+    'subject': '?s2',
+    'predicate': 'http://example.org/p2',
+    'object': '?common',
+    'graph': 'watdiv100'
+}
+
+
+def build_plan():
+    iterator, card = hdtDoc.search(triple['subject'], triple['predicate'], triple['object'])
+    scan = ScanIterator(iterator, triple, card)
+    return ProjectionIterator(IndexJoinIterator(scan, innerTriple, hdtDoc), ['?s1', '?s2']), card
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_size", [1, 10])
+async def test_profile_plan(batch_size):
+    plan, card = build_plan()
+    profiler = PlanProfiler()
+    (results, saved, done, _) = await engine.execute(plan, 10e7, batch_size=batch_size, profiler=profiler)
+    assert done
+    proj = profiler.tree()
+    assert proj['operator'] == 'proj'
+    assert proj['rows_out'] == len(results) == 20
+    join = proj['children'][0]
+    assert join['operator'] == 'join'
+    assert join['rows_out'] == proj['rows_in'] == 20
+    assert join['db_reads'] == 20
+    scan = join['children'][0]
+    assert scan['operator'] == 'scan' and scan['children'] == []
+    assert scan['rows_in'] == scan['rows_out'] == scan['db_reads'] == card
+    assert join['rows_in'] == card
+    assert join['db_calls'] == card
+    assert proj['time'] >= join['time'] >= scan['time']
+
+
+@pytest.mark.asyncio
+async def test_no_profiling():
+    plan, _ = build_plan()
+    await engine.execute(plan, 10e7)
+    assert PlanProfiler().tree() is None
+    assert 'next' not in vars(plan)
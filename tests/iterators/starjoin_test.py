@@ -0,0 +1,81 @@
+# starjoin_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pytest
+from sage.query_engine.sage_engine import SageEngine
+from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.iterators.starjoin import StarJoinIterator
+from sage.query_engine.iterators.nlj import IndexJoinIterator
+from sage.query_engine.iterators.loader import load
+from sage.query_engine.optimizer.query_parser import parse_query
+from sage.database.hdt.connector import HDTFileConnector
+from tests.utils import DummyDataset, MemoryDatabase
+
+hdtDoc = HDTFileConnector('tests/data/test.hdt')
+dataset = DummyDataset(hdtDoc, 'watdiv100')
+engine = SageEngine()
+
+
+def triple(subject, predicate, obj):
+    return {'subject': subject, 'predicate': predicate, 'object': obj, 'graph': 'watdiv100'}
+
+
+outer = triple('?s', 'http://example.org/p3', '?x')
+star = [triple('?s', 'http://example.org/p3', '?y'), triple('?s', '?p', '?o')]
+
+
+def build_scan():
+    iterator, card = hdtDoc.search(outer['subject'], outer['predicate'], outer['object'])
+    return ScanIterator(iterator, outer, card)
+
+
+def as_sorted(results):
+    return sorted(tuple(sorted(mu.items())) for mu in results)
+
+
+async def expected_results():
+    plan = build_scan()
+    for pattern in star:
+        plan = IndexJoinIterator(plan, pattern, hdtDoc)
+    (results, _, _, _) = await engine.execute(plan, 10e7)
+    return as_sorted(results)
+
+
+@pytest.mark.asyncio
+async def test_starjoin_read():
+    join = StarJoinIterator(build_scan(), star, hdtDoc)
+    (results, _, done, _) = await engine.execute(join, 10e7)
+    assert done
+    assert len(results) == 12 * 12 * 12
+    assert as_sorted(results) == await expected_results()
+    # a single search per solution mappings of the outer relation
+    assert join.db_calls() == 12
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_size", [1, 5])
+async def test_starjoin_reload(batch_size):
+    plan = StarJoinIterator(build_scan(), star, hdtDoc)
+    results = list()
+    done = False
+    while not done:
+        (values, saved, done, _) = await engine.execute(plan, 10e7, limit=100, batch_size=batch_size)
+        results += values
+        if not done:
+            plan = load(saved.SerializeToString(), dataset)
+            assert type(plan) is StarJoinIterator
+    assert as_sorted(results) == await expected_results()
+
+
+@pytest.mark.asyncio
+async def test_join_builder_selects_starjoin():
+    db = MemoryDatabase()
+    for subject in ['a', 'b', 'c']:
+        for predicate in ['p1', 'p2', 'p3']:
+            db.insert(f"http://example.org/{subject}", f"http://example.org/{predicate}", f"http://example.org/{subject}{predicate}")
+    query = "SELECT * WHERE { ?s <http://example.org/p1> ?a . ?s <http://example.org/p2> ?b . ?s <http://example.org/p3> ?c . }"
+    plan, _ = parse_query(query, DummyDataset(db, 'watdiv100'), 'watdiv100')
+    joins = [child for child in plan.children() if type(child) is StarJoinIterator]
+    assert len(joins) == 1 and len(joins[0]._star) == 2
+    (results, _, done, _) = await engine.execute(plan, 10e7)
+    assert done
+    assert as_sorted(results) == as_sorted([{'?s': f"http://example.org/{s}", '?a': f"http://example.org/{s}p1", '?b': f"http://example.org/{s}p2", '?c': f"http://example.org/{s}p3"} for s in ['a', 'b', 'c']])
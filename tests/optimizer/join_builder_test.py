@@ -0,0 +1,109 @@
+# join_builder_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pytest
+from sage.query_engine.sage_engine import SageEngine
+from sage.query_engine.iterators.hashjoin import HashJoinIterator
+from sage.query_engine.iterators.loader import load
+from sage.query_engine.iterators.nlj import IndexJoinIterator
+from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.optimizer.query_parser import parse_query
+from sage.database.hdt.connector import HDTFileConnector
+from tests.utils import DummyDataset
+
+
+class CountingHDTConnector(HDTFileConnector):
+    """A HDTFileConnector that counts the searches issued to it"""
+
+    def __init__(self, file):
+        super(CountingHDTConnector, self).__init__(file)
+        self.searches = 0
+
+    def search(self, subject, predicate, obj, last_read=None, as_of=None):
+        self.searches += 1
+        return super(CountingHDTConnector, self).search(subject, predicate, obj, last_read=last_read, as_of=as_of)
+
+    def search_ids(self, subject, predicate, obj, last_read=None, as_of=None):
+        self.searches += 1
+        return super(CountingHDTConnector, self).search_ids(subject, predicate, obj, last_read=last_read, as_of=as_of)
+
+
+hdtDoc = CountingHDTConnector('tests/data/test.hdt')
+dataset = DummyDataset(hdtDoc, 'watdiv100')
+engine = SageEngine()
+
+
+def count_scans(iterator):
+    # the inner triple pattern of a Hash join is scanned using an iterator of the database
+    scans = 1 if type(iterator) in [ScanIterator, HashJoinIterator] else 0
+    return scans + sum(count_scans(child) for child in iterator.children())
+
+
+@pytest.mark.parametrize("subj,pred,obj", [
+    ('?s', '?p', '?o'),
+    ('?s', 'http://example.org/p1', '?o'),
+    ('http://example.org/s3', '?p', '?o'),
+    ('?s', 'http://example.org/unknown', '?o')
+])
+def test_hdt_estimate(subj, pred, obj):
+    _, cardinality = hdtDoc.search(subj, pred, obj)
+    assert hdtDoc.estimate(subj, pred, obj) == cardinality
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query,cardinality", [
+    ("SELECT * WHERE { ?s <http://example.org/p1> ?o . ?s <http://example.org/p3> ?x . ?s2 <http://example.org/p2> ?o . }", 0),
+    ("SELECT * WHERE { ?s1 <http://example.org/p1> ?common . ?s2 ?p ?common . }", 150),
+    ("SELECT * WHERE { ?s <http://example.org/p3> ?x . ?s ?p ?o . }", 144)
+])
+async def test_plan_opens_one_scan_per_executed_pattern(query, cardinality):
+    hdtDoc.searches = 0
+    plan, _ = parse_query(query, dataset, 'watdiv100')
+    assert hdtDoc.searches == count_scans(plan)
+    (results, _, done, _) = await engine.execute(plan, 10e7)
+    assert done
+    assert len(results) == cardinality
+
+
+def find_join(iterator, kind):
+    if type(iterator) is kind:
+        return iterator
+    for child in iterator.children():
+        join = find_join(child, kind)
+        if join is not None:
+            return join
+    return None
+
+
+@pytest.mark.asyncio
+async def test_projection_pushdown():
+    bgp = "{ ?s <http://example.org/p1> ?o . ?s2 <http://example.org/p2> ?o . ?s2 ?p ?x }"
+    plan, _ = parse_query(f"SELECT ?x WHERE {bgp}", dataset, 'watdiv100')
+    # only ?s2 is needed to join with the last triple pattern
+    join = find_join(plan, IndexJoinIterator)
+    assert join._projection == ['?s2']
+    (expected, _, done, _) = await engine.execute(parse_query(f"SELECT * WHERE {bgp}", dataset, 'watdiv100')[0], 10e7)
+    assert done
+    expected = sorted([mu['?x'] for mu in expected])
+    # the projection is preserved when the plan is saved and reloaded
+    results = list()
+    done = False
+    while not done:
+        (values, saved, done, _) = await engine.execute(plan, 10e-4)
+        results += values
+        if not done:
+            plan = load(saved.SerializeToString(), dataset)
+            assert find_join(plan, IndexJoinIterator)._projection in [None, ['?s2']]
+    assert sorted([mu['?x'] for mu in results]) == expected
+
+
+@pytest.mark.asyncio
+async def test_index_join_projection():
+    iterator, card = hdtDoc.search('?s', 'http://example.org/p3', '?x')
+    scan = ScanIterator(iterator, {'subject': '?s', 'predicate': 'http://example.org/p3', 'object': '?x', 'graph': 'watdiv100'}, card)
+    inner = {'subject': '?s', 'predicate': '?p', 'object': '?o', 'graph': 'watdiv100'}
+    join = IndexJoinIterator(scan, inner, hdtDoc, projection=['?o', '?s'])
+    (results, saved, done, _) = await engine.execute(join, 10e7)
+    assert done
+    assert len(results) == 144
+    assert all(set(mu.keys()) == {'?s', '?o'} for mu in results)
+    assert list(join.save().projection) == ['?o', '?s']
@@ -0,0 +1,108 @@
+# join_order_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+from sage.query_engine.optimizer.join_order import DP_THRESHOLD, distinct_values, estimate_join, extend_estimate, order_joins, sample_fanouts
+from sage.query_engine.optimizer.query_parser import parse_query
+from sage.database.hdt.connector import HDTFileConnector
+from tests.utils import DummyDataset
+
+hdtDoc = HDTFileConnector('tests/data/test.hdt')
+dataset = DummyDataset(hdtDoc, 'watdiv100')
+
+
+def pattern(subject, predicate, obj, cardinality, distinct):
+    triple = {'subject': subject, 'predicate': predicate, 'object': obj, 'graph': 'watdiv100'}
+    return {'triple': triple, 'cardinality': cardinality, 'distinct': distinct}
+
+
+def test_estimate_join():
+    left = (100, {'?s': 10, '?o': 100})
+    right = (50, {'?s': 25})
+    cardinality, distinct = estimate_join(left, right)
+    assert cardinality == 100 * 50 / 25
+    assert distinct == {'?s': 10, '?o': 100}
+    # without join variables, the join is a cross product
+    assert estimate_join((3, {'?a': 3}), (4, {'?b': 4}))[0] == 12
+
+
+def test_order_joins_avoids_cross_products():
+    a = pattern('?x', 'http://example.org/p1', '?y', 10, {'?x': 10, '?y': 10})
+    b = pattern('?z', 'http://example.org/p2', '?w', 5, {'?z': 5, '?w': 5})
+    c = pattern('?y', 'http://example.org/p3', '?z', 1000, {'?y': 1000, '?z': 1000})
+    order = order_joins([a, b, c])
+    assert order in [[a, c, b], [b, c, a]]
+
+
+def test_order_joins_selective_first():
+    a = pattern('?s', 'http://example.org/p1', '?a', 1000, {'?s': 100, '?a': 1000})
+    b = pattern('?s', 'http://example.org/p2', '?b', 10, {'?s': 10, '?b': 10})
+    c = pattern('?s', 'http://example.org/p3', 'http://example.org/o', 1, {'?s': 1})
+    assert order_joins([a, b, c]) == [c, b, a]
+
+
+def test_order_joins_greedy():
+    patterns = [pattern('?s', f"http://example.org/p{i}", f"?o{i}", 100 - i, {'?s': 10, f"?o{i}": 100 - i}) for i in range(DP_THRESHOLD + 2)]
+    order = order_joins(patterns)
+    assert len(order) == len(patterns)
+    assert order[0] is patterns[-1]
+
+
+def test_order_joins_bound_vars():
+    a = pattern('?x', 'http://example.org/p1', '?y', 10, {'?x': 10, '?y': 10})
+    b = pattern('?s', 'http://example.org/p2', '?o', 1000, {'?s': 1000, '?o': 1000})
+    assert order_joins([a, b]) == [a, b]
+    # a triple pattern joined with the bound variables is evaluated first
+    assert order_joins([a, b], bound_vars={'?s'}) == [b, a]
+
+
+def test_hdt_distinct_values():
+    triple = {'subject': '?s', 'predicate': 'http://example.org/p1', 'object': '?o', 'graph': 'watdiv100'}
+    _, cardinality = hdtDoc.search(triple['subject'], triple['predicate'], triple['object'])
+    assert distinct_values(triple, cardinality, hdtDoc) == {'?s': 2, '?o': 100}
+    triple = {'subject': '?s', 'predicate': '?p', 'object': '?o', 'graph': 'watdiv100'}
+    _, cardinality = hdtDoc.search(triple['subject'], triple['predicate'], triple['object'])
+    assert distinct_values(triple, cardinality, hdtDoc) == {'?s': 4, '?p': 3, '?o': 112}
+
+
+def test_order_joins_first():
+    a = pattern('?s', 'http://example.org/p1', '?a', 1000, {'?s': 100, '?a': 1000})
+    b = pattern('?s', 'http://example.org/p2', '?b', 10, {'?s': 10, '?b': 10})
+    c = pattern('?s', 'http://example.org/p3', 'http://example.org/o', 1, {'?s': 1})
+    assert order_joins([a, b, c], first=a) == [a, c, b]
+
+
+def test_extend_estimate_with_fanout():
+    a = pattern('?s', 'http://example.org/p1', '?a', 1000, {'?s': 100, '?a': 1000})
+    b = pattern('?s', 'http://example.org/p2', '?b', 10, {'?s': 10, '?b': 10})
+    assert extend_estimate(extend_estimate(None, a), b)[0] == 1000 * 10 / 100
+    b['fanout'] = (frozenset(['?s']), 0.5)
+    assert extend_estimate(extend_estimate(None, a), b)[0] == 500
+    # the fanout is only used when the sampled variables are bound
+    assert extend_estimate((5, {'?a': 5}), b)[0] == 50
+
+
+def test_hdt_sample():
+    sample = hdtDoc.sample('?s', 'http://example.org/p1', '?o', 11)
+    assert len(sample) == 11
+    # the sample is spread over the subjects
+    assert set(triple[0] for triple in sample) == {'http://example.org/s1', 'http://example.org/s2'}
+    assert len(hdtDoc.sample('http://example.org/s4', '?p', '?o', 100)) == 12
+    assert hdtDoc.sample('http://example.org/unknown', '?p', '?o', 10) == []
+
+
+def test_sample_fanouts():
+    p3 = pattern('?s', 'http://example.org/p3', '?x', 12, {'?s': 1, '?x': 12})
+    p1 = pattern('?s', 'http://example.org/p1', '?o', 110, {'?s': 2, '?o': 100})
+    spo = pattern('?x', '?p', '?o2', 132, {'?x': 4, '?p': 3, '?o2': 112})
+    assert sample_fanouts([p3, p1, spo], dataset)
+    # the subject of p3 has no p1 value
+    assert p1['fanout'] == (frozenset(['?s']), 0)
+    assert 'fanout' in spo
+    assert not sample_fanouts([p3, p1], dataset, budget=-1)
+
+
+def test_sampled_cardinalities_stats():
+    query = "SELECT * WHERE { ?s <http://example.org/p3> ?x . ?s <http://example.org/p1> ?o . }"
+    _, cardinalities = parse_query(query, dataset, 'watdiv100')
+    stats = {cardinality['triple']['predicate']: cardinality for cardinality in cardinalities}
+    assert stats['http://example.org/p1']['bound_cardinality'] == 0
+    assert 'bound_cardinality' not in stats['http://example.org/p3']
@@ -0,0 +1,54 @@
+# query_cache_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pytest
+from sage.query_engine.sage_engine import SageEngine
+from sage.query_engine.optimizer.query_cache import QueryCache, normalize_query
+from sage.query_engine.optimizer.query_parser import parse_query, query_cache
+from sage.database.hdt.connector import HDTFileConnector
+from tests.utils import DummyDataset
+
+hdtDoc = HDTFileConnector('tests/data/test.hdt')
+dataset = DummyDataset(hdtDoc, 'watdiv100')
+engine = SageEngine()
+
+query = """
+SELECT * WHERE {
+    ?s1 <http://example.org/p1> ?common . # first pattern
+    ?s2 <http://example.org/p2> ?common .
+}
+"""
+
+
+def test_normalize_query():
+    assert normalize_query(query) == "SELECT * WHERE { ?s1 <http://example.org/p1> ?common . ?s2 <http://example.org/p2> ?common . }"
+    # literals, IRIs and comments markers inside them are left untouched
+    assert normalize_query('SELECT * WHERE { ?s ?p "a  # b" . ?s ?p <http://example.org#x> }') == 'SELECT * WHERE { ?s ?p "a  # b" . ?s ?p <http://example.org#x> }'
+    assert normalize_query("SELECT * WHERE { ?s ?p '''a\n  b''' }") == "SELECT * WHERE { ?s ?p '''a\n  b''' }"
+    assert normalize_query('SELECT * WHERE { ?s ?p "a  b" }') != normalize_query('SELECT * WHERE { ?s ?p "a b" }')
+
+
+def test_query_cache_lru():
+    cache = QueryCache(max_size=2)
+    keys = [cache.key(f"SELECT * WHERE {{ ?s ?p {i} }}", 'watdiv100') for i in range(3)]
+    for i, key in enumerate(keys):
+        assert cache.get(key) is None
+        cache.put(key, i)
+    assert len(cache) == 2
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) == 2
+    assert cache.info() == {'hits': 1, 'misses': 4, 'size': 2, 'max_size': 2}
+    # the same query against another default graph is another entry
+    assert cache.get(cache.key("SELECT * WHERE { ?s ?p 2 }", 'other')) is None
+
+
+@pytest.mark.asyncio
+async def test_parse_query_uses_cache():
+    query_cache.clear()
+    for layout in [query, " ".join(query.split("# first pattern"))]:
+        plan, cardinalities = parse_query(layout, dataset, 'watdiv100')
+        results, saved, done, _ = await engine.execute(plan, 10e7)
+        assert done
+        assert len(results) == 20
+        assert len(cardinalities) == 2
+    assert query_cache.hits == 1
+    assert query_cache.misses == 1
@@ -0,0 +1,84 @@
+# reoptimizer_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pytest
+from sage.query_engine.sage_engine import SageEngine
+from sage.query_engine.iterators.loader import load
+from sage.query_engine.iterators.nlj import IndexJoinIterator
+from sage.query_engine.iterators.projection import ProjectionIterator
+from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.iterators.union import BagUnionIterator
+from sage.query_engine.optimizer.reoptimizer import reoptimize
+from sage.database.hdt.connector import HDTFileConnector
+from tests.utils import DummyDataset
+
+hdtDoc = HDTFileConnector('tests/data/test.hdt')
+dataset = DummyDataset(hdtDoc, 'watdiv100')
+engine = SageEngine()
+spo = {
+    'subject': '?s',
+    'predicate': '?p',
+    'object': '?o',
+    'graph': 'watdiv100'
+}
+star = {
+    'subject': '?s',
+    'predicate': '?p2',
+    'object': '?o2',
+    'graph': 'watdiv100'
+}
+p2 = {
+    'subject': '?s',
+    'predicate': 'http://example.org/p2',
+    'object': '?x',
+    'graph': 'watdiv100'
+}
+
+
+def build_plan(counters=None):
+    """Build the plan SELECT * WHERE { ?s ?p ?o . ?s ?p2 ?o2 . ?s p2 ?x }, using a bad join order"""
+    counters = counters if counters is not None else [(0, 0), (0, 0)]
+    iterator, card = hdtDoc.search(spo['subject'], spo['predicate'], spo['object'])
+    plan = ScanIterator(iterator, spo, card)
+    for triple, (rows_in, rows_out) in zip([star, p2], counters):
+        plan = IndexJoinIterator(plan, triple, hdtDoc, rows_in=rows_in, rows_out=rows_out)
+    return ProjectionIterator(plan)
+
+
+def as_sorted(results):
+    return sorted(tuple(sorted(mu.items())) for mu in results)
+
+
+def test_reoptimize_without_counters():
+    plan = build_plan()
+    assert reoptimize(plan, dataset) is plan
+    assert type(plan._source) is IndexJoinIterator
+    assert plan._source._innerTriple == p2
+
+
+def test_reoptimize_with_counters():
+    plan = build_plan(counters=[(100, 10000), (10000, 0)])
+    plan = reoptimize(plan, dataset)
+    # no solution mappings is in-flight, so the new join tree replaces the old one,
+    # and the most selective triple pattern is joined first
+    assert type(plan._source) is not BagUnionIterator
+    assert type(plan._source) is not IndexJoinIterator or plan._source._innerTriple != p2
+    assert repr(plan).index('http://example.org/p2') < repr(plan).index('?p2')
+
+
+@pytest.mark.asyncio
+async def test_adaptive_reload():
+    (expected, _, done, _) = await engine.execute(build_plan(), 10e7)
+    assert done
+    assert len(expected) == 1000
+    plan = build_plan()
+    results = list()
+    reoptimized = False
+    done = False
+    while not done:
+        (values, saved, done, _) = await engine.execute(plan, 10e-4)
+        results += values
+        if not done:
+            plan = load(saved.SerializeToString(), dataset, adaptive=True)
+            reoptimized = reoptimized or type(plan._source) is BagUnionIterator or plan._source._innerTriple != p2
+    assert reoptimized
+    assert as_sorted(results) == as_sorted(expected)
@@ -0,0 +1,70 @@
+# rewriter_test.py
+# Author: Thomas MINIER - MIT License 2017-2020
+import pytest
+from rdflib.plugins.sparql.algebra import translateQuery
+from rdflib.plugins.sparql.parser import parseQuery
+from sage.query_engine.sage_engine import SageEngine
+from sage.query_engine.iterators.filter import FilterIterator
+from sage.query_engine.iterators.scan import ScanIterator
+from sage.query_engine.optimizer.join_builder import build_left_join_tree
+from sage.query_engine.optimizer.query_parser import localize_triples, parse_filter_expr, parse_query
+from sage.query_engine.optimizer.rewriter import expression_vars, rewrite_plan
+from sage.database.hdt.connector import HDTFileConnector
+from tests.utils import DummyDataset
+
+hdtDoc = HDTFileConnector('tests/data/test.hdt')
+dataset = DummyDataset(hdtDoc, 'watdiv100')
+engine = SageEngine()
+
+
+def naive_plan(query):
+    """Build a plan that evaluates the FILTER clause of a query on top of its BGP, without any rewriting"""
+    node = translateQuery(parseQuery(query)).algebra.p.p
+    triples = list(localize_triples(node.p.triples, ['watdiv100']))
+    iterator, _, _ = build_left_join_tree(triples, dataset, 'watdiv100')
+    return FilterIterator(iterator, parse_filter_expr(node.expr))
+
+
+def as_sorted(results):
+    return sorted(tuple(sorted(mu.items())) for mu in results)
+
+
+def test_rewrite_plan():
+    query = "SELECT * WHERE { ?s <http://example.org/p1> ?o . ?s ?p ?o2 FILTER(?s = <http://example.org/s2> && ?o != ?o2 && ?p = ?p) }"
+    original = translateQuery(parseQuery(query)).algebra
+    plan = rewrite_plan(original).p.p
+    # the equality is substituted and its variable is bound on top of the BGP
+    assert plan.name == 'Extend'
+    assert str(plan.var) == 's'
+    # the other expressions are split and evaluated on the BGP
+    assert plan.p.name == 'Filter' and plan.p.p.name == 'Filter' and plan.p.p.p.name == 'BGP'
+    assert [expression_vars(node.expr) for node in [plan.p.p, plan.p]] == [{'?o', '?o2'}, {'?p'}]
+    assert all(str(triple[0]) == 'http://example.org/s2' for triple in plan.p.p.p.triples)
+    # the logical plan is left untouched
+    assert original.p.p.name == 'Filter'
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query", [
+    "SELECT * WHERE { ?s <http://example.org/p1> ?o . ?s2 <http://example.org/p2> ?o . ?s2 ?p ?x FILTER(regex(str(?o), \"o00\") && ?x != ?o) }",
+    "SELECT * WHERE { ?s <http://example.org/p2> ?o . ?s2 ?p ?o FILTER(?s = <http://example.org/s3> && ?p != <http://example.org/p2>) }",
+    "SELECT * WHERE { ?s <http://example.org/p1> ?o . ?s ?p ?o2 FILTER(<http://example.org/o001> = ?o && ?o = ?o2) }",
+    "SELECT * WHERE { ?s <http://example.org/p1> ?o . ?s ?p ?o2 FILTER(?s = <http://example.org/s1> && ?s = <http://example.org/s2>) }"
+])
+async def test_rewritten_results(query):
+    plan, _ = parse_query(query, dataset, 'watdiv100')
+    (results, _, done, _) = await engine.execute(plan, 10e7)
+    assert done
+    (expected, _, done, _) = await engine.execute(naive_plan(query), 10e7)
+    assert done
+    assert as_sorted(results) == as_sorted(expected)
+
+
+def test_filter_pushdown():
+    query = "SELECT * WHERE { ?s <http://example.org/p1> ?o . ?s2 <http://example.org/p2> ?o . ?s2 ?p ?x FILTER(regex(str(?o), \"o00\") && ?x != ?o) }"
+    plan, _ = parse_query(query, dataset, 'watdiv100')
+    # the regex is evaluated right after the Scan, which binds ?o
+    pipeline = plan._source
+    while not (type(pipeline) is FilterIterator and type(pipeline._source) is ScanIterator):
+        pipeline = pipeline._source
+    assert 'REGEX' in pipeline._raw_expression
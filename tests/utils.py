@@ -60,6 +60,9 @@ class MemoryDatabase(DatabaseConnector):
         results = results[offset:]
         return SimpleIterator(results, pattern, offset), len(results)
 
+    def supports_sorted_seek(self):
+        return True
+
     def insert(self, subject, predicate, obj):
         self._triples.append((subject, predicate, obj))
 